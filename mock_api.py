@@ -1,22 +1,75 @@
-import random
+"""
+mock_api.py - Mock domain server and deterministic OpenAI-compatible LLM server.
+
+Serves fake pages (`/page/{id}`, `/posts/{id}`) for fetch benchmarks and a mock
+`/v1/chat/completions` (+ `/v1/models`) so the LLM agents can be load-tested offline,
+without OpenAI spend. Point the backend at it with:
+
+    OPENAI_BASE_URL=http://127.0.0.1:8000/v1 OPENAI_MODEL_OVERRIDE=mock-gpt
+
+Example (heavy-tailed latency, 2% 5xx, 5% 429, 40 tok/s, 600 requests/minute):
+
+    python mock_api.py --latency-profile lognormal --latency-mean 0.8 \
+        --llm-error-rate 0.02 --llm-429-rate 0.05 --tokens-per-sec 40 --rpm-limit 600
+
+Responses are deterministic for a given --seed: the canned JSON is derived from the
+page URL found in the prompt, and latency/error draws from the prompt and how many
+times it has been sent (so a retried request can succeed where the first one failed).
+"""
+import argparse
 import asyncio
+import hashlib
+import json
 import logging
-import argparse
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+import math
+import random
+import re
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
 import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 
 # ─── CLI Args ─────────────────────────────────────────────────────────────────
 
+LATENCY_PROFILES = ("none", "fixed", "uniform", "normal", "lognormal", "pareto")
+
 parser = argparse.ArgumentParser(description="Mock API Server")
 parser.add_argument("--fail-rate", type=float, default=0.05, help="Simulated failure rate (0.0-1.0)")
 parser.add_argument("--port", type=int, default=8000, help="Port to run the server on")
 parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to bind the server to")
 
+llm = parser.add_argument_group("mock OpenAI (/v1/chat/completions)")
+llm.add_argument("--seed", type=int, default=0, help="Seed for deterministic responses/latency")
+llm.add_argument("--latency-profile", choices=LATENCY_PROFILES, default="lognormal",
+                 help="Distribution of time-to-first-token")
+llm.add_argument("--latency-mean", type=float, default=0.5, help="Mean time-to-first-token (s)")
+llm.add_argument("--latency-sigma", type=float, default=0.5,
+                 help="Spread: stddev (normal), log-sigma (lognormal), half-width ratio (uniform)")
+llm.add_argument("--pareto-alpha", type=float, default=2.5,
+                 help="Tail index for the pareto profile")
+llm.add_argument("--tokens-per-sec", type=float, default=0.0,
+                 help="Completion throughput; 0 disables generation delay")
+llm.add_argument("--llm-error-rate", type=float, default=0.0, help="Fraction of 500 responses")
+llm.add_argument("--llm-429-rate", type=float, default=0.0, help="Fraction of random 429 responses")
+llm.add_argument("--rpm-limit", type=int, default=0,
+                 help="Requests per minute before real 429s (0 = unlimited)")
+llm.add_argument("--tpm-limit", type=int, default=0,
+                 help="Tokens per minute reported in rate-limit headers (0 = unlimited)")
+llm.add_argument("--model-name", type=str, default="mock-gpt", help="Model id listed by /v1/models")
+
 args, _ = parser.parse_known_args()
 FAIL_RATE = args.fail_rate
 
+CHARS_PER_TOKEN = 4
+RATE_WINDOW_S = 60.0
+STREAM_CHUNK_TOKENS = 4
+MAX_TRACKED_PROMPTS = 10_000
+
 # ─── App Initialization ───────────────────────────────────────────────────────
 
 app = FastAPI()
@@ -82,8 +135,241 @@ async def root():
     return HTMLResponse("<h1>This is a mock domain server.</h1>")
 
 
+# ─── Mock OpenAI: deterministic helpers ───────────────────────────────────────
+
+_PAGE_URL_RE = re.compile(r"Page URL:\s*(\S+)")
+_ANY_URL_RE = re.compile(r"https?://[^\s\"'<>]+")
+
+# Times each prompt has been seen, so retries draw fresh (but reproducible) outcomes.
+# Least recently sent prompts are dropped past MAX_TRACKED_PROMPTS, so memory stays
+# bounded under long load tests; a prompt forgotten that way starts again at attempt 1.
+_prompt_attempts: OrderedDict[str, int] = OrderedDict()
+# Request timestamps / token counts inside the rate-limit window.
+_rate_window: deque[tuple[float, int]] = deque()
+
+
+def _rng(*parts: object) -> random.Random:
+    digest = hashlib.sha256(":".join(str(p) for p in (args.seed, *parts)).encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))  # noqa: S311 - simulation only
+
+
+def _next_attempt(prompt_key: str) -> int:
+    attempt = _prompt_attempts.pop(prompt_key, 0) + 1
+    _prompt_attempts[prompt_key] = attempt
+    while len(_prompt_attempts) > MAX_TRACKED_PROMPTS:
+        _prompt_attempts.popitem(last=False)
+    return attempt
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def _message_text(messages: list[dict]) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, list):  # content parts: [{"type": "text", "text": ...}]
+            content = " ".join(str(p.get("text", "")) for p in content if isinstance(p, dict))
+        parts.append(str(content or ""))
+    return "\n".join(parts)
+
+
+def _prompt_urls(prompt: str) -> list[str]:
+    urls = _PAGE_URL_RE.findall(prompt) or _ANY_URL_RE.findall(prompt)
+    return list(dict.fromkeys(u.rstrip(".,;)") for u in urls))
+
+
+def _canned_item(key: str) -> dict:
+    """Plausible extraction result derived only from `key` (URL or prompt hash)."""
+    rng = _rng("item", key)
+    slug = key.rstrip("/").rsplit("/", 1)[-1] if "/" in key else "item"
+    return {
+        "title": f"Mock {slug.replace('-', ' ').title()}",
+        "description": f"Deterministic mock extraction for {key}.",
+        "price": round(rng.uniform(5, 500), 2),
+        "author": rng.choice(["Ada Lovelace", "Alan Turing", "Grace Hopper", None]),
+        "date_published": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "page_type": rng.choice(["product", "blog", "job", "news"]),
+    }
+
+
+def _completion_content(prompt: str) -> str:
+    urls = _prompt_urls(prompt)
+    if '"items"' in prompt and len(urls) > 1:  # batched prompt (llm_batch)
+        return json.dumps({"items": [{"url": u, **_canned_item(u)} for u in urls]})
+    key = urls[0] if urls else hashlib.sha256(prompt.encode()).hexdigest()[:12]
+    item = _canned_item(key)
+    if urls:
+        item["url"] = urls[0]
+    return json.dumps(item)
+
+
+def _sample_latency(rng: random.Random) -> float:
+    mean, sigma = args.latency_mean, args.latency_sigma
+    profile = args.latency_profile
+    if profile == "none" or mean <= 0:
+        return 0.0
+    if profile == "fixed":
+        return mean
+    if profile == "uniform":
+        return rng.uniform(mean * (1 - sigma), mean * (1 + sigma))
+    if profile == "normal":
+        return max(0.0, rng.gauss(mean, sigma))
+    if profile == "lognormal":
+        # Parameterized so that E[X] == mean.
+        return rng.lognormvariate(math.log(mean) - sigma**2 / 2, sigma)
+    # pareto: heavy tail with E[X] == mean (alpha > 1)
+    alpha = args.pareto_alpha
+    return mean * (alpha - 1) / alpha * rng.paretovariate(alpha)
+
+
+def _rate_limit_headers(now: float) -> dict[str, str]:
+    while _rate_window and now - _rate_window[0][0] > RATE_WINDOW_S:
+        _rate_window.popleft()
+    reset = RATE_WINDOW_S - (now - _rate_window[0][0]) if _rate_window else 0.0
+    headers = {
+        "x-ratelimit-reset-requests": f"{reset:.3f}s",
+        "x-ratelimit-reset-tokens": f"{reset:.3f}s",
+    }
+    if args.rpm_limit:
+        headers["x-ratelimit-limit-requests"] = str(args.rpm_limit)
+        headers["x-ratelimit-remaining-requests"] = str(max(0, args.rpm_limit - len(_rate_window)))
+    if args.tpm_limit:
+        used = sum(tokens for _, tokens in _rate_window)
+        headers["x-ratelimit-limit-tokens"] = str(args.tpm_limit)
+        headers["x-ratelimit-remaining-tokens"] = str(max(0, args.tpm_limit - used))
+    return headers
+
+
+def _openai_error(
+    status: int, message: str, err_type: str, headers: dict[str, str]
+) -> JSONResponse:
+    body = {"error": {"message": message, "type": err_type, "param": None, "code": err_type}}
+    return JSONResponse(body, status_code=status, headers=headers)
+
+
+@dataclass(frozen=True)
+class _Completion:
+    """One canned completion, shared by the JSON and the streaming response."""
+
+    id: str
+    created: int
+    model: str
+    content: str
+    per_token_s: float
+
+
+# ─── Mock OpenAI: endpoints ───────────────────────────────────────────────────
+
+@app.get("/v1/models")
+async def list_models() -> dict[str, object]:
+    model = {"id": args.model_name, "object": "model", "owned_by": "mock"}
+    return {"object": "list", "data": [model]}
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request) -> Response:
+    body = await request.json()
+    model = body.get("model", args.model_name)
+    prompt = _message_text(body.get("messages", []))
+    prompt_key = hashlib.sha256(f"{model}\n{prompt}".encode()).hexdigest()
+    rng = _rng("request", prompt_key, _next_attempt(prompt_key))
+
+    content = _completion_content(prompt)
+    prompt_tokens = _estimate_tokens(prompt)
+    completion_tokens = _estimate_tokens(content)
+    usage = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
+
+    now = time.monotonic()
+    headers = _rate_limit_headers(now)
+    if args.rpm_limit and len(_rate_window) >= args.rpm_limit:
+        retry_after = headers["x-ratelimit-reset-requests"].rstrip("s")
+        headers["retry-after"] = str(max(1, math.ceil(float(retry_after))))
+        logger.warning("429 (rpm limit) for %s", model)
+        return _openai_error(429, "Rate limit reached for requests", "rate_limit_exceeded", headers)
+    _rate_window.append((now, usage["total_tokens"]))
+
+    latency = _sample_latency(rng)
+    roll = rng.random()
+    if roll < args.llm_429_rate:
+        await asyncio.sleep(min(latency, 0.1))
+        headers["retry-after"] = "1"
+        logger.warning("Simulated 429 for %s", model)
+        return _openai_error(429, "Simulated rate limit", "rate_limit_exceeded", headers)
+    if roll < args.llm_429_rate + args.llm_error_rate:
+        await asyncio.sleep(latency)
+        logger.warning("Simulated 500 for %s", model)
+        return _openai_error(500, "Simulated server error", "server_error", headers)
+
+    await asyncio.sleep(latency)
+    completion = _Completion(
+        id=f"chatcmpl-mock-{prompt_key[:16]}",
+        created=int(time.time()),
+        model=model,
+        content=content,
+        per_token_s=1 / args.tokens_per_sec if args.tokens_per_sec > 0 else 0.0,
+    )
+
+    if body.get("stream"):
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+        return StreamingResponse(
+            _stream_chunks(completion, usage if include_usage else None),
+            media_type="text/event-stream",
+            headers=headers,
+        )
+
+    await asyncio.sleep(completion_tokens * completion.per_token_s)
+    return JSONResponse(
+        {
+            "id": completion.id,
+            "object": "chat.completion",
+            "created": completion.created,
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": usage,
+        },
+        headers=headers,
+    )
+
+
+async def _stream_chunks(
+    completion: _Completion, usage: dict[str, int] | None
+) -> AsyncIterator[str]:
+    def chunk(delta: dict[str, str], finish_reason: str | None = None, **extra: object) -> str:
+        payload: dict[str, object] = {
+            "id": completion.id,
+            "object": "chat.completion.chunk",
+            "created": completion.created,
+            "model": completion.model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        payload.update(extra)
+        return f"data: {json.dumps(payload)}\n\n"
+
+    yield chunk({"role": "assistant", "content": ""})
+    content = completion.content
+    step = STREAM_CHUNK_TOKENS * CHARS_PER_TOKEN
+    for start in range(0, len(content), step):
+        await asyncio.sleep(STREAM_CHUNK_TOKENS * completion.per_token_s)
+        yield chunk({"content": content[start:start + step]})
+    yield chunk({}, finish_reason="stop")
+    if usage is not None:
+        yield chunk({}, choices=[], usage=usage)  # final usage-only chunk, as OpenAI sends
+    yield "data: [DONE]\n\n"
+
 
 # ─── Entrypoint ───────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    uvicorn.run("mock_api:app", host=args.host, port=args.port, reload=True)
\ No newline at end of file
+    uvicorn.run("mock_api:app", host=args.host, port=args.port, reload=True)
@@ -8,7 +8,10 @@ import json
 import csv
 from pathlib import Path
 import sys
+import time
 import asyncio
+import multiprocessing
+from typing import Any, TextIO
 
 # Ensure the project root is in the Python path
 sys.path.insert(0, str(Path(__file__).resolve().parent.resolve()))
@@ -16,33 +19,91 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.resolve()))
 from agentic_scraper.backend.core.settings import Settings
 from agentic_scraper.backend.core.logger_setup import setup_logging
 from agentic_scraper.backend.scraper.schemas import ScrapedItem
-from agentic_scraper.backend.scraper.pipeline import scrape_with_stats
+from agentic_scraper.backend.scraper.pipeline import (
+    PipelineOptions,
+    scrape_iter,
+    scrape_urls_bulk,
+    scrape_with_stats,
+)
+from agentic_scraper.backend.scraper.checkpoint import CheckpointJournal
+from agentic_scraper.backend.scraper.agents.llm_endpoint import resolve_endpoint
+from agentic_scraper.backend.scraper.bulk_backends import LocalFileBulkBackend, OpenAIBulkBackend
+from agentic_scraper.backend.scraper.distributed import collect_batch, enqueue_batch, run_worker
+from agentic_scraper.backend.scraper.work_queue import SQLiteWorkQueue
 
 # --- WINDOWS ASYNCIO FIX ---
 if sys.platform.startswith("win"):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-def parse_args():
+Stats = dict[str, Any]
+
+
+def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Agentic Scraper - Batch Mode")
-    parser.add_argument("--input", required=True, help="Path to input file with URLs (one per line)")
-    parser.add_argument("--output", help="Path to output file (.json or .csv)")
+    parser.add_argument(
+        "--input", help="Path to input file with URLs (one per line); not used with --worker"
+    )
+    parser.add_argument("--output", help="Path to output file (.json, .csv, or streamed .jsonl)")
     parser.add_argument("--fetch-concurrency", type=int, help="Override FETCH_CONCURRENCY")
     parser.add_argument("--llm-concurrency", type=int, help="Override LLM_CONCURRENCY")
     parser.add_argument("--timeout", type=int, help="Override MAX_CONCURRENT_REQUESTS")
     parser.add_argument("--retries", type=int, help="Override RETRY_ATTEMPTS")
-    return parser.parse_args()
+    parser.add_argument(
+        "--bulk",
+        choices=["openai", "local"],
+        help="Extract via an offline bulk job (OpenAI Batch API, or a local stand-in)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Journal of finished URLs (default: <output>.checkpoint.jsonl; not used with --bulk)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from the checkpoint: finished URLs are not fetched or extracted again",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="With --resume, also retry URLs the checkpoint recorded as failed",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Coordinate N local worker processes over a shared work queue (see --queue)",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="Run as a worker for an existing queue until interrupted (no --input needed)",
+    )
+    parser.add_argument(
+        "--queue", help="Work queue file for --workers/--worker (default: WORK_QUEUE_PATH)"
+    )
+    args = parser.parse_args()
+    if not args.worker and not args.input:
+        parser.error("--input is required unless --worker is given")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
 
 def load_urls(path: str) -> list[str]:
-    with open(path, encoding="utf-8") as f:
+    with Path(path).open(encoding="utf-8") as f:
         return [line.strip() for line in f if line.strip() and not line.startswith("#")]
 
-def save_results(output_path: str, items: list[ScrapedItem]):
+def _jsonl_line(item: ScrapedItem) -> str:
+    return json.dumps(item.model_dump(mode="json"), ensure_ascii=False) + "\n"
+
+def save_results(output_path: str, items: list[ScrapedItem]) -> None:
     ext = Path(output_path).suffix.lower()
     if ext == ".json":
-        with open(output_path, "w", encoding="utf-8") as f:
+        with Path(output_path).open("w", encoding="utf-8") as f:
             json.dump([item.model_dump(mode="json") for item in items], f, indent=2, ensure_ascii=False)
+    elif ext == ".jsonl":
+        with Path(output_path).open("w", encoding="utf-8") as f:
+            f.writelines(_jsonl_line(item) for item in items)
     elif ext == ".csv":
-        with open(output_path, "w", encoding="utf-8", newline="") as f:
+        with Path(output_path).open("w", encoding="utf-8", newline="") as f:
             writer = csv.DictWriter(f, fieldnames=items[0].model_dump().keys())
             writer.writeheader()
             for item in items:
@@ -50,12 +111,129 @@ def save_results(output_path: str, items: list[ScrapedItem]):
     else:
         raise ValueError(f"Unsupported output format: {output_path}")
 
-def main():
-    args = parse_args()
+def build_bulk_backend(kind: str, settings: Settings) -> LocalFileBulkBackend | OpenAIBulkBackend:
+    if kind == "local":
+        return LocalFileBulkBackend(work_dir=Path(settings.bulk_work_dir) / "local")
+    return OpenAIBulkBackend.from_endpoint(resolve_endpoint(settings.openai, settings))
+
+async def run_bulk(
+    urls: list[str], settings: Settings, kind: str
+) -> tuple[list[ScrapedItem], Stats]:
+    start = time.perf_counter()
+    backend = build_bulk_backend(kind, settings)
+    items = await scrape_urls_bulk(urls, settings, settings.openai, backend=backend)
+    stats = {
+        "num_urls": len(urls),
+        "num_success": len(items),
+        "num_failed": len(urls) - len(items),
+        "duration_sec": round(time.perf_counter() - start, 2),
+    }
+    return items, stats
+
+def _open_stream_output(output_path: str) -> TextIO:
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.open("w", encoding="utf-8")
+
+def _append_line(f: TextIO, line: str) -> None:
+    f.write(line)
+    f.flush()
+
+async def run_streaming(
+    urls: list[str], settings: Settings, output_path: str, options: PipelineOptions
+) -> tuple[list[ScrapedItem], Stats]:
+    # Write each item as soon as a worker finishes it; nothing is held in memory.
+    # On resume, checkpointed items are replayed first, so the file is rewritten whole.
+    # File I/O runs in a thread so it never blocks the pipeline's event loop.
+    start = time.perf_counter()
+    count = 0
+    f = await asyncio.to_thread(_open_stream_output, output_path)
+    try:
+        async for item in scrape_iter(urls, settings, options=options):
+            await asyncio.to_thread(_append_line, f, _jsonl_line(item))
+            count += 1
+    finally:
+        await asyncio.to_thread(f.close)
+    stats = {
+        "num_urls": len(urls),
+        "num_success": count,
+        "num_failed": len(urls) - count,
+        "duration_sec": round(time.perf_counter() - start, 2),
+        **(options.extra_stats or {}),
+    }
+    return [], stats
+
+def open_work_queue(path: str, settings: Settings) -> SQLiteWorkQueue:
+    return SQLiteWorkQueue(
+        path, lease_s=settings.work_queue_lease_s, max_attempts=settings.work_queue_max_attempts
+    )
+
+def _worker_process(
+    queue_path: str,
+    settings_kwargs: dict[str, Any],
+    *,
+    exit_when_idle: bool,
+    batch_id: str | None = None,
+) -> None:
+    # Top-level so it can be pickled for spawned processes.
     setup_logging()
+    settings = Settings(**settings_kwargs)
+    queue = open_work_queue(queue_path, settings)
+    asyncio.run(
+        run_worker(queue, settings=settings, exit_when_idle=exit_when_idle, batch_id=batch_id)
+    )
 
-    urls = load_urls(args.input)
-    print(f"🔗 Loaded {len(urls)} URLs from {args.input}")
+async def run_distributed(
+    urls: list[str],
+    settings: Settings,
+    queue_path: str,
+    num_workers: int,
+    settings_kwargs: dict[str, Any],
+) -> tuple[list[ScrapedItem], Stats]:
+    # Chunks are queued before any worker starts, so an idle worker really means "done".
+    # Workers only claim this batch: chunks left behind by a crashed run are not theirs.
+    start = time.perf_counter()
+    queue = open_work_queue(queue_path, settings)
+    batch_id = await enqueue_batch(queue, urls, settings=settings)
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(
+            target=_worker_process,
+            args=(queue_path, settings_kwargs),
+            kwargs={"exit_when_idle": True, "batch_id": batch_id},
+            daemon=True,
+        )
+        for _ in range(num_workers)
+    ]
+    for proc in workers:
+        proc.start()
+    try:
+        items, chunk_stats = await collect_batch(
+            queue,
+            batch_id,
+            settings=settings,
+            should_stop=lambda: not any(proc.is_alive() for proc in workers),
+        )
+    finally:
+        for proc in workers:
+            proc.join(timeout=settings.work_queue_poll_interval_s)
+            if proc.is_alive():
+                proc.terminate()
+        # Drop the batch's chunks even on failure so no later worker picks them up.
+        await queue.purge(batch_id)
+    num_urls = len(dict.fromkeys(urls))
+    stats = {
+        "num_urls": num_urls,
+        "num_success": len(items),
+        "num_failed": num_urls - len(items),
+        "duration_sec": round(time.perf_counter() - start, 2),
+        **chunk_stats,
+    }
+    return items, stats
+
+def main() -> None:
+    args = parse_args()
+    setup_logging()
 
     # Selectively override settings from CLI args (only if passed)
     overrides = {
@@ -73,17 +251,61 @@ def main():
 
     print(f"⚙️ Settings: fetch={settings.fetch_concurrency}, llm={settings.llm_concurrency}, timeout={settings.request_timeout}s, retries={settings.retry_attempts}")
 
+    queue_path = args.queue or settings.work_queue_path
+    if args.worker:
+        print(f"👷 Worker joined {queue_path} (Ctrl+C to stop)")
+        try:
+            _worker_process(queue_path, settings_kwargs, exit_when_idle=False)
+        except KeyboardInterrupt:
+            print("👋 Worker stopped")
+        return
+
+    urls = load_urls(args.input)
+    print(f"🔗 Loaded {len(urls)} URLs from {args.input}")
+
+    output_path = args.output or "output/experiment/results.json"
+    streaming = Path(output_path).suffix.lower() == ".jsonl"
+    checkpoint_path = args.checkpoint or f"{output_path}.checkpoint.jsonl"
+
     try:
-        results, stats = asyncio.run(scrape_with_stats(urls, settings))
+        if args.bulk:
+            results, stats = asyncio.run(run_bulk(urls, settings, args.bulk))
+        elif args.workers:
+            results, stats = asyncio.run(
+                run_distributed(urls, settings, queue_path, args.workers, settings_kwargs)
+            )
+            print(
+                f"🧩 Chunks: {stats['num_chunks']} ({stats['num_failed_chunks']} failed, "
+                f"{stats['num_unfinished_chunks']} unfinished) via {queue_path}"
+            )
+        else:
+            # Every finished URL is journaled, so an interrupted run can be resumed.
+            journal = CheckpointJournal(
+                checkpoint_path, resume=args.resume, retry_failed=args.retry_failed
+            )
+            with journal:
+                options = PipelineOptions(checkpoint=journal, extra_stats={})
+                if streaming:
+                    results, stats = asyncio.run(
+                        run_streaming(urls, settings, output_path, options)
+                    )
+                else:
+                    results, stats = asyncio.run(
+                        scrape_with_stats(urls, settings, options=options)
+                    )
+            print(f"🧾 Checkpoint: {checkpoint_path} ({stats.get('num_resumed', 0)} URLs resumed)")
     except Exception as e:
         print(f"❌ Scraping failed: {e}")
+        if not args.bulk and not args.workers:
+            print(f"↩️ Rerun with --resume to continue from {checkpoint_path}")
         return
 
     print(f"✅ Finished in {stats['duration_sec']} seconds")
     print(f"📦 Success: {stats['num_success']} / {stats['num_urls']}, Failures: {stats['num_failed']}")
 
-    output_path = args.output or "output/experiment/results.json"
-    if results:
+    if streaming and not args.bulk and not args.workers:
+        print(f"💾 Results streamed to {output_path}")
+    elif results:
         save_results(output_path, results)
         print(f"💾 Results saved to {output_path}")
 
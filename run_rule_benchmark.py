@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+run_rule_benchmark.py - Micro-benchmark: legacy rule-based helpers vs the compiled engine.
+
+Usage:
+    python run_rule_benchmark.py --pages 20000 --workers 4
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Ensure the project root is in the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.resolve()))
+
+from agentic_scraper.backend.scraper.agents.rule_based import (
+    guess_description,
+    guess_price,
+    guess_title,
+)
+from agentic_scraper.backend.scraper.agents.rule_engine import (
+    extract_fields,
+    extract_fields_batch,
+    extract_fields_parallel,
+)
+
+PRICES = [
+    "$12.99",
+    "19,99 €",
+    "£1,250.00",
+    "1.234,56 EUR",
+    "CHF 49.90",
+    "₹ 2,499",
+    "1\u00a0299 zł",
+]
+FILLER = (
+    "Our hand-made product is crafted from sustainably sourced materials and ships "
+    "worldwide within three business days of your order being placed."
+)
+
+
+def make_page(rng: random.Random) -> str:
+    paragraphs = [f"Product {rng.randint(1, 10_000)}", "Home > Shop > Category"]
+    paragraphs += [FILLER] * rng.randint(1, 4)
+    paragraphs.append(f"Price: {rng.choice(PRICES)}")
+    paragraphs += ["Reviews and related products"] * rng.randint(0, 20)
+    return "\n\n".join(paragraphs)
+
+
+def legacy(text: str) -> tuple[object, object, object]:
+    return guess_title(text), guess_description(text), guess_price(text)
+
+
+def report(line: str = "") -> None:
+    sys.stdout.write(f"{line}\n")
+
+
+def timed(label: str, fn: Callable[[list[str]], object], pages: list[str]) -> float:
+    start = time.perf_counter()
+    fn(pages)
+    elapsed = time.perf_counter() - start
+    report(f"{label:<28} {elapsed:8.3f}s  {len(pages) / elapsed:12,.0f} pages/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rule-based extraction micro-benchmark")
+    parser.add_argument("--pages", type=int, default=20_000, help="Number of synthetic pages")
+    parser.add_argument("--workers", type=int, default=None, help="Process count for fan-out")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)  # noqa: S311 - reproducible synthetic pages, not crypto
+    pages = [make_page(rng) for _ in range(args.pages)]
+    report(f"🧪 {len(pages)} synthetic pages\n")
+
+    base = timed("legacy guess_* helpers", lambda ps: [legacy(p) for p in ps], pages)
+    single = timed("engine extract_fields", lambda ps: [extract_fields(p) for p in ps], pages)
+    batch = timed("engine batch", extract_fields_batch, pages)
+    parallel = timed(
+        "engine process pool",
+        lambda ps: extract_fields_parallel(ps, max_workers=args.workers),
+        pages,
+    )
+
+    report()
+    for label, elapsed in (("single", single), ("batch", batch), ("process pool", parallel)):
+        report(f"⚡ {label}: {base / elapsed:.1f}x vs legacy")
+
+
+if __name__ == "__main__":
+    main()
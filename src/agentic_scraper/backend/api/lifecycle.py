@@ -4,6 +4,11 @@ FastAPI lifespan handler for startup and shutdown tasks.
 Responsibilities:
 - Preload Auth0 JWKS on application startup (non-fatal; falls back to lazy load).
 - Log service status and key lifecycle events (startup/shutdown).
+- Register the long-lived screenshot browser pool (launched lazily) and close it on
+  shutdown.
+- Register the process-wide fair scheduler that shares fetch/LLM limits across jobs.
+- Drop jobs still waiting in the scrape job queue on shutdown.
+- Terminate the rule-based extraction processes (process mode) on shutdown.
 - Clear the in-memory cancel-event registry on shutdown.
 
 Public API:
@@ -42,6 +47,7 @@ from agentic_scraper.backend.api.auth.auth0_helpers import jwks_cache_instance
 from agentic_scraper.backend.api.routes.scrape_cancel_registry import (
     clear_all as clear_cancel_events,
 )
+from agentic_scraper.backend.api.routes.scrape_executor import stop_job_executor
 from agentic_scraper.backend.config.messages import (
     MSG_DEBUG_LIFESPAN_STARTED,
     MSG_ERROR_PRELOADING_JWKS,
@@ -51,10 +57,15 @@ from agentic_scraper.backend.config.messages import (
     MSG_WARNING_JWKS_PRELOAD_FAILED_STARTING_LAZILY,
 )
 from agentic_scraper.backend.core.logger_setup import get_logger
+from agentic_scraper.backend.core.settings import get_settings
+from agentic_scraper.backend.scraper.browser_pool import start_browser_pool, stop_browser_pool
+from agentic_scraper.backend.scraper.process_pool import shutdown_extraction_pool
+from agentic_scraper.backend.scraper.scheduler import start_scheduler, stop_scheduler
 
 __all__ = ["lifespan"]
 
 logger = get_logger()
+settings = get_settings()
 
 
 def _should_skip_jwks_preload() -> bool:
@@ -118,6 +129,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             logger.exception(MSG_ERROR_PRELOADING_JWKS)
             logger.warning(MSG_WARNING_JWKS_PRELOAD_FAILED_STARTING_LAZILY)
 
+    # Jobs share one browser pool; nothing is launched until the first screenshot.
+    start_browser_pool(settings)
+    # All jobs draw fetch/LLM slots from one scheduler, fairly per user and per job.
+    start_scheduler(settings)
+
     logger.debug(MSG_DEBUG_LIFESPAN_STARTED.format(app=app))
 
     try:
@@ -127,5 +143,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # ─── Shutdown ───
         logger.info(MSG_INFO_SHUTDOWN_LOG)
         # Best-effort cleanup; suppress errors to avoid masking shutdown.
+        with suppress(Exception):
+            stop_job_executor()
         with suppress(Exception):
             clear_cancel_events()
+        with suppress(Exception):
+            await stop_browser_pool()
+        with suppress(Exception):
+            stop_scheduler()
+        with suppress(Exception):
+            shutdown_extraction_pool()
@@ -2,15 +2,17 @@
 Scrape job routes for creating, listing, fetching, and canceling scrapes.
 
 Endpoints / Dependencies:
-- `POST /scrapes` (`create_scrape_job`): Create a new scrape job and start it.
+- `POST /scrapes` (`create_scrape_job`): Create a new scrape job and start or queue it.
 - `GET  /scrapes/{job_id}` (`get_scrape_job`): Fetch a specific job (and result if done).
 - `GET  /scrapes` (`list_scrape_jobs`): List jobs with optional filters & pagination.
 - `DELETE /scrapes/{job_id}` (`cancel_scrape_job`): Cancel a queued/running job.
+- `POST /scrapes/{job_id}/resume` (`resume_scrape_job`): Re-run a failed/canceled job,
+  skipping URLs its checkpoint journal already covers.
 
 Auth:
 - All endpoints require a valid JWT via `get_current_user`.
 - Scopes enforced per endpoint:
-  - create: `create:scrapes`
+  - create / resume: `create:scrapes`
   - read:    `read:scrapes`
   - cancel:  `cancel:scrapes`
 
@@ -19,12 +21,16 @@ Response Models:
 - `ScrapeList` for collection responses.
 - `POST /scrapes` responds 202 with a `Location` header pointing to the job URL.
 - `DELETE /scrapes/{job_id}` responds 204 on success (idempotent).
+- `POST /scrapes/{job_id}/resume` responds 202 with the requeued job.
 
 Error Codes & Status:
 - 400: Invalid query params (limit/cursor/status).
 - 401/403: Auth/scope failures (raised by dependencies).
 - 404: Job not found.
-- 409: Job exists but is not cancelable (already terminal).
+- 409: Job exists but is not cancelable (already terminal), or not resumable (not
+  failed/canceled, or `checkpoint_dir` unset).
+- 429: Caller already has `max_queued_jobs_per_user` jobs waiting (`Retry-After` set).
+- 503: The global job queue is full (`Retry-After` set).
 
 Usage:
     from fastapi import FastAPI
@@ -33,11 +39,14 @@ Usage:
     app.include_router(router)
 
 Notes:
-- Background execution is scheduled via `asyncio.create_task`; tasks are tracked and auto-pruned.
+- Background execution goes through the job executor: at most `max_running_jobs` run at
+  once, later jobs stay `queued` (with `queue_position`) until a slot frees up.
 - Cancelation is cooperative: a per-job `asyncio.Event` is used to signal running pipelines.
+- With `checkpoint_dir` set, each job journals its finished URLs. A job lost in a restart
+  is re-created from its journal on resume (an inline OpenAI key is not journaled, so it
+  then runs on the owner's stored credentials).
 """
 
-import asyncio
 import logging
 from typing import Annotated
 from uuid import UUID
@@ -53,13 +62,20 @@ from agentic_scraper.backend.api.routes.scrape_cancel_registry import (
     register_cancel_event,
     set_canceled,
 )
+from agentic_scraper.backend.api.routes.scrape_executor import (
+    JobAdmissionError,
+    get_job_executor,
+)
 from agentic_scraper.backend.api.routes.scrape_helpers import (
+    _checkpoints_enabled,
     _finalize_failure,
     _finalize_success_if_not_canceled,
     _mark_running,
     _merge_runtime_settings,
     _resolve_openai_creds_or_fail,
+    _restore_job_from_checkpoint,
     _run_pipeline_and_build_result,
+    _write_checkpoint_meta,
 )
 from agentic_scraper.backend.api.schemas.scrape import (
     ScrapeCreate,
@@ -67,10 +83,12 @@ from agentic_scraper.backend.api.schemas.scrape import (
     ScrapeList,
 )
 from agentic_scraper.backend.api.stores.job_store import (
+    ScrapeJobRecord,
     cancel_job,
     create_job,
     get_job,
     list_jobs,
+    requeue_job,
 )
 from agentic_scraper.backend.config.constants import (
     DEFAULT_JOB_LIST_MAX_LIMIT,
@@ -78,18 +96,25 @@ from agentic_scraper.backend.config.constants import (
 )
 from agentic_scraper.backend.config.messages import (
     MSG_ERROR_INVALID_JOB_STATUS,
+    MSG_HTTP_CHECKPOINTS_DISABLED,
     MSG_HTTP_FORBIDDEN_JOB_ACCESS,
     MSG_HTTP_JOB_NOT_CANCELABLE,
     MSG_HTTP_JOB_NOT_FOUND_DETAIL,
+    MSG_HTTP_JOB_NOT_RESUMABLE,
+    MSG_HTTP_JOB_QUEUE_FULL,
+    MSG_HTTP_JOB_STILL_STOPPING,
     MSG_HTTP_LOCATION_HEADER_SET,
+    MSG_HTTP_TOO_MANY_QUEUED_JOBS,
     MSG_INFO_SCRAPE_REQUEST_RECEIVED,
     MSG_JOB_CANCEL_REQUESTED,
     MSG_JOB_CANCELED,
     MSG_JOB_CREATED,
     MSG_JOB_LIST_REQUESTED,
     MSG_JOB_NOT_FOUND,
+    MSG_JOB_RESUMED,
 )
 from agentic_scraper.backend.config.types import AgentMode, JobStatus
+from agentic_scraper.backend.scraper.scheduler import scheduler_tenant
 from agentic_scraper.backend.utils.validators import (
     validate_cursor,
     validate_job_status,
@@ -104,28 +129,48 @@ __all__ = [
     "create_scrape_job",
     "get_scrape_job",
     "list_scrape_jobs",
+    "resume_scrape_job",
     "router",
 ]
 
 # Inject current user via the shared dependency.
 CurrentUser = Annotated[AuthUser, Depends(get_current_user)]
 
-# Keep a reference to background tasks (RUF006) and auto-clean when done.
-_pending_tasks: set[asyncio.Task[None]] = set()
+
+def _to_scrape_job(job: ScrapeJobRecord) -> ScrapeJob:
+    """
+    Build the API model for a stored job, adding its queue position while queued.
+
+    Args:
+        job (ScrapeJobRecord): Stored job snapshot.
+
+    Returns:
+        ScrapeJob: Response model (`queue_position` is None unless the job is waiting).
+    """
+    return ScrapeJob(**job, queue_position=get_job_executor().position(job["id"]))
 
 
-def _track_task(t: asyncio.Task[None]) -> None:
+def _admission_error_to_http(err: JobAdmissionError) -> HTTPException:
     """
-    Track a background task and auto-remove it upon completion.
+    Map an executor rejection to 429 (per-user limit) or 503 (global queue full).
 
     Args:
-        t (asyncio.Task[None]): The task to track.
+        err (JobAdmissionError): Rejection raised by the executor.
 
     Returns:
-        None
+        HTTPException: Error response carrying a `Retry-After` header.
     """
-    _pending_tasks.add(t)
-    t.add_done_callback(_pending_tasks.discard)
+    if err.per_user:
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=MSG_HTTP_TOO_MANY_QUEUED_JOBS.format(limit=err.limit),
+            headers={"Retry-After": str(err.retry_after_s)},
+        )
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=MSG_HTTP_JOB_QUEUE_FULL,
+        headers={"Retry-After": str(err.retry_after_s)},
+    )
 
 
 async def _run_scrape_job(job_id: str, payload: ScrapeCreate, user: CurrentUser) -> None:
@@ -136,7 +181,8 @@ async def _run_scrape_job(job_id: str, payload: ScrapeCreate, user: CurrentUser)
         1) Mark RUNNING (skips if already terminal).
         2) Short-circuit if already CANCELED.
         3) Resolve creds (fail job if missing for LLM modes).
-        4) Merge runtime settings and run pipeline with cancel awareness.
+        4) Merge runtime settings and run pipeline with cancel awareness, charging
+           global fetch/LLM slots to this user and job (fair scheduler).
         5) Finalize SUCCEEDED only if not canceled.
         6) Always cleanup the cancel registry entry.
 
@@ -170,13 +216,16 @@ async def _run_scrape_job(job_id: str, payload: ScrapeCreate, user: CurrentUser)
         cancel_event = get_cancel_event(job_id) or register_cancel_event(job_id)
 
         # Run the pipeline; the returned flag indicates if the run reported cancellation.
-        result_model, was_canceled = await _run_pipeline_and_build_result(
-            payload=payload,
-            merged_settings=merged_settings,
-            creds=creds,
-            cancel_event=cancel_event,
-            job_id=job_id,
-        )
+        # Fetch/LLM slots are charged to this user and job by the global fair scheduler.
+        with scheduler_tenant(owner=user["sub"], job=job_id):
+            result_model, was_canceled = await _run_pipeline_and_build_result(
+                payload=payload,
+                merged_settings=merged_settings,
+                creds=creds,
+                cancel_event=cancel_event,
+                job_id=job_id,
+                owner_sub=user["sub"],
+            )
 
         # Only finalize as succeeded if the job didn't report cancellation.
         if not was_canceled:
@@ -203,7 +252,7 @@ async def create_scrape_job(
     request: Request,
 ) -> ScrapeJob:
     """
-    Create a new scrape job and start it asynchronously.
+    Create a new scrape job and start it asynchronously (or queue it when busy).
 
     Sets the `Location` header to the polling URL of the created job.
 
@@ -214,10 +263,11 @@ async def create_scrape_job(
         request (Request): Incoming request (used for building absolute Location URL).
 
     Returns:
-        ScrapeJob: Initial job snapshot (QUEUED state).
+        ScrapeJob: Initial job snapshot (QUEUED state, with `queue_position` if waiting).
 
     Raises:
-        HTTPException: 401/403 if auth or scope checks fail.
+        HTTPException: 401/403 if auth or scope checks fail; 429/503 (with
+            `Retry-After`) if the job would overflow the per-user or global queue.
     """
     # Scope: create:scrapes
     check_required_scopes(user, {RequiredScopes.SCRAPES_CREATE})
@@ -225,26 +275,32 @@ async def create_scrape_job(
     # URLs are normalized/deduped/bounded by ScrapeCreate.
     logger.info(MSG_INFO_SCRAPE_REQUEST_RECEIVED.format(n=len(payload.urls)))
 
+    # Admission control: reject before creating a record the queue cannot hold.
+    executor = get_job_executor()
+    try:
+        executor.admit(user["sub"])
+    except JobAdmissionError as err:
+        raise _admission_error_to_http(err) from err
+
     # Create queued job (record owner for authorization) using normalized payload.
     request_payload = payload.model_dump()
     job = create_job(request_payload, owner_sub=user["sub"])
     logger.info(MSG_JOB_CREATED.format(job_id=job["id"]))
+    _write_checkpoint_meta(job["id"], payload, user["sub"])
 
     # Register cancel event at creation to avoid cancel-before-register gaps.
     register_cancel_event(job["id"])
 
-    # Schedule background execution explicitly as an asyncio task.
-    task: asyncio.Task[None] = asyncio.create_task(
-        _run_scrape_job(job["id"], payload, user), name=f"scrape-job-{job['id']}"
-    )
-    _track_task(task)
+    # Start now, or wait in the bounded queue until a running slot frees up.
+    job_id = job["id"]
+    executor.submit(job_id, user["sub"], lambda: _run_scrape_job(job_id, payload, user))
 
     # Set Location header for polling (absolute).
     response_url = str(request.url_for("get_scrape_job", job_id=job["id"]))
     response.headers["Location"] = response_url
     logger.info(MSG_HTTP_LOCATION_HEADER_SET.format(url=response_url))
 
-    return ScrapeJob(**job)
+    return _to_scrape_job(job)
 
 
 @router.get(
@@ -285,7 +341,7 @@ async def get_scrape_job(job_id: UUID, user: CurrentUser) -> ScrapeJob:
             status_code=status.HTTP_403_FORBIDDEN, detail=MSG_HTTP_FORBIDDEN_JOB_ACCESS
         )
 
-    return ScrapeJob(**job)
+    return _to_scrape_job(job)
 
 
 @router.get(
@@ -354,7 +410,7 @@ async def list_scrape_jobs(
         status=status_filter, limit=safe_limit, cursor=safe_cursor, owner_sub=user["sub"]
     )
 
-    return ScrapeList(items=[ScrapeJob(**j) for j in items], next_cursor=next_cursor)
+    return ScrapeList(items=[_to_scrape_job(j) for j in items], next_cursor=next_cursor)
 
 
 @router.delete(
@@ -433,4 +489,91 @@ async def cancel_scrape_job(job_id: UUID, user: CurrentUser) -> Response:
     # Successfully marked canceled; wake any waiting workers.
     logger.info(MSG_JOB_CANCELED.format(job_id=job_id_str))
     set_canceled(job_id_str)
+    # A job that never left the queue will not run (and clean up) itself.
+    if get_job_executor().discard(job_id_str):
+        cleanup(job_id_str)
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    "/{job_id}/resume",
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def resume_scrape_job(job_id: UUID, user: CurrentUser) -> ScrapeJob:
+    """
+    Resume a failed or canceled job from its checkpoint journal.
+
+    URLs the journal already covers (extracted or failed) are not scraped again; their
+    items are merged into the new result. A job this process no longer knows (e.g. after
+    a restart) is re-created from its journal first.
+
+    Args:
+        job_id (UUID): The job identifier.
+        user (AuthUser): Authenticated user (injected).
+
+    Returns:
+        ScrapeJob: The requeued job snapshot (QUEUED, with `queue_position` if waiting).
+
+    Raises:
+        HTTPException:
+            - 404 if neither the job nor its checkpoint exists.
+            - 403 if the job is owned by a different user.
+            - 409 if checkpoints are disabled, the job is not failed/canceled, or its
+              previous run has not exited yet.
+            - 429/503 (with `Retry-After`) if the queue cannot take the job.
+    """
+    # Scope: create:scrapes (a resume starts new work on the caller's quota)
+    check_required_scopes(user, {RequiredScopes.SCRAPES_CREATE})
+
+    job_id_str = str(job_id)
+    if not _checkpoints_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=MSG_HTTP_CHECKPOINTS_DISABLED
+        )
+
+    job = get_job(job_id_str) or _restore_job_from_checkpoint(job_id_str)
+    if not job:
+        logger.warning(MSG_JOB_NOT_FOUND.format(job_id=job_id_str))
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=MSG_HTTP_JOB_NOT_FOUND_DETAIL
+        )
+
+    # Ownership guard
+    if job.get("owner_sub") and job["owner_sub"] != user["sub"]:
+        logger.warning(
+            MSG_HTTP_FORBIDDEN_JOB_ACCESS.format(user_sub=user["sub"], job_id=job_id_str)
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail=MSG_HTTP_FORBIDDEN_JOB_ACCESS
+        )
+
+    not_resumable = HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=MSG_HTTP_JOB_NOT_RESUMABLE.format(status=job["status"]),
+    )
+    if job["status"] not in {JobStatus.FAILED, JobStatus.CANCELED}:
+        raise not_resumable
+
+    # A canceled run is marked CANCELED at once but unwinds later; a second run meanwhile
+    # would share its cancel event and checkpoint journal.
+    executor = get_job_executor()
+    if executor.is_active(job_id_str):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=MSG_HTTP_JOB_STILL_STOPPING.format(job_id=job_id_str),
+        )
+    try:
+        executor.admit(user["sub"])
+    except JobAdmissionError as err:
+        raise _admission_error_to_http(err) from err
+
+    # The store re-checks the status, so two concurrent resumes start one run.
+    requeued = requeue_job(job_id_str)
+    if requeued is None:
+        raise not_resumable
+    logger.info(MSG_JOB_RESUMED.format(job_id=job_id_str))
+
+    payload = ScrapeCreate.model_validate(requeued["_request"])
+    register_cancel_event(job_id_str)
+    executor.submit(job_id_str, user["sub"], lambda: _run_scrape_job(job_id_str, payload, user))
+    return _to_scrape_job(requeued)
@@ -7,7 +7,8 @@ Responsibilities:
 - Provide helpers to set, query, and clean up cancellation events.
 
 Public API:
-- `register_cancel_event`: Ensure an asyncio.Event exists for a job (creates or reuses).
+- `register_cancel_event`: Ensure an asyncio.Event exists for a job (creates, reuses an
+  unset one, or replaces one a previous run already set).
 - `get_cancel_event`: Retrieve the current event for a job (if any).
 - `set_canceled`: Mark a job as canceled, setting the event or pre-marking if absent.
 - `cleanup`: Remove a job's cancel event and pre-cancel mark.
@@ -31,6 +32,9 @@ Usage:
 Notes:
 - Intended for ephemeral, process-local orchestration; not persistent across restarts.
 - Pre-cancel ensures that a cancel request is honored even if the event wasn't created yet.
+- The event is a running job's only cancel signal: fetchers and workers await it next
+  to their in-flight work (no job-store polling), so every cancel must go through
+  `set_canceled`.
 """
 
 from __future__ import annotations
@@ -68,7 +72,8 @@ def register_cancel_event(job_id: str) -> asyncio.Event:
     Create or retrieve a cancel event for the given job.
 
     If the job was pre-canceled before event registration, the event is
-    returned already set.
+    returned already set. An event that is already set belongs to a canceled
+    earlier run (e.g. before a resume) and is replaced with a fresh one.
 
     Args:
         job_id (str): Job identifier (validated as UUID).
@@ -79,7 +84,7 @@ def register_cancel_event(job_id: str) -> asyncio.Event:
     job_id = validate_uuid(job_id)
 
     ev = _cancel_events.get(job_id)
-    if ev is not None:
+    if ev is not None and not ev.is_set():
         logger.debug(MSG_DEBUG_CANCEL_EVENT_REUSED.format(job_id=job_id))
         return ev
 
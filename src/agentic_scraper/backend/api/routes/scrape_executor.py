@@ -0,0 +1,318 @@
+"""
+Bounded execution queue and admission control for scrape jobs.
+
+Responsibilities:
+- Run at most `max_running_jobs` scrape pipelines at once; further jobs wait (status
+  `queued`) in a FIFO and start as running jobs finish.
+- Reject submissions that would overflow the queue: per user (`max_queued_jobs_per_user`)
+  and globally (`max_queued_jobs`), with a retry hint for the client.
+- Report a queued job's position and drop queued jobs that are canceled before starting.
+- Track each job's run until its task finishes, so a job is never run twice at once.
+
+Public API:
+- `JobAdmissionError`: Raised by `admit` when a submission must be rejected.
+- `JobExecutor`: `admit()`, `submit()`, `position()`, `is_active()`, `discard()` and
+  counters.
+- `get_job_executor` / `stop_job_executor`: Per-loop registry (created on first use).
+
+Operational:
+- Concurrency: Single event loop; all state is touched from the loop only. `admit` and
+  `submit` are synchronous, so a check-then-submit sequence cannot race.
+- Memory: Queued jobs hold only a start callback; no pipeline work (fetching, browser
+  pages, LLM calls) happens until a running slot frees up.
+- Logging: INFO when a job is queued; WARNING on rejection; DEBUG on dequeue/discard.
+
+Usage:
+    executor = get_job_executor()
+    executor.admit(owner)              # may raise JobAdmissionError (→ 429/503)
+    job = create_job(payload, owner_sub=owner)
+    executor.submit(job["id"], owner, lambda: _run_scrape_job(job["id"], payload, user))
+
+Notes:
+- Jobs that can start immediately are never rejected; the limits only bound the backlog.
+- Queued jobs are process-local; on shutdown they are dropped and marked `canceled`
+  in the job store, so clients stop polling them and can resume them later.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from agentic_scraper.backend.api.stores.job_store import update_job
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_JOB_DEQUEUED,
+    MSG_DEBUG_JOB_DISCARDED,
+    MSG_INFO_JOB_EXECUTOR_STOPPED,
+    MSG_INFO_JOB_QUEUED,
+    MSG_JOB_CANCELED_ON_SHUTDOWN,
+    MSG_WARNING_JOB_REJECTED_QUEUE_FULL,
+    MSG_WARNING_JOB_REJECTED_USER_LIMIT,
+)
+from agentic_scraper.backend.config.types import JobStatus
+from agentic_scraper.backend.core.settings import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from agentic_scraper.backend.core.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "JobAdmissionError",
+    "JobExecutor",
+    "get_job_executor",
+    "stop_job_executor",
+]
+
+
+class JobAdmissionError(RuntimeError):
+    """
+    A job submission was rejected because the execution queue is saturated.
+
+    Attributes:
+        per_user (bool): True when the caller's own queued-job limit was hit.
+        limit (int): The limit that was exceeded.
+        retry_after_s (int): Suggested client back-off in seconds.
+    """
+
+    def __init__(self, *, per_user: bool, limit: int, retry_after_s: int) -> None:
+        """Record which limit was exceeded and the retry hint."""
+        super().__init__(f"job queue limit reached (per_user={per_user}, limit={limit})")
+        self.per_user = per_user
+        self.limit = limit
+        self.retry_after_s = retry_after_s
+
+
+@dataclass(frozen=True)
+class _QueuedJob:
+    job_id: str
+    owner: str
+    start: Callable[[], Coroutine[Any, Any, None]]
+
+
+class JobExecutor:
+    """
+    Start scrape jobs up to a running limit and queue the rest in FIFO order.
+
+    Attributes:
+        max_running (int): Jobs executing at once.
+        max_queued (int): Jobs allowed to wait across all users.
+        max_queued_per_user (int): Jobs one owner may have waiting.
+        retry_after_s (int): Back-off hint attached to rejections.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_running: int,
+        max_queued: int,
+        max_queued_per_user: int,
+        retry_after_s: int,
+    ) -> None:
+        """
+        Create an executor.
+
+        Args:
+            max_running (int): Jobs executing at once (at least 1).
+            max_queued (int): Jobs allowed to wait across all users.
+            max_queued_per_user (int): Jobs one owner may have waiting.
+            retry_after_s (int): Back-off hint attached to rejections.
+        """
+        self.max_running = max(1, max_running)
+        self.max_queued = max_queued
+        self.max_queued_per_user = max_queued_per_user
+        self.retry_after_s = retry_after_s
+        self._queue: deque[_QueuedJob] = deque()
+        self._queued_by_owner: Counter[str] = Counter()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._active: dict[str, asyncio.Task[None]] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> JobExecutor:
+        """Build an executor from the `max_*_jobs` / `job_queue_retry_after_s` settings."""
+        return cls(
+            max_running=settings.max_running_jobs,
+            max_queued=settings.max_queued_jobs,
+            max_queued_per_user=settings.max_queued_jobs_per_user,
+            retry_after_s=settings.job_queue_retry_after_s,
+        )
+
+    @property
+    def running(self) -> int:
+        """Number of jobs currently executing."""
+        return len(self._tasks)
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a running slot."""
+        return len(self._queue)
+
+    def position(self, job_id: str) -> int | None:
+        """Return the 1-based queue position of `job_id`, or None if it is not queued."""
+        for idx, entry in enumerate(self._queue, start=1):
+            if entry.job_id == job_id:
+                return idx
+        return None
+
+    def is_active(self, job_id: str) -> bool:
+        """
+        Return True while `job_id` is queued or its run has not finished.
+
+        A canceled job keeps running until its pipeline notices the cancel event, so
+        its stored status is not enough to tell whether it may be started again.
+        """
+        return job_id in self._active or self.position(job_id) is not None
+
+    def admit(self, owner: str) -> None:
+        """
+        Check that a new job for `owner` may be accepted.
+
+        Args:
+            owner (str): Submitting user (`owner_sub`).
+
+        Raises:
+            JobAdmissionError: If the job would have to queue and the owner's or the
+                global queue limit is already reached.
+        """
+        if self.running < self.max_running and not self._queue:
+            return  # starts immediately
+        queued_for_owner = self._queued_by_owner[owner]
+        if queued_for_owner >= self.max_queued_per_user:
+            logger.warning(
+                MSG_WARNING_JOB_REJECTED_USER_LIMIT.format(
+                    owner=owner, queued=queued_for_owner, limit=self.max_queued_per_user
+                )
+            )
+            raise JobAdmissionError(
+                per_user=True, limit=self.max_queued_per_user, retry_after_s=self.retry_after_s
+            )
+        if len(self._queue) >= self.max_queued:
+            logger.warning(
+                MSG_WARNING_JOB_REJECTED_QUEUE_FULL.format(
+                    queued=len(self._queue), limit=self.max_queued
+                )
+            )
+            raise JobAdmissionError(
+                per_user=False, limit=self.max_queued, retry_after_s=self.retry_after_s
+            )
+
+    def submit(
+        self, job_id: str, owner: str, start: Callable[[], Coroutine[Any, Any, None]]
+    ) -> int | None:
+        """
+        Start a job now or append it to the queue.
+
+        Args:
+            job_id (str): Job identifier.
+            owner (str): Owning user (`owner_sub`).
+            start (Callable[[], Coroutine]): Builds the job coroutine; only called when
+                the job actually starts.
+
+        Returns:
+            int | None: Queue position if the job was queued, None if it started.
+        """
+        entry = _QueuedJob(job_id=job_id, owner=owner, start=start)
+        if self.running < self.max_running and not self._queue:
+            self._start(entry)
+            return None
+        self._queue.append(entry)
+        self._queued_by_owner[owner] += 1
+        position = len(self._queue)
+        logger.info(
+            MSG_INFO_JOB_QUEUED.format(job_id=job_id, position=position, running=self.running)
+        )
+        return position
+
+    def discard(self, job_id: str) -> bool:
+        """
+        Remove a queued job (e.g. canceled before it started).
+
+        Args:
+            job_id (str): Job identifier.
+
+        Returns:
+            bool: True if the job was queued and has been removed.
+        """
+        for entry in self._queue:
+            if entry.job_id == job_id:
+                self._queue.remove(entry)
+                self._release_owner(entry.owner)
+                logger.debug(MSG_DEBUG_JOB_DISCARDED.format(job_id=job_id))
+                return True
+        return False
+
+    def clear(self) -> list[str]:
+        """Drop every queued job (running jobs are unaffected) and return their ids."""
+        dropped = [entry.job_id for entry in self._queue]
+        self._queue.clear()
+        self._queued_by_owner.clear()
+        return dropped
+
+    def _start(self, entry: _QueuedJob) -> None:
+        task = asyncio.create_task(entry.start(), name=f"scrape-job-{entry.job_id}")
+        self._tasks.add(task)
+        self._active[entry.job_id] = task
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        job_id = next((jid for jid, t in self._active.items() if t is task), None)
+        if job_id is not None:
+            del self._active[job_id]
+        while self._queue and self.running < self.max_running:
+            entry = self._queue.popleft()
+            self._release_owner(entry.owner)
+            logger.debug(MSG_DEBUG_JOB_DEQUEUED.format(job_id=entry.job_id))
+            self._start(entry)
+
+    def _release_owner(self, owner: str) -> None:
+        self._queued_by_owner[owner] -= 1
+        if self._queued_by_owner[owner] <= 0:
+            del self._queued_by_owner[owner]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-loop registry
+# ─────────────────────────────────────────────────────────────────────────────
+
+_EXECUTORS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, JobExecutor]
+_EXECUTORS = weakref.WeakKeyDictionary()
+
+
+def get_job_executor() -> JobExecutor:
+    """
+    Return the running loop's executor, creating it from settings on first use.
+
+    Returns:
+        JobExecutor: The executor shared by all job submissions on this loop.
+    """
+    loop = asyncio.get_running_loop()
+    executor = _EXECUTORS.get(loop)
+    if executor is None:
+        executor = _EXECUTORS[loop] = JobExecutor.from_settings(get_settings())
+    return executor
+
+
+def stop_job_executor() -> None:
+    """
+    Drop the running loop's executor and its queued jobs (running jobs continue).
+
+    Dropped jobs never start, so they are marked CANCELED instead of staying QUEUED.
+    """
+    executor = _EXECUTORS.pop(asyncio.get_running_loop(), None)
+    if executor is None:
+        return
+    dropped = executor.clear()
+    for job_id in dropped:
+        update_job(
+            job_id,
+            status=JobStatus.CANCELED,
+            error=MSG_JOB_CANCELED_ON_SHUTDOWN.format(job_id=job_id),
+        )
+    logger.info(MSG_INFO_JOB_EXECUTOR_STOPPED.format(dropped=len(dropped)))
@@ -5,6 +5,8 @@ Responsibilities:
 - Resolve runtime configuration and OpenAI credentials for a scrape run.
 - Transition job state safely (RUNNING/SUCCEEDED/FAILED) with terminal guards.
 - Run the scraper pipeline and convert results into API DTOs.
+- Mirror streamed pipeline progress onto the job record while the run is in flight.
+- Keep a per-job checkpoint journal (`checkpoint_dir`) so failed/canceled jobs resume.
 - Emit lightweight debug logs for dynamic fields to aid observability.
 
 Public API:
@@ -28,13 +30,18 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 
-from agentic_scraper.backend.api.models import AuthUser
+from agentic_scraper.backend.api.models import AuthUser, OwnerSub
 from agentic_scraper.backend.api.schemas.scrape import (
     ScrapeCreate,
     ScrapeResultDynamic,
     ScrapeResultFixed,
 )
-from agentic_scraper.backend.api.stores.job_store import get_job, update_job
+from agentic_scraper.backend.api.stores.job_store import (
+    ScrapeJobRecord,
+    get_job,
+    restore_job,
+    update_job,
+)
 from agentic_scraper.backend.api.stores.user_store import load_user_credentials
 from agentic_scraper.backend.config.constants import SCRAPER_CONFIG_FIELDS
 from agentic_scraper.backend.config.messages import (
@@ -51,6 +58,11 @@ from agentic_scraper.backend.config.messages import (
 )
 from agentic_scraper.backend.config.types import AgentMode, JobStatus, OpenAIConfig
 from agentic_scraper.backend.core.settings import Settings, get_settings
+from agentic_scraper.backend.scraper.checkpoint import (
+    CheckpointJournal,
+    checkpoint_path,
+    read_checkpoint_meta,
+)
 from agentic_scraper.backend.scraper.pipeline import PipelineOptions, scrape_with_stats
 
 logger = logging.getLogger(__name__)
@@ -112,8 +124,10 @@ def _resolve_openai_creds_or_fail(
     Resolve OpenAI credentials for this run and enforce prerequisites.
 
     Strategy:
-        - If inline credentials look masked (e.g., "***"), ignore them and fall back
-          to stored credentials.
+        - If inline credentials look masked (e.g., "***") or carry no key, ignore the key
+          and fall back to stored credentials.
+        - Inline `base_url` / `model` (OpenAI-compatible endpoint) are always kept, so a
+          keyless local inference server works without stored credentials.
         - If the selected agent mode requires LLM and no credentials are available,
           mark the job as FAILED and return None.
 
@@ -130,13 +144,24 @@ def _resolve_openai_creds_or_fail(
         None: Errors are handled internally with job updates/logging.
     """
     inline = payload.openai_credentials
+    endpoint_overrides = (
+        inline.model_dump(include={"base_url", "model"}, exclude_none=True) if inline else {}
+    )
     # Ignore obviously masked inline keys to avoid treating UI previews as real secrets.
     if inline and _masked(getattr(inline, "api_key", None)):
         logger.info(MSG_INFO_INLINE_KEY_MASKED_FALLBACK)
         inline = None
+    elif inline and not inline.api_key:
+        inline = None  # endpoint-only override: key comes from stored creds (if any)
 
     needs_llm = payload.agent_mode != AgentMode.RULE_BASED
     creds: OpenAIConfig | None = inline or load_user_credentials(user["sub"])
+    if endpoint_overrides:
+        creds = (
+            creds.model_copy(update=endpoint_overrides)
+            if creds
+            else OpenAIConfig(**endpoint_overrides)
+        )
 
     if needs_llm and not creds:
         update_job(
@@ -168,31 +193,100 @@ def _merge_runtime_settings(payload: ScrapeCreate) -> Settings:
         - Emits a debug log of the merged config values for traceability.
     """
     # Extract only whitelisted fields from the payload to avoid accidental overrides.
-    config_values = payload.model_dump(include=set(SCRAPER_CONFIG_FIELDS))
+    # Unset (None) fields keep the global value, e.g. `openai_model` when the job names a
+    # model via `openai_credentials.model` instead.
+    config_values = payload.model_dump(include=set(SCRAPER_CONFIG_FIELDS), exclude_none=True)
     merged: Settings = settings.model_copy(update=config_values)
     logger.debug(MSG_DEBUG_SCRAPE_CONFIG_MERGED.format(config=config_values))
     return merged
 
 
-async def _run_pipeline_and_build_result(
+def _checkpoints_enabled() -> bool:
+    """Return True when jobs keep checkpoint journals (`checkpoint_dir` is set)."""
+    return bool(settings.checkpoint_dir)
+
+
+def _write_checkpoint_meta(job_id: str, payload: ScrapeCreate, owner_sub: str) -> None:
+    """
+    Start a job's checkpoint journal with what a later resume needs (no-op when disabled).
+
+    Args:
+        job_id (str): The job identifier.
+        payload (ScrapeCreate): The job's request (an inline API key is not persisted).
+        owner_sub (str): The job owner's subject identifier.
+    """
+    if not settings.checkpoint_dir:
+        return
+    request = payload.model_dump(mode="json", exclude={"openai_credentials": {"api_key"}})
+    path = checkpoint_path(settings.checkpoint_dir, job_id)
+    with CheckpointJournal(path, resume=False) as journal:
+        journal.write_meta(job_id=job_id, owner_sub=owner_sub, request=request)
+
+
+def _restore_job_from_checkpoint(job_id: str) -> ScrapeJobRecord | None:
+    """
+    Re-create a job this process lost (e.g. after a restart) from its journal metadata.
+
+    Args:
+        job_id (str): The job identifier.
+
+    Returns:
+        ScrapeJobRecord | None: The restored FAILED job, or None without a usable journal.
+    """
+    if not settings.checkpoint_dir:
+        return None
+    meta = read_checkpoint_meta(checkpoint_path(settings.checkpoint_dir, job_id)) or {}
+    request, owner_sub = meta.get("request"), meta.get("owner_sub")
+    if not isinstance(request, dict) or not isinstance(owner_sub, str):
+        return None
+    return restore_job(job_id, request, OwnerSub(owner_sub))
+
+
+def _discard_checkpoint(job_id: str) -> None:
+    """Delete a finished job's journal (succeeded jobs are never resumed)."""
+    if settings.checkpoint_dir:
+        checkpoint_path(settings.checkpoint_dir, job_id).unlink(missing_ok=True)
+
+
+class _JobProgressHooks:
+    """Pipeline job hooks that record worker progress on the job as items stream in."""
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+
+    def on_progress(self, done: int, total: int) -> None:
+        """Store `done / total` as the job's progress (terminal jobs are left untouched)."""
+        if total > 0:
+            update_job(self.job_id, progress=min(done / total, 1.0))
+
+
+async def _run_pipeline_and_build_result(  # noqa: PLR0913 - job context passed through
     payload: ScrapeCreate,
     merged_settings: Settings,
     creds: OpenAIConfig | None,
     cancel_event: asyncio.Event | None,
     job_id: str,
+    *,
+    owner_sub: str | None = None,
 ) -> tuple[ScrapeResultDynamic | ScrapeResultFixed, bool]:
     """
     Execute the scrape pipeline and adapt the result to the correct API DTO.
 
     Decides between fixed vs. dynamic result envelopes based on `agent_mode`, then
-    logs a minimal debug summary of dynamic extras (first item's keys).
+    logs a minimal debug summary of dynamic extras (first item's keys). Items stream
+    through `scrape_iter` (via `scrape_with_stats`), and job progress is updated as
+    each input finishes, so pollers see the run advance before the result is ready.
+    With `checkpoint_dir` set, finished URLs are journaled and a resumed job only
+    scrapes the URLs its journal does not cover.
 
     Args:
         payload (ScrapeCreate): Validated request payload.
         merged_settings (Settings): Runtime settings (global + overrides).
         creds (OpenAIConfig | None): Resolved OpenAI credentials (may be None for rule-based).
-        cancel_event (asyncio.Event | None): Optional cooperative cancel signal.
-        job_id (str): Job identifier for cancellation checks.
+        cancel_event (asyncio.Event | None): The job's registry cancel event; setting it
+            interrupts in-flight fetches, LLM calls and screenshots.
+        job_id (str): Job identifier (progress updates and checkpoint journal).
+        owner_sub (str | None): Job owner; scopes the cross-job near-duplicate index.
 
     Returns:
         tuple[ScrapeResultDynamic | ScrapeResultFixed, bool]:
@@ -204,26 +298,28 @@ async def _run_pipeline_and_build_result(
                    will transition the job to FAILED as appropriate.
     """
     urls = [str(u) for u in payload.urls]
-
-    # Expose a store-backed should_cancel() to handle cross-process events/races.
-    def _should_cancel() -> bool:
-        j = get_job(job_id)
-        # Fallback: rely on cancel_event if job lookup isn't available
-        if j is None:
-            return bool(cancel_event and cancel_event.is_set())
-        return str(j.get("status", "")).lower() == "canceled"
-
-    items, stats = await scrape_with_stats(
-        urls,
-        settings=merged_settings,
-        openai=creds,
-        options=PipelineOptions(
-            cancel_event=cancel_event,
-            should_cancel=_should_cancel,
-            job_hooks=None,
-        ),
+    journal = (
+        CheckpointJournal(checkpoint_path(merged_settings.checkpoint_dir, job_id), resume=True)
+        if merged_settings.checkpoint_dir
+        else None
     )
 
+    try:
+        items, stats = await scrape_with_stats(
+            urls,
+            settings=merged_settings,
+            openai=creds,
+            options=PipelineOptions(
+                cancel_event=cancel_event,
+                job_hooks=_JobProgressHooks(job_id),
+                checkpoint=journal,
+                owner=owner_sub,
+            ),
+        )
+    finally:
+        if journal is not None:
+            journal.close()
+
     # Construct the correct result envelope based on agent mode.
     result_model: ScrapeResultDynamic | ScrapeResultFixed
     if payload.agent_mode in {AgentMode.LLM_FIXED, AgentMode.RULE_BASED}:
@@ -289,7 +385,7 @@ def _finalize_success_if_not_canceled(
 
     Notes:
         - Does nothing if the job is already CANCELED/SUCCEEDED/FAILED.
-        - Sets progress to 1.0 on success.
+        - Sets progress to 1.0 on success and deletes the job's checkpoint journal.
     """
     current = get_job(job_id)
     if not current:
@@ -307,6 +403,7 @@ def _finalize_success_if_not_canceled(
         updated_at=datetime.now(timezone.utc),
     )
     logger.info(MSG_JOB_SUCCEEDED.format(job_id=job_id))
+    _discard_checkpoint(job_id)
 
 
 def _finalize_failure(job_id: str, e: Exception) -> None:
@@ -60,6 +60,7 @@ from agentic_scraper.backend.config.messages import (
 )
 from agentic_scraper.backend.config.types import (
     AgentMode,
+    FetchRenderMode,
     JobStatus,
     OpenAIConfig,
     OpenAIModel,
@@ -112,6 +113,8 @@ class ScrapeCreate(BaseModel):
         screenshot_enabled (bool): Capture screenshots when available.
         verbose (bool): Enable verbose logging.
         retry_attempts (int): Non-LLM retry attempts.
+        fetch_render_mode (FetchRenderMode | None): Per-job render fetch mode
+            (None keeps the server default).
     """
 
     urls: UrlsType
@@ -133,6 +136,9 @@ class ScrapeCreate(BaseModel):
     screenshot_enabled: bool = False
     verbose: bool = False
     retry_attempts: int = Field(0, ge=0, description="Non-LLM retry attempts.")
+    fetch_render_mode: FetchRenderMode | None = Field(
+        None, description="Render pages in headless Chromium: off, auto (thin pages), always."
+    )
 
     @field_validator("urls", mode="before")
     @classmethod
@@ -179,12 +185,15 @@ class ScrapeCreate(BaseModel):
 
         Notes:
             - `AgentMode.RULE_BASED` does not require any OpenAI model/config.
+            - `openai_credentials.model` (OpenAI-compatible endpoint) satisfies the check.
         """
         # Rule-based mode does not need an OpenAI model.
         if self.agent_mode == AgentMode.RULE_BASED:
             return self
 
-        if self.openai_model is None:
+        # A per-job endpoint model (`openai_credentials.model`) replaces `openai_model`.
+        has_endpoint_model = bool(self.openai_credentials and self.openai_credentials.model)
+        if self.openai_model is None and not has_endpoint_model:
             raise ValueError(
                 MSG_ERROR_MISSING_FIELDS_FOR_AGENT.format(
                     agent_mode=self.agent_mode.value,
@@ -292,6 +301,9 @@ class ScrapeJob(BaseModel):
         default=None, ge=0.0, le=1.0, description="0..1 progress while running."
     )
     error: str | None = Field(default=None, description="Populated when status == 'failed'.")
+    queue_position: int | None = Field(
+        default=None, ge=1, description="1-based position in the job queue while waiting."
+    )
     # NOTE: Order matters if you keep a plain union; consider a discriminator in future.
     result: ScrapeResultDynamic | ScrapeResultFixed | None = Field(
         default=None, description="Present when status == 'succeeded'."
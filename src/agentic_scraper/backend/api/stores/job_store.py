@@ -12,6 +12,8 @@ Public API:
 - `update_job`: Mutate selected fields (status/progress/result/error) with guards.
 - `list_jobs`: Enumerate jobs with optional status/owner filters and cursor pagination.
 - `cancel_job`: Best-effort cancellation for QUEUED/RUNNING jobs.
+- `requeue_job`: Move a FAILED/CANCELED job back to QUEUED (resume).
+- `restore_job`: Re-create a job (as FAILED) from its checkpoint after a restart.
 
 Operational:
 - Concurrency: Thread-safe within a single process via `RLock` (re-entrant).
@@ -49,6 +51,7 @@ from agentic_scraper.backend.config.constants import (
 from agentic_scraper.backend.config.messages import (
     MSG_ERROR_INVALID_JOB_STATUS,
     MSG_JOB_CANCELED_BY_USER,
+    MSG_JOB_INTERRUPTED,
 )
 from agentic_scraper.backend.config.types import JobStatus
 from agentic_scraper.backend.utils.validators import (
@@ -66,6 +69,8 @@ __all__ = [
     "create_job",
     "get_job",
     "list_jobs",
+    "requeue_job",
+    "restore_job",
     "update_job",
 ]
 
@@ -419,3 +424,70 @@ def cancel_job(job_id: str, user_sub: OwnerSub) -> bool:
             return True
 
         return False
+
+
+def requeue_job(job_id: str) -> ScrapeJobRecord | None:
+    """
+    Move a FAILED or CANCELED job back to QUEUED so it can be resumed.
+
+    Clears the previous run's error, result and canceller; progress restarts at 0.0.
+
+    Args:
+        job_id (str): The job identifier.
+
+    Returns:
+        ScrapeJobRecord | None: The requeued snapshot, or None if the job does not exist
+        or is not FAILED/CANCELED.
+    """
+    try:
+        validate_uuid(job_id)
+    except ValueError:
+        return None
+
+    with _LOCK:
+        job = _STORE.get(job_id)
+        if job is None or job["status"] not in {JobStatus.FAILED, JobStatus.CANCELED}:
+            return None
+        job["status"] = JobStatus.QUEUED
+        job["progress"] = 0.0
+        job["error"] = None
+        job["result"] = None
+        job["canceled_by"] = None
+        job["updated_at"] = _utcnow()
+        return _job_snapshot(job)
+
+
+def restore_job(job_id: str, request_payload: JobRequest, owner_sub: OwnerSub) -> ScrapeJobRecord:
+    """
+    Re-create a job this process does not know (e.g. after a restart) in FAILED state.
+
+    Used to resume a job from its checkpoint journal: its run was lost with the previous
+    process, so it is recorded as failed and can then go through `requeue_job`. An
+    existing record is returned unchanged.
+
+    Args:
+        job_id (str): The original job identifier.
+        request_payload (dict[str, object]): The job's original request.
+        owner_sub (OwnerSub): The job owner's subject identifier.
+
+    Returns:
+        ScrapeJobRecord: Snapshot of the restored (or existing) job.
+    """
+    now = _utcnow()
+    with _LOCK:
+        job = _STORE.setdefault(
+            job_id,
+            {
+                "id": job_id,
+                "status": JobStatus.FAILED,
+                "owner_sub": owner_sub,
+                "created_at": now,
+                "updated_at": now,
+                "progress": 0.0,
+                "error": MSG_JOB_INTERRUPTED,
+                "result": None,
+                "_request": deepcopy(request_payload),
+                "canceled_by": None,
+            },
+        )
+        return _job_snapshot(job)
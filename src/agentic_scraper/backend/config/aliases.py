@@ -11,6 +11,7 @@ from agentic_scraper.backend.scraper.schemas import ScrapedItem
 ScrapeInput: TypeAlias = tuple[str, str]
 OnSuccessCallback: TypeAlias = Callable[[ScrapedItem], None]
 OnErrorCallback: TypeAlias = Callable[[str, Exception], None]
+OnInputDoneCallback: TypeAlias = Callable[[str, ScrapedItem | None], None]
 
 ScrapeResultWithSkipCount: TypeAlias = tuple[list[ScrapedItem], int]
 
@@ -16,6 +16,7 @@ SCRAPER_CONFIG_FIELDS = [
     "agent_mode",
     "retry_attempts",
     "llm_schema_retries",
+    "fetch_render_mode",
 ]
 
 # ---------------------------------------------------------------------
@@ -70,6 +71,42 @@ DEFAULT_ENV: str = Environment.DEV.value
 # === Screenshot Toggle ===
 DEFAULT_SCREENSHOT_ENABLED = True
 
+# === Screenshot browser pool ===
+DEFAULT_BROWSER_POOL_ENABLED = True
+DEFAULT_BROWSER_POOL_SIZE = 1
+MIN_BROWSER_POOL_SIZE = 1
+MAX_BROWSER_POOL_SIZE = 8
+DEFAULT_BROWSER_POOL_MAX_PAGES = 4
+MIN_BROWSER_POOL_MAX_PAGES = 1
+MAX_BROWSER_POOL_MAX_PAGES = 64
+DEFAULT_BROWSER_POOL_RECYCLE_AFTER = 100
+MIN_BROWSER_POOL_RECYCLE_AFTER = 1
+MAX_BROWSER_POOL_RECYCLE_AFTER = 10_000
+
+# === Screenshot stage (decoupled from extraction workers) ===
+DEFAULT_SCREENSHOT_STAGE_ENABLED = True
+DEFAULT_SCREENSHOT_CONCURRENCY = 2
+MIN_SCREENSHOT_CONCURRENCY = 1
+MAX_SCREENSHOT_CONCURRENCY = 32
+DEFAULT_SCREENSHOT_TIMEOUT_S = 20.0
+MIN_SCREENSHOT_TIMEOUT_S = 1.0
+MAX_SCREENSHOT_TIMEOUT_S = 300.0
+
+# === Screenshot output & cache ===
+DEFAULT_SCREENSHOT_QUALITY = 80  # JPEG/WebP only
+MIN_SCREENSHOT_QUALITY = 1
+MAX_SCREENSHOT_QUALITY = 100
+DEFAULT_SCREENSHOT_FULL_PAGE = True
+DEFAULT_SCREENSHOT_MAX_HEIGHT = 0  # px; 0 = no cap
+MIN_SCREENSHOT_MAX_HEIGHT = 0
+MAX_SCREENSHOT_MAX_HEIGHT = 50_000
+DEFAULT_SCREENSHOT_THUMBNAIL_WIDTH = 0  # px; 0 = no thumbnail
+MIN_SCREENSHOT_THUMBNAIL_WIDTH = 0
+MAX_SCREENSHOT_THUMBNAIL_WIDTH = 1280
+DEFAULT_SCREENSHOT_CACHE_TTL_S = 86_400.0  # 0 = always recapture
+MIN_SCREENSHOT_CACHE_TTL_S = 0.0
+MAX_SCREENSHOT_CACHE_TTL_S = 30 * 86_400.0
+
 # === OpenAI Models ===
 VALID_OPENAI_MODELS = {model.value for model in OpenAIModel}
 DEFAULT_OPENAI_MODEL: str = OpenAIModel.GPT_3_5.value
@@ -122,6 +159,124 @@ DEFAULT_LLM_CONCURRENCY = 5
 MIN_LLM_CONCURRENCY = 1
 MAX_LLM_CONCURRENCY = 10
 
+# Worker-pool input queue bound (backpressure); 0 = unbounded
+DEFAULT_MAX_QUEUE_SIZE = 256
+MIN_MAX_QUEUE_SIZE = 0
+MAX_MAX_QUEUE_SIZE = 100_000
+
+# Process-backed extraction for rule-based runs (WORKER_POOL_MODE=process)
+DEFAULT_PROCESS_POOL_WORKERS = 0  # 0 = os.cpu_count()
+MIN_PROCESS_POOL_WORKERS = 0
+MAX_PROCESS_POOL_WORKERS = 128
+DEFAULT_PROCESS_POOL_CHUNK_SIZE = 32
+MIN_PROCESS_POOL_CHUNK_SIZE = 1
+MAX_PROCESS_POOL_CHUNK_SIZE = 1000
+
+# Memory budget for fetched-but-unprocessed pages (0 = unlimited, staged pipeline)
+DEFAULT_MEMORY_BUDGET_MB = 0
+MIN_MEMORY_BUDGET_MB = 0
+MAX_MEMORY_BUDGET_MB = 65536
+DEFAULT_MEMORY_BUDGET_COMPRESS = False
+
+# === Global fair scheduler (API: limits shared by all concurrent jobs) ===
+DEFAULT_SCHEDULER_ENABLED = True
+DEFAULT_SCHEDULER_FETCH_CONCURRENCY = 32
+MIN_SCHEDULER_FETCH_CONCURRENCY = 1
+MAX_SCHEDULER_FETCH_CONCURRENCY = 1000
+DEFAULT_SCHEDULER_LLM_CONCURRENCY = 16
+MIN_SCHEDULER_LLM_CONCURRENCY = 1
+MAX_SCHEDULER_LLM_CONCURRENCY = 500
+
+# === Job admission (API: bounded execution queue for POST /scrapes) ===
+DEFAULT_MAX_RUNNING_JOBS = 4
+MIN_MAX_RUNNING_JOBS = 1
+MAX_MAX_RUNNING_JOBS = 256
+DEFAULT_MAX_QUEUED_JOBS = 100
+MIN_MAX_QUEUED_JOBS = 0
+MAX_MAX_QUEUED_JOBS = 10_000
+DEFAULT_MAX_QUEUED_JOBS_PER_USER = 10
+MIN_MAX_QUEUED_JOBS_PER_USER = 0
+MAX_MAX_QUEUED_JOBS_PER_USER = 1000
+DEFAULT_JOB_QUEUE_RETRY_AFTER_S = 30
+MIN_JOB_QUEUE_RETRY_AFTER_S = 1
+MAX_JOB_QUEUE_RETRY_AFTER_S = 3600
+
+# === Multi-page LLM batching ===
+DEFAULT_LLM_BATCH_ENABLED = False
+DEFAULT_LLM_BATCH_MAX_ITEMS = 8
+MIN_LLM_BATCH_MAX_ITEMS = 2
+MAX_LLM_BATCH_MAX_ITEMS = 20
+DEFAULT_LLM_BATCH_TOKEN_BUDGET = 3000
+MIN_LLM_BATCH_TOKEN_BUDGET = 256
+MAX_LLM_BATCH_TOKEN_BUDGET = 16000
+DEFAULT_LLM_BATCH_PAGE_MAX_TOKENS = 400
+MIN_LLM_BATCH_PAGE_MAX_TOKENS = 16
+MAX_LLM_BATCH_PAGE_MAX_TOKENS = 4000
+
+# === Distributed work queue (run_batch.py --workers) ===
+DEFAULT_WORK_QUEUE_PATH = "./.cache/work_queue.sqlite3"
+DEFAULT_WORK_QUEUE_CHUNK_SIZE = 50
+MIN_WORK_QUEUE_CHUNK_SIZE = 1
+MAX_WORK_QUEUE_CHUNK_SIZE = 10_000
+DEFAULT_WORK_QUEUE_LEASE_S = 120.0
+MIN_WORK_QUEUE_LEASE_S = 1.0
+MAX_WORK_QUEUE_LEASE_S = 86_400.0
+DEFAULT_WORK_QUEUE_MAX_ATTEMPTS = 3
+MIN_WORK_QUEUE_MAX_ATTEMPTS = 1
+MAX_WORK_QUEUE_MAX_ATTEMPTS = 100
+DEFAULT_WORK_QUEUE_POLL_INTERVAL_S = 1.0
+MIN_WORK_QUEUE_POLL_INTERVAL_S = 0.01
+MAX_WORK_QUEUE_POLL_INTERVAL_S = 60.0
+
+# === Near-duplicate reuse ===
+DEFAULT_NEAR_DUP_ENABLED = False
+DEFAULT_NEAR_DUP_MAX_DISTANCE = 3
+MIN_NEAR_DUP_MAX_DISTANCE = 0
+MAX_NEAR_DUP_MAX_DISTANCE = 16
+
+# === Per-request model routing ===
+DEFAULT_MODEL_ROUTING_ENABLED = False
+DEFAULT_MODEL_ROUTING_LONG_MODEL = OpenAIModel.GPT_4O
+DEFAULT_MODEL_ROUTING_ESCALATION_MODEL = OpenAIModel.GPT_4O
+DEFAULT_MODEL_ROUTING_LONG_PAGE_TOKENS = 3000
+MIN_MODEL_ROUTING_LONG_PAGE_TOKENS = 256
+MAX_MODEL_ROUTING_LONG_PAGE_TOKENS = 128_000
+DEFAULT_MODEL_ROUTING_MAX_FAILURE_RATE = 0.5
+
+# === LLM fallback chain / circuit breaker ===
+DEFAULT_LLM_CIRCUIT_FAILURE_THRESHOLD = 3
+MIN_LLM_CIRCUIT_FAILURE_THRESHOLD = 1
+MAX_LLM_CIRCUIT_FAILURE_THRESHOLD = 100
+DEFAULT_LLM_CIRCUIT_COOLDOWN_S = 60.0
+
+# === Hedged LLM requests & per-stage timeouts (0 = no stage timeout) ===
+DEFAULT_LLM_HEDGE_ENABLED = False
+DEFAULT_LLM_HEDGE_QUANTILE = 0.9
+MIN_LLM_HEDGE_QUANTILE = 0.5
+MAX_LLM_HEDGE_QUANTILE = 0.99
+DEFAULT_FETCH_TIMEOUT_S = 0.0
+DEFAULT_PARSE_TIMEOUT_S = 0.0
+DEFAULT_LLM_TIMEOUT_S = 0.0
+MIN_STAGE_TIMEOUT_S = 0.0
+MAX_STAGE_TIMEOUT_S = 600.0
+
+# === OpenAI-compatible endpoints (local inference servers) ===
+DEFAULT_LLM_ENDPOINT_HEALTH_CHECK = True
+MIN_LLM_ENDPOINT_CONCURRENCY = 0  # 0 / unset → unlimited
+MAX_LLM_ENDPOINT_CONCURRENCY = 256
+
+# === Soft-404 / error-page classification ===
+DEFAULT_PAGE_CLASSIFIER_ENABLED = False
+DEFAULT_PAGE_MIN_TEXT_CHARS = 200
+MIN_PAGE_MIN_TEXT_CHARS = 0
+MAX_PAGE_MIN_TEXT_CHARS = 10_000
+
+# === Headless-render fetch (JavaScript-heavy pages) ===
+DEFAULT_RENDER_MIN_TEXT_CHARS = 200  # auto mode renders pages with less main text
+MIN_RENDER_MIN_TEXT_CHARS = 1
+MAX_RENDER_MIN_TEXT_CHARS = 10_000
+DEFAULT_RENDER_BLOCK_RESOURCES = True
+
 # === Logging ===
 DEFAULT_LOG_MAX_BYTES = 1_000_000
 DEFAULT_LOG_BACKUP_COUNT = 5
@@ -183,6 +338,117 @@ FIELD_SYNONYMS: dict[str, str] = {
     "posted_by": "author",
 }
 
+# rule_engine.py
+RULE_ENGINE_CHUNK_SIZE = 500  # texts per process-pool task (amortizes pickling)
+RULE_ENGINE_PARALLEL_MIN_TEXTS = 2000  # below this, process start-up outweighs the gain
+
+# bulk_extract.py / bulk_backends.py
+DEFAULT_BULK_WORK_DIR = "./.cache/bulk"
+DEFAULT_BULK_POLL_INTERVAL_S = 30.0
+MIN_BULK_POLL_INTERVAL_S = 0.01
+DEFAULT_BULK_TIMEOUT_S = 86_400.0  # provider completion window is 24h
+BULK_ENDPOINT = "/v1/chat/completions"
+BULK_COMPLETION_WINDOW = "24h"
+BULK_REQUESTS_FILENAME = "requests.jsonl"
+BULK_MANIFEST_FILENAME = "manifest.json"
+BULK_OUTPUT_FILENAME = "output.jsonl"
+
+# near_dup.py
+SIMHASH_BITS = 64
+SIMHASH_SHINGLE_SIZE = 3  # words per shingle
+NEAR_DUP_MIN_TOKENS = 20  # shorter texts carry too little signal to fingerprint safely
+NEAR_DUP_INDEX_MAX_ENTRIES = 10_000  # oldest entries are dropped beyond this
+
+# page_classifier.py
+# Phrases (in the body or <title>) only count on short pages: long articles may mention them
+# in passing, and titles like "Error handling in Python" are legitimate.
+PAGE_CLASSIFIER_MAX_ERROR_TEXT_CHARS = 1500
+PAGE_CLASSIFIER_DUPLICATE_MIN_PAGES = 3  # same text on this many URLs of one host → template
+SOFT_404_PHRASES: tuple[str, ...] = (
+    "page not found",
+    "404 not found",
+    "error 404",
+    "this page does not exist",
+    "this page doesn't exist",
+    "the page you requested could not be found",
+    "we couldn't find the page",
+    "we can't find the page",
+    "no longer available",
+)
+LOGIN_WALL_PHRASES: tuple[str, ...] = (
+    "sign in to continue",
+    "log in to continue",
+    "login to continue",
+    "please sign in",
+    "please log in",
+    "you must be logged in",
+    "subscribe to continue reading",
+)
+BOT_CHALLENGE_PHRASES: tuple[str, ...] = (
+    "checking your browser",
+    "verify you are human",
+    "verify you are a human",
+    "enable javascript and cookies to continue",
+    "complete the captcha",
+    "are you a robot",
+    "unusual traffic from your computer",
+    "access denied",
+)
+SOFT_404_TITLE_PATTERN = r"\b(404|not found)\b"
+
+# model_router.py
+MODEL_ROUTING_MIN_SAMPLES = 5  # outcomes needed before a failure rate is trusted
+MODEL_ROUTING_MIN_FIELD_SCORE = 3.0  # items scoring below this (field weights) are escalated
+
+# llm_fallback.py
+HTTP_SERVER_ERROR_MIN_STATUS = 500  # 5xx responses count as provider failures
+
+# screenshotter.py / browser_pool.py
+SCREENSHOT_VIEWPORT_WIDTH = 1280
+SCREENSHOT_VIEWPORT_HEIGHT = 800
+SCREENSHOT_NAV_TIMEOUT_MS = 15_000
+SCREENSHOT_URL_HASH_BYTES = 4  # 8 hex chars in filenames
+SCREENSHOT_CONTENT_HASH_BYTES = 6  # 12 hex chars in filenames
+SCREENSHOT_THUMBNAIL_SUFFIX = ".thumb"
+
+# renderer.py
+RENDER_NAV_TIMEOUT_MS = 20_000
+RENDER_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# A screenshot from the same navigation needs images (and fonts) to look right.
+RENDER_BLOCKED_RESOURCE_TYPES_WITH_SCREENSHOT = frozenset({"media"})
+
+# llm_endpoint.py
+LLM_ENDPOINT_HEALTH_TIMEOUT_S = 5.0
+LLM_ENDPOINT_HEALTH_TTL_S = 30.0  # cached probe result lifetime
+LLM_ENDPOINT_PLACEHOLDER_API_KEY = "not-needed"  # local servers ignore it
+
+# llm_hedge.py
+LLM_HEDGE_MIN_SAMPLES = 20  # completed calls per target before hedging starts
+LLM_HEDGE_WINDOW_SIZE = 200  # recent latencies kept per target
+
+# memory_budget.py
+MEMORY_BUDGET_COMPRESS_LEVEL = 1  # zlib level for queued page text (fastest)
+BYTES_PER_MB = 1024 * 1024
+
+# checkpoint.py / pipeline.py
+CHECKPOINT_NO_ITEM_REASON = "NoItem: extraction returned no item"  # journaled None outcomes
+
+# work_queue.py / distributed.py
+WORK_QUEUE_HEARTBEAT_FRACTION = 1 / 3  # a held lease is renewed this often (x lease)
+WORK_QUEUE_SQLITE_BUSY_TIMEOUT_S = 30.0  # wait for another process's write lock
+
+# pool_schedule.py
+DOMAIN_LATENCY_EWMA_ALPHA = 0.3  # weight of the newest sample in per-domain averages
+DOMAIN_LATENCY_MAX_DOMAINS = 1024  # least recently updated domains are forgotten first
+DOMAIN_LATENCY_CHARS_UNIT = 1000  # latencies are tracked as seconds per 1k chars
+
+# scheduler.py
+SCHEDULER_ANONYMOUS_TENANT = "-"  # owner/job key for work outside any job
+
+# llm_batch.py
+CHARS_PER_TOKEN_ESTIMATE = 4  # coarse heuristic; good enough for budget packing
+LLM_BATCH_LINGER_SECONDS = 0.05  # how long a partial batch waits for more short pages
+
 
 # ---------------------------------------------------------------------
 # api/auth/
@@ -302,6 +302,21 @@ MSG_HTTP_JOB_NOT_CANCELABLE = (
 )
 MSG_JOB_CANCELED_BY_USER = "[API] [ROUTE] [SCRAPE] Job canceled: {job_id}, by user: {user_sub}"
 MSG_HTTP_LOCATION_HEADER_SET = "[API] [ROUTE] [SCRAPE] Location header set for scrape job: {url}"
+MSG_HTTP_TOO_MANY_QUEUED_JOBS = (
+    "Too many queued scrape jobs for this user (limit {limit}); retry later."
+)
+MSG_HTTP_JOB_QUEUE_FULL = "The scrape job queue is full; retry later."
+MSG_HTTP_JOB_NOT_RESUMABLE = (
+    "[API] [ROUTE] [SCRAPE] Job cannot be resumed in its current status: {status}."
+)
+MSG_HTTP_JOB_STILL_STOPPING = (
+    "[API] [ROUTE] [SCRAPE] Job {job_id} is still stopping its previous run; retry shortly."
+)
+MSG_HTTP_CHECKPOINTS_DISABLED = (
+    "[API] [ROUTE] [SCRAPE] Job checkpoints are disabled (set CHECKPOINT_DIR to resume jobs)."
+)
+MSG_JOB_RESUMED = "[API] [ROUTE] [SCRAPE] Job resumed from checkpoint: {job_id}"
+MSG_JOB_INTERRUPTED = "Job was interrupted by a server restart; resume it to continue."
 MSG_INFO_INLINE_KEY_MASKED_FALLBACK = (
     "[API] [ROUTE] [SCRAPE] Inline OpenAI key appears masked; falling back to stored credentials."
 )
@@ -336,6 +351,25 @@ MSG_JOB_SKIP_MARK_FAILED_TERMINAL = (
     "[API] [ROUTE] [SCRAPE] Job {job_id} already terminal ({status}); skipping FAILED."
 )
 
+# routes/scrape_executor.py
+MSG_INFO_JOB_QUEUED = (
+    "[API] [ROUTE] [SCRAPE] job queued: {job_id} (position {position}, {running} running)"
+)
+MSG_DEBUG_JOB_DEQUEUED = "[API] [ROUTE] [SCRAPE] job dequeued: {job_id}"
+MSG_DEBUG_JOB_DISCARDED = "[API] [ROUTE] [SCRAPE] queued job discarded: {job_id}"
+MSG_WARNING_JOB_REJECTED_USER_LIMIT = (
+    "[API] [ROUTE] [SCRAPE] job rejected for {owner}: {queued} already queued (limit {limit})"
+)
+MSG_WARNING_JOB_REJECTED_QUEUE_FULL = (
+    "[API] [ROUTE] [SCRAPE] job rejected: queue full ({queued} queued, limit {limit})"
+)
+MSG_INFO_JOB_EXECUTOR_STOPPED = (
+    "[API] [ROUTE] [SCRAPE] job executor stopped ({dropped} queued jobs dropped)"
+)
+MSG_JOB_CANCELED_ON_SHUTDOWN = (
+    "[API] [ROUTE] [SCRAPE] Job canceled: {job_id}, dropped from the queue on shutdown"
+)
+
 # schemas/scrape.py
 MSG_ERROR_URLS_MUST_BE_LIST = "urls must be a list of URLs"
 
@@ -383,6 +417,10 @@ MSG_ERROR_UNREACHABLE_FETCH_URL = (
 MSG_DEBUG_RETRYING_URL = "[FETCHER] Retrying {url} (attempt {no}): previous failure was {exc!r}"
 MSG_ERROR_UNEXPECTED_FETCH_EXCEPTION = "[FETCHER] Unexpected exception while fetching {url}"
 
+# renderer.py
+MSG_INFO_RENDER_COMPLETE = "[RENDER] Rendered {rendered} of {total} page(s) in Chromium"
+MSG_WARNING_RENDER_FAILED = "[RENDER] Headless render failed for {url}"
+
 
 # models.py
 MSG_ERROR_EMPTY_STRING = "Field '{field}' must not be empty or whitespace."
@@ -403,6 +441,34 @@ MSG_INFO_WORKER_POOL_START = "[SCREENSHOT] Running worker pool with screenshots
 MSG_ERROR_SCREENSHOT_FAILED = "[SCREENSHOT] Failed to capture screenshot: {url}"
 MSG_INFO_SCREENSHOT_SAVED = "[SCREENSHOT] Screenshot saved to {path}"
 MSG_ERROR_INVALID_SCREENSHOT_URL = "[SCREENSHOT] Invalid URL passed to capture_screenshot: {url}"
+MSG_DEBUG_SCREENSHOT_CACHE_HIT = "[SCREENSHOT] Cache hit, skipping capture: {path}"
+MSG_WARNING_SCREENSHOT_THUMBNAIL_FAILED = "[SCREENSHOT] Thumbnail generation failed for {path}"
+
+# browser_pool.py
+MSG_INFO_BROWSER_POOL_STARTED = (
+    "[SCREENSHOT] Browser pool started (browsers={size}, max_pages={max_pages})"
+)
+MSG_DEBUG_BROWSER_LAUNCHED = "[SCREENSHOT] Launched pooled browser #{count}"
+MSG_INFO_BROWSER_RECYCLED = "[SCREENSHOT] Recycled pooled browser after {pages} pages"
+MSG_INFO_BROWSER_POOL_CLOSED = "[SCREENSHOT] Browser pool closed ({launched} browsers launched)"
+
+# scheduler.py
+MSG_INFO_SCHEDULER_STARTED = (
+    "[SCHEDULER] Global fair scheduler started (fetch={fetch}, llm={llm} slots)"
+)
+MSG_INFO_SCHEDULER_STOPPED = "[SCHEDULER] Global fair scheduler stopped ({granted} slots granted)"
+
+# process_pool.py
+MSG_INFO_PROCESS_POOL_STARTED = "[POOL] Extraction process pool started ({processes} processes)"
+MSG_WARNING_PROCESS_POOL_CHUNK_TIMEOUT = (
+    "[POOL] Extraction chunk exceeded {timeout}s; terminating the process pool"
+)
+
+# screenshot_stage.py
+MSG_WARNING_SCREENSHOT_TIMEOUT = "[SCREENSHOT] Capture timed out after {timeout}s: {url}"
+MSG_DEBUG_SCREENSHOT_STAGE_DONE = (
+    "[SCREENSHOT] Stage closed (captured={captured}, failed={failed}, timed_out={timed_out})"
+)
 
 
 # worker_pool.py
@@ -422,6 +488,9 @@ MSG_DEBUG_WORKER_CANCELLED = WORKER_ID_PREFIX + "Cancelled during shutdown."
 
 MSG_DEBUG_POOL_ENQUEUED_URL = WORKER_PREFIX + "Enqueued URL: {url}"
 MSG_DEBUG_POOL_SPAWNED_WORKERS = WORKER_PREFIX + "Spawned {count} workers."
+MSG_DEBUG_POOL_PROCESS_MODE = (
+    WORKER_PREFIX + "Process mode: {processes} extraction processes, chunks of {chunk_size}."
+)
 MSG_DEBUG_POOL_CANCELLING_WORKERS = WORKER_PREFIX + "All tasks completed. Cancelling workers..."
 MSG_DEBUG_POOL_DONE = WORKER_PREFIX + "Worker pool finished. Total results: {count} in {time:.2f}s"
 
@@ -445,6 +514,7 @@ MSG_WARNING_ON_ITEM_CALLBACK_FAILED = (
 
 MSG_WARNING_ON_ITEM_PROCESSED_FAILED = WORKER_PREFIX + "on_item_processed callback failed: {error}"
 MSG_WARNING_ON_ERROR_CALLBACK_FAILED = WORKER_PREFIX + "on_error callback failed: {error}"
+MSG_WARNING_ON_INPUT_DONE_FAILED = WORKER_PREFIX + "on_input_done callback failed: {error}"
 
 
 # pipeline.py
@@ -454,6 +524,14 @@ MSG_DEBUG_SCRAPE_STATS_START = (
 )
 
 MSG_INFO_FETCH_COMPLETE = "[PIPELINE] Fetched HTML for {count} URLs"
+MSG_WARNING_PARSE_TIMEOUT = "[PIPELINE] Parsing {url} took longer than {timeout}s; page skipped"
+MSG_INFO_MEMORY_BUDGET_STREAMING = (
+    "[PIPELINE] Memory budget {mb} MB: streaming fetched pages into the worker pool "
+    "(compress={compress})"
+)
+MSG_WARNING_MEMORY_BUDGET_IGNORED = (
+    "[PIPELINE] Memory budget ignored: {stage} needs the whole batch before extraction"
+)
 
 MSG_INFO_VALID_SCRAPE_INPUTS = (
     "[PIPELINE] Prepared {valid} valid scrape inputs ({skipped} skipped due to fetch errors)"
@@ -470,6 +548,66 @@ MSG_DEBUG_PIPELINE_WORKER_POOL_START = (
 
 MSG_DEBUG_PIPELINE_FETCH_START = "[PIPELINE] Starting HTML fetch for {count} URLs..."
 
+# bulk_extract.py / bulk_backends.py
+MSG_INFO_BULK_REQUESTS_WRITTEN = "[BULK] Wrote {count} bulk requests to {path}"
+MSG_INFO_BULK_SUBMITTED = "[BULK] Submitted bulk job {batch_id} ({count} requests)"
+MSG_DEBUG_BULK_STATUS = "[BULK] Bulk job {batch_id} status: {status}"
+MSG_INFO_BULK_MERGED = (
+    "[BULK] Bulk job {batch_id} merged: {valid} valid items, {failed} failed of {total}"
+)
+MSG_WARNING_BULK_RESULT_ERROR = "[BULK] Bulk request {custom_id} for {url} failed: {error}"
+MSG_WARNING_BULK_UNKNOWN_CUSTOM_ID = (
+    "[BULK] Ignoring bulk result with unknown custom_id {custom_id}"
+)
+MSG_ERROR_BULK_REQUIRES_LLM_MODE = (
+    "[BULK] Bulk extraction requires an LLM agent mode; got agent_mode={agent_mode}"
+)
+MSG_ERROR_BULK_JOB_NOT_COMPLETED = "[BULK] Bulk job {batch_id} ended with status {status}"
+MSG_ERROR_BULK_JOB_TIMEOUT = "[BULK] Bulk job {batch_id} did not finish within {timeout}s"
+MSG_ERROR_BULK_UNKNOWN_BATCH = "[BULK] Unknown bulk job id: {batch_id}"
+MSG_ERROR_BULK_NO_OUTPUT = "[BULK] Bulk job {batch_id} has no output file"
+
+# near_dup.py
+MSG_INFO_NEAR_DUP_PLANNED = (
+    "[NEAR_DUP] {total} pages → {representatives} to extract "
+    "({reused} reused within job, {index_hits} from index)"
+)
+MSG_DEBUG_NEAR_DUP_MATCH = "[NEAR_DUP] {url} reuses {source} (distance={distance})"
+MSG_WARNING_NEAR_DUP_INDEX_LOAD_FAILED = (
+    "[NEAR_DUP] Could not load near-duplicate index from {path}: {error}"
+)
+MSG_WARNING_NEAR_DUP_INDEX_SAVE_FAILED = (
+    "[NEAR_DUP] Could not save near-duplicate index to {path}: {error}"
+)
+
+# checkpoint.py
+MSG_INFO_CHECKPOINT_RESUMED = (
+    "[CHECKPOINT] Resuming from {path}: {done} URLs already finished, {pending} pending"
+)
+MSG_WARNING_CHECKPOINT_LINE_SKIPPED = "[CHECKPOINT] Skipping unreadable line {line} of {path}"
+
+# work_queue.py / distributed.py
+MSG_INFO_WORK_QUEUE_ENQUEUED = (
+    "[WORK_QUEUE] Batch {batch_id}: queued {urls} URLs in {chunks} chunks at {path}"
+)
+MSG_DEBUG_WORK_QUEUE_CLAIMED = (
+    "[WORK_QUEUE] Worker {worker_id} leased chunk {chunk_id} ({urls} URLs, attempt {attempt})"
+)
+MSG_WARNING_WORK_QUEUE_LEASE_LOST = (
+    "[WORK_QUEUE] Worker {worker_id} lost the lease on chunk {chunk_id}; result discarded"
+)
+MSG_WARNING_WORK_QUEUE_CHUNK_FAILED = (
+    "[WORK_QUEUE] Worker {worker_id} failed chunk {chunk_id} (attempt {attempt}): {error}"
+)
+MSG_WARNING_WORK_QUEUE_STOPPED = (
+    "[WORK_QUEUE] Batch {batch_id} stopped with {pending} chunks unfinished (no live workers)"
+)
+
+# page_classifier.py
+MSG_INFO_PAGE_REJECTED = "[CLASSIFIER] Skipping {url}: {reason}"
+MSG_ERROR_PAGE_REJECTED = "Page rejected before extraction: {reason}"
+MSG_INFO_PAGES_REJECTED_SUMMARY = "[CLASSIFIER] Rejected {rejected} of {total} pages: {by_reason}"
+
 # In backend/config/messages.py
 
 MSG_DEBUG_JOB_HOOK_ON_STARTED_ERROR = "job_hooks.on_started raised an exception; ignoring."
@@ -488,6 +626,43 @@ MSG_DEBUG_AGENT_DISPATCH_START = (
 )
 MSG_DEBUG_AGENT_SELECTED = "[AGENT] Using {mode} extraction agent"
 
+# llm_fallback.py
+MSG_WARNING_LLM_FALLBACK = "[AGENT] [LLM] {target} failed ({error}); falling back to {next}"
+MSG_WARNING_LLM_CIRCUIT_OPENED = (
+    "[AGENT] [LLM] Circuit opened for {target}; skipping it for {cooldown:.0f}s"
+)
+MSG_DEBUG_LLM_FALLBACK_SKIPPED_OPEN = "[AGENT] [LLM] Skipping {target}: circuit open"
+MSG_WARNING_LLM_FALLBACK_KEY_MISSING = (
+    "[AGENT] [LLM] Fallback entry skipped: API key variable {env} is not set"
+)
+
+# llm_hedge.py
+MSG_DEBUG_LLM_HEDGE_ISSUED = (
+    "[AGENT] [LLM] [HEDGE] {target}: no response after {delay:.2f}s; sending a hedge request"
+)
+MSG_DEBUG_LLM_HEDGE_WON = (
+    "[AGENT] [LLM] [HEDGE] {target}: hedge won ({elapsed:.2f}s after the primary started)"
+)
+MSG_DEBUG_LLM_HEDGE_SKIPPED_BUSY = (
+    "[AGENT] [LLM] [HEDGE] {target}: slow primary, but no free slot; not hedging"
+)
+
+# llm_endpoint.py
+MSG_ERROR_LLM_BASE_URL_NOT_ALLOWED = (
+    "LLM base URL {base_url!r} is not allowed; add it to LLM_ALLOWED_BASE_URLS"
+)
+MSG_ERROR_LLM_ENDPOINT_UNHEALTHY = "LLM endpoint {base_url} failed its health check"
+MSG_INFO_LLM_ENDPOINT_HEALTHY = "[AGENT] [LLM] Endpoint {base_url} is healthy"
+
+# model_router.py
+MSG_DEBUG_MODEL_ROUTED = (
+    "[AGENT] [ROUTER] [{url}] model={model} reason={reason} tokens~{tokens} page={page_type}"
+)
+MSG_INFO_MODEL_ESCALATED = (
+    "[AGENT] [ROUTER] [{url}] {model} produced invalid or low-score output; "
+    "retrying with {escalation}"
+)
+
 
 # agent_helpers.py
 MSG_DEBUG_LLM_JSON_DUMP_SAVED = "[AGENT] Full LLM JSON output saved to {path}"
@@ -530,6 +705,9 @@ MSG_ERROR_MASKED_OPENAI_API_KEY = (
 MSG_DEBUG_LLM_JSON_REPAIRED = (
     "[AGENT] [LLM] [{url}]LLM output repaired and parsed after JSONDecodeError"
 )
+MSG_WARNING_LLM_JSON_TRUNCATED = (
+    "[AGENT] [LLM] [{url}] LLM output was truncated; recovered {fields} complete field(s)"
+)
 
 # field_utils.py
 MSG_DEBUG_UNAVAILABLE_FIELDS_DETECTED = "Unavailable fields detected in raw data: {fields}"
@@ -644,6 +822,26 @@ MSG_DEBUG_PROMPT_FALLBACK_MODE = (
 )
 
 
+# llm_batch.py
+MSG_DEBUG_LLM_BATCH_SENT = (
+    "[AGENT] [LLM] [BATCH] Sending {count} short pages in one call (~{tokens} tokens)"
+)
+MSG_DEBUG_LLM_BATCH_SPLIT = (
+    "[AGENT] [LLM] [BATCH] Batch of {count} returned {valid} valid items; "
+    "{fallback} falling back to single-page calls"
+)
+MSG_WARNING_LLM_BATCH_FAILED = (
+    "[AGENT] [LLM] [BATCH] Batched call for {count} pages failed; "
+    "falling back to single-page calls: {error}"
+)
+MSG_WARNING_LLM_BATCH_UNPARSEABLE = (
+    "[AGENT] [LLM] [BATCH] Batched response could not be split into per-URL items"
+)
+MSG_DEBUG_LLM_BATCH_SUMMARY = (
+    "[AGENT] [LLM] [BATCH] {batches} batched calls covered {pages} pages; "
+    "{single_calls} single-page calls ({fallbacks} fallbacks)"
+)
+
 # ---------------------------------------------------------------------
 # common/logging.py
 # ---------------------------------------------------------------------
@@ -38,6 +38,33 @@ class LogFormat(str, Enum):
     JSON = "json"
 
 
+class FetchRenderMode(str, Enum):
+    OFF = "off"
+    AUTO = "auto"
+    ALWAYS = "always"
+
+
+class SchedulerResource(str, Enum):
+    FETCH = "fetch"
+    LLM = "llm"
+
+
+class WorkerPoolMode(str, Enum):
+    ASYNC = "async"
+    PROCESS = "process"
+
+
+class WorkerPoolSchedule(str, Enum):
+    FIFO = "fifo"
+    LONGEST_FIRST = "longest_first"
+
+
+class ScreenshotFormat(str, Enum):
+    PNG = "png"
+    JPEG = "jpeg"
+    WEBP = "webp"
+
+
 class Auth0Algs(str, Enum):
     RS256 = "RS256"
 
@@ -50,6 +77,32 @@ class JobStatus(str, Enum):
     CANCELED = "canceled"
 
 
+class BulkJobState(str, Enum):
+    VALIDATING = "validating"
+    IN_PROGRESS = "in_progress"
+    FINALIZING = "finalizing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    EXPIRED = "expired"
+    CANCELLING = "cancelling"
+    CANCELLED = "cancelled"
+
+
+class WorkChunkState(str, Enum):
+    QUEUED = "queued"
+    LEASED = "leased"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class PageRejectReason(str, Enum):
+    SOFT_404 = "soft_404"
+    LOGIN_WALL = "login_wall"
+    BOT_CHALLENGE = "bot_challenge"
+    THIN_CONTENT = "thin_content"
+    DUPLICATE_TEMPLATE = "duplicate_template"
+
+
 class OpenAIConfig(BaseModel):
     """
     Container for OpenAI credential configuration used by agents.
@@ -57,10 +110,15 @@ class OpenAIConfig(BaseModel):
     Fields:
         api_key (str | None): API key if provided per-request.
         project_id (str | None): Project ID if provided per-request.
+        base_url (str | None): OpenAI-compatible endpoint for this job (must be
+            allow-listed via `LLM_ALLOWED_BASE_URLS`).
+        model (str | None): Free-form model name served by that endpoint.
     """
 
     api_key: str | None = None
     project_id: str | None = None
+    base_url: str | None = None
+    model: str | None = None
 
 
 class AllowedTab(str, Enum):
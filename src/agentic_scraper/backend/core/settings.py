@@ -52,38 +52,162 @@ from pydantic_settings import BaseSettings
 from agentic_scraper.backend.config.constants import (
     DEFAULT_AGENT_MODE,
     DEFAULT_AUTH0_ALGORITHM,
+    DEFAULT_BROWSER_POOL_ENABLED,
+    DEFAULT_BROWSER_POOL_MAX_PAGES,
+    DEFAULT_BROWSER_POOL_RECYCLE_AFTER,
+    DEFAULT_BROWSER_POOL_SIZE,
+    DEFAULT_BULK_POLL_INTERVAL_S,
+    DEFAULT_BULK_TIMEOUT_S,
+    DEFAULT_BULK_WORK_DIR,
     DEFAULT_DEBUG_MODE,
     DEFAULT_DUMP_LLM_JSON_DIR,
     DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_FETCH_TIMEOUT_S,
+    DEFAULT_JOB_QUEUE_RETRY_AFTER_S,
+    DEFAULT_LLM_BATCH_ENABLED,
+    DEFAULT_LLM_BATCH_MAX_ITEMS,
+    DEFAULT_LLM_BATCH_PAGE_MAX_TOKENS,
+    DEFAULT_LLM_BATCH_TOKEN_BUDGET,
+    DEFAULT_LLM_CIRCUIT_COOLDOWN_S,
+    DEFAULT_LLM_CIRCUIT_FAILURE_THRESHOLD,
     DEFAULT_LLM_CONCURRENCY,
+    DEFAULT_LLM_ENDPOINT_HEALTH_CHECK,
+    DEFAULT_LLM_HEDGE_ENABLED,
+    DEFAULT_LLM_HEDGE_QUANTILE,
     DEFAULT_LLM_MAX_TOKENS,
     DEFAULT_LLM_SCHEMA_RETRIES,
     DEFAULT_LLM_TEMPERATURE,
+    DEFAULT_LLM_TIMEOUT_S,
     DEFAULT_LOG_BACKUP_COUNT,
     DEFAULT_LOG_DIR,
     DEFAULT_LOG_MAX_BYTES,
     DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_QUEUE_SIZE,
+    DEFAULT_MAX_QUEUED_JOBS,
+    DEFAULT_MAX_QUEUED_JOBS_PER_USER,
+    DEFAULT_MAX_RUNNING_JOBS,
+    DEFAULT_MEMORY_BUDGET_COMPRESS,
+    DEFAULT_MEMORY_BUDGET_MB,
+    DEFAULT_MODEL_ROUTING_ENABLED,
+    DEFAULT_MODEL_ROUTING_ESCALATION_MODEL,
+    DEFAULT_MODEL_ROUTING_LONG_MODEL,
+    DEFAULT_MODEL_ROUTING_LONG_PAGE_TOKENS,
+    DEFAULT_MODEL_ROUTING_MAX_FAILURE_RATE,
+    DEFAULT_NEAR_DUP_ENABLED,
+    DEFAULT_NEAR_DUP_MAX_DISTANCE,
+    DEFAULT_PAGE_CLASSIFIER_ENABLED,
+    DEFAULT_PAGE_MIN_TEXT_CHARS,
+    DEFAULT_PARSE_TIMEOUT_S,
+    DEFAULT_PROCESS_POOL_CHUNK_SIZE,
+    DEFAULT_PROCESS_POOL_WORKERS,
+    DEFAULT_RENDER_BLOCK_RESOURCES,
+    DEFAULT_RENDER_MIN_TEXT_CHARS,
     DEFAULT_REQUEST_TIMEOUT,
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_RETRY_BACKOFF_MAX,
     DEFAULT_RETRY_BACKOFF_MIN,
+    DEFAULT_SCHEDULER_ENABLED,
+    DEFAULT_SCHEDULER_FETCH_CONCURRENCY,
+    DEFAULT_SCHEDULER_LLM_CONCURRENCY,
+    DEFAULT_SCREENSHOT_CACHE_TTL_S,
+    DEFAULT_SCREENSHOT_CONCURRENCY,
     DEFAULT_SCREENSHOT_DIR,
     DEFAULT_SCREENSHOT_ENABLED,
+    DEFAULT_SCREENSHOT_FULL_PAGE,
+    DEFAULT_SCREENSHOT_MAX_HEIGHT,
+    DEFAULT_SCREENSHOT_QUALITY,
+    DEFAULT_SCREENSHOT_STAGE_ENABLED,
+    DEFAULT_SCREENSHOT_THUMBNAIL_WIDTH,
+    DEFAULT_SCREENSHOT_TIMEOUT_S,
     DEFAULT_VERBOSE,
+    DEFAULT_WORK_QUEUE_CHUNK_SIZE,
+    DEFAULT_WORK_QUEUE_LEASE_S,
+    DEFAULT_WORK_QUEUE_MAX_ATTEMPTS,
+    DEFAULT_WORK_QUEUE_PATH,
+    DEFAULT_WORK_QUEUE_POLL_INTERVAL_S,
+    MAX_BROWSER_POOL_MAX_PAGES,
+    MAX_BROWSER_POOL_RECYCLE_AFTER,
+    MAX_BROWSER_POOL_SIZE,
     MAX_FETCH_CONCURRENCY,
+    MAX_JOB_QUEUE_RETRY_AFTER_S,
+    MAX_LLM_BATCH_MAX_ITEMS,
+    MAX_LLM_BATCH_PAGE_MAX_TOKENS,
+    MAX_LLM_BATCH_TOKEN_BUDGET,
+    MAX_LLM_CIRCUIT_FAILURE_THRESHOLD,
     MAX_LLM_CONCURRENCY,
+    MAX_LLM_ENDPOINT_CONCURRENCY,
+    MAX_LLM_HEDGE_QUANTILE,
     MAX_LLM_MAX_TOKENS,
     MAX_LLM_SCHEMA_RETRIES,
     MAX_LLM_TEMPERATURE,
+    MAX_MAX_QUEUE_SIZE,
+    MAX_MAX_QUEUED_JOBS,
+    MAX_MAX_QUEUED_JOBS_PER_USER,
+    MAX_MAX_RUNNING_JOBS,
+    MAX_MEMORY_BUDGET_MB,
+    MAX_MODEL_ROUTING_LONG_PAGE_TOKENS,
+    MAX_NEAR_DUP_MAX_DISTANCE,
+    MAX_PAGE_MIN_TEXT_CHARS,
+    MAX_PROCESS_POOL_CHUNK_SIZE,
+    MAX_PROCESS_POOL_WORKERS,
+    MAX_RENDER_MIN_TEXT_CHARS,
     MAX_RETRY_ATTEMPTS,
+    MAX_SCHEDULER_FETCH_CONCURRENCY,
+    MAX_SCHEDULER_LLM_CONCURRENCY,
+    MAX_SCREENSHOT_CACHE_TTL_S,
+    MAX_SCREENSHOT_CONCURRENCY,
+    MAX_SCREENSHOT_MAX_HEIGHT,
+    MAX_SCREENSHOT_QUALITY,
+    MAX_SCREENSHOT_THUMBNAIL_WIDTH,
+    MAX_SCREENSHOT_TIMEOUT_S,
+    MAX_STAGE_TIMEOUT_S,
+    MAX_WORK_QUEUE_CHUNK_SIZE,
+    MAX_WORK_QUEUE_LEASE_S,
+    MAX_WORK_QUEUE_MAX_ATTEMPTS,
+    MAX_WORK_QUEUE_POLL_INTERVAL_S,
     MIN_BACKOFF_SECONDS,
+    MIN_BROWSER_POOL_MAX_PAGES,
+    MIN_BROWSER_POOL_RECYCLE_AFTER,
+    MIN_BROWSER_POOL_SIZE,
+    MIN_BULK_POLL_INTERVAL_S,
     MIN_FETCH_CONCURRENCY,
+    MIN_JOB_QUEUE_RETRY_AFTER_S,
+    MIN_LLM_BATCH_MAX_ITEMS,
+    MIN_LLM_BATCH_PAGE_MAX_TOKENS,
+    MIN_LLM_BATCH_TOKEN_BUDGET,
+    MIN_LLM_CIRCUIT_FAILURE_THRESHOLD,
     MIN_LLM_CONCURRENCY,
+    MIN_LLM_ENDPOINT_CONCURRENCY,
+    MIN_LLM_HEDGE_QUANTILE,
     MIN_LLM_MAX_TOKENS,
     MIN_LLM_SCHEMA_RETRIES,
     MIN_LLM_TEMPERATURE,
     MIN_MAX_CONCURRENT_REQUESTS,
+    MIN_MAX_QUEUE_SIZE,
+    MIN_MAX_QUEUED_JOBS,
+    MIN_MAX_QUEUED_JOBS_PER_USER,
+    MIN_MAX_RUNNING_JOBS,
+    MIN_MEMORY_BUDGET_MB,
+    MIN_MODEL_ROUTING_LONG_PAGE_TOKENS,
+    MIN_NEAR_DUP_MAX_DISTANCE,
+    MIN_PAGE_MIN_TEXT_CHARS,
+    MIN_PROCESS_POOL_CHUNK_SIZE,
+    MIN_PROCESS_POOL_WORKERS,
+    MIN_RENDER_MIN_TEXT_CHARS,
     MIN_RETRY_ATTEMPTS,
+    MIN_SCHEDULER_FETCH_CONCURRENCY,
+    MIN_SCHEDULER_LLM_CONCURRENCY,
+    MIN_SCREENSHOT_CACHE_TTL_S,
+    MIN_SCREENSHOT_CONCURRENCY,
+    MIN_SCREENSHOT_MAX_HEIGHT,
+    MIN_SCREENSHOT_QUALITY,
+    MIN_SCREENSHOT_THUMBNAIL_WIDTH,
+    MIN_SCREENSHOT_TIMEOUT_S,
+    MIN_STAGE_TIMEOUT_S,
+    MIN_WORK_QUEUE_CHUNK_SIZE,
+    MIN_WORK_QUEUE_LEASE_S,
+    MIN_WORK_QUEUE_MAX_ATTEMPTS,
+    MIN_WORK_QUEUE_POLL_INTERVAL_S,
     PROJECT_NAME,
     VALID_AGENT_MODES,
 )
@@ -91,10 +215,14 @@ from agentic_scraper.backend.config.messages import MSG_DEBUG_SETTINGS_LOADED_WI
 from agentic_scraper.backend.config.types import (
     AgentMode,
     Environment,
+    FetchRenderMode,
     LogFormat,
     LogLevel,
     OpenAIConfig,
     OpenAIModel,
+    ScreenshotFormat,
+    WorkerPoolMode,
+    WorkerPoolSchedule,
 )
 from agentic_scraper.backend.core.settings_helpers import validated_settings
 from agentic_scraper.backend.utils.validators import (
@@ -149,6 +277,19 @@ class Settings(BaseSettings):
         llm_temperature (float): Default sampling temperature for LLM calls.
         screenshot_enabled (bool): Enable screenshot capture.
         screenshot_dir (str): Directory for screenshots.
+        browser_pool_enabled (bool): Reuse long-lived browsers for screenshots.
+        browser_pool_size (int): Number of pooled Chromium browsers.
+        browser_pool_max_pages (int): Max concurrently open pooled pages.
+        browser_pool_recycle_after (int): Pages served before a browser is replaced.
+        screenshot_stage_enabled (bool): Capture screenshots off the extraction workers.
+        screenshot_concurrency (int): Concurrent captures in the screenshot stage.
+        screenshot_timeout_s (float): Per-capture timeout in the screenshot stage.
+        screenshot_format (ScreenshotFormat): Output image format (png/jpeg/webp).
+        screenshot_quality (int): JPEG/WebP quality (1-100).
+        screenshot_full_page (bool): Capture the full scroll height (else viewport only).
+        screenshot_max_height (int): Cap on full-page capture height in px (0 = none).
+        screenshot_thumbnail_width (int): Thumbnail width in px (0 = no thumbnail).
+        screenshot_cache_ttl_s (float): Reuse a capture of the same URL + content this long.
         log_dir (str): Base log directory.
         log_level (LogLevel): Minimum log level.
         log_max_bytes (int): Rotation size for log files.
@@ -157,6 +298,74 @@ class Settings(BaseSettings):
         verbose (bool): Extra debug logs and full tracebacks.
         fetch_concurrency (int): Fetch worker concurrency (CLI/batch paths).
         llm_concurrency (int): LLM call concurrency (CLI/batch paths).
+        max_queue_size (int): Worker-pool input queue bound (0 = unbounded).
+        worker_pool_mode (WorkerPoolMode): Rule-based extraction on the event loop (async)
+            or in worker processes (process).
+        process_pool_workers (int): Extraction processes in process mode (0 = CPU count).
+        process_pool_chunk_size (int): `(url, text)` inputs sent to a process per task.
+        worker_pool_schedule (WorkerPoolSchedule): Dequeue inputs in arrival order (fifo)
+            or most expensive first (longest_first) to shorten tail stragglers.
+        memory_budget_mb (int): Megabytes of fetched-but-unprocessed pages a run may hold
+            before fetching pauses (0 = unlimited).
+        memory_budget_compress (bool): Compress page text waiting for a worker.
+        scheduler_enabled (bool): Share global fetch/LLM limits fairly across API jobs.
+        scheduler_fetch_concurrency (int): Process-wide concurrent fetches (all jobs).
+        scheduler_llm_concurrency (int): Process-wide concurrent LLM calls (all jobs).
+        max_running_jobs (int): API scrape jobs executing at once; the rest wait queued.
+        max_queued_jobs (int): Queued API jobs across all users (503 beyond this).
+        max_queued_jobs_per_user (int): Queued API jobs per user (429 beyond this).
+        job_queue_retry_after_s (int): `Retry-After` seconds sent with 429/503 rejections.
+        checkpoint_dir (str | None): Directory for API job checkpoint journals; failed or
+            canceled jobs can then be resumed (unset = no checkpoints).
+        llm_batch_enabled (bool): Pack several short pages into one LLM call (not applied
+            while `model_routing_enabled` is on, since batched calls cannot be routed).
+        llm_batch_max_items (int): Maximum number of pages per batched LLM call.
+        llm_batch_token_budget (int): Estimated page-text tokens allowed per batched call.
+        llm_batch_page_max_tokens (int): Pages above this estimate are never batched.
+        bulk_work_dir (str): Directory for offline bulk request/result files.
+        bulk_poll_interval_s (float): Seconds between bulk job status polls.
+        bulk_timeout_s (float): Give up waiting for a bulk job after this many seconds.
+        work_queue_path (str): SQLite file backing the distributed work queue.
+        work_queue_chunk_size (int): URLs per work-queue chunk (one lease).
+        work_queue_lease_s (float): Visibility timeout of a chunk lease; workers renew it
+            by heartbeat, and a chunk whose worker died is re-leased after it.
+        work_queue_max_attempts (int): Leases per chunk before it is marked failed.
+        work_queue_poll_interval_s (float): Seconds between work-queue polls.
+        near_dup_enabled (bool): Extract one page per near-duplicate cluster and reuse it.
+        near_dup_max_distance (int): Max SimHash Hamming distance treated as a duplicate.
+        near_dup_index_path (str | None): Optional JSON index for reuse across jobs (API
+            jobs use one sibling file per owner).
+        page_classifier_enabled (bool): Skip soft-404/login/bot-challenge pages before agents.
+        page_min_text_chars (int): Pages with less visible text are rejected as thin content.
+        fetch_render_mode (FetchRenderMode): Render pages in Chromium: off/auto/always.
+        render_min_text_chars (int): In auto mode, pages with less main text are rendered.
+        render_block_resources (bool): Block images/fonts/media while rendering.
+        model_routing_enabled (bool): Pick the LLM model per page instead of `openai_model`.
+        model_routing_long_model (OpenAIModel): Larger-context model for long pages.
+        model_routing_escalation_model (OpenAIModel): Model retried after invalid or
+            low-score output.
+        model_routing_long_page_tokens (int): Estimated tokens from which a page is "long".
+        model_routing_max_failure_rate (float): Default-model failure rate (per page type)
+            above which pages of that type start on the escalation model.
+        llm_fallback_chain (str | None): Ordered `model[@API_KEY_ENV]` fallbacks used when
+            the primary model is throttled or failing.
+        llm_circuit_failure_threshold (int): Consecutive provider failures that open a
+            target's circuit breaker.
+        llm_circuit_cooldown_s (float): Seconds an open breaker keeps a target out of use.
+        llm_hedge_enabled (bool): Duplicate an LLM call once it outlives the target's
+            running latency quantile, keeping whichever answer arrives first.
+        llm_hedge_quantile (float): Latency quantile that triggers a hedge (0.9 = p90).
+        fetch_timeout_s (float): Per-URL fetch budget including retries (0 = none).
+        parse_timeout_s (float): Per-page main-text extraction budget (0 = none).
+        llm_timeout_s (float): Per-attempt LLM call budget; a timeout fails over (0 = none).
+        openai_base_url (str | None): OpenAI-compatible server (vLLM, llama.cpp, TGI...)
+            used instead of the public API.
+        openai_model_override (str | None): Free-form model name sent instead of
+            `openai_model` (e.g. a local model id).
+        llm_allowed_base_urls (str | None): Comma-separated base URLs jobs may select via
+            `OpenAIConfig.base_url`.
+        llm_endpoint_concurrency (int | None): Max in-flight LLM requests per endpoint.
+        llm_endpoint_health_check (bool): Probe custom endpoints before a job starts.
         dump_llm_json_dir (str | None): Optional path to dump parsed LLM JSON.
         retry_attempts (int): Retry attempts for transient LLM errors.
         retry_backoff_min (float): Minimum retry backoff (seconds).
@@ -223,6 +432,87 @@ class Settings(BaseSettings):
         default=DEFAULT_SCREENSHOT_ENABLED, validation_alias="SCREENSHOT_ENABLED"
     )
     screenshot_dir: str = Field(default=DEFAULT_SCREENSHOT_DIR, validation_alias="SCREENSHOT_DIR")
+    browser_pool_enabled: bool = Field(
+        default=DEFAULT_BROWSER_POOL_ENABLED,
+        validation_alias="BROWSER_POOL_ENABLED",
+        description="If true, screenshots reuse pooled browsers instead of one launch per URL.",
+    )
+    browser_pool_size: int = Field(
+        default=DEFAULT_BROWSER_POOL_SIZE,
+        validation_alias="BROWSER_POOL_SIZE",
+        ge=MIN_BROWSER_POOL_SIZE,
+        le=MAX_BROWSER_POOL_SIZE,
+        description="Number of long-lived Chromium browsers in the pool.",
+    )
+    browser_pool_max_pages: int = Field(
+        default=DEFAULT_BROWSER_POOL_MAX_PAGES,
+        validation_alias="BROWSER_POOL_MAX_PAGES",
+        ge=MIN_BROWSER_POOL_MAX_PAGES,
+        le=MAX_BROWSER_POOL_MAX_PAGES,
+        description="Max pages open at once across pooled browsers (screenshot concurrency).",
+    )
+    browser_pool_recycle_after: int = Field(
+        default=DEFAULT_BROWSER_POOL_RECYCLE_AFTER,
+        validation_alias="BROWSER_POOL_RECYCLE_AFTER",
+        ge=MIN_BROWSER_POOL_RECYCLE_AFTER,
+        le=MAX_BROWSER_POOL_RECYCLE_AFTER,
+        description="Pages a pooled browser serves before it is closed and replaced.",
+    )
+    screenshot_stage_enabled: bool = Field(
+        default=DEFAULT_SCREENSHOT_STAGE_ENABLED,
+        validation_alias="SCREENSHOT_STAGE_ENABLED",
+        description="Capture screenshots in a separate stage so extraction never waits on them.",
+    )
+    screenshot_concurrency: int = Field(
+        default=DEFAULT_SCREENSHOT_CONCURRENCY,
+        validation_alias="SCREENSHOT_CONCURRENCY",
+        ge=MIN_SCREENSHOT_CONCURRENCY,
+        le=MAX_SCREENSHOT_CONCURRENCY,
+        description="Number of concurrent captures in the screenshot stage.",
+    )
+    screenshot_timeout_s: float = Field(
+        default=DEFAULT_SCREENSHOT_TIMEOUT_S,
+        validation_alias="SCREENSHOT_TIMEOUT_S",
+        ge=MIN_SCREENSHOT_TIMEOUT_S,
+        le=MAX_SCREENSHOT_TIMEOUT_S,
+        description="Seconds before a single screenshot capture is abandoned.",
+    )
+    screenshot_format: ScreenshotFormat = Field(
+        default=ScreenshotFormat.PNG, validation_alias="SCREENSHOT_FORMAT"
+    )
+    screenshot_quality: int = Field(
+        default=DEFAULT_SCREENSHOT_QUALITY,
+        validation_alias="SCREENSHOT_QUALITY",
+        ge=MIN_SCREENSHOT_QUALITY,
+        le=MAX_SCREENSHOT_QUALITY,
+        description="Encoder quality for JPEG/WebP screenshots (ignored for PNG).",
+    )
+    screenshot_full_page: bool = Field(
+        default=DEFAULT_SCREENSHOT_FULL_PAGE,
+        validation_alias="SCREENSHOT_FULL_PAGE",
+        description="Capture the full scroll height; false captures the viewport only.",
+    )
+    screenshot_max_height: int = Field(
+        default=DEFAULT_SCREENSHOT_MAX_HEIGHT,
+        validation_alias="SCREENSHOT_MAX_HEIGHT",
+        ge=MIN_SCREENSHOT_MAX_HEIGHT,
+        le=MAX_SCREENSHOT_MAX_HEIGHT,
+        description="Clip full-page captures to this many pixels (0 disables the cap).",
+    )
+    screenshot_thumbnail_width: int = Field(
+        default=DEFAULT_SCREENSHOT_THUMBNAIL_WIDTH,
+        validation_alias="SCREENSHOT_THUMBNAIL_WIDTH",
+        ge=MIN_SCREENSHOT_THUMBNAIL_WIDTH,
+        le=MAX_SCREENSHOT_THUMBNAIL_WIDTH,
+        description="Write a `<name>.thumb.<ext>` thumbnail this wide (0 disables).",
+    )
+    screenshot_cache_ttl_s: float = Field(
+        default=DEFAULT_SCREENSHOT_CACHE_TTL_S,
+        validation_alias="SCREENSHOT_CACHE_TTL_S",
+        ge=MIN_SCREENSHOT_CACHE_TTL_S,
+        le=MAX_SCREENSHOT_CACHE_TTL_S,
+        description="Skip capture when a file for the same URL and content is this fresh.",
+    )
 
     # Logging
     log_dir: str = Field(default=DEFAULT_LOG_DIR, validation_alias="LOG_DIR")
@@ -255,6 +545,359 @@ class Settings(BaseSettings):
         le=MAX_LLM_CONCURRENCY,
     )
 
+    max_queue_size: int = Field(
+        default=DEFAULT_MAX_QUEUE_SIZE,
+        validation_alias="MAX_QUEUE_SIZE",
+        ge=MIN_MAX_QUEUE_SIZE,
+        le=MAX_MAX_QUEUE_SIZE,
+        description="Inputs buffered ahead of the workers; the producer waits when full.",
+    )
+
+    # Executor-backed extraction for the synchronous (rule-based) agent
+    worker_pool_mode: WorkerPoolMode = Field(
+        default=WorkerPoolMode.ASYNC,
+        validation_alias="WORKER_POOL_MODE",
+        description="async: extract on the event loop; process: rule-based chunks in processes.",
+    )
+    process_pool_workers: int = Field(
+        default=DEFAULT_PROCESS_POOL_WORKERS,
+        validation_alias="PROCESS_POOL_WORKERS",
+        ge=MIN_PROCESS_POOL_WORKERS,
+        le=MAX_PROCESS_POOL_WORKERS,
+        description="Worker processes for process mode (0 = one per CPU).",
+    )
+    process_pool_chunk_size: int = Field(
+        default=DEFAULT_PROCESS_POOL_CHUNK_SIZE,
+        validation_alias="PROCESS_POOL_CHUNK_SIZE",
+        ge=MIN_PROCESS_POOL_CHUNK_SIZE,
+        le=MAX_PROCESS_POOL_CHUNK_SIZE,
+        description="Inputs per process task; larger chunks amortize pickling overhead.",
+    )
+    worker_pool_schedule: WorkerPoolSchedule = Field(
+        default=WorkerPoolSchedule.FIFO,
+        validation_alias="WORKER_POOL_SCHEDULE",
+        description="fifo: input order; longest_first: largest estimated cost first.",
+    )
+
+    # Bytes-in-flight backpressure between fetching and extraction
+    memory_budget_mb: int = Field(
+        default=DEFAULT_MEMORY_BUDGET_MB,
+        validation_alias="MEMORY_BUDGET_MB",
+        ge=MIN_MEMORY_BUDGET_MB,
+        le=MAX_MEMORY_BUDGET_MB,
+        description="Fetching pauses while unprocessed pages exceed this (0 = unlimited).",
+    )
+    memory_budget_compress: bool = Field(
+        default=DEFAULT_MEMORY_BUDGET_COMPRESS,
+        validation_alias="MEMORY_BUDGET_COMPRESS",
+        description="If true, page text waiting for a worker is kept zlib-compressed.",
+    )
+
+    # Process-wide fair scheduler (registered by the API lifespan)
+    scheduler_enabled: bool = Field(
+        default=DEFAULT_SCHEDULER_ENABLED,
+        validation_alias="SCHEDULER_ENABLED",
+        description="If true, API jobs share global fetch/LLM limits with per-user fairness.",
+    )
+    scheduler_fetch_concurrency: int = Field(
+        default=DEFAULT_SCHEDULER_FETCH_CONCURRENCY,
+        validation_alias="SCHEDULER_FETCH_CONCURRENCY",
+        ge=MIN_SCHEDULER_FETCH_CONCURRENCY,
+        le=MAX_SCHEDULER_FETCH_CONCURRENCY,
+        description="Concurrent HTTP fetches across all jobs in the process.",
+    )
+    scheduler_llm_concurrency: int = Field(
+        default=DEFAULT_SCHEDULER_LLM_CONCURRENCY,
+        validation_alias="SCHEDULER_LLM_CONCURRENCY",
+        ge=MIN_SCHEDULER_LLM_CONCURRENCY,
+        le=MAX_SCHEDULER_LLM_CONCURRENCY,
+        description="Concurrent LLM calls across all jobs in the process.",
+    )
+
+    # Job admission for POST /scrapes (bounded execution queue)
+    max_running_jobs: int = Field(
+        default=DEFAULT_MAX_RUNNING_JOBS,
+        validation_alias="MAX_RUNNING_JOBS",
+        ge=MIN_MAX_RUNNING_JOBS,
+        le=MAX_MAX_RUNNING_JOBS,
+        description="Scrape jobs executing concurrently; further jobs wait in the queue.",
+    )
+    max_queued_jobs: int = Field(
+        default=DEFAULT_MAX_QUEUED_JOBS,
+        validation_alias="MAX_QUEUED_JOBS",
+        ge=MIN_MAX_QUEUED_JOBS,
+        le=MAX_MAX_QUEUED_JOBS,
+        description="Jobs allowed to wait across all users; new jobs get 503 when full.",
+    )
+    max_queued_jobs_per_user: int = Field(
+        default=DEFAULT_MAX_QUEUED_JOBS_PER_USER,
+        validation_alias="MAX_QUEUED_JOBS_PER_USER",
+        ge=MIN_MAX_QUEUED_JOBS_PER_USER,
+        le=MAX_MAX_QUEUED_JOBS_PER_USER,
+        description="Jobs one user may have waiting; further submissions get 429.",
+    )
+    job_queue_retry_after_s: int = Field(
+        default=DEFAULT_JOB_QUEUE_RETRY_AFTER_S,
+        validation_alias="JOB_QUEUE_RETRY_AFTER_S",
+        ge=MIN_JOB_QUEUE_RETRY_AFTER_S,
+        le=MAX_JOB_QUEUE_RETRY_AFTER_S,
+        description="Retry-After (seconds) returned when a job submission is rejected.",
+    )
+    checkpoint_dir: str | None = Field(
+        default=None,
+        validation_alias="CHECKPOINT_DIR",
+        description="Directory for per-job checkpoint journals (enables resuming jobs).",
+    )
+
+    # Multi-page batching of short pages (LLM modes only)
+    llm_batch_enabled: bool = Field(
+        default=DEFAULT_LLM_BATCH_ENABLED,
+        validation_alias="LLM_BATCH_ENABLED",
+        description="If true, short pages are packed into shared LLM calls.",
+    )
+    llm_batch_max_items: int = Field(
+        default=DEFAULT_LLM_BATCH_MAX_ITEMS,
+        validation_alias="LLM_BATCH_MAX_ITEMS",
+        ge=MIN_LLM_BATCH_MAX_ITEMS,
+        le=MAX_LLM_BATCH_MAX_ITEMS,
+        description="Maximum number of pages sent in one batched LLM call.",
+    )
+    llm_batch_token_budget: int = Field(
+        default=DEFAULT_LLM_BATCH_TOKEN_BUDGET,
+        validation_alias="LLM_BATCH_TOKEN_BUDGET",
+        ge=MIN_LLM_BATCH_TOKEN_BUDGET,
+        le=MAX_LLM_BATCH_TOKEN_BUDGET,
+        description="Estimated tokens of page text allowed in one batched LLM call.",
+    )
+    llm_batch_page_max_tokens: int = Field(
+        default=DEFAULT_LLM_BATCH_PAGE_MAX_TOKENS,
+        validation_alias="LLM_BATCH_PAGE_MAX_TOKENS",
+        ge=MIN_LLM_BATCH_PAGE_MAX_TOKENS,
+        le=MAX_LLM_BATCH_PAGE_MAX_TOKENS,
+        description="Pages whose estimated token count exceeds this are sent alone.",
+    )
+
+    # Offline bulk extraction (provider batch jobs)
+    bulk_work_dir: str = Field(
+        default=DEFAULT_BULK_WORK_DIR,
+        validation_alias="BULK_WORK_DIR",
+        description="Directory where bulk request/manifest/result files are written.",
+    )
+    bulk_poll_interval_s: float = Field(
+        default=DEFAULT_BULK_POLL_INTERVAL_S,
+        validation_alias="BULK_POLL_INTERVAL_S",
+        ge=MIN_BULK_POLL_INTERVAL_S,
+        description="Seconds between status polls of a submitted bulk job.",
+    )
+    bulk_timeout_s: float = Field(
+        default=DEFAULT_BULK_TIMEOUT_S,
+        validation_alias="BULK_TIMEOUT_S",
+        gt=0,
+        description="Maximum seconds to wait for a bulk job before giving up.",
+    )
+
+    # Distributed coordinator/worker mode (shared work queue)
+    work_queue_path: str = Field(
+        default=DEFAULT_WORK_QUEUE_PATH,
+        validation_alias="WORK_QUEUE_PATH",
+        description="SQLite file backing the shared work queue.",
+    )
+    work_queue_chunk_size: int = Field(
+        default=DEFAULT_WORK_QUEUE_CHUNK_SIZE,
+        validation_alias="WORK_QUEUE_CHUNK_SIZE",
+        ge=MIN_WORK_QUEUE_CHUNK_SIZE,
+        le=MAX_WORK_QUEUE_CHUNK_SIZE,
+        description="URLs per work-queue chunk (one lease).",
+    )
+    work_queue_lease_s: float = Field(
+        default=DEFAULT_WORK_QUEUE_LEASE_S,
+        validation_alias="WORK_QUEUE_LEASE_S",
+        ge=MIN_WORK_QUEUE_LEASE_S,
+        le=MAX_WORK_QUEUE_LEASE_S,
+        description="Visibility timeout: a chunk without heartbeats is re-leased after this.",
+    )
+    work_queue_max_attempts: int = Field(
+        default=DEFAULT_WORK_QUEUE_MAX_ATTEMPTS,
+        validation_alias="WORK_QUEUE_MAX_ATTEMPTS",
+        ge=MIN_WORK_QUEUE_MAX_ATTEMPTS,
+        le=MAX_WORK_QUEUE_MAX_ATTEMPTS,
+        description="Leases per chunk before it is marked failed.",
+    )
+    work_queue_poll_interval_s: float = Field(
+        default=DEFAULT_WORK_QUEUE_POLL_INTERVAL_S,
+        validation_alias="WORK_QUEUE_POLL_INTERVAL_S",
+        ge=MIN_WORK_QUEUE_POLL_INTERVAL_S,
+        le=MAX_WORK_QUEUE_POLL_INTERVAL_S,
+        description="Seconds between queue polls (idle workers, coordinator progress).",
+    )
+
+    # Near-duplicate reuse (SimHash over main text)
+    near_dup_enabled: bool = Field(
+        default=DEFAULT_NEAR_DUP_ENABLED,
+        validation_alias="NEAR_DUP_ENABLED",
+        description="If true, near-identical pages reuse one extraction result.",
+    )
+    near_dup_max_distance: int = Field(
+        default=DEFAULT_NEAR_DUP_MAX_DISTANCE,
+        validation_alias="NEAR_DUP_MAX_DISTANCE",
+        ge=MIN_NEAR_DUP_MAX_DISTANCE,
+        le=MAX_NEAR_DUP_MAX_DISTANCE,
+        description="Maximum Hamming distance between 64-bit SimHashes to count as duplicates.",
+    )
+    near_dup_index_path: str | None = Field(
+        default=None,
+        validation_alias="NEAR_DUP_INDEX_PATH",
+        description="Optional JSON file persisting fingerprints/results across jobs.",
+    )
+
+    # Soft-404 / error-page classification (between parsing and the worker pool)
+    page_classifier_enabled: bool = Field(
+        default=DEFAULT_PAGE_CLASSIFIER_ENABLED,
+        validation_alias="PAGE_CLASSIFIER_ENABLED",
+        description="If true, error/login/challenge pages are rejected before extraction.",
+    )
+    page_min_text_chars: int = Field(
+        default=DEFAULT_PAGE_MIN_TEXT_CHARS,
+        validation_alias="PAGE_MIN_TEXT_CHARS",
+        ge=MIN_PAGE_MIN_TEXT_CHARS,
+        le=MAX_PAGE_MIN_TEXT_CHARS,
+        description="Minimum visible text length; shorter pages are rejected as thin content.",
+    )
+
+    # Headless-render fetch for JavaScript-heavy pages (pooled Chromium)
+    fetch_render_mode: FetchRenderMode = Field(
+        default=FetchRenderMode.OFF,
+        validation_alias="FETCH_RENDER_MODE",
+        description="off: HTTP only; auto: render thin pages; always: render every page.",
+    )
+    render_min_text_chars: int = Field(
+        default=DEFAULT_RENDER_MIN_TEXT_CHARS,
+        validation_alias="RENDER_MIN_TEXT_CHARS",
+        ge=MIN_RENDER_MIN_TEXT_CHARS,
+        le=MAX_RENDER_MIN_TEXT_CHARS,
+        description="In auto mode, pages whose main text is shorter are re-fetched rendered.",
+    )
+    render_block_resources: bool = Field(
+        default=DEFAULT_RENDER_BLOCK_RESOURCES,
+        validation_alias="RENDER_BLOCK_RESOURCES",
+        description="Abort image/font/media requests while rendering (kept for screenshots).",
+    )
+
+    # Per-request model routing (LLM modes only)
+    model_routing_enabled: bool = Field(
+        default=DEFAULT_MODEL_ROUTING_ENABLED,
+        validation_alias="MODEL_ROUTING_ENABLED",
+        description="If true, the model is chosen per page; `openai_model` is the cheap default.",
+    )
+    model_routing_long_model: OpenAIModel = Field(
+        default=DEFAULT_MODEL_ROUTING_LONG_MODEL,
+        validation_alias="MODEL_ROUTING_LONG_MODEL",
+        description="Larger-context model used for pages above the long-page threshold.",
+    )
+    model_routing_escalation_model: OpenAIModel = Field(
+        default=DEFAULT_MODEL_ROUTING_ESCALATION_MODEL,
+        validation_alias="MODEL_ROUTING_ESCALATION_MODEL",
+        description="Stronger model retried once after invalid or low-score output.",
+    )
+    model_routing_long_page_tokens: int = Field(
+        default=DEFAULT_MODEL_ROUTING_LONG_PAGE_TOKENS,
+        validation_alias="MODEL_ROUTING_LONG_PAGE_TOKENS",
+        ge=MIN_MODEL_ROUTING_LONG_PAGE_TOKENS,
+        le=MAX_MODEL_ROUTING_LONG_PAGE_TOKENS,
+        description="Pages with at least this many estimated tokens go to the long model.",
+    )
+    model_routing_max_failure_rate: float = Field(
+        default=DEFAULT_MODEL_ROUTING_MAX_FAILURE_RATE,
+        validation_alias="MODEL_ROUTING_MAX_FAILURE_RATE",
+        ge=0.0,
+        le=1.0,
+        description="Failure rate per page type above which the escalation model is used first.",
+    )
+
+    # Fallback model chain + circuit breaker (provider brownouts)
+    llm_fallback_chain: str | None = Field(
+        default=None,
+        validation_alias="LLM_FALLBACK_CHAIN",
+        description="Comma-separated `model` or `model@API_KEY_ENV` fallbacks, in order.",
+    )
+    llm_circuit_failure_threshold: int = Field(
+        default=DEFAULT_LLM_CIRCUIT_FAILURE_THRESHOLD,
+        validation_alias="LLM_CIRCUIT_FAILURE_THRESHOLD",
+        ge=MIN_LLM_CIRCUIT_FAILURE_THRESHOLD,
+        le=MAX_LLM_CIRCUIT_FAILURE_THRESHOLD,
+        description="Consecutive rate-limit/5xx/connection failures that open a breaker.",
+    )
+    llm_circuit_cooldown_s: float = Field(
+        default=DEFAULT_LLM_CIRCUIT_COOLDOWN_S,
+        validation_alias="LLM_CIRCUIT_COOLDOWN_S",
+        ge=0,
+        description="Seconds a model with an open breaker is skipped by the fallback chain.",
+    )
+
+    # Hedged LLM requests and per-stage timeouts (screenshots: `screenshot_timeout_s`)
+    llm_hedge_enabled: bool = Field(
+        default=DEFAULT_LLM_HEDGE_ENABLED,
+        validation_alias="LLM_HEDGE_ENABLED",
+        description="If true, slow LLM calls get one duplicate request; the first answer wins.",
+    )
+    llm_hedge_quantile: float = Field(
+        default=DEFAULT_LLM_HEDGE_QUANTILE,
+        validation_alias="LLM_HEDGE_QUANTILE",
+        ge=MIN_LLM_HEDGE_QUANTILE,
+        le=MAX_LLM_HEDGE_QUANTILE,
+        description="Running latency quantile after which a call is hedged.",
+    )
+    fetch_timeout_s: float = Field(
+        default=DEFAULT_FETCH_TIMEOUT_S,
+        validation_alias="FETCH_TIMEOUT_S",
+        ge=MIN_STAGE_TIMEOUT_S,
+        le=MAX_STAGE_TIMEOUT_S,
+        description="Seconds allowed per URL fetch, retries included (0 = no limit).",
+    )
+    parse_timeout_s: float = Field(
+        default=DEFAULT_PARSE_TIMEOUT_S,
+        validation_alias="PARSE_TIMEOUT_S",
+        ge=MIN_STAGE_TIMEOUT_S,
+        le=MAX_STAGE_TIMEOUT_S,
+        description="Seconds allowed to extract a page's main text (0 = no limit).",
+    )
+    llm_timeout_s: float = Field(
+        default=DEFAULT_LLM_TIMEOUT_S,
+        validation_alias="LLM_TIMEOUT_S",
+        ge=MIN_STAGE_TIMEOUT_S,
+        le=MAX_STAGE_TIMEOUT_S,
+        description="Seconds allowed per LLM attempt before failing over (0 = no limit).",
+    )
+
+    # OpenAI-compatible endpoints (local inference servers)
+    openai_base_url: str | None = Field(
+        default=None,
+        validation_alias="OPENAI_BASE_URL",
+        description="OpenAI-compatible base URL (e.g. http://localhost:8000/v1); unset → OpenAI.",
+    )
+    openai_model_override: str | None = Field(
+        default=None,
+        validation_alias="OPENAI_MODEL_OVERRIDE",
+        description="Model name sent instead of `openai_model` (any string the server serves).",
+    )
+    llm_allowed_base_urls: str | None = Field(
+        default=None,
+        validation_alias="LLM_ALLOWED_BASE_URLS",
+        description="Comma-separated base URLs that jobs may select per request.",
+    )
+    llm_endpoint_concurrency: int | None = Field(
+        default=None,
+        validation_alias="LLM_ENDPOINT_CONCURRENCY",
+        ge=MIN_LLM_ENDPOINT_CONCURRENCY,
+        le=MAX_LLM_ENDPOINT_CONCURRENCY,
+        description="Max in-flight LLM requests per endpoint (unset/0 → unlimited).",
+    )
+    llm_endpoint_health_check: bool = Field(
+        default=DEFAULT_LLM_ENDPOINT_HEALTH_CHECK,
+        validation_alias="LLM_ENDPOINT_HEALTH_CHECK",
+        description="If true, custom endpoints are probed (GET /models) before a job starts.",
+    )
+
     # Retry behavior (used in agent.py with tenacity)
     dump_llm_json_dir: str | None = Field(
         default=DEFAULT_DUMP_LLM_JSON_DIR,
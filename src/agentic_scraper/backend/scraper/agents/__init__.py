@@ -6,6 +6,7 @@ Responsibilities:
 - Map `AgentMode` values to the appropriate extraction function.
 - Provide a single public entrypoint `extract_structured_data` that selects and
   invokes the right agent (rule-based, fixed LLM, dynamic LLM, adaptive LLM).
+- Optionally route each LLM request to a model via `ModelRouter`.
 
 Public API:
 - `extract_structured_data`: Unified async function that delegates to the agent
@@ -33,6 +34,7 @@ from agentic_scraper.backend.config.messages import (
 )
 from agentic_scraper.backend.config.types import AgentMode
 from agentic_scraper.backend.core.settings import Settings
+from agentic_scraper.backend.scraper.agents.model_router import ModelRouter
 from agentic_scraper.backend.scraper.models import ScrapeRequest
 from agentic_scraper.backend.scraper.schemas import ScrapedItem
 from agentic_scraper.backend.utils.validators import validate_agent_mode
@@ -60,6 +62,7 @@ async def extract_structured_data(
     request: ScrapeRequest,
     *,
     settings: Settings,
+    router: ModelRouter | None = None,
 ) -> ScrapedItem | None:
     """
     Unified agent entrypoint for structured data extraction.
@@ -67,6 +70,8 @@ async def extract_structured_data(
     Args:
         request (ScrapeRequest): Input containing URL, cleaned text, and context.
         settings (Settings): Runtime settings, including `agent_mode` and OpenAI config.
+        router (ModelRouter | None): Optional per-run model router (LLM modes); when set,
+            the model is chosen per request and recorded on the item.
 
     Returns:
         ScrapedItem | None: Structured item if extraction succeeds; None if the agent
@@ -88,4 +93,6 @@ async def extract_structured_data(
         raise ValueError(MSG_ERROR_UNHANDLED_AGENT_MODE.format(value=mode))
 
     logger.debug(MSG_DEBUG_AGENT_SELECTED.format(mode=mode))
+    if router is not None and mode != AgentMode.RULE_BASED:
+        return await router.run(request, agent_fn)
     return await agent_fn(request, settings=settings)
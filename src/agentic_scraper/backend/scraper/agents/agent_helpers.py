@@ -7,18 +7,23 @@ Responsibilities:
 - Capture screenshots (best-effort) for debugging/archiving.
 - Extract contextual hints from HTML/URL to enrich LLM prompts.
 - Score non-empty fields and decide on early-exit across retries.
+- Flag unusable model output (unparseable JSON, schema validation failures) so callers
+  can tell it apart from provider errors.
 - Normalize and verify OpenAI credentials (defense-in-depth).
 
 Public API:
-- `parse_llm_response`: Safe JSON parse with common-repair fallback.
+- `parse_llm_response`: Safe JSON parse with tolerant-parser fallback.
 - `capture_optional_screenshot`: Best-effort screenshot capture.
 - `handle_openai_exception`: Verbosity-aware OpenAI error logging.
 - `log_structured_data`: Debug log + optional JSON dump of fields.
 - `extract_context_hints`: HTML/URL breadcrumbs/meta hints.
+- `infer_page_type`: Keyword-based page type used by hints and model routing.
 - `try_validate_scraped_item`: Schema validation → ScrapedItem | None.
 - `score_and_log_fields`: Weighted field scoring with debug logs.
 - `retrieve_openai_credentials`: Validate & extract API key/project.
 - `should_exit_early`: Retry loop short-circuit decision helper.
+- `output_check_scope` / `note_invalid_output`: Track whether the enclosed extraction
+  produced output that failed parsing or validation (used by model routing).
 
 Operational:
 - Concurrency: All helpers are pure or async and safe to call from worker tasks.
@@ -34,13 +39,18 @@ Usage:
     item = try_validate_scraped_item(data or {}, url, settings)
 
 Notes:
-- JSON “repair” aims for common LLM artifacts only; it is intentionally conservative.
+- JSON “repair” is delegated to `json_repair.TolerantJSONParser`, which never rewrites
+  string contents (apostrophes inside values survive).
 - Screenshotting requires Playwright runtime; failures are logged and ignored.
 """
 
+import asyncio
 import json
 import logging
-import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
@@ -80,20 +90,27 @@ from agentic_scraper.backend.config.messages import (
     MSG_ERROR_RATE_LIMIT_LOG_WITH_URL,
     MSG_ERROR_SCREENSHOT_FAILED_WITH_URL,
     MSG_INFO_ADAPTIVE_EXTRACTION_SUCCESS_WITH_URL,
+    MSG_WARNING_LLM_JSON_TRUNCATED,
+    MSG_WARNING_SCREENSHOT_TIMEOUT,
 )
 from agentic_scraper.backend.config.types import OpenAIConfig
 from agentic_scraper.backend.core.settings import Settings
 from agentic_scraper.backend.scraper.agents.field_utils import FIELD_WEIGHTS, score_nonempty_fields
+from agentic_scraper.backend.scraper.agents.json_repair import TolerantJSONParser
 from agentic_scraper.backend.scraper.schemas import ScrapedItem
-from agentic_scraper.backend.scraper.screenshotter import capture_screenshot
+from agentic_scraper.backend.scraper.screenshotter import ScreenshotOptions, capture_screenshot
 
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "OutputCheck",
     "capture_optional_screenshot",
     "extract_context_hints",
     "handle_openai_exception",
+    "infer_page_type",
     "log_structured_data",
+    "note_invalid_output",
+    "output_check_scope",
     "parse_llm_response",
     "retrieve_openai_credentials",
     "score_and_log_fields",
@@ -134,6 +151,49 @@ def _is_masked_secret(s: str | None) -> bool:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+@dataclass
+class OutputCheck:
+    """
+    Output-quality flags for one extraction.
+
+    Attributes:
+        invalid (bool): The model answered, but its output could not be parsed or failed
+            schema validation (as opposed to a provider error or an empty reply).
+    """
+
+    invalid: bool = False
+
+
+_CURRENT_OUTPUT_CHECK: ContextVar[OutputCheck | None] = ContextVar(
+    "llm_output_check", default=None
+)
+
+
+@contextmanager
+def output_check_scope() -> Iterator[OutputCheck]:
+    """
+    Collect output-quality flags for the enclosed extraction (and tasks it creates).
+
+    Yields:
+        OutputCheck: Flags set by `note_invalid_output` while in scope.
+    """
+    check = OutputCheck()
+    token = _CURRENT_OUTPUT_CHECK.set(check)
+    try:
+        yield check
+    finally:
+        _CURRENT_OUTPUT_CHECK.reset(token)
+
+
+def note_invalid_output() -> None:
+    """Flag the current extraction's model output as unparseable or invalid."""
+    if (check := _CURRENT_OUTPUT_CHECK.get()) is not None:
+        check.invalid = True
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+
+
 def parse_llm_response(content: str, url: str, settings: Settings) -> dict[str, Any] | None:
     """
     Parse LLM JSON content safely, with conservative auto-repair on failure.
@@ -147,8 +207,10 @@ def parse_llm_response(content: str, url: str, settings: Settings) -> dict[str,
         dict[str, Any] | None: Parsed dictionary if successful, else None.
 
     Notes:
-        - On initial parse failure, attempts cheap repairs (e.g., strip ``` fences,
-          fix quotes/trailing commas/unquoted keys) before giving up.
+        - On initial parse failure, falls back to `TolerantJSONParser` (code fences,
+          single quotes, trailing commas, unquoted keys) in one pass over the text.
+        - Truncated output (e.g. `max_tokens` reached) yields the completed fields
+          instead of None.
         - Does not raise; callers should handle None.
     """
     try:
@@ -158,32 +220,55 @@ def parse_llm_response(content: str, url: str, settings: Settings) -> dict[str,
         if settings.is_verbose_mode:
             logger.debug(MSG_ERROR_LLM_JSON_DECODE_LOG.format(exc=e, url=url))
 
-        # Attempt repair of common LLM formatting artifacts.
-        fixed = _try_fix_and_parse_json(content)
-        if fixed is not None:
+        # Single-pass tolerant parse: repairs common artifacts and recovers truncated output.
+        parser = TolerantJSONParser(content)
+        fixed = parser.parse()
+        if not fixed:
+            note_invalid_output()
+            return None
+        if parser.truncated:
+            logger.warning(MSG_WARNING_LLM_JSON_TRUNCATED.format(url=url, fields=len(fixed)))
+        else:
             logger.debug(MSG_DEBUG_LLM_JSON_REPAIRED.format(url=url))
-            return fixed
-
-        return None
+        return cast("dict[str, Any]", fixed)
 
 
-async def capture_optional_screenshot(url: str, settings: Settings) -> str | None:
+async def capture_optional_screenshot(
+    url: str, settings: Settings, *, page_hash: str | None = None
+) -> str | None:
     """
     Best-effort screenshot capture; returns None on failure.
 
     Args:
         url (str): The URL to capture.
-        settings (Settings): Runtime config (screenshot directory, etc.).
+        settings (Settings): Runtime config (screenshot directory, format, cache, etc.).
+        page_hash (str | None): `content_hash()` of the page text; enables reuse of a
+            fresh capture of the same content.
 
     Returns:
         str | None: Path to saved screenshot if successful, otherwise None.
 
     Notes:
         - Exceptions from Playwright or filesystem are swallowed and logged.
+        - Captures are bounded by `settings.screenshot_timeout_s`, so an inline capture
+          cannot stall its worker.
         - Keeps pipeline resilient when headless browser is unavailable.
     """
     try:
-        return await capture_screenshot(url, output_dir=Path(settings.screenshot_dir))
+        return await asyncio.wait_for(
+            capture_screenshot(
+                url,
+                output_dir=Path(settings.screenshot_dir),
+                options=ScreenshotOptions.from_settings(settings),
+                page_hash=page_hash,
+            ),
+            timeout=settings.screenshot_timeout_s,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            MSG_WARNING_SCREENSHOT_TIMEOUT.format(url=url, timeout=settings.screenshot_timeout_s)
+        )
+        return None
     except (PlaywrightError, OSError, ValueError):
         logger.warning(MSG_ERROR_SCREENSHOT_FAILED_WITH_URL.format(url=url))
         return None
@@ -267,6 +352,25 @@ def log_structured_data(data: dict[str, Any], settings: Settings) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+def infer_page_type(signals: str) -> str:
+    """
+    Naive keyword-based page type ("product", "job", "blog" or "unknown").
+
+    Args:
+        signals (str): Lower-cased URL/title/heading text to inspect.
+
+    Returns:
+        str: Inferred page type.
+    """
+    if "product" in signals or "shop" in signals:
+        return "product"
+    if "job" in signals or "career" in signals or "apply" in signals:
+        return "job"
+    if "blog" in signals or "post" in signals or "article" in signals:
+        return "blog"
+    return "unknown"
+
+
 def extract_context_hints(html: str, url: str) -> dict[str, str]:
     """
     Extract simple contextual hints from HTML and URL to enrich prompts.
@@ -349,14 +453,7 @@ def extract_context_hints(html: str, url: str) -> dict[str, str]:
     lower_h1 = first_h1.lower()
     combined = f"{lower_url} {lower_title} {lower_h1}"
 
-    if "product" in combined or "shop" in combined:
-        page_type = "product"
-    elif "job" in combined or "career" in combined or "apply" in combined:
-        page_type = "job"
-    elif "blog" in combined or "post" in combined or "article" in combined:
-        page_type = "blog"
-    else:
-        page_type = "unknown"
+    page_type = infer_page_type(combined)
 
     logger.debug(
         MSG_DEBUG_CONTEXT_HINTS_EXTRACTED.format(
@@ -407,6 +504,7 @@ def try_validate_scraped_item(
         item = ScrapedItem.model_validate(data)
     except ValidationError as ve:
         logger.warning(MSG_ERROR_LLM_VALIDATION_FAILED_WITH_URL.format(url=url, exc=ve))
+        note_invalid_output()
         return None
     else:
         logger.info(MSG_INFO_ADAPTIVE_EXTRACTION_SUCCESS_WITH_URL.format(url=url))
@@ -538,39 +636,3 @@ def should_exit_early(
         )
 
     return should_stop
-
-
-def _try_fix_and_parse_json(bad_json: str) -> dict[str, Any] | None:
-    """
-    Attempt to repair common LLM JSON formatting issues and re-parse.
-
-    Fixes:
-        - Strips ```json fences.
-        - Single quotes → double quotes.
-        - Trailing commas before ']' or '}'.
-        - Quotes unquoted property names (`foo: 1` → `"foo": 1`).
-
-    Args:
-        bad_json (str): Original malformed JSON text.
-
-    Returns:
-        dict[str, Any] | None: Parsed JSON if successful, else None.
-
-    Notes:
-        - Intentionally conservative; avoids heavy-weight “JSONC” parsing.
-    """
-    cleaned = bad_json.strip().removeprefix("```json").removesuffix("```").strip()
-
-    # Replace single quotes with double quotes (common markdown/LLM artifact).
-    cleaned = cleaned.replace("'", '"')
-
-    # Remove trailing commas before object/array close.
-    cleaned = re.sub(r",\s*([\]}])", r"\1", cleaned)
-
-    # Quote unquoted keys: { a: 1 } → { "a": 1 }.
-    cleaned = re.sub(r"([{,]\s*)([a-zA-Z_][a-zA-Z0-9_]*)(\s*):", r'\1"\2"\3:', cleaned)
-
-    try:
-        return cast("dict[str, Any]", json.loads(cleaned))
-    except json.JSONDecodeError:
-        return None
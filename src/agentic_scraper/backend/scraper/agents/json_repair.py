@@ -0,0 +1,281 @@
+"""
+Tolerant single-pass JSON parser for repairing LLM output.
+
+Responsibilities:
+- Parse "almost JSON" produced by LLMs in one left-to-right pass, without rewriting the
+  text first: code fences and leading prose, single-quoted strings, trailing commas,
+  unquoted keys, Python literals (`True`/`False`/`None`), and raw newlines in strings.
+- Recover partial objects from truncated output (e.g. when `max_tokens` was hit): every
+  completed key/value pair is kept and open containers are closed implicitly.
+
+Public API:
+- `TolerantJSONParser`: Parser instance; exposes `truncated` after `parse()`.
+- `loads_tolerant`: Convenience wrapper returning the parsed value or None.
+
+Operational:
+- Cost: Linear in the input length; string bodies are consumed with precompiled patterns
+  rather than character by character.
+- Logging: None; callers log repair/truncation outcomes.
+
+Usage:
+    from agentic_scraper.backend.scraper.agents.json_repair import loads_tolerant
+
+    data = loads_tolerant("```json\\n{title: 'Bob's shop', price: 12,}\\n```")
+
+Notes:
+- A quote only closes a string when the next non-space character is a structural one
+  (`,` `:` `}` `]`, or another quote) or the end of input, so apostrophes inside
+  single-quoted values (`'Bob's shop'`) survive instead of being rewritten into broken JSON.
+- A value cut off mid-token (an unterminated string, `tru`, a dangling key) is dropped;
+  the enclosing object keeps its other fields.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+__all__ = ["TolerantJSONParser", "loads_tolerant"]
+
+_WS = " \t\r\n"
+# After a closing quote: separators/closers, or another string (missing ":" or ",").
+_CLOSERS = ",:}]\"'"
+_ESCAPES = {
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+_STRING_CHUNK_RE = {
+    '"': re.compile(r'[^"\\]*'),
+    "'": re.compile(r"[^'\\]*"),
+}
+_NUMBER_RE = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_BARE_WORD_RE = re.compile(r"[A-Za-z_$][\w$-]*")
+_BARE_VALUE_RE = re.compile(r"[^,}\]\n]+")
+_LITERALS: dict[str, Any] = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "True": True,
+    "False": False,
+    "None": None,
+}
+
+
+class _TruncatedError(Exception):
+    """Input ended inside the current value."""
+
+
+class TolerantJSONParser:
+    """
+    Recursive-descent parser that accepts common LLM JSON artifacts.
+
+    Attributes:
+        text (str): Input text.
+        truncated (bool): True when the input ended before the top-level value closed.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Prepare a parser for `text` (no work is done until `parse()`)."""
+        self.text = text
+        self.pos = 0
+        self.truncated = False
+
+    # ── Entry point ─────────────────────────────────────────────────────────
+
+    def parse(self) -> Any | None:  # noqa: ANN401 - JSON values are untyped
+        """
+        Parse the first JSON object/array in the text.
+
+        Returns:
+            Any | None: Parsed (possibly partial) value, or None when the text contains
+            no object/array or nothing could be recovered.
+        """
+        starts = [i for i in (self.text.find("{"), self.text.find("[")) if i != -1]
+        if not starts:
+            return None
+        self.pos = min(starts)
+        try:
+            return self._value()
+        except _TruncatedError:
+            self.truncated = True
+            return None
+        except RecursionError:
+            return None
+
+    # ── Scanning helpers ────────────────────────────────────────────────────
+
+    def _skip_ws(self) -> str:
+        """Skip whitespace; return the next character ('' at end of input)."""
+        text, pos = self.text, self.pos
+        while pos < len(text) and text[pos] in _WS:
+            pos += 1
+        self.pos = pos
+        return text[pos] if pos < len(text) else ""
+
+    def _closes_string(self, quote_pos: int) -> bool:
+        """True when the quote at `quote_pos` is followed by a structural char or EOF."""
+        pos = quote_pos + 1
+        text = self.text
+        while pos < len(text) and text[pos] in _WS:
+            pos += 1
+        # "```" after the closing quote means the fence ended the payload.
+        return pos >= len(text) or text[pos] in _CLOSERS or text.startswith("`", pos)
+
+    # ── Grammar ─────────────────────────────────────────────────────────────
+
+    def _value(self) -> Any:  # noqa: ANN401 - JSON values are untyped
+        ch = self._skip_ws()
+        if not ch:
+            raise _TruncatedError
+        if ch == "{":
+            return self._object()
+        if ch == "[":
+            return self._array()
+        if ch in "\"'":
+            return self._string(ch)
+        return self._scalar()
+
+    def _object(self) -> dict[str, Any]:
+        self.pos += 1  # consume "{"
+        out: dict[str, Any] = {}
+        while True:
+            ch = self._skip_ws()
+            if not ch:
+                self.truncated = True
+                return out
+            if ch in "}]":  # "]" tolerates a mismatched closer
+                self.pos += 1
+                return out
+            if ch == ",":
+                self.pos += 1
+                continue
+            try:
+                key = self._key()
+                if self._skip_ws() == ":":
+                    self.pos += 1
+                # A missing colon is tolerated: `key value` still forms a pair.
+                out[key] = self._value()
+            except _TruncatedError:
+                self.truncated = True
+                return out
+
+    def _array(self) -> list[Any]:
+        self.pos += 1  # consume "["
+        out: list[Any] = []
+        while True:
+            ch = self._skip_ws()
+            if not ch:
+                self.truncated = True
+                return out
+            if ch in "]}":  # "}" tolerates a mismatched closer
+                self.pos += 1
+                return out
+            if ch == ",":
+                self.pos += 1
+                continue
+            try:
+                out.append(self._value())
+            except _TruncatedError:
+                self.truncated = True
+                return out
+
+    def _key(self) -> str:
+        ch = self.text[self.pos]
+        if ch in "\"'":
+            return self._string(ch)
+        match = _BARE_WORD_RE.match(self.text, self.pos)
+        if match is None:
+            # Unknown junk before a key: take everything up to the colon.
+            end = self.text.find(":", self.pos)
+            if end == -1:
+                raise _TruncatedError
+            key = self.text[self.pos : end].strip()
+            self.pos = end
+            return key
+        self.pos = match.end()
+        return match.group(0)
+
+    def _string(self, quote: str) -> str:
+        chunk_re = _STRING_CHUNK_RE[quote]
+        text = self.text
+        pos = self.pos + 1
+        parts: list[str] = []
+        while True:
+            match = chunk_re.match(text, pos)  # always matches (possibly empty)
+            assert match is not None  # noqa: S101 - narrows the type for mypy
+            parts.append(match.group(0))
+            pos = match.end()
+            if pos >= len(text):
+                raise _TruncatedError
+            if text[pos] == quote:
+                if self._closes_string(pos):
+                    self.pos = pos + 1
+                    return "".join(parts)
+                parts.append(quote)  # stray apostrophe/quote inside the value
+                pos += 1
+                continue
+            # Backslash escape.
+            if pos + 1 >= len(text):
+                raise _TruncatedError
+            esc = text[pos + 1]
+            if esc == "u":
+                hex_digits = text[pos + 2 : pos + 6]
+                if len(hex_digits) < 4:  # noqa: PLR2004 - \uXXXX
+                    raise _TruncatedError
+                try:
+                    parts.append(chr(int(hex_digits, 16)))
+                    pos += 6
+                except ValueError:
+                    parts.append(esc)
+                    pos += 2
+                continue
+            parts.append(_ESCAPES.get(esc, esc))
+            pos += 2
+
+    def _scalar(self) -> Any:  # noqa: ANN401 - JSON values are untyped
+        text = self.text
+        number = _NUMBER_RE.match(text, self.pos)
+        if number is not None:
+            end = number.end()
+            if end >= len(text):
+                raise _TruncatedError  # digits may continue past the cut
+            self.pos = end
+            literal = number.group(0)
+            return float(literal) if any(c in literal for c in ".eE") else int(literal)
+
+        word = _BARE_WORD_RE.match(text, self.pos)
+        if word is not None and word.group(0) in _LITERALS:
+            if word.end() >= len(text):
+                raise _TruncatedError
+            self.pos = word.end()
+            return _LITERALS[word.group(0)]
+
+        # Unquoted text value: read up to the next structural character.
+        bare = _BARE_VALUE_RE.match(text, self.pos)
+        if bare is None:
+            return None  # missing value (`"a": ,`); the container handles the closer
+        if bare.end() >= len(text):
+            raise _TruncatedError
+        self.pos = bare.end()
+        return bare.group(0).strip()
+
+
+def loads_tolerant(text: str) -> Any | None:  # noqa: ANN401 - JSON values are untyped
+    """
+    Parse LLM output tolerantly; see `TolerantJSONParser`.
+
+    Args:
+        text (str): Raw LLM output.
+
+    Returns:
+        Any | None: Parsed (possibly partial) object/array, or None if nothing usable.
+    """
+    return TolerantJSONParser(text).parse()
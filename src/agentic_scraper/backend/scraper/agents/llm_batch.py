@@ -0,0 +1,449 @@
+# src/agentic_scraper/backend/scraper/agents/llm_batch.py
+"""
+Multi-page LLM batching for short pages.
+
+Responsibilities:
+- Estimate prompt tokens for page text and decide which requests are "short".
+- Pack short `ScrapeRequest`s into one LLM call (up to an item count and token budget)
+  and split the JSON reply back into per-URL items.
+- Validate each batched item through the regular normalization/validation helpers and
+  fall back to the single-page agent for any page that is missing or invalid.
+- Bound the number of concurrent LLM calls (batched + single) made through the batcher.
+
+Public API:
+- `estimate_tokens`: Cheap chars→tokens estimate used for budget packing.
+- `extract_batch`: One LLM call for several requests → `{url: ScrapedItem | None}`.
+- `ShortPageBatcher`: Micro-batcher used by the worker pool to coalesce short pages.
+- `BatchCounters`: Counters describing how many calls batching saved.
+
+Operational:
+- Concurrency: `ShortPageBatcher` is single-event-loop; `submit` never awaits before
+  enqueuing, so no lock is needed. A partial batch is flushed after a short linger
+  window (`LLM_BATCH_LINGER_SECONDS`) so a lone short page is never starved.
+- Retries: Batched calls are not retried; failed pages go through the single-page
+  agent, which owns retry/backoff.
+- Logging: Uses message constants; page content is never logged here.
+
+Usage:
+    from agentic_scraper.backend.scraper.agents.llm_batch import ShortPageBatcher
+
+    batcher = ShortPageBatcher(settings=settings, fallback=single_page_fn, max_calls=5)
+    item = await batcher.extract(request)
+    await batcher.aclose()
+
+Notes:
+- The batched prompt asks for `{"items": [...]}`; a bare JSON array or a URL-keyed
+  object is accepted as well, since models do not always follow the envelope.
+- Screenshots are captured per page after a batched item validates, mirroring the
+  single-page agents (capture only after a successful parse). `ShortPageBatcher`
+  captures them after releasing its call slot, so a slow render never holds up other
+  LLM calls; `extract_batch` itself never captures.
+- Batched calls always use the run's default model: pages are not routed through
+  `ModelRouter`. The worker pool therefore disables batching when model routing is on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from agentic_scraper.backend.config.aliases import APIErrorT, OpenAIErrorT, RateLimitErrorT
+from agentic_scraper.backend.config.constants import (
+    CHARS_PER_TOKEN_ESTIMATE,
+    LLM_BATCH_LINGER_SECONDS,
+    MAX_LLM_MAX_TOKENS,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_LLM_BATCH_SENT,
+    MSG_DEBUG_LLM_BATCH_SPLIT,
+    MSG_DEBUG_LLM_BATCH_SUMMARY,
+    MSG_WARNING_LLM_BATCH_FAILED,
+    MSG_WARNING_LLM_BATCH_UNPARSEABLE,
+)
+from agentic_scraper.backend.config.types import AgentMode
+from agentic_scraper.backend.scraper.agents.agent_helpers import (
+    capture_optional_screenshot,
+    parse_llm_response,
+    retrieve_openai_credentials,
+    try_validate_scraped_item,
+)
+from agentic_scraper.backend.scraper.agents.field_utils import normalize_fields, normalize_keys
+from agentic_scraper.backend.scraper.agents.llm_dynamic import AsyncOpenAI
+from agentic_scraper.backend.scraper.agents.llm_endpoint import resolve_endpoint
+from agentic_scraper.backend.scraper.agents.llm_fallback import create_chat_completion
+from agentic_scraper.backend.scraper.agents.prompt_helpers import build_batch_prompt
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.models import ScrapeRequest
+    from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["BatchCounters", "ShortPageBatcher", "estimate_tokens", "extract_batch"]
+
+SinglePageFn = Callable[["ScrapeRequest"], Awaitable["ScrapedItem | None"]]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of prompt tokens for `text`.
+
+    Args:
+        text (str): Page text.
+
+    Returns:
+        int: Approximate token count (ceil of chars / `CHARS_PER_TOKEN_ESTIMATE`).
+
+    Notes:
+        - Deliberately tokenizer-free: packing only needs a stable, cheap upper-ish bound.
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN_ESTIMATE)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batched call + response splitting
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _entries_from_payload(payload: object) -> list[dict[str, Any]]:
+    """
+    Normalize the possible batched reply shapes into a list of per-page dicts.
+
+    Accepted shapes:
+        - `{"items": [{...}, ...]}` (requested envelope)
+        - `[{...}, ...]` (bare array)
+        - `{"<url>": {...}, ...}` (URL-keyed object; the key becomes `url` if absent)
+    """
+    if isinstance(payload, dict) and isinstance(payload.get("items"), list):
+        payload = payload["items"]
+    if isinstance(payload, list):
+        return [e for e in payload if isinstance(e, dict)]
+    if isinstance(payload, dict):
+        return [{"url": key, **val} for key, val in payload.items() if isinstance(val, dict)]
+    return []
+
+
+def _url_key(url: object) -> str:
+    """Comparison key for URLs echoed by the model (trim + ignore a trailing slash)."""
+    return str(url).strip().rstrip("/")
+
+
+def _validate_entry(
+    raw: dict[str, Any],
+    request: ScrapeRequest,
+    settings: Settings,
+) -> ScrapedItem | None:
+    """
+    Normalize and validate one batched entry for `request`.
+
+    Notes:
+        - Fixed mode validates the fields as returned (like `llm_fixed`); dynamic modes
+          normalize keys/values first (like `llm_dynamic`).
+        - The request URL always wins over whatever the model echoed back.
+    """
+    data = dict(raw) if settings.agent_mode == AgentMode.LLM_FIXED else normalize_keys(raw)
+    data["url"] = request.url
+    if settings.agent_mode != AgentMode.LLM_FIXED:
+        data = normalize_fields(data)
+
+    return try_validate_scraped_item(data, request.url, settings)
+
+
+async def _with_screenshot(
+    item: ScrapedItem, request: ScrapeRequest, settings: Settings
+) -> ScrapedItem:
+    """Attach a screenshot to a validated batched item when its request asks for one."""
+    if not request.take_screenshot:
+        return item
+    screenshot_path = await capture_optional_screenshot(request.url, settings)
+    if screenshot_path:
+        return item.model_copy(update={"screenshot_path": screenshot_path})
+    return item
+
+
+async def extract_batch(
+    requests: list[ScrapeRequest],
+    *,
+    settings: Settings,
+) -> dict[str, ScrapedItem | None]:
+    """
+    Extract several short pages with a single LLM call.
+
+    Args:
+        requests (list[ScrapeRequest]): Requests to pack together (same credentials).
+        settings (Settings): Runtime configuration (model, temperature, token limit).
+
+    Returns:
+        dict[str, ScrapedItem | None]: Map of request URL → validated item, or None for
+            pages the reply did not cover or that failed validation. Items carry no
+            screenshot; callers capture them once the LLM call is done.
+
+    Raises:
+        OpenAIErrorT | APIErrorT | RateLimitErrorT: Propagated so the caller can fall
+            back to single-page calls for the whole batch.
+        ValueError: If OpenAI credentials are missing or invalid.
+
+    Notes:
+        - `max_tokens` scales with the number of pages (capped at `MAX_LLM_MAX_TOKENS`)
+          because the reply carries one object per page.
+    """
+    results: dict[str, ScrapedItem | None] = {r.url: None for r in requests}
+    if not requests:
+        return results
+
+    prompt = build_batch_prompt(
+        [(r.url, r.text) for r in requests],
+        fixed_schema=settings.agent_mode == AgentMode.LLM_FIXED,
+    )
+    logger.debug(
+        MSG_DEBUG_LLM_BATCH_SENT.format(
+            count=len(requests), tokens=sum(estimate_tokens(r.text) for r in requests)
+        )
+    )
+
+    endpoint = resolve_endpoint(
+        requests[0].openai, settings, credentials=retrieve_openai_credentials
+    )
+    client = AsyncOpenAI(**endpoint.client_kwargs())
+    response, _model = await create_chat_completion(
+        client,
+        settings=settings,
+        make_client=lambda key: AsyncOpenAI(api_key=key, project=None),
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=min(MAX_LLM_MAX_TOKENS, settings.llm_max_tokens * len(requests)),
+        endpoint=endpoint,
+    )
+
+    content = response.choices[0].message.content
+    batch_label = f"batch:{requests[0].url}"
+    payload = parse_llm_response(content, batch_label, settings) if content else None
+    entries = _entries_from_payload(payload)
+    if not entries:
+        logger.warning(MSG_WARNING_LLM_BATCH_UNPARSEABLE)
+        return results
+
+    by_url = {_url_key(e.get("url")): e for e in entries if e.get("url")}
+    for request in requests:
+        raw = by_url.get(_url_key(request.url))
+        if raw is not None:
+            results[request.url] = _validate_entry(raw, request, settings)
+
+    valid = sum(1 for v in results.values() if v is not None)
+    logger.debug(
+        MSG_DEBUG_LLM_BATCH_SPLIT.format(
+            count=len(requests), valid=valid, fallback=len(requests) - valid
+        )
+    )
+    return results
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Micro-batcher used by the worker pool
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class BatchCounters:
+    """
+    Counters describing batching effectiveness for one pool run.
+
+    Attributes:
+        batches (int): Number of multi-page LLM calls issued.
+        batched_pages (int): Pages covered by those calls.
+        single_calls (int): Single-page calls (long pages, lone pages, fallbacks).
+        fallbacks (int): Pages that were batched but re-run as single-page calls.
+    """
+
+    batches: int = 0
+    batched_pages: int = 0
+    single_calls: int = 0
+    fallbacks: int = 0
+
+
+@dataclass
+class _PendingPage:
+    """A short page waiting for its batch, plus the future its worker awaits."""
+
+    request: ScrapeRequest
+    future: asyncio.Future[ScrapedItem | None]
+    tokens: int
+
+
+@dataclass
+class ShortPageBatcher:
+    """
+    Coalesce short pages submitted by concurrent workers into shared LLM calls.
+
+    Attributes:
+        settings (Settings): Runtime settings (batch limits, agent mode, model).
+        fallback (SinglePageFn): Single-page extractor (normally the agent dispatcher).
+        max_calls (int): Maximum concurrent LLM calls issued through this batcher.
+        linger_s (float): How long a partial batch waits for more pages before flushing.
+        counters (BatchCounters): Effectiveness counters (logged on close).
+
+    Notes:
+        - Workers call `extract(request)`; short pages wait on a future resolved when
+          their batch completes, long pages go straight to `fallback`.
+        - A batch is flushed when it reaches `llm_batch_max_items`, when the next page
+          would exceed `llm_batch_token_budget`, or when the linger timer fires.
+        - If a waiting worker is cancelled, its future is cancelled and the page is
+          dropped from the batch before the call is made.
+    """
+
+    settings: Settings
+    fallback: SinglePageFn
+    max_calls: int = 1
+    linger_s: float = LLM_BATCH_LINGER_SECONDS
+    counters: BatchCounters = field(default_factory=BatchCounters)
+    _pending: list[_PendingPage] = field(default_factory=list, init=False)
+    _pending_tokens: int = field(default=0, init=False)
+    _timer: asyncio.TimerHandle | None = field(default=None, init=False)
+    _tasks: set[asyncio.Task[None]] = field(default_factory=set, init=False)
+    _call_slots: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Create the call limiter once `max_calls` is known."""
+        self._call_slots = asyncio.Semaphore(max(1, self.max_calls))
+
+    def is_eligible(self, request: ScrapeRequest) -> bool:
+        """Return True if `request` is short enough to share an LLM call."""
+        return estimate_tokens(request.text) <= self.settings.llm_batch_page_max_tokens
+
+    async def extract(self, request: ScrapeRequest) -> ScrapedItem | None:
+        """
+        Extract one page, batching it with other short pages when possible.
+
+        Args:
+            request (ScrapeRequest): The page to extract.
+
+        Returns:
+            ScrapedItem | None: The extracted item (batched or single-page).
+
+        Raises:
+            Exception: Whatever the single-page fallback raises for this page.
+        """
+        if not self.is_eligible(request):
+            return await self._call_single(request)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ScrapedItem | None] = loop.create_future()
+        tokens = estimate_tokens(request.text)
+
+        # Flush first if this page would push the open batch over its token budget.
+        if self._pending and self._pending_tokens + tokens > self.settings.llm_batch_token_budget:
+            self._flush()
+
+        self._pending.append(_PendingPage(request=request, future=future, tokens=tokens))
+        self._pending_tokens += tokens
+
+        if len(self._pending) >= self.settings.llm_batch_max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger_s, self._flush)
+
+        return await future
+
+    async def aclose(self) -> None:
+        """Cancel the linger timer and any in-flight batch tasks, then log counters."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for pending in self._pending:
+            pending.future.cancel()
+        self._pending = []
+        self._pending_tokens = 0
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        logger.debug(
+            MSG_DEBUG_LLM_BATCH_SUMMARY.format(
+                batches=self.counters.batches,
+                pages=self.counters.batched_pages,
+                single_calls=self.counters.single_calls,
+                fallbacks=self.counters.fallbacks,
+            )
+        )
+
+    # ─── internals ───
+
+    def _flush(self) -> None:
+        """Detach the open batch and process it in a background task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending, self._pending_tokens = self._pending, [], 0
+        if not batch:
+            return
+        task = asyncio.create_task(self._run_batch(batch), name="llm-batch")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _call_single(self, request: ScrapeRequest) -> ScrapedItem | None:
+        """Run the single-page extractor under the shared call limit."""
+        async with self._call_slots:
+            self.counters.single_calls += 1
+            return await self.fallback(request)
+
+    async def _resolve_single(self, pending: _PendingPage) -> None:
+        """Run a single-page call for a batched page and settle its future."""
+        try:
+            item = await self._call_single(pending.request)
+        except asyncio.CancelledError:
+            pending.future.cancel()
+            raise
+        except Exception as e:  # noqa: BLE001 — surfaced to the waiting worker
+            if not pending.future.done():
+                pending.future.set_exception(e)
+        else:
+            if not pending.future.done():
+                pending.future.set_result(item)
+
+    async def _run_batch(self, batch: list[_PendingPage]) -> None:
+        """Issue one batched call, settle valid pages, and fall back for the rest."""
+        # Skip pages whose workers have already gone away (cancelled futures).
+        live = [p for p in batch if not p.future.done()]
+        if not live:
+            return
+        if len(live) == 1:
+            await self._resolve_single(live[0])
+            return
+
+        results: dict[str, ScrapedItem | None] = {}
+        try:
+            async with self._call_slots:
+                self.counters.batches += 1
+                self.counters.batched_pages += len(live)
+                results = await extract_batch([p.request for p in live], settings=self.settings)
+        except (RateLimitErrorT, APIErrorT, OpenAIErrorT, ValueError) as e:
+            logger.warning(MSG_WARNING_LLM_BATCH_FAILED.format(count=len(live), error=e))
+
+        # The call slot is released here: screenshots and fallbacks do not hold it.
+        settle: list[Awaitable[None]] = []
+        retry: list[_PendingPage] = []
+        for pending in live:
+            item = results.get(pending.request.url)
+            if item is None:
+                retry.append(pending)
+            else:
+                settle.append(self._resolve_batched(pending, item))
+
+        self.counters.fallbacks += len(retry)
+        await asyncio.gather(*settle, *(self._resolve_single(p) for p in retry))
+
+    async def _resolve_batched(self, pending: _PendingPage, item: ScrapedItem) -> None:
+        """Settle a batched page's future, capturing its screenshot first if requested."""
+        if pending.future.done():
+            return
+        try:
+            item = await _with_screenshot(item, pending.request, self.settings)
+        except asyncio.CancelledError:
+            pending.future.cancel()
+            raise
+        if not pending.future.done():
+            pending.future.set_result(item)
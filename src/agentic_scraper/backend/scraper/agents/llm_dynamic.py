@@ -30,7 +30,7 @@ Notes:
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from tenacity import (
     AsyncRetrying,
@@ -59,6 +59,8 @@ from agentic_scraper.backend.scraper.agents.field_utils import (
     normalize_keys,
     score_nonempty_fields,
 )
+from agentic_scraper.backend.scraper.agents.llm_endpoint import resolve_endpoint
+from agentic_scraper.backend.scraper.agents.llm_fallback import create_chat_completion
 from agentic_scraper.backend.scraper.agents.prompt_helpers import build_prompt
 
 if TYPE_CHECKING:
@@ -196,17 +198,20 @@ async def _extract_impl(
     # Dict-based messages keep compatibility with both real client and stub.
     messages_payload: list[dict[str, object]] = [{"role": "user", "content": prompt}]
 
-    # Validate and extract OpenAI credentials early; fail fast if invalid.
-    api_key, project_id = retrieve_openai_credentials(request.openai)
-    client = AsyncOpenAI(api_key=api_key, project=project_id)
+    # Resolve endpoint/credentials early; fail fast if invalid.
+    endpoint = resolve_endpoint(request.openai, settings, credentials=retrieve_openai_credentials)
+    client = AsyncOpenAI(**endpoint.client_kwargs())
 
     try:
         # Both the real SDK and the stub expose: client.chat.completions.create(...)
-        response: Any = await client.chat.completions.create(
-            model=settings.openai_model,
+        # Primary model first, then `settings.llm_fallback_chain` on provider failures.
+        response, used_model = await create_chat_completion(
+            client,
+            settings=settings,
+            make_client=lambda key: AsyncOpenAI(api_key=key, project=None),
             messages=messages_payload,
-            temperature=settings.llm_temperature,
             max_tokens=settings.llm_max_tokens,
+            endpoint=endpoint,
         )
 
         # OpenAI SDK shape: choices[0].message.content (string or None)
@@ -223,6 +228,8 @@ async def _extract_impl(
         # Normalize keys (e.g., "cost" -> "price") and ensure url is present.
         raw_data = normalize_keys(raw_data)
         raw_data["url"] = request.url
+        if used_model != settings.openai_model:
+            raw_data["llm_model"] = used_model  # served by a fallback model
 
         # Score discovery quality and note explicitly unavailable fields (e.g., "N/A").
         unavailable_fields = detect_unavailable_fields(raw_data)
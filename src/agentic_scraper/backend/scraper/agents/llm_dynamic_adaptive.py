@@ -66,6 +66,8 @@ from agentic_scraper.backend.scraper.agents.field_utils import (
     normalize_fields,
     normalize_keys,
 )
+from agentic_scraper.backend.scraper.agents.llm_endpoint import resolve_endpoint
+from agentic_scraper.backend.scraper.agents.llm_fallback import create_chat_completion
 from agentic_scraper.backend.scraper.agents.prompt_helpers import (
     _sort_fields_by_weight,
     build_prompt,
@@ -77,6 +79,7 @@ if TYPE_CHECKING:
     from openai.types.chat import ChatCompletionMessageParam
 
     from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.agents.llm_endpoint import LLMEndpoint
     from agentic_scraper.backend.scraper.models import ScrapeRequest
     from agentic_scraper.backend.scraper.schemas import ScrapedItem
 
@@ -188,7 +191,8 @@ async def run_llm_with_retries(
     messages: list[ChatCompletionMessageParam],
     settings: Settings,
     url: str,
-) -> str | None:
+    endpoint: LLMEndpoint | None = None,
+) -> tuple[str | None, str | None]:
     """
     Run the LLM call with retries for robustness against transient OpenAI errors.
 
@@ -197,9 +201,11 @@ async def run_llm_with_retries(
         messages (list[ChatCompletionMessageParam]): Conversation payload to send.
         settings (Settings): Runtime config (model, tokens, temperature, retry policy).
         url (str): URL for logging context.
+        endpoint (LLMEndpoint | None): Resolved endpoint of `client` (model override).
 
     Returns:
-        str | None: Content string (LLM JSON) on success, else None.
+        tuple[str | None, str | None]: Content string (LLM JSON) on success, else None,
+            and the model that answered (None when no model did).
 
     Notes:
         - Tenacity governs retry behavior; OpenAI-style exceptions are handled
@@ -220,23 +226,27 @@ async def run_llm_with_retries(
     ):
         with attempt:
             try:
-                response: _ResponseProto = await client.chat.completions.create(
-                    model=settings.openai_model,
+                # Primary model first, then `settings.llm_fallback_chain` on provider failures.
+                response: _ResponseProto
+                response, used_model = await create_chat_completion(
+                    client,
+                    settings=settings,
+                    make_client=lambda key: AsyncOpenAI(api_key=key, project=None),
                     messages=messages,
-                    temperature=settings.llm_temperature,
                     max_tokens=settings.llm_max_tokens,
+                    endpoint=endpoint,
                 )
                 # Response shape is unified via structural protocols above
                 content_obj = response.choices[0].message.content
                 if not isinstance(content_obj, str) or not content_obj:
-                    return None
-                return content_obj.strip()
+                    return None, used_model
+                return content_obj.strip(), used_model
             except retry_on as e:
                 # Design choice: treat OpenAI-family errors as handled and stop the attempt chain.
                 # Tests expect us to return None rather than propagate.
                 handle_openai_exception(e, url=url, settings=settings)
-                return None
-    return None
+                return None, None
+    return None, None
 
 
 # -----------------------------------------------------------------------------
@@ -297,6 +307,7 @@ async def process_retry(
     request: ScrapeRequest,
     settings: Settings,
     client: _ClientProto,
+    endpoint: LLMEndpoint | None = None,
 ) -> tuple[bool, RetryContext]:
     """
     Perform a single adaptive retry pass with updated prompt and result evaluation.
@@ -308,6 +319,7 @@ async def process_retry(
         request (ScrapeRequest): Current scrape request (url/text/hints).
         settings (Settings): Runtime config including retry limits.
         client (_ClientProto): OpenAI client.
+        endpoint (LLMEndpoint | None): Resolved endpoint of `client`.
 
     Returns:
         tuple[bool, RetryContext]:
@@ -326,7 +338,11 @@ async def process_retry(
     )
 
     # Run the current message stack (ctx.messages) and add the assistant reply to context.
-    content = await run_llm_with_retries(client, ctx.messages, settings, request.url)
+    content, used_model = await run_llm_with_retries(
+        client, ctx.messages, settings, request.url, endpoint=endpoint
+    )
+    # Only fallback models are recorded, as in the other LLM agents.
+    fallback_model = used_model if used_model != settings.openai_model else None
     if content is None:
         # Treat as handled (e.g., rate limit); signal the loop to stop.
         return True, ctx
@@ -344,11 +360,15 @@ async def process_retry(
     # Track all non-empty fields seen across attempts (union).
     ctx.all_fields.update({k: v for k, v in raw_data.items() if v not in [None, ""]})
 
+    if item is not None and fallback_model:
+        item.llm_model = fallback_model
+
     # Score fields and update "best" trackers.
     score = score_and_log_fields(observed_fields, attempt_num, request.url, raw_data)
     if score > ctx.best_score:
         ctx.best_score = score
         ctx.best_fields = copy.deepcopy(raw_data)
+        ctx.best_fields_model = fallback_model
     if item is not None and score > ctx.best_valid_score:
         ctx.best_valid_item = item
         ctx.best_valid_score = score
@@ -410,6 +430,8 @@ async def handle_fallback(
     all_fields: dict[str, Any],
     request: ScrapeRequest,
     settings: Settings,
+    *,
+    llm_model: str | None = None,
 ) -> ScrapedItem | None:
     """
     Attempt final validation and return the best available result after retries.
@@ -420,6 +442,8 @@ async def handle_fallback(
         all_fields (dict[str, Any]): Union of all non-empty fields observed.
         request (ScrapeRequest): Original request (used for URL and screenshot flag).
         settings (Settings): Runtime config incl. screenshot directory.
+        llm_model (str | None): Fallback model that produced `best_fields`, recorded on
+            items validated from the raw candidates.
 
     Returns:
         ScrapedItem | None: Best validated item, or a validated candidate from
@@ -445,6 +469,8 @@ async def handle_fallback(
             enriched = dict(candidate)
             if screenshot_path:
                 enriched["screenshot_path"] = screenshot_path
+            if llm_model:
+                enriched["llm_model"] = llm_model
             item = try_validate_scraped_item(enriched, request.url, settings)
             if item:
                 return item
@@ -502,9 +528,9 @@ async def extract_adaptive_data(
     initial_messages: list[ChatCompletionMessageParam] = [sys_msg, user_msg]
     logger.debug(MSG_DEBUG_LLM_INITIAL_PROMPT.format(url=request.url, prompt=prompt))
 
-    # Validate/prepare credentials up front; fail fast if missing/invalid.
-    api_key, project_id = retrieve_openai_credentials(request.openai)
-    client: _ClientProto = AsyncOpenAI(api_key=api_key, project=project_id)  # structural typing
+    # Resolve endpoint/credentials up front; fail fast if missing/invalid.
+    endpoint = resolve_endpoint(request.openai, settings, credentials=retrieve_openai_credentials)
+    client: _ClientProto = AsyncOpenAI(**endpoint.client_kwargs())  # structural typing
 
     # RetryContext tracks scores, best fields, best validated item, and the running message list.
     ctx = RetryContext(
@@ -525,6 +551,7 @@ async def extract_adaptive_data(
             request=request,
             settings=settings,
             client=client,
+            endpoint=endpoint,
         )
         if done:
             # Exit when the retry step signals early-stop (no further useful progress).
@@ -539,4 +566,5 @@ async def extract_adaptive_data(
         ctx.all_fields,
         request,
         settings,
+        llm_model=ctx.best_fields_model,
     )
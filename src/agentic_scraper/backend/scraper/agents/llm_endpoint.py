@@ -0,0 +1,267 @@
+"""
+OpenAI-compatible endpoint resolution, per-endpoint concurrency and health checks.
+
+Responsibilities:
+- Resolve where an LLM request goes: the public OpenAI API or an OpenAI-compatible
+  server (vLLM, llama.cpp, TGI, ...) given by a per-job `OpenAIConfig.base_url` or
+  `settings.openai_base_url`, plus an optional free-form model override.
+- Cap in-flight requests per endpoint (`settings.llm_endpoint_concurrency`) so a small
+  in-house server is not flooded by the worker pool.
+- Probe custom endpoints (`GET {base_url}/models`) before a job starts.
+
+Public API:
+- `LLMEndpoint`: Resolved credentials, base URL and model override.
+- `resolve_endpoint`: Build an `LLMEndpoint` from request credentials + settings.
+- `resolve_model`: Model override for a request (no credentials needed).
+- `endpoint_slot`: Async context manager enforcing the per-endpoint concurrency cap.
+- `check_endpoint_health`: Cached health probe for custom endpoints.
+- `ensure_endpoint_healthy`: Pre-job probe that raises when the endpoint is down.
+- `LLMEndpointUnavailableError`: Raised when a custom endpoint fails its health check.
+
+Operational:
+- Concurrency: Semaphores are kept per event loop and per base URL.
+- Network: Health probes use httpx with `LLM_ENDPOINT_HEALTH_TIMEOUT_S`; results are
+  cached for `LLM_ENDPOINT_HEALTH_TTL_S`.
+- Security: Per-job base URLs must appear in `settings.llm_allowed_base_urls` (or equal
+  `settings.openai_base_url`); otherwise API users could point the backend at
+  arbitrary internal hosts.
+
+Usage:
+    endpoint = resolve_endpoint(request.openai, settings)
+    client = AsyncOpenAI(**endpoint.client_kwargs())
+    async with endpoint_slot(endpoint.label, settings):
+        ...
+
+Notes:
+- Custom endpoints do not require a project id, and a placeholder API key is sent when
+  none is configured (most local servers ignore it but the SDK requires one).
+- Model precedence: `OpenAIConfig.model` → `settings.openai_model_override` →
+  `settings.openai_model` (which model routing may have set per request).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from agentic_scraper.backend.config.constants import (
+    LLM_ENDPOINT_HEALTH_TIMEOUT_S,
+    LLM_ENDPOINT_HEALTH_TTL_S,
+    LLM_ENDPOINT_PLACEHOLDER_API_KEY,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_ERROR_LLM_BASE_URL_NOT_ALLOWED,
+    MSG_ERROR_LLM_ENDPOINT_UNHEALTHY,
+    MSG_INFO_LLM_ENDPOINT_HEALTHY,
+)
+from agentic_scraper.backend.scraper.agents.agent_helpers import retrieve_openai_credentials
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from agentic_scraper.backend.config.types import OpenAIConfig
+    from agentic_scraper.backend.core.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "LLMEndpoint",
+    "LLMEndpointUnavailableError",
+    "check_endpoint_health",
+    "endpoint_slot",
+    "ensure_endpoint_healthy",
+    "resolve_endpoint",
+    "resolve_model",
+]
+
+
+class LLMEndpointUnavailableError(RuntimeError):
+    """A configured OpenAI-compatible endpoint failed its health check."""
+
+
+@dataclass(frozen=True)
+class LLMEndpoint:
+    """
+    Where and as whom an LLM request is sent.
+
+    Attributes:
+        api_key (str): API key (placeholder for keyless local servers).
+        project_id (str | None): OpenAI project id (public endpoint only).
+        base_url (str | None): OpenAI-compatible base URL (None → public OpenAI API).
+        model (str | None): Model name overriding `settings.openai_model`.
+    """
+
+    api_key: str
+    project_id: str | None = None
+    base_url: str | None = None
+    model: str | None = None
+
+    @property
+    def label(self) -> str:
+        """Stable key for logs, semaphores and breakers."""
+        return self.base_url or "openai"
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for `AsyncOpenAI(...)` (`base_url` only when set)."""
+        kwargs: dict[str, Any] = {"api_key": self.api_key, "project": self.project_id}
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        return kwargs
+
+
+def _normalize_base_url(url: str | None) -> str | None:
+    """Trim whitespace and trailing slashes; empty → None."""
+    if not url:
+        return None
+    return url.strip().rstrip("/") or None
+
+
+def resolve_model(config: OpenAIConfig | None, settings: Settings) -> str | None:
+    """
+    Return the model override for one request (None → use `settings.openai_model`).
+
+    Args:
+        config (OpenAIConfig | None): Per-request/job credentials (may carry `model`).
+        settings (Settings): Provides `openai_model_override`.
+
+    Returns:
+        str | None: `OpenAIConfig.model`, else `settings.openai_model_override`.
+    """
+    return (config.model if config else None) or settings.openai_model_override
+
+
+def resolve_endpoint(
+    config: OpenAIConfig | None,
+    settings: Settings,
+    *,
+    credentials: Callable[[OpenAIConfig | None], tuple[str, str]] = retrieve_openai_credentials,
+) -> LLMEndpoint:
+    """
+    Resolve the endpoint, credentials and model override for one request.
+
+    Args:
+        config (OpenAIConfig | None): Per-request/job credentials (may carry `base_url`
+            and `model`).
+        settings (Settings): Global/merged settings (`openai_base_url`,
+            `openai_model_override`, `llm_allowed_base_urls`).
+        credentials (Callable): Validator for public-API credentials (agents pass their
+            module-level `retrieve_openai_credentials` so it stays patchable).
+
+    Returns:
+        LLMEndpoint: Resolved endpoint.
+
+    Raises:
+        ValueError: If public-API credentials are missing/masked, or a per-job base URL
+            is not allow-listed.
+    """
+    job_url = _normalize_base_url(config.base_url if config else None)
+    default_url = _normalize_base_url(settings.openai_base_url)
+    if job_url and job_url != default_url:
+        allowed = {
+            _normalize_base_url(u) for u in (settings.llm_allowed_base_urls or "").split(",")
+        }
+        if job_url not in allowed:
+            raise ValueError(MSG_ERROR_LLM_BASE_URL_NOT_ALLOWED.format(base_url=job_url))
+    base_url = job_url or default_url
+    model = resolve_model(config, settings)
+
+    if base_url is None:
+        api_key, project_id = credentials(config)
+        return LLMEndpoint(api_key=api_key, project_id=project_id, model=model)
+
+    return LLMEndpoint(
+        api_key=(config.api_key if config else None) or LLM_ENDPOINT_PLACEHOLDER_API_KEY,
+        project_id=config.project_id if config else None,
+        base_url=base_url,
+        model=model,
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-endpoint concurrency
+# ─────────────────────────────────────────────────────────────────────────────
+
+_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]
+_SEMAPHORES = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def endpoint_slot(label: str, settings: Settings) -> AsyncIterator[None]:
+    """
+    Hold one of `settings.llm_endpoint_concurrency` slots for an endpoint (no-op if unset).
+
+    Args:
+        label (str): Endpoint key (`LLMEndpoint.label`); slots are shared per base URL.
+        settings (Settings): Provides the per-endpoint limit.
+    """
+    limit = settings.llm_endpoint_concurrency
+    if not limit:
+        yield
+        return
+    per_loop = _SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    semaphore = per_loop.setdefault(label, asyncio.Semaphore(limit))
+    async with semaphore:
+        yield
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Health checks
+# ─────────────────────────────────────────────────────────────────────────────
+
+_HEALTH_CACHE: dict[str, tuple[float, bool]] = {}
+
+
+async def check_endpoint_health(endpoint: LLMEndpoint, *, force: bool = False) -> bool:
+    """
+    Probe `GET {base_url}/models` on a custom endpoint (cached).
+
+    Args:
+        endpoint (LLMEndpoint): Endpoint to probe; the public API is assumed healthy.
+        force (bool): Ignore the cached result.
+
+    Returns:
+        bool: True when the endpoint answered with a 2xx status.
+    """
+    if endpoint.base_url is None:
+        return True
+    now = time.monotonic()
+    cached = _HEALTH_CACHE.get(endpoint.base_url)
+    if cached is not None and not force and now - cached[0] < LLM_ENDPOINT_HEALTH_TTL_S:
+        return cached[1]
+
+    try:
+        async with httpx.AsyncClient(timeout=LLM_ENDPOINT_HEALTH_TIMEOUT_S) as client:
+            response = await client.get(
+                f"{endpoint.base_url}/models",
+                headers={"Authorization": f"Bearer {endpoint.api_key}"},
+            )
+        healthy = response.is_success
+    except httpx.HTTPError:
+        healthy = False
+
+    _HEALTH_CACHE[endpoint.base_url] = (now, healthy)
+    if healthy:
+        logger.info(MSG_INFO_LLM_ENDPOINT_HEALTHY.format(base_url=endpoint.base_url))
+    return healthy
+
+
+async def ensure_endpoint_healthy(config: OpenAIConfig | None, settings: Settings) -> None:
+    """
+    Fail fast before a job starts when its custom endpoint is down.
+
+    Raises:
+        LLMEndpointUnavailableError: If the resolved custom endpoint is unhealthy.
+        ValueError: Propagated from `resolve_endpoint` (credentials / allow-list).
+    """
+    endpoint = resolve_endpoint(config, settings)
+    if not await check_endpoint_health(endpoint):
+        raise LLMEndpointUnavailableError(
+            MSG_ERROR_LLM_ENDPOINT_UNHEALTHY.format(base_url=endpoint.base_url)
+        )
@@ -0,0 +1,300 @@
+"""
+Fallback model chain with per-target circuit breakers for LLM chat completions.
+
+Responsibilities:
+- Send a chat completion to the primary model and, when the provider is throttling or
+  failing, move on to the next configured model/credential instead of giving up.
+- Track provider failures per target and open a circuit breaker for a cool-down period
+  after repeated failures, so degraded targets are skipped rather than retried.
+
+Public API:
+- `FallbackTarget`: One entry of the chain (model + optional API-key env var).
+- `parse_fallback_chain`: Parse `settings.llm_fallback_chain`.
+- `create_chat_completion`: Chain-aware replacement for `client.chat.completions.create`.
+- `credential_tag`: Short hash of an API key (part of breaker keys).
+- `reset_circuit_breakers`: Clear breaker state (tests / operator tooling).
+
+Operational:
+- Concurrency: Breaker state is process-wide (brownouts affect every job) and only
+  mutated from the event loop. Breakers are keyed by model, endpoint and a hash of the
+  API key, so one user's quota or key problems never trip another user's breaker.
+- Logging: WARNING when a target fails over or a breaker opens; DEBUG when skipping.
+
+Usage:
+    response, model = await create_chat_completion(
+        client,
+        settings=settings,
+        make_client=lambda key: AsyncOpenAI(api_key=key),
+        messages=messages,
+        max_tokens=settings.llm_max_tokens,
+    )
+
+Notes:
+- Chain syntax (`LLM_FALLBACK_CHAIN`): comma-separated `model` or `model@ENV_VAR`
+  entries, e.g. `gpt-4o,gpt-3.5-turbo-16k@BACKUP_OPENAI_API_KEY`. Entries without
+  `@ENV_VAR` reuse the primary credentials. Entries whose `ENV_VAR` is unset are skipped
+  (logged once per variable) rather than silently sent with the primary key.
+- Only provider-side failures fail over: rate limits, connection errors/timeouts
+  (including `llm_timeout_s`) and 5xx responses. Request errors (4xx) are raised
+  immediately.
+- Each attempt may be hedged (one duplicate after the target's running latency
+  quantile; see `llm_hedge.hedged_call`) when `llm_hedge_enabled` is set.
+- With no chain configured the primary is always called, exactly as before.
+- The primary (and chain entries without `@ENV_VAR`) go to the request's resolved
+  `LLMEndpoint`; entries with alternate credentials go to the public OpenAI API. Each
+  call holds a per-endpoint concurrency slot (see `llm_endpoint.endpoint_slot`) and, in
+  the API, a global LLM slot from the fair scheduler (see `scheduler.scheduled_slot`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any
+
+from openai import APIConnectionError
+
+from agentic_scraper.backend.config.aliases import APIErrorT, RateLimitErrorT
+from agentic_scraper.backend.config.constants import HTTP_SERVER_ERROR_MIN_STATUS
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_LLM_FALLBACK_SKIPPED_OPEN,
+    MSG_WARNING_LLM_CIRCUIT_OPENED,
+    MSG_WARNING_LLM_FALLBACK,
+    MSG_WARNING_LLM_FALLBACK_KEY_MISSING,
+)
+from agentic_scraper.backend.config.types import SchedulerResource
+from agentic_scraper.backend.scraper.agents.llm_endpoint import endpoint_slot
+from agentic_scraper.backend.scraper.agents.llm_hedge import hedged_call
+from agentic_scraper.backend.scraper.scheduler import scheduled_slot
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.agents.llm_endpoint import LLMEndpoint
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "FallbackTarget",
+    "create_chat_completion",
+    "credential_tag",
+    "parse_fallback_chain",
+    "reset_circuit_breakers",
+]
+
+
+@dataclass(frozen=True)
+class FallbackTarget:
+    """
+    One model/credential pair in the fallback chain.
+
+    Attributes:
+        model (str): Model name passed to the provider.
+        api_key_env (str | None): Env var holding an alternate API key (None → primary).
+        base_url (str | None): OpenAI-compatible endpoint (None → public OpenAI API).
+        credential (str | None): Short hash of the API key used (see `credential_tag`).
+    """
+
+    model: str
+    api_key_env: str | None = None
+    base_url: str | None = None
+    credential: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Breaker key (model plus credential source, endpoint and key hash)."""
+        key = f"{self.model}@{self.api_key_env}" if self.api_key_env else self.model
+        key = f"{key}|{self.base_url}" if self.base_url else key
+        return f"{key}#{self.credential}" if self.credential else key
+
+
+def credential_tag(api_key: str | None) -> str | None:
+    """Short, non-reversible tag of an API key for breaker keys and logs."""
+    if not api_key:
+        return None
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+@lru_cache(maxsize=32)
+def _warn_missing_key(env: str) -> None:
+    """Log (once per variable) that a chain entry's key variable is unset."""
+    logger.warning(MSG_WARNING_LLM_FALLBACK_KEY_MISSING.format(env=env))
+
+
+@lru_cache(maxsize=8)
+def parse_fallback_chain(raw: str | None) -> tuple[FallbackTarget, ...]:
+    """
+    Parse a comma-separated chain of `model` / `model@ENV_VAR` entries.
+
+    Args:
+        raw (str | None): Raw setting value.
+
+    Returns:
+        tuple[FallbackTarget, ...]: Parsed targets in order (blank entries skipped).
+    """
+    targets: list[FallbackTarget] = []
+    for entry in (raw or "").split(","):
+        model, _, env = entry.strip().partition("@")
+        if model.strip():
+            targets.append(FallbackTarget(model.strip(), env.strip() or None))
+    return tuple(targets)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Circuit breakers
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class _Breaker:
+    failures: int = 0
+    open_until: float = 0.0
+
+
+_BREAKERS: dict[str, _Breaker] = {}
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all failure counts and close every breaker."""
+    _BREAKERS.clear()
+
+
+def _is_open(target: FallbackTarget) -> bool:
+    breaker = _BREAKERS.get(target.key)
+    return breaker is not None and breaker.open_until > time.monotonic()
+
+
+def _record_success(target: FallbackTarget) -> None:
+    _BREAKERS.pop(target.key, None)
+
+
+def _record_failure(target: FallbackTarget, settings: Settings) -> None:
+    breaker = _BREAKERS.setdefault(target.key, _Breaker())
+    breaker.failures += 1
+    if breaker.failures >= settings.llm_circuit_failure_threshold:
+        breaker.open_until = time.monotonic() + settings.llm_circuit_cooldown_s
+        breaker.failures = 0
+        logger.warning(
+            MSG_WARNING_LLM_CIRCUIT_OPENED.format(
+                target=target.key, cooldown=settings.llm_circuit_cooldown_s
+            )
+        )
+
+
+def _is_provider_failure(exc: Exception) -> bool:
+    """Rate limits, connection problems, timeouts and 5xx; not request (4xx) errors."""
+    if isinstance(exc, (RateLimitErrorT, APIConnectionError, asyncio.TimeoutError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and status >= HTTP_SERVER_ERROR_MIN_STATUS
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Chain-aware completion
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@asynccontextmanager
+async def _target_slots(target: FallbackTarget, settings: Settings) -> AsyncIterator[None]:
+    """Hold the global LLM slot and the target endpoint's slot for one attempt."""
+    async with (
+        scheduled_slot(SchedulerResource.LLM),
+        endpoint_slot(target.base_url or "openai", settings),
+    ):
+        yield
+
+
+async def create_chat_completion(  # noqa: PLR0913 - keyword-only call options
+    client: Any,  # noqa: ANN401 - real SDK client or test stub
+    *,
+    settings: Settings,
+    make_client: Callable[[str], Any],
+    messages: Any,  # noqa: ANN401 - SDK message params or plain dicts
+    max_tokens: int,
+    endpoint: LLMEndpoint | None = None,
+) -> tuple[Any, str]:
+    """
+    Call the primary model, failing over along `settings.llm_fallback_chain`.
+
+    Args:
+        client (Any): Client built from the request's primary credentials.
+        settings (Settings): Model, temperature, chain and breaker configuration.
+        make_client (Callable[[str], Any]): Builds a client for an alternate API key.
+        messages (Any): Chat messages.
+        max_tokens (int): Completion token limit.
+        endpoint (LLMEndpoint | None): Resolved endpoint of `client`; its `model`
+            replaces `settings.openai_model` as the primary.
+
+    Returns:
+        tuple[Any, str]: Provider response and the model that produced it.
+
+    Raises:
+        APIErrorT | RateLimitErrorT | OpenAIErrorT: The last provider error when every
+            target failed, or a request (4xx) error immediately.
+    """
+    base_url = endpoint.base_url if endpoint else None
+    primary_model = (endpoint.model if endpoint else None) or str(
+        getattr(settings.openai_model, "value", settings.openai_model)
+    )
+    primary_key = endpoint.api_key if endpoint else getattr(client, "api_key", None)
+    primary_tag = credential_tag(primary_key if isinstance(primary_key, str) else None)
+    chain_targets = [FallbackTarget(primary_model, base_url=base_url, credential=primary_tag)]
+    for t in parse_fallback_chain(settings.llm_fallback_chain):
+        if not t.api_key_env:
+            chain_targets.append(FallbackTarget(t.model, base_url=base_url, credential=primary_tag))
+        elif api_key := os.environ.get(t.api_key_env):
+            chain_targets.append(
+                FallbackTarget(t.model, t.api_key_env, credential=credential_tag(api_key))
+            )
+        else:
+            _warn_missing_key(t.api_key_env)
+    chain = tuple(chain_targets)
+    # Breakers only matter when there is somewhere else to go.
+    candidates = [t for t in chain if not _is_open(t)] if len(chain) > 1 else list(chain)
+    for skipped in (t for t in chain if t not in candidates):
+        logger.debug(MSG_DEBUG_LLM_FALLBACK_SKIPPED_OPEN.format(target=skipped.key))
+    if not candidates:
+        candidates = [chain[0]]  # everything is cooling down: probe the primary
+
+    last_error: Exception | None = None
+    for index, target in enumerate(candidates):
+        api_key = os.environ.get(target.api_key_env) if target.api_key_env else None
+        target_client = make_client(api_key) if api_key else client
+        try:
+            response = await hedged_call(
+                partial(
+                    target_client.chat.completions.create,
+                    model=target.model,
+                    messages=messages,
+                    temperature=settings.llm_temperature,
+                    max_tokens=max_tokens,
+                ),
+                key=target.key,
+                settings=settings,
+                slot=partial(_target_slots, target, settings),
+            )
+        except (RateLimitErrorT, APIErrorT, asyncio.TimeoutError) as e:
+            if not _is_provider_failure(e):
+                raise
+            _record_failure(target, settings)
+            last_error = e
+            if index + 1 < len(candidates):
+                logger.warning(
+                    MSG_WARNING_LLM_FALLBACK.format(
+                        target=target.key, next=candidates[index + 1].key, error=type(e).__name__
+                    )
+                )
+            continue
+        _record_success(target)
+        return response, target.model
+
+    assert last_error is not None  # noqa: S101 - loop ran at least once
+    raise last_error
@@ -33,7 +33,7 @@ Notes:
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from pydantic import ValidationError
 from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -50,9 +50,12 @@ from agentic_scraper.backend.scraper.agents.agent_helpers import (
     capture_optional_screenshot,
     handle_openai_exception,
     log_structured_data,
+    note_invalid_output,
     parse_llm_response,
     retrieve_openai_credentials,
 )
+from agentic_scraper.backend.scraper.agents.llm_endpoint import resolve_endpoint
+from agentic_scraper.backend.scraper.agents.llm_fallback import create_chat_completion
 from agentic_scraper.backend.scraper.schemas import ScrapedItem
 
 if TYPE_CHECKING:
@@ -186,17 +189,20 @@ async def _extract_impl(
         {"role": "user", "content": request.text[:4000]},  # trim to control token usage
     ]
 
-    # Extract and validate credentials early; fail fast if missing/invalid.
-    api_key, project_id = retrieve_openai_credentials(request.openai)
-    client = AsyncOpenAI(api_key=api_key, project=project_id)
+    # Resolve endpoint/credentials early; fail fast if missing/invalid.
+    endpoint = resolve_endpoint(request.openai, settings, credentials=retrieve_openai_credentials)
+    client = AsyncOpenAI(**endpoint.client_kwargs())
 
     try:
         # Real SDK & stub both expose: client.chat.completions.create(...)
-        response: Any = await client.chat.completions.create(
-            model=settings.openai_model,
+        # Primary model first, then `settings.llm_fallback_chain` on provider failures.
+        response, used_model = await create_chat_completion(
+            client,
+            settings=settings,
+            make_client=lambda key: AsyncOpenAI(api_key=key, project=None),
             messages=messages,
-            temperature=settings.llm_temperature,
             max_tokens=settings.llm_max_tokens,
+            endpoint=endpoint,
         )
 
         # OpenAI SDK shape: choices[0].message.content (string or None)
@@ -210,6 +216,8 @@ async def _extract_impl(
         raw_data = parse_llm_response(content, request.url, settings)
         if raw_data is None:
             return None
+        if used_model != settings.openai_model:
+            raw_data["llm_model"] = used_model  # served by a fallback model
 
         # Optional screenshot—deferred until after a successful parse to avoid waste.
         if request.take_screenshot:
@@ -223,6 +231,7 @@ async def _extract_impl(
         except ValidationError as ve:
             # Log at warning; the caller treats None as "no item" for this URL.
             logger.warning(MSG_ERROR_LLM_VALIDATION_FAILED_WITH_URL.format(url=request.url, exc=ve))
+            note_invalid_output()
             return None
     except (RateLimitErrorT, APIErrorT, OpenAIErrorT) as e:
         # Uniform, verbosity-aware logging for OpenAI exceptions.
@@ -0,0 +1,268 @@
+"""
+Hedged LLM requests: duplicate a slow call once and keep whichever answer arrives first.
+
+Responsibilities:
+- Keep a rolling window of recent call latencies per fallback target.
+- Start a single hedge request when an attempt has held its slot for longer than the
+  target's running latency quantile (`llm_hedge_quantile`, p90 by default), then cancel
+  the loser. No hedge is sent when its own slot is not free right away.
+- Bound every attempt by `llm_timeout_s` so a stuck call fails over instead of hanging.
+- Count hedges, hedge wins and the estimated latency saved for the current job.
+
+Public API:
+- `HedgeStats`: Per-job counters, exported into pipeline stats via `as_stats()`.
+- `hedge_stats_scope`: Bind a fresh `HedgeStats` for the enclosed code (and its tasks).
+- `hedged_call`: Run one LLM attempt with optional hedging and timeout.
+- `reset_latency_windows`: Forget recorded latencies (tests / operator tooling).
+
+Operational:
+- Concurrency: Latency windows are process-wide (like the circuit breakers) and only
+  mutated from the event loop. A hedge holds its own scheduler/endpoint slot.
+- Cost: At most one extra request per call, and only for the slowest ~(1 - quantile)
+  share of calls once a target has `LLM_HEDGE_MIN_SAMPLES` completed calls.
+- Logging: DEBUG when a hedge is sent and when it wins.
+
+Usage:
+    with hedge_stats_scope() as stats:
+        response = await hedged_call(
+            partial(client.chat.completions.create, model=model, messages=messages),
+            key=target.key,
+            settings=settings,
+            slot=partial(acquire_slots, target),
+        )
+    extra_stats.update(stats.as_stats())
+
+Notes:
+- Latency is measured while holding the slot, and the hedge delay also starts only
+  once the primary holds its slot, so time spent queueing neither inflates the quantile
+  nor triggers hedges. Cancelled losers are not recorded.
+- A hedge that would have to queue for its slot is dropped (not counted): under
+  saturation it would only add load. Slots are free when acquirable without suspending,
+  which holds for the scheduler and endpoint semaphores.
+- `llm_hedge_saved_sec` is an estimate: for each hedge win, the mean of recorded
+  latencies above the winning time, minus the winning time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import AbstractAsyncContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+from agentic_scraper.backend.config.constants import (
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_WINDOW_SIZE,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_LLM_HEDGE_ISSUED,
+    MSG_DEBUG_LLM_HEDGE_SKIPPED_BUSY,
+    MSG_DEBUG_LLM_HEDGE_WON,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from agentic_scraper.backend.core.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "HedgeStats",
+    "hedge_stats_scope",
+    "hedged_call",
+    "reset_latency_windows",
+]
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeStats:
+    """
+    Hedging counters for one job.
+
+    Attributes:
+        hedges (int): Hedge requests sent.
+        wins (int): Hedge requests that answered before their primary.
+        saved_s (float): Estimated latency saved by winning hedges, in seconds.
+    """
+
+    hedges: int = 0
+    wins: int = 0
+    saved_s: float = 0.0
+
+    def as_stats(self) -> dict[str, float | int]:
+        """Return the counters under their pipeline-stats keys."""
+        return {
+            "num_llm_hedges": self.hedges,
+            "num_llm_hedge_wins": self.wins,
+            "llm_hedge_saved_sec": round(self.saved_s, 2),
+        }
+
+
+_CURRENT_STATS: ContextVar[HedgeStats | None] = ContextVar("llm_hedge_stats", default=None)
+
+
+@contextmanager
+def hedge_stats_scope() -> Iterator[HedgeStats]:
+    """
+    Collect hedging counters for the enclosed code (and tasks it creates).
+
+    Yields:
+        HedgeStats: Counters updated by every `hedged_call` in scope.
+    """
+    stats = HedgeStats()
+    token = _CURRENT_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _CURRENT_STATS.reset(token)
+
+
+class _LatencyWindow:
+    """Most recent successful call latencies of one target."""
+
+    def __init__(self) -> None:
+        self._samples: deque[float] = deque(maxlen=LLM_HEDGE_WINDOW_SIZE)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float:
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def mean_above(self, seconds: float) -> float:
+        slower = [s for s in self._samples if s > seconds]
+        return sum(slower) / len(slower) if slower else seconds
+
+
+_WINDOWS: dict[str, _LatencyWindow] = {}
+
+
+def reset_latency_windows() -> None:
+    """Forget all recorded latencies (hedging restarts its warm-up)."""
+    _WINDOWS.clear()
+
+
+async def _attempt(
+    call: Callable[[], Awaitable[T]],
+    slot: Callable[[], AbstractAsyncContextManager[None]],
+    window: _LatencyWindow,
+    timeout_s: float,
+    holding: asyncio.Event | None = None,
+) -> T:
+    async with slot():
+        if holding is not None:
+            holding.set()
+        started = time.monotonic()
+        if timeout_s > 0:
+            result = await asyncio.wait_for(call(), timeout=timeout_s)
+        else:
+            result = await call()
+        window.add(time.monotonic() - started)
+        return result
+
+
+async def hedged_call(
+    call: Callable[[], Awaitable[T]],
+    *,
+    key: str,
+    settings: Settings,
+    slot: Callable[[], AbstractAsyncContextManager[None]] | None = None,
+) -> T:
+    """
+    Await `call()`, sending one duplicate if it outlives the target's latency quantile.
+
+    Args:
+        call (Callable[[], Awaitable[T]]): Starts one provider request.
+        key (str): Target key (latencies are tracked per key).
+        settings (Settings): Provides `llm_hedge_enabled`, `llm_hedge_quantile` and
+            `llm_timeout_s`.
+        slot (Callable[[], AbstractAsyncContextManager[None]] | None): Concurrency
+            slot(s) held around each attempt, including the hedge.
+
+    Returns:
+        T: Result of whichever attempt succeeded first.
+
+    Raises:
+        TimeoutError: If an attempt exceeded `llm_timeout_s` (and no hedge succeeded).
+        Exception: The primary's error when every attempt failed.
+    """
+    window = _WINDOWS.setdefault(key, _LatencyWindow())
+    acquire = slot or nullcontext
+    timeout_s = settings.llm_timeout_s
+    if not settings.llm_hedge_enabled or len(window) < LLM_HEDGE_MIN_SAMPLES:
+        return await _attempt(call, acquire, window, timeout_s)
+
+    delay = window.quantile(settings.llm_hedge_quantile)
+    primary_holding = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_attempt(call, acquire, window, timeout_s, primary_holding))
+    ]
+    try:
+        # The hedge delay runs from the moment the primary holds its slot.
+        holding_wait = asyncio.create_task(primary_holding.wait())
+        try:
+            await asyncio.wait([tasks[0], holding_wait], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            holding_wait.cancel()
+        started = time.monotonic()
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            hedge = await _start_hedge(call, acquire, window, timeout_s)
+            if hedge is None:
+                logger.debug(MSG_DEBUG_LLM_HEDGE_SKIPPED_BUSY.format(target=key))
+            else:
+                logger.debug(MSG_DEBUG_LLM_HEDGE_ISSUED.format(target=key, delay=delay))
+                tasks.append(hedge)
+                if (stats := _CURRENT_STATS.get()) is not None:
+                    stats.hedges += 1
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = next((t for t in tasks if t in done and t.exception() is None), None)
+            if winner is None:
+                continue
+            if winner is not tasks[0]:
+                _record_hedge_win(key, window, time.monotonic() - started)
+            return winner.result()
+        error = tasks[0].exception()
+        assert error is not None  # noqa: S101 - every attempt failed
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _start_hedge(
+    call: Callable[[], Awaitable[T]],
+    slot: Callable[[], AbstractAsyncContextManager[None]],
+    window: _LatencyWindow,
+    timeout_s: float,
+) -> asyncio.Task[T] | None:
+    """Start a hedge attempt if its slot is free right now; otherwise cancel it."""
+    holding = asyncio.Event()
+    hedge = asyncio.create_task(_attempt(call, slot, window, timeout_s, holding))
+    await asyncio.sleep(0)  # let the hedge run up to its first suspension
+    if holding.is_set() or hedge.done():
+        return hedge
+    hedge.cancel()
+    await asyncio.gather(hedge, return_exceptions=True)
+    return None
+
+
+def _record_hedge_win(key: str, window: _LatencyWindow, elapsed: float) -> None:
+    logger.debug(MSG_DEBUG_LLM_HEDGE_WON.format(target=key, elapsed=elapsed))
+    if (stats := _CURRENT_STATS.get()) is not None:
+        stats.wins += 1
+        stats.saved_s += max(0.0, window.mean_above(elapsed) - elapsed)
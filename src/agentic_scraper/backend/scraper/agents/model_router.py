@@ -0,0 +1,222 @@
+"""
+Per-request LLM model routing for the agent dispatcher.
+
+Responsibilities:
+- Choose the OpenAI model for each page from its estimated token count, inferred page
+  type, and the failure rate observed so far in the run.
+- Escalate once to a stronger model when the routed model's output fails parsing or
+  validation, or its item scores below `MODEL_ROUTING_MIN_FIELD_SCORE`.
+- Record the model that produced each item on `ScrapedItem.llm_model`.
+
+Public API:
+- `RouteDecision`: Chosen model, reason and the signals behind it.
+- `ModelRouter`: Run-scoped router (policy + outcome statistics).
+
+Operational:
+- Concurrency: One router per worker-pool run; mutated only from the event loop.
+- Logging: DEBUG per routing decision; INFO per escalation.
+
+Usage:
+    from agentic_scraper.backend.scraper.agents.model_router import ModelRouter
+
+    router = ModelRouter(settings)
+    item = await agents.extract_structured_data(request, settings=settings, router=router)
+
+Notes:
+- Policy, in order: long pages → `model_routing_long_model`; page types whose failure
+  rate on the default model exceeds `model_routing_max_failure_rate` → escalation model;
+  everything else → `settings.openai_model` (the cheap default).
+- The routed model is applied through `settings.model_copy(update=...)`, so agents keep
+  reading `settings.openai_model` and need no routing awareness.
+- Pages packed by the short-page batcher are short by definition and stay on the
+  default model.
+- Provider errors (timeouts, rate limits, empty replies) are not escalated and do not
+  count towards failure rates: the fallback chain handles those, and a stronger model
+  would not help.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from agentic_scraper.backend.config.constants import (
+    MODEL_ROUTING_MIN_FIELD_SCORE,
+    MODEL_ROUTING_MIN_SAMPLES,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_MODEL_ROUTED,
+    MSG_INFO_MODEL_ESCALATED,
+)
+from agentic_scraper.backend.scraper.agents.agent_helpers import (
+    infer_page_type,
+    output_check_scope,
+)
+from agentic_scraper.backend.scraper.agents.field_utils import score_nonempty_fields
+from agentic_scraper.backend.scraper.agents.llm_batch import estimate_tokens
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from agentic_scraper.backend.config.types import OpenAIModel
+    from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.models import ScrapeRequest
+    from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+    AgentFn = Callable[..., Awaitable[ScrapedItem | None]]
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ModelRouter", "RouteDecision"]
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """
+    Outcome of routing one request.
+
+    Attributes:
+        model (OpenAIModel): Model to call.
+        reason (str): "default", "long_page" or "failure_rate".
+        tokens (int): Estimated prompt tokens of the page text.
+        page_type (str): Inferred page type (from context hints or the URL).
+    """
+
+    model: OpenAIModel
+    reason: str
+    tokens: int
+    page_type: str
+
+
+class ModelRouter:
+    """
+    Run-scoped model router with per-(model, page type) outcome statistics.
+
+    Attributes:
+        settings (Settings): Base settings (routing thresholds and models).
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Create a router with empty statistics."""
+        self.settings = settings
+        # (model, page_type) → [attempts, failures]
+        self._outcomes: defaultdict[tuple[str, str], list[int]] = defaultdict(lambda: [0, 0])
+
+    # ── Statistics ──────────────────────────────────────────────────────────
+
+    def record(self, model: OpenAIModel, page_type: str, *, ok: bool) -> None:
+        """Count one extraction outcome for `model` on `page_type`."""
+        counts = self._outcomes[(model.value, page_type)]
+        counts[0] += 1
+        if not ok:
+            counts[1] += 1
+
+    def failure_rate(self, model: OpenAIModel, page_type: str) -> float | None:
+        """Observed failure rate, or None until `MODEL_ROUTING_MIN_SAMPLES` outcomes exist."""
+        attempts, failures = self._outcomes.get((model.value, page_type), (0, 0))
+        if attempts < MODEL_ROUTING_MIN_SAMPLES:
+            return None
+        return failures / attempts
+
+    # ── Policy ──────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def page_type_of(request: ScrapeRequest) -> str:
+        """Page type from context hints when available, else from URL keywords."""
+        hints = request.context_hints or {}
+        return hints.get("page") or hints.get("page_type") or infer_page_type(request.url.lower())
+
+    def choose(self, request: ScrapeRequest) -> RouteDecision:
+        """
+        Pick the model for `request`.
+
+        Args:
+            request (ScrapeRequest): Page to extract.
+
+        Returns:
+            RouteDecision: Selected model and the reason.
+        """
+        s = self.settings
+        tokens = estimate_tokens(request.text)
+        page_type = self.page_type_of(request)
+
+        if tokens >= s.model_routing_long_page_tokens:
+            return RouteDecision(s.model_routing_long_model, "long_page", tokens, page_type)
+
+        rate = self.failure_rate(s.openai_model, page_type)
+        if rate is not None and rate > s.model_routing_max_failure_rate:
+            return RouteDecision(
+                s.model_routing_escalation_model, "failure_rate", tokens, page_type
+            )
+        return RouteDecision(s.openai_model, "default", tokens, page_type)
+
+    @staticmethod
+    def field_score(item: ScrapedItem) -> float:
+        """Weighted score of the item's extracted fields (bookkeeping fields excluded)."""
+        fields = item.model_dump(exclude={"url", "screenshot_path", "llm_model"})
+        return score_nonempty_fields(fields)
+
+    # ── Execution ───────────────────────────────────────────────────────────
+
+    async def _attempt(
+        self,
+        agent_fn: AgentFn,
+        request: ScrapeRequest,
+        model: OpenAIModel,
+        page_type: str,
+    ) -> tuple[ScrapedItem | None, bool]:
+        """Run one extraction; returns the item and whether its output quality was poor."""
+        routed = self.settings.model_copy(update={"openai_model": model})
+        with output_check_scope() as check:
+            item = await agent_fn(request, settings=routed)
+        if item is None:
+            poor = check.invalid
+            if poor:  # provider failures say nothing about the model's extraction quality
+                self.record(model, page_type, ok=False)
+            return None, poor
+        poor = self.field_score(item) < MODEL_ROUTING_MIN_FIELD_SCORE
+        self.record(model, page_type, ok=not poor)
+        if item.llm_model is None:  # a fallback model may have served it
+            item.llm_model = model.value
+        return item, poor
+
+    async def run(self, request: ScrapeRequest, agent_fn: AgentFn) -> ScrapedItem | None:
+        """
+        Route `request`, call `agent_fn`, and escalate once on invalid or low-score output.
+
+        Args:
+            request (ScrapeRequest): Page to extract.
+            agent_fn (AgentFn): Agent entrypoint `(request, *, settings)`.
+
+        Returns:
+            ScrapedItem | None: Item tagged with `llm_model` (the higher-scoring one when
+            both attempts produced an item), or None if no attempt produced one.
+        """
+        decision = self.choose(request)
+        logger.debug(
+            MSG_DEBUG_MODEL_ROUTED.format(
+                url=request.url,
+                model=decision.model.value,
+                reason=decision.reason,
+                tokens=decision.tokens,
+                page_type=decision.page_type,
+            )
+        )
+        item, poor = await self._attempt(agent_fn, request, decision.model, decision.page_type)
+
+        escalation = self.settings.model_routing_escalation_model
+        if not poor or decision.model == escalation:
+            return item
+        logger.info(
+            MSG_INFO_MODEL_ESCALATED.format(
+                url=request.url, model=decision.model.value, escalation=escalation.value
+            )
+        )
+        escalated, _ = await self._attempt(agent_fn, request, escalation, decision.page_type)
+        if item is None or (
+            escalated is not None and self.field_score(escalated) >= self.field_score(item)
+        ):
+            return escalated
+        return item
@@ -7,11 +7,13 @@ Responsibilities:
 - Build retry prompts that focus the LLM on missing fields while encouraging
   discovery of additional relevant data.
 - Provide a fallback prompt when there are no clearly-missing required fields.
+- Build multi-page prompts that pack several short pages into a single call.
 
 Public API:
 - `build_prompt`: Construct an initial prompt (style: 'simple' | 'enhanced').
 - `build_retry_prompt`: Construct a focused retry prompt around missing fields.
 - `build_retry_or_fallback_prompt`: Choose retry or generic fallback prompt.
+- `build_batch_prompt`: Construct one prompt covering several short pages.
 
 Operational:
 - Logging: Debug logs annotate which mode/context was used (no PII).
@@ -48,7 +50,12 @@ from agentic_scraper.backend.scraper.agents.field_utils import FIELD_WEIGHTS
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["build_prompt", "build_retry_or_fallback_prompt", "build_retry_prompt"]
+__all__ = [
+    "build_batch_prompt",
+    "build_prompt",
+    "build_retry_or_fallback_prompt",
+    "build_retry_prompt",
+]
 
 # A short illustrative example that helps steer the model when the input text is short
 # enough (we avoid adding it to long prompts to control token usage).
@@ -321,3 +328,56 @@ Return as a valid JSON object.
         "Create new field names as needed when encountering novel information. "
         "Return as a valid JSON object."
     )
+
+
+def build_batch_prompt(pages: list[tuple[str, str]], *, fixed_schema: bool = False) -> str:
+    """
+    Build a single prompt that asks the LLM to extract several short pages at once.
+
+    Args:
+        pages (list[tuple[str, str]]): `(url, text)` pairs to extract, in order.
+        fixed_schema (bool): If True, restrict output to the fixed schema fields
+            (title, description, price, author, date_published); otherwise use the
+            open-ended dynamic instructions.
+
+    Returns:
+        str: A prompt requesting a JSON object of the form `{"items": [...]}` with one
+            entry per page, each carrying its own `url`.
+
+    Notes:
+        - The shared instruction block is emitted once, which is where batching saves
+          prompt tokens compared with one `build_prompt` call per page.
+        - Each page is delimited and labelled with its URL so results can be split back
+          by URL regardless of the order the model returns them in.
+    """
+    if fixed_schema:
+        fields_block = (
+            "For each page, return only these fields: url, title, description, price, "
+            "author, date_published. Use null for any field that is not present."
+        )
+    else:
+        fields_block = f"""For each page, infer the page_type (e.g. product, blog, job) and extract
+as many useful structured fields as the page clearly presents.
+The following fields are especially important: {", ".join(IMPORTANT_FIELDS)}.
+Mandatory fields for every page: url, page_type.
+If a field is unavailable (e.g., 'Not specified', 'N/A'), return it as null.
+Do not guess or hallucinate values."""
+
+    page_blocks = "\n\n".join(
+        f"=== PAGE {idx} ===\nPage URL: {url}\nPage Content:\n{text}"
+        for idx, (url, text) in enumerate(pages, start=1)
+    )
+
+    return f"""
+You are a smart web content extraction agent.
+You will receive {len(pages)} independent web pages. Extract each page separately;
+never mix information between pages.
+
+{fields_block}
+
+Return a single valid JSON object of the form:
+{{"items": [{{"url": "<page url>", ...fields...}}, ...]}}
+with exactly one entry per page, and copy each page's URL verbatim into its "url" field.
+
+{page_blocks}
+""".strip()
@@ -9,7 +9,7 @@ Responsibilities:
 
 Public API:
 - `extract_structured_data`: Main entry point; returns a validated `ScrapedItem | None`.
-- `guess_title`: First non-empty line heuristic.
+- `guess_title`: First non-empty line heuristic (legacy per-field helper).
 - `guess_description`: Medium-length paragraph heuristic (price tails removed).
 - `guess_price`: Regex-based price detection with fallbacks.
 
@@ -28,6 +28,8 @@ Usage:
 Notes:
 - Heuristics are intentionally conservative to avoid false positives.
 - Price parsing tolerates common thousands/decimal separators (',' vs '.').
+- `extract_structured_data` uses the single-pass scanner in `rule_engine`; the `guess_*`
+  helpers remain as the reference implementation for `run_rule_benchmark.py`.
 """
 
 import logging
@@ -56,6 +58,7 @@ from agentic_scraper.backend.scraper.agents.agent_helpers import (
     capture_optional_screenshot,
     log_structured_data,
 )
+from agentic_scraper.backend.scraper.agents.rule_engine import extract_fields
 from agentic_scraper.backend.scraper.models import ScrapeRequest
 from agentic_scraper.backend.scraper.schemas import ScrapedItem
 
@@ -272,10 +275,9 @@ async def extract_structured_data(
     """
     logger.debug(MSG_DEBUG_RULE_BASED_START.format(url=request.url))
 
-    # Field inference via simple text/regex heuristics.
-    title = guess_title(request.text)
-    description = guess_description(request.text)
-    price = guess_price(request.text)
+    # Field inference via the compiled single-pass scanner (see rule_engine.py).
+    fields = extract_fields(request.text)
+    title, description, price = fields.title, fields.description, fields.price
 
     logger.debug(MSG_DEBUG_RULE_BASED_TITLE.format(title=title))
     logger.debug(MSG_DEBUG_RULE_BASED_DESCRIPTION.format(description=description))
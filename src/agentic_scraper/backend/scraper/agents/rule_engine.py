@@ -0,0 +1,287 @@
+"""
+Compiled, batch-oriented rule-based extraction engine.
+
+Responsibilities:
+- Extract title / description / price from plain text with patterns compiled once at
+  import time; each field is a single forward scan that stops at the first hit.
+- Recognize prices in common currencies and locales (symbol or ISO code before/after the
+  amount; `1,234.56`, `1.234,56`, `1 234,56` groupings).
+- Offer batch entry points that process many texts per call, with an optional
+  process-pool fan-out for very large rule-based runs.
+
+Public API:
+- `RuleFields`: Extracted fields for one text.
+- `extract_fields`: Single-text scanner.
+- `extract_fields_batch`: In-process batch over many texts.
+- `extract_fields_parallel`: Chunked `ProcessPoolExecutor` fan-out (falls back in-process).
+- `extract_items_batch`: `(url, text)` inputs → validated `ScrapedItem | None` list.
+- `extract_item_dicts`: Process-pool entry point; like `extract_items_batch` but returns
+  picklable `ScrapedItem` dicts (used by the worker pool's process mode).
+
+Operational:
+- Concurrency: Pure CPU work; the parallel helper uses worker processes, so call it from
+  a thread (`asyncio.to_thread`) when inside an event loop.
+- Logging: None per text (hot path); callers log summaries.
+
+Usage:
+    from agentic_scraper.backend.scraper.agents.rule_engine import extract_items_batch
+
+    items = extract_items_batch(inputs, max_workers=4)
+
+Notes:
+- Price detection anchors on ASCII digit runs (cheap to scan for) and only then checks
+  the few characters around each number for a currency marker.
+- Prices are taken in document order (first match wins); the legacy helpers in
+  `rule_based` prefer `$` prices anywhere in the text. A lone separator followed by
+  exactly three digits is read as a thousands separator (`$1,299` → 1299.0).
+- `run_rule_benchmark.py` (repo root) compares this engine with the legacy helpers.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from agentic_scraper.backend.config.constants import (
+    DESCRIPTION_MAX_LENGTH,
+    DESCRIPTION_MIN_LENGTH,
+    REGEX_PARAGRAPH_SPLIT_PATTERN,
+    RULE_ENGINE_CHUNK_SIZE,
+    RULE_ENGINE_PARALLEL_MIN_TEXTS,
+)
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.config.aliases import ScrapeInput
+
+__all__ = [
+    "RuleFields",
+    "extract_fields",
+    "extract_fields_batch",
+    "extract_fields_parallel",
+    "extract_item_dicts",
+    "extract_items_batch",
+]
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Precompiled patterns
+# ──────────────────────────────────────────────────────────────────────────────
+
+_CURRENCY_BEFORE = (
+    r"(?:US\$|C\$|A\$|NZ\$|HK\$|R\$|\$|€|£|¥|₹|₩|₽|₺|₪|"
+    r"CHF|USD|EUR|GBP|JPY|INR|CAD|AUD|CNY|BRL)"
+)
+_CURRENCY_AFTER = r"(?:€|\$|£|¥|₽|zł|kr|Kč|Ft|lei|CHF|USD|EUR|GBP|PLN|SEK|NOK|DKK|CZK|HUF|RON|JPY)"
+# Candidate numbers: ASCII digit runs joined by separators. Anchoring on `[0-9]` lets the
+# regex engine skip text quickly; the strict grammar below then validates each candidate.
+# A plain ASCII space never joins digits: "$49 100% cotton" must stay 49, not 49100.
+_NUMBER_RUN_RE = re.compile(r"[0-9]+(?:[.,\u00a0\u202f][0-9]+)*")
+# Grouped thousands (",", ".", NBSP, narrow NBSP) or a plain integer, plus decimals.
+_AMOUNT_RE = re.compile(
+    r"[0-9]{1,3}(?:[.,\u00a0\u202f][0-9]{3})+(?:[.,][0-9]{1,2})?|[0-9]+(?:[.,][0-9]{1,2})?"
+)
+# Currency context is checked only around amounts, never scanned for on its own.
+_CURRENCY_BEFORE_RE = re.compile(rf"{_CURRENCY_BEFORE}\s?\Z")
+_CURRENCY_AFTER_RE = re.compile(rf"\s?{_CURRENCY_AFTER}(?!\w)")
+_PARAGRAPH_SEP_RE = re.compile(REGEX_PARAGRAPH_SPLIT_PATTERN)
+_FIRST_LINE_RE = re.compile(r"\S[^\n]*")
+
+_CURRENCY_LOOKBACK = 4  # longest "before" token ("NZ$" + space) fits in this window
+_GROUP_SPACES = str.maketrans("", "", "\u00a0\u202f")
+_THOUSANDS_GROUP_LEN = 3
+
+
+@dataclass(frozen=True, slots=True)
+class RuleFields:
+    """Fields inferred from one text (any may be None)."""
+
+    title: str | None = None
+    description: str | None = None
+    price: float | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        """True when nothing informative was found."""
+        return self.title is None and self.description is None and self.price is None
+
+
+def _amount_to_float(amount: str) -> float | None:
+    """Normalize a locale-formatted amount ('1.234,56', '1,299', '12,5') to float."""
+    s = amount.translate(_GROUP_SPACES)
+    if "," in s and "." in s:
+        decimal = "," if s.rfind(",") > s.rfind(".") else "."
+        thousands = "." if decimal == "," else ","
+        s = s.replace(thousands, "").replace(decimal, ".")
+    elif "," in s or "." in s:
+        sep = "," if "," in s else "."
+        head, _, tail = s.rpartition(sep)
+        if s.count(sep) > 1 or len(tail) == _THOUSANDS_GROUP_LEN:
+            s = s.replace(sep, "")
+        else:
+            s = f"{head.replace(sep, '')}.{tail}"
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
+def _first_price(text: str) -> float | None:
+    """First amount in `text` with a currency marker right before or after it."""
+    for m in _NUMBER_RUN_RE.finditer(text):
+        start, end = m.span()
+        if start and text[start - 1] in ".,":
+            continue
+        has_before = (
+            _CURRENCY_BEFORE_RE.search(text, max(0, start - _CURRENCY_LOOKBACK), start)
+            and not text[end : end + 1].isalpha()
+        )
+        if not (has_before or _CURRENCY_AFTER_RE.match(text, end)):
+            continue
+        amount = m.group(0)
+        if _AMOUNT_RE.fullmatch(amount):
+            return _amount_to_float(amount)
+    return None
+
+
+def _description_from(paragraph: str) -> str | None:
+    """Trim trailing price lines and accept the paragraph if its length fits."""
+    candidate = paragraph.strip()
+    if len(candidate) < DESCRIPTION_MIN_LENGTH:
+        # Trimming only shortens the paragraph, so it can never qualify.
+        return None
+    lines = candidate.splitlines()
+    while lines and _first_price(lines[-1]) is not None:
+        lines.pop()
+    candidate = "\n".join(lines).strip()
+    if DESCRIPTION_MIN_LENGTH <= len(candidate) <= DESCRIPTION_MAX_LENGTH:
+        return candidate
+    return None
+
+
+def _first_description(text: str) -> str | None:
+    """First qualifying paragraph, walking separators lazily (no full split)."""
+    pos = 0
+    for sep in _PARAGRAPH_SEP_RE.finditer(text):
+        description = _description_from(text[pos : sep.start()])
+        if description is not None:
+            return description
+        pos = sep.end()
+    return _description_from(text[pos:])
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Public API
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+def extract_fields(text: str) -> RuleFields:
+    """
+    Infer title, description and price from `text`.
+
+    Args:
+        text (str): Visible page text.
+
+    Returns:
+        RuleFields: First non-empty line as title, first medium-length paragraph
+        (blank-line separated, trailing price lines removed) as description, and the
+        first currency-marked amount in document order as price.
+
+    Notes:
+        - Each field is one forward scan with a precompiled pattern that stops at the
+          first hit; nothing is split or copied up front.
+    """
+    first_line = _FIRST_LINE_RE.search(text)
+    return RuleFields(
+        title=first_line.group(0).strip() if first_line else None,
+        description=_first_description(text),
+        price=_first_price(text),
+    )
+
+
+def extract_fields_batch(texts: Sequence[str]) -> list[RuleFields]:
+    """Run `extract_fields` over many texts in one call (order preserved)."""
+    return [extract_fields(t) for t in texts]
+
+
+def extract_fields_parallel(
+    texts: Sequence[str],
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = RULE_ENGINE_CHUNK_SIZE,
+) -> list[RuleFields]:
+    """
+    Extract fields for many texts, fanning out to worker processes when worthwhile.
+
+    Args:
+        texts (Sequence[str]): Input texts.
+        max_workers (int | None): Process count (None → CPU count; 1 → in-process).
+        chunk_size (int): Texts per worker task.
+
+    Returns:
+        list[RuleFields]: One entry per input text, in input order.
+
+    Notes:
+        - Batches smaller than `RULE_ENGINE_PARALLEL_MIN_TEXTS` run in-process, since
+          process start-up and pickling dominate for small inputs.
+    """
+    if max_workers == 1 or len(texts) < RULE_ENGINE_PARALLEL_MIN_TEXTS:
+        return extract_fields_batch(texts)
+
+    chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return [fields for chunk in pool.map(extract_fields_batch, chunks) for fields in chunk]
+
+
+def extract_items_batch(
+    inputs: Sequence[ScrapeInput],
+    *,
+    max_workers: int | None = 1,
+) -> list[ScrapedItem | None]:
+    """
+    Batch rule-based extraction from `(url, text)` inputs to validated items.
+
+    Args:
+        inputs (Sequence[ScrapeInput]): `(url, text)` pairs.
+        max_workers (int | None): Forwarded to `extract_fields_parallel` (default in-process).
+
+    Returns:
+        list[ScrapedItem | None]: Item per input; None when no field was found or the
+        item failed validation.
+    """
+    fields = extract_fields_parallel([text for _url, text in inputs], max_workers=max_workers)
+    items: list[ScrapedItem | None] = []
+    for (url, _text), f in zip(inputs, fields, strict=True):
+        if f.is_empty:
+            items.append(None)
+            continue
+        try:
+            items.append(
+                ScrapedItem(url=url, title=f.title, description=f.description, price=f.price)
+            )
+        except ValidationError:
+            items.append(None)
+    return items
+
+
+def extract_item_dicts(inputs: Sequence[ScrapeInput]) -> list[dict[str, Any] | None]:
+    """
+    Extract a chunk of inputs in the current process and return serialized items.
+
+    Runs inside worker processes (`WORKER_POOL_MODE=process`): dicts pickle cheaply and
+    are re-validated into `ScrapedItem` by the parent.
+
+    Args:
+        inputs (Sequence[ScrapeInput]): `(url, text)` pairs.
+
+    Returns:
+        list[dict[str, Any] | None]: `ScrapedItem.model_dump()` per input, or None.
+    """
+    return [
+        item.model_dump() if item is not None else None
+        for item in extract_items_batch(inputs, max_workers=1)
+    ]
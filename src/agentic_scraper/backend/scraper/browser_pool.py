@@ -0,0 +1,289 @@
+"""
+Long-lived Playwright browser pool for screenshots.
+
+Responsibilities:
+- Keep one Playwright driver and a small number of Chromium browsers alive across
+  screenshots instead of launching a browser per URL.
+- Hand out isolated browser contexts/pages from a bounded pool.
+- Recycle each browser after `recycle_after` pages (and replace crashed browsers) to
+  cap memory growth.
+
+Public API:
+- `BrowserPool`: The pool (lazy start, `page()` context manager, `close()`).
+- `get_browser_pool`: Pool registered for the running event loop (or None).
+- `start_browser_pool` / `stop_browser_pool`: Register/close the loop's pool (API lifespan).
+- `browser_pool_session`: Pool for the duration of one pipeline run, unless a
+  longer-lived one (API lifespan) is already registered.
+
+Operational:
+- Concurrency: At most `max_pages` pages are open at once; pages are spread over up to
+  `size` browsers (least-busy first). Playwright objects are bound to their event loop,
+  so pools are registered per loop.
+- Startup: Nothing is launched until the first `page()` call; an unused pool is free.
+- Logging: INFO on driver start/close and browser recycling; DEBUG per launch.
+
+Usage:
+    from agentic_scraper.backend.scraper.browser_pool import browser_pool_session
+
+    async with browser_pool_session(settings):
+        await run_worker_pool(...)  # capture_screenshot() now reuses pooled browsers
+
+Notes:
+- Each page gets its own browser context (cookies/storage are never shared between URLs).
+- A browser marked for recycling stops receiving pages and is closed once its in-flight
+  pages finish; a replacement is launched on demand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from playwright.async_api import async_playwright
+
+from agentic_scraper.backend.config.constants import (
+    SCREENSHOT_VIEWPORT_HEIGHT,
+    SCREENSHOT_VIEWPORT_WIDTH,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_BROWSER_LAUNCHED,
+    MSG_INFO_BROWSER_POOL_CLOSED,
+    MSG_INFO_BROWSER_POOL_STARTED,
+    MSG_INFO_BROWSER_RECYCLED,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from agentic_scraper.backend.core.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "BrowserPool",
+    "browser_pool_session",
+    "get_browser_pool",
+    "start_browser_pool",
+    "stop_browser_pool",
+]
+
+
+@dataclass
+class _BrowserSlot:
+    browser: Any
+    pages_served: int = 0
+    in_flight: int = 0
+    retired: bool = False
+
+
+class BrowserPool:
+    """
+    Bounded pool of Chromium browsers handing out isolated pages.
+
+    Attributes:
+        size (int): Maximum number of live browsers.
+        max_pages (int): Maximum number of concurrently open pages (all browsers).
+        recycle_after (int): Pages served by one browser before it is replaced.
+        launched (int): Browsers launched so far (including replacements).
+        recycled (int): Browsers closed for recycling or after a crash.
+    """
+
+    def __init__(self, *, size: int, max_pages: int, recycle_after: int) -> None:
+        """Create an idle pool; the driver and browsers start on first use."""
+        self.size = size
+        self.max_pages = max_pages
+        self.recycle_after = recycle_after
+        self.launched = 0
+        self.recycled = 0
+        self._pages = asyncio.Semaphore(max_pages)
+        self._lock = asyncio.Lock()
+        self._slots: list[_BrowserSlot] = []
+        self._playwright_cm: Any = None
+        self._playwright: Any = None
+        self._closed = False
+        self._sessions = 0  # active `browser_pool_session` users
+        self._transient = False  # started by a session (closed when the last one exits)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> BrowserPool:
+        """Build a pool sized by `browser_pool_*` settings."""
+        return cls(
+            size=settings.browser_pool_size,
+            max_pages=settings.browser_pool_max_pages,
+            recycle_after=settings.browser_pool_recycle_after,
+        )
+
+    # ── Browser lifecycle ───────────────────────────────────────────────────
+
+    async def _launch(self) -> _BrowserSlot:
+        if self._playwright is None:
+            self._playwright_cm = async_playwright()
+            self._playwright = await self._playwright_cm.__aenter__()
+            logger.info(
+                MSG_INFO_BROWSER_POOL_STARTED.format(size=self.size, max_pages=self.max_pages)
+            )
+        browser = await self._playwright.chromium.launch(headless=True)
+        self.launched += 1
+        logger.debug(MSG_DEBUG_BROWSER_LAUNCHED.format(count=self.launched))
+        slot = _BrowserSlot(browser)
+        self._slots.append(slot)
+        return slot
+
+    async def _acquire_slot(self) -> _BrowserSlot:
+        async with self._lock:
+            if self._closed:
+                msg = "Browser pool is closed"
+                raise RuntimeError(msg)
+            for slot in self._slots:
+                if not slot.retired and not slot.browser.is_connected():
+                    slot.retired = True  # crashed: stop handing it out
+            live = [s for s in self._slots if not s.retired]
+            if len(live) < self.size:
+                slot = await self._launch()
+            else:
+                slot = min(live, key=lambda s: s.in_flight)
+            slot.in_flight += 1
+            slot.pages_served += 1
+            if slot.pages_served >= self.recycle_after:
+                slot.retired = True
+            return slot
+
+    async def _release(self, slot: _BrowserSlot) -> None:
+        slot.in_flight -= 1
+        if slot.retired and slot.in_flight == 0 and slot in self._slots:
+            self._slots.remove(slot)
+            self.recycled += 1
+            logger.info(MSG_INFO_BROWSER_RECYCLED.format(pages=slot.pages_served))
+            with suppress(Exception):
+                await slot.browser.close()
+
+    # ── Public API ──────────────────────────────────────────────────────────
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        """
+        Borrow a fresh page in its own browser context.
+
+        Yields:
+            Page: A Playwright page with the standard screenshot viewport.
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+        """
+        async with self._pages:
+            slot = await self._acquire_slot()
+            try:
+                context = await slot.browser.new_context(
+                    viewport={
+                        "width": SCREENSHOT_VIEWPORT_WIDTH,
+                        "height": SCREENSHOT_VIEWPORT_HEIGHT,
+                    }
+                )
+                try:
+                    yield await context.new_page()
+                finally:
+                    with suppress(Exception):
+                        await context.close()
+            finally:
+                await self._release(slot)
+
+    async def close(self) -> None:
+        """Close every browser and stop the Playwright driver (idempotent)."""
+        async with self._lock:
+            self._closed = True
+            slots, self._slots = self._slots, []
+            for slot in slots:
+                with suppress(Exception):
+                    await slot.browser.close()
+            if self._playwright_cm is not None:
+                with suppress(Exception):
+                    await self._playwright_cm.__aexit__(None, None, None)
+                self._playwright_cm = self._playwright = None
+                logger.info(MSG_INFO_BROWSER_POOL_CLOSED.format(launched=self.launched))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-loop registry
+# ─────────────────────────────────────────────────────────────────────────────
+
+_POOLS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]
+_POOLS = weakref.WeakKeyDictionary()
+
+
+def get_browser_pool() -> BrowserPool | None:
+    """Return the pool registered for the running event loop, if any."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _POOLS.get(loop)
+
+
+def start_browser_pool(settings: Settings) -> BrowserPool | None:
+    """
+    Register a pool for the running loop (no-op when disabled or already registered).
+
+    Args:
+        settings (Settings): Provides `browser_pool_enabled` and pool sizing.
+
+    Returns:
+        BrowserPool | None: The registered pool, or None when pooling is disabled.
+    """
+    existing = get_browser_pool()
+    if existing is not None or not settings.browser_pool_enabled:
+        return existing
+    pool = BrowserPool.from_settings(settings)
+    _POOLS[asyncio.get_running_loop()] = pool
+    return pool
+
+
+async def stop_browser_pool() -> None:
+    """Close and unregister the running loop's pool, if any."""
+    pool = _POOLS.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
+
+
+@asynccontextmanager
+async def browser_pool_session(
+    settings: Settings, *, required: bool = False
+) -> AsyncIterator[BrowserPool | None]:
+    """
+    Provide a pool for one pipeline run.
+
+    Reuses a pool that is already registered (e.g. by the API lifespan or a concurrent
+    run); otherwise starts one when screenshots and pooling are enabled. A pool started
+    here is closed when the last session using it exits.
+
+    Args:
+        settings (Settings): Run settings (`screenshot_enabled`, `browser_pool_*`).
+        required (bool): Always provide a pool (render fetch needs a browser even when
+            screenshots or pooling are disabled).
+
+    Yields:
+        BrowserPool | None: Active pool, or None when screenshots are not pooled.
+    """
+    pool = get_browser_pool()
+    wanted = required or (settings.screenshot_enabled and settings.browser_pool_enabled)
+    if pool is None and wanted:
+        pool = BrowserPool.from_settings(settings)
+        pool._transient = True  # noqa: SLF001 - module-private bookkeeping
+        _POOLS[asyncio.get_running_loop()] = pool
+    if pool is None:
+        yield None
+        return
+
+    pool._sessions += 1  # noqa: SLF001
+    try:
+        yield pool
+    finally:
+        pool._sessions -= 1  # noqa: SLF001
+        if pool._transient and pool._sessions == 0:  # noqa: SLF001
+            loop = asyncio.get_running_loop()
+            if _POOLS.get(loop) is pool:
+                del _POOLS[loop]
+            await pool.close()
@@ -0,0 +1,211 @@
+"""
+Pluggable backends for offline bulk (batch-API style) LLM extraction.
+
+Responsibilities:
+- Define the minimal backend contract used by the bulk runner: submit a JSONL request
+  file, report job status, and return result lines.
+- Provide `OpenAIBulkBackend`, which talks to the provider's Files + Batches endpoints.
+- Provide `LocalFileBulkBackend`, a file-based stand-in that "completes" jobs locally
+  so bulk mode can be exercised offline (tests, demos, dry runs).
+
+Public API:
+- `BulkBackend`: Protocol implemented by all backends.
+- `OpenAIBulkBackend`: Provider-backed implementation (requires the OpenAI SDK client).
+- `LocalFileBulkBackend`: Offline implementation writing results next to the inputs.
+
+Operational:
+- Concurrency: Backends are awaited sequentially by the runner (submit → poll → fetch).
+- Logging: Status transitions are logged at DEBUG by the runner, not here.
+- I/O: The local backend performs small synchronous file reads/writes.
+
+Usage:
+    from agentic_scraper.backend.scraper.bulk_backends import LocalFileBulkBackend
+
+    backend = LocalFileBulkBackend(work_dir=Path(".cache/bulk/local"))
+    # or: OpenAIBulkBackend.from_endpoint(resolve_endpoint(settings.openai, settings))
+    batch_id = await backend.submit(Path(".cache/bulk/requests.jsonl"))
+    assert await backend.status(batch_id) == BulkJobState.COMPLETED
+
+Notes:
+- Result lines follow the provider format:
+  `{"custom_id": ..., "response": {"status_code": 200, "body": {...}}, "error": null}`.
+- The local backend's `responder` receives each request body and returns the assistant
+  message content (a JSON string); raising marks that line as an error.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from openai import AsyncOpenAI
+
+from agentic_scraper.backend.config.constants import (
+    BULK_COMPLETION_WINDOW,
+    BULK_ENDPOINT,
+    BULK_OUTPUT_FILENAME,
+    BULK_REQUESTS_FILENAME,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_ERROR_BULK_NO_OUTPUT,
+    MSG_ERROR_BULK_UNKNOWN_BATCH,
+)
+from agentic_scraper.backend.config.types import BulkJobState
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.scraper.agents.llm_endpoint import LLMEndpoint
+
+__all__ = ["BulkBackend", "LocalFileBulkBackend", "OpenAIBulkBackend"]
+
+BulkResponder = Callable[[dict[str, Any]], str]
+
+
+class BulkBackend(Protocol):
+    """Contract for bulk job backends (provider or local stand-in)."""
+
+    async def submit(self, requests_path: Path) -> str:
+        """Submit a JSONL request file and return the backend's job id."""
+        ...
+
+    async def status(self, batch_id: str) -> BulkJobState:
+        """Return the current state of a submitted job."""
+        ...
+
+    async def results(self, batch_id: str) -> list[dict[str, Any]]:
+        """Return parsed result lines for a completed job."""
+        ...
+
+
+def _parse_jsonl(text: str) -> list[dict[str, Any]]:
+    """Parse JSONL text into a list of dicts (blank lines ignored)."""
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Provider backend
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class OpenAIBulkBackend:
+    """
+    Bulk backend using the OpenAI Files + Batches API.
+
+    Attributes:
+        client (Any): An `openai.AsyncOpenAI` instance (or compatible object).
+    """
+
+    client: Any
+
+    @classmethod
+    def from_endpoint(cls, endpoint: LLMEndpoint) -> OpenAIBulkBackend:
+        """Build a backend for a resolved endpoint (credentials and base URL)."""
+        return cls(client=AsyncOpenAI(**endpoint.client_kwargs()))
+
+    async def submit(self, requests_path: Path) -> str:
+        """Upload the request file and create a batch against the chat endpoint."""
+        with requests_path.open("rb") as fh:
+            upload = await self.client.files.create(file=fh, purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=upload.id,
+            endpoint=BULK_ENDPOINT,
+            completion_window=BULK_COMPLETION_WINDOW,
+        )
+        return str(batch.id)
+
+    async def status(self, batch_id: str) -> BulkJobState:
+        """Map the provider's batch status onto `BulkJobState`."""
+        batch = await self.client.batches.retrieve(batch_id)
+        try:
+            return BulkJobState(str(batch.status))
+        except ValueError:
+            # Unknown/new provider states are treated as still running.
+            return BulkJobState.IN_PROGRESS
+
+    async def results(self, batch_id: str) -> list[dict[str, Any]]:
+        """Download and parse the batch output file."""
+        batch = await self.client.batches.retrieve(batch_id)
+        output_file_id = getattr(batch, "output_file_id", None)
+        if not output_file_id:
+            raise RuntimeError(MSG_ERROR_BULK_NO_OUTPUT.format(batch_id=batch_id))
+        content = await self.client.files.content(output_file_id)
+        return _parse_jsonl(content.text)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Local stand-in backend
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _empty_object_responder(body: dict[str, Any]) -> str:
+    """Default local responder: an empty JSON object (the runner fills in `url`)."""
+    _ = body
+    return "{}"
+
+
+@dataclass
+class LocalFileBulkBackend:
+    """
+    Offline bulk backend that processes jobs from files on local disk.
+
+    Attributes:
+        work_dir (Path): Root directory; each job gets `<work_dir>/<batch_id>/`.
+        responder (BulkResponder): Produces assistant content for one request body.
+
+    Notes:
+        - Jobs complete on the first `status()` poll, which keeps the submit → poll →
+          fetch sequence identical to the provider flow.
+    """
+
+    work_dir: Path
+    responder: BulkResponder = _empty_object_responder
+
+    def _job_dir(self, batch_id: str) -> Path:
+        job_dir = self.work_dir / batch_id
+        if not job_dir.is_dir():
+            raise KeyError(MSG_ERROR_BULK_UNKNOWN_BATCH.format(batch_id=batch_id))
+        return job_dir
+
+    async def submit(self, requests_path: Path) -> str:
+        """Copy the request file into a fresh job directory and return its id."""
+        batch_id = f"local-{uuid.uuid4().hex[:12]}"
+        job_dir = self.work_dir / batch_id
+        job_dir.mkdir(parents=True, exist_ok=False)
+        shutil.copyfile(requests_path, job_dir / BULK_REQUESTS_FILENAME)
+        return batch_id
+
+    async def status(self, batch_id: str) -> BulkJobState:
+        """Process the job (once) and report it as completed."""
+        job_dir = self._job_dir(batch_id)
+        output_path = job_dir / BULK_OUTPUT_FILENAME
+        if not output_path.exists():
+            requests = _parse_jsonl((job_dir / BULK_REQUESTS_FILENAME).read_text("utf-8"))
+            lines = [json.dumps(self._respond(req), ensure_ascii=False) for req in requests]
+            output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return BulkJobState.COMPLETED
+
+    async def results(self, batch_id: str) -> list[dict[str, Any]]:
+        """Return the parsed output lines of a processed job."""
+        output_path = self._job_dir(batch_id) / BULK_OUTPUT_FILENAME
+        if not output_path.exists():
+            raise RuntimeError(MSG_ERROR_BULK_NO_OUTPUT.format(batch_id=batch_id))
+        return _parse_jsonl(output_path.read_text("utf-8"))
+
+    def _respond(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Build one provider-shaped result line for a request line."""
+        custom_id = request.get("custom_id")
+        try:
+            content = self.responder(request.get("body", {}))
+        except Exception as e:  # noqa: BLE001 — responder errors become per-line errors
+            return {"custom_id": custom_id, "response": None, "error": {"message": str(e)}}
+        body = {"choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]}
+        return {
+            "custom_id": custom_id,
+            "response": {"status_code": 200, "body": body},
+            "error": None,
+        }
@@ -0,0 +1,329 @@
+"""
+Offline bulk extraction: run LLM extraction as an asynchronous provider batch job.
+
+Responsibilities:
+- Render one chat-completion request per `(url, text)` input into a JSONL file in the
+  provider's batch format, plus a manifest mapping `custom_id` → URL.
+- Submit the file through a pluggable `BulkBackend`, poll until the job finishes,
+  and fetch the result lines.
+- Merge results back through the regular `parse_llm_response` → `normalize_fields` →
+  `try_validate_scraped_item` path so items match interactive runs.
+
+Public API:
+- `build_bulk_request_lines`: Inputs → provider request lines + manifest.
+- `write_bulk_requests`: Persist request lines and manifest under a job directory.
+- `merge_bulk_results`: Result lines + manifest → validated `ScrapedItem`s.
+- `run_bulk_extraction`: End-to-end write → submit → poll → merge.
+
+Operational:
+- Latency: Designed for overnight jobs; polling interval/timeout come from `Settings`.
+- Cancellation: The poll loop honors a `CancelToken`; cancelling stops waiting but
+  does not cancel the provider-side job.
+- Logging: Counts and job ids only; page content is never logged.
+
+Usage:
+    from agentic_scraper.backend.scraper.bulk_extract import run_bulk_extraction
+
+    items = await run_bulk_extraction(inputs, settings=settings, backend=backend)
+
+Notes:
+- Prompts mirror the single-page agents: the fixed system prompt for `llm-fixed`,
+  the enhanced `build_prompt` for the dynamic modes. Adaptive retries do not apply in
+  bulk mode; pages that fail validation are reported as failures.
+- The manifest makes result files mergeable later, even from another process.
+- The request model follows the single-page agents (`resolve_model`): the job's
+  `OpenAIConfig.model`, then `settings.openai_model_override`, then `openai_model`.
+  Base URL and credentials belong to the backend (`OpenAIBulkBackend.from_endpoint`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from agentic_scraper.backend.config.constants import (
+    BULK_ENDPOINT,
+    BULK_MANIFEST_FILENAME,
+    BULK_REQUESTS_FILENAME,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_BULK_STATUS,
+    MSG_ERROR_BULK_JOB_NOT_COMPLETED,
+    MSG_ERROR_BULK_JOB_TIMEOUT,
+    MSG_ERROR_BULK_REQUIRES_LLM_MODE,
+    MSG_INFO_BULK_MERGED,
+    MSG_INFO_BULK_REQUESTS_WRITTEN,
+    MSG_INFO_BULK_SUBMITTED,
+    MSG_SYSTEM_PROMPT,
+    MSG_WARNING_BULK_RESULT_ERROR,
+    MSG_WARNING_BULK_UNKNOWN_CUSTOM_ID,
+)
+from agentic_scraper.backend.config.types import AgentMode, BulkJobState
+from agentic_scraper.backend.scraper.agents.agent_helpers import (
+    parse_llm_response,
+    try_validate_scraped_item,
+)
+from agentic_scraper.backend.scraper.agents.field_utils import normalize_fields, normalize_keys
+from agentic_scraper.backend.scraper.agents.llm_endpoint import resolve_model
+from agentic_scraper.backend.scraper.agents.prompt_helpers import build_prompt
+from agentic_scraper.backend.scraper.cancel_helpers import CancelToken, is_canceled
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.config.aliases import ScrapeInput
+    from agentic_scraper.backend.config.types import OpenAIConfig
+    from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.bulk_backends import BulkBackend
+    from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "build_bulk_request_lines",
+    "merge_bulk_results",
+    "run_bulk_extraction",
+    "write_bulk_requests",
+]
+
+# Provider states after which polling stops.
+_TERMINAL_STATES = {
+    BulkJobState.COMPLETED,
+    BulkJobState.FAILED,
+    BulkJobState.EXPIRED,
+    BulkJobState.CANCELLED,
+}
+
+
+def _messages_for(url: str, text: str, settings: Settings) -> list[dict[str, str]]:
+    """Build chat messages for one page, matching the interactive agent for the mode."""
+    if settings.agent_mode == AgentMode.LLM_FIXED:
+        return [
+            {"role": "system", "content": MSG_SYSTEM_PROMPT},
+            {"role": "user", "content": text[:4000]},
+        ]
+    prompt = build_prompt(text=text, url=url, prompt_style="enhanced", context_hints=None)
+    return [{"role": "user", "content": prompt}]
+
+
+def build_bulk_request_lines(
+    inputs: list[ScrapeInput],
+    *,
+    settings: Settings,
+    openai: OpenAIConfig | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    """
+    Render provider batch request lines for the given inputs.
+
+    Args:
+        inputs (list[ScrapeInput]): `(url, text)` pairs.
+        settings (Settings): Runtime settings (agent mode, model, temperature, tokens).
+        openai (OpenAIConfig | None): Job credentials; only its `model` is used here.
+
+    Returns:
+        tuple[list[dict[str, Any]], dict[str, str]]:
+            - Request lines (`custom_id`, `method`, `url`, `body`).
+            - Manifest mapping `custom_id` → page URL.
+
+    Raises:
+        ValueError: If `settings.agent_mode` is not an LLM mode.
+    """
+    if settings.agent_mode == AgentMode.RULE_BASED:
+        raise ValueError(MSG_ERROR_BULK_REQUIRES_LLM_MODE.format(agent_mode=settings.agent_mode))
+
+    model = resolve_model(openai, settings) or str(
+        getattr(settings.openai_model, "value", settings.openai_model)
+    )
+    lines: list[dict[str, Any]] = []
+    manifest: dict[str, str] = {}
+    for idx, (url, text) in enumerate(inputs):
+        # Index-based ids stay short and unique even when a URL repeats.
+        custom_id = f"req-{idx}"
+        manifest[custom_id] = url
+        lines.append(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BULK_ENDPOINT,
+                "body": {
+                    "model": model,
+                    "messages": _messages_for(url, text, settings),
+                    "temperature": settings.llm_temperature,
+                    "max_tokens": settings.llm_max_tokens,
+                },
+            }
+        )
+    return lines, manifest
+
+
+def write_bulk_requests(
+    lines: list[dict[str, Any]],
+    manifest: dict[str, str],
+    job_dir: Path,
+) -> Path:
+    """
+    Write request lines (JSONL) and the manifest (JSON) into `job_dir`.
+
+    Returns:
+        Path: Path of the written request file.
+    """
+    job_dir.mkdir(parents=True, exist_ok=True)
+    requests_path = job_dir / BULK_REQUESTS_FILENAME
+    with requests_path.open("w", encoding="utf-8") as fh:
+        for line in lines:
+            fh.write(json.dumps(line, ensure_ascii=False) + "\n")
+    (job_dir / BULK_MANIFEST_FILENAME).write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    logger.info(MSG_INFO_BULK_REQUESTS_WRITTEN.format(count=len(lines), path=requests_path))
+    return requests_path
+
+
+def _content_of(result: dict[str, Any]) -> str | None:
+    """Extract assistant content from a provider result line (None if absent)."""
+    response = result.get("response") or {}
+    body = response.get("body") or {}
+    choices = body.get("choices") or []
+    if not choices:
+        return None
+    message = choices[0].get("message") or {}
+    content = message.get("content")
+    return content if isinstance(content, str) else None
+
+
+def merge_bulk_results(
+    results: list[dict[str, Any]],
+    manifest: dict[str, str],
+    *,
+    settings: Settings,
+) -> list[ScrapedItem]:
+    """
+    Convert provider result lines into validated items.
+
+    Args:
+        results (list[dict[str, Any]]): Parsed result lines from the backend.
+        manifest (dict[str, str]): `custom_id` → URL mapping written at submit time.
+        settings (Settings): Runtime settings (agent mode, verbosity).
+
+    Returns:
+        list[ScrapedItem]: Items in manifest (input) order; failed lines are skipped.
+    """
+    by_id: dict[str, ScrapedItem] = {}
+    for result in results:
+        custom_id = str(result.get("custom_id"))
+        url = manifest.get(custom_id)
+        if url is None:
+            logger.warning(MSG_WARNING_BULK_UNKNOWN_CUSTOM_ID.format(custom_id=custom_id))
+            continue
+
+        content = None if result.get("error") else _content_of(result)
+        if content is None:
+            logger.warning(
+                MSG_WARNING_BULK_RESULT_ERROR.format(
+                    custom_id=custom_id, url=url, error=result.get("error")
+                )
+            )
+            continue
+
+        raw = parse_llm_response(content, url, settings)
+        if raw is None:
+            continue
+        if settings.agent_mode != AgentMode.LLM_FIXED:
+            raw = normalize_fields(normalize_keys(raw))
+        item = try_validate_scraped_item({**raw, "url": url}, url, settings)
+        if item is not None:
+            by_id[custom_id] = item
+
+    return [by_id[cid] for cid in manifest if cid in by_id]
+
+
+async def _wait_for_completion(
+    backend: BulkBackend,
+    batch_id: str,
+    *,
+    settings: Settings,
+    cancel: CancelToken | None,
+) -> bool:
+    """
+    Poll the backend until the job reaches a terminal state.
+
+    Returns:
+        bool: True when completed; False if cancelled while waiting.
+
+    Raises:
+        RuntimeError: If the job ends in a non-completed terminal state.
+        TimeoutError: If `settings.bulk_timeout_s` elapses first.
+    """
+    deadline = time.monotonic() + settings.bulk_timeout_s
+    while True:
+        if is_canceled(cancel):
+            return False
+        state = await backend.status(batch_id)
+        logger.debug(MSG_DEBUG_BULK_STATUS.format(batch_id=batch_id, status=state.value))
+        if state == BulkJobState.COMPLETED:
+            return True
+        if state in _TERMINAL_STATES:
+            raise RuntimeError(
+                MSG_ERROR_BULK_JOB_NOT_COMPLETED.format(batch_id=batch_id, status=state.value)
+            )
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                MSG_ERROR_BULK_JOB_TIMEOUT.format(
+                    batch_id=batch_id, timeout=settings.bulk_timeout_s
+                )
+            )
+        await asyncio.sleep(settings.bulk_poll_interval_s)
+
+
+async def run_bulk_extraction(  # noqa: PLR0913 - keyword-only job options
+    inputs: list[ScrapeInput],
+    *,
+    settings: Settings,
+    backend: BulkBackend,
+    job_dir: Path | None = None,
+    cancel: CancelToken | None = None,
+    openai: OpenAIConfig | None = None,
+) -> list[ScrapedItem]:
+    """
+    Extract `inputs` through an asynchronous bulk job.
+
+    Args:
+        inputs (list[ScrapeInput]): `(url, text)` pairs prepared by the pipeline.
+        settings (Settings): Runtime settings (agent mode, bulk polling knobs).
+        backend (BulkBackend): Provider or local backend.
+        job_dir (Path | None): Where to write request/manifest files. Defaults to a
+            timestamped directory under `settings.bulk_work_dir`.
+        cancel (CancelToken | None): Optional cancel signal checked while polling.
+        openai (OpenAIConfig | None): Job credentials whose `model` overrides the default.
+
+    Returns:
+        list[ScrapedItem]: Validated items in input order (empty if cancelled).
+
+    Raises:
+        ValueError: If the agent mode is rule-based.
+        RuntimeError: If the job fails/expires/is cancelled provider-side.
+        TimeoutError: If the job does not finish within `settings.bulk_timeout_s`.
+    """
+    if not inputs:
+        return []
+
+    lines, manifest = build_bulk_request_lines(inputs, settings=settings, openai=openai)
+    job_dir = job_dir or Path(settings.bulk_work_dir) / f"job-{time.strftime('%Y%m%d-%H%M%S')}"
+    requests_path = write_bulk_requests(lines, manifest, job_dir)
+
+    batch_id = await backend.submit(requests_path)
+    logger.info(MSG_INFO_BULK_SUBMITTED.format(batch_id=batch_id, count=len(lines)))
+
+    if not await _wait_for_completion(backend, batch_id, settings=settings, cancel=cancel):
+        return []
+
+    results = await backend.results(batch_id)
+    items = merge_bulk_results(results, manifest, settings=settings)
+    logger.info(
+        MSG_INFO_BULK_MERGED.format(
+            batch_id=batch_id, valid=len(items), failed=len(lines) - len(items), total=len(lines)
+        )
+    )
+    return items
@@ -7,12 +7,15 @@ Responsibilities:
 - Centralize safe evaluation of cancel predicates, shielding the pipeline
   from unexpected exceptions.
 - Offer convenience helpers to test or raise cancellation in long-running loops.
+- Race in-flight work (fetches, LLM calls, screenshots) against a token's event, so
+  cancellation interrupts it instead of waiting for the next check.
 
 Public API:
 - `CancelToken`: Immutable container with optional `event` and `should_cancel` callable.
 - `safe_should_cancel`: Evaluate a user-supplied cancel predicate safely.
 - `is_canceled`: Return True if either the token's event is set or its predicate returns True.
 - `raise_if_canceled`: Raise asyncio.CancelledError if the token indicates cancellation.
+- `await_or_cancel`: Await work, cancelling it as soon as the token's event is set.
 
 Usage:
     from agentic_scraper.backend.scraper.cancel_helpers import CancelToken, is_canceled
@@ -21,22 +24,33 @@ Usage:
     if is_canceled(token):
         break  # cooperative cancel
     raise_if_canceled(token)  # raises asyncio.CancelledError if canceled
+    html = await await_or_cancel(client.get(url), token)  # interrupted by the event
 
 Notes:
 - Prefer `raise_if_canceled` in loops to ensure tasks exit promptly.
 - Logging for predicate errors is done at DEBUG level to avoid log spam.
+- Only the event can interrupt in-flight work; a predicate is evaluated at check points.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from typing import TypeVar
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["CancelToken", "is_canceled", "raise_if_canceled", "safe_should_cancel"]
+__all__ = [
+    "CancelToken",
+    "await_or_cancel",
+    "is_canceled",
+    "raise_if_canceled",
+    "safe_should_cancel",
+]
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True)
@@ -105,3 +119,41 @@ def raise_if_canceled(token: CancelToken | None) -> None:
     """
     if is_canceled(token):
         raise asyncio.CancelledError
+
+
+async def await_or_cancel(work: Awaitable[T], token: CancelToken | None) -> T:
+    """
+    Await `work`, cancelling it as soon as the token's event is set.
+
+    Args:
+        work (Awaitable[T]): Coroutine or future to run (e.g. a fetch or an LLM call).
+        token (CancelToken | None): Token whose event interrupts the work.
+
+    Returns:
+        T: The result of `work` when it finishes first.
+
+    Raises:
+        asyncio.CancelledError: If the event was set first; `work` has been cancelled
+            and awaited by then.
+
+    Notes:
+        - Without an event this is a plain `await work`.
+        - If the caller itself is cancelled, `work` is cancelled too.
+    """
+    event = token.event if token else None
+    if event is None:
+        return await work
+    task = asyncio.ensure_future(work)
+    if event.is_set():
+        task.cancel()
+    waiter = asyncio.create_task(event.wait(), name="cancel-wait")
+    try:
+        await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        waiter.cancel()
+        if not task.done():
+            task.cancel()
+            await asyncio.wait({task})
+    if task.cancelled():
+        raise asyncio.CancelledError
+    return task.result()
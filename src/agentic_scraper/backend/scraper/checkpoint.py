@@ -0,0 +1,190 @@
+"""
+Append-only checkpoint journal that lets an interrupted batch resume where it stopped.
+
+Responsibilities:
+- Record every URL that reached a final outcome as the run progresses: its extracted
+  item(s), or the reason it failed (extraction error, classifier rejection).
+- Reload a journal after a crash or cancel, so a resumed run re-emits finished items
+  and only fetches/extracts the remaining URLs.
+- Carry optional run metadata (e.g. the API job's owner and request) so a job can be
+  resumed by a process that never saw it.
+
+Public API:
+- `CheckpointJournal`: `record_item()`, `record_failure()`, `write_meta()`, `pending()`,
+  `resumed_items()` and `close()`.
+- `checkpoint_path`: Journal path of an API job inside `checkpoint_dir`.
+- `read_checkpoint_meta`: Read a journal's metadata without opening it for writing.
+
+Operational:
+- Format: One JSON object per line (`meta` / `item` / `failed` records), flushed after
+  every write, so a killed process loses at most the line being written.
+- Concurrency: Single event loop; writes are small and synchronous.
+- Robustness: A truncated last line (crash mid-write) is skipped on load.
+
+Usage:
+    with CheckpointJournal(path, resume=True) as journal:
+        options = PipelineOptions(checkpoint=journal)
+        async for item in scrape_iter(urls, settings, options=options):
+            ...
+
+Notes:
+- Fetch failures and canceled work are not journaled: they cost no LLM calls and are
+  often transient, so a resumed run retries them.
+- Failed URLs are skipped on resume unless `retry_failed=True`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from agentic_scraper.backend.config.messages import MSG_WARNING_CHECKPOINT_LINE_SKIPPED
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["CheckpointJournal", "checkpoint_path", "read_checkpoint_meta"]
+
+JSONObj = dict[str, object]
+
+
+def checkpoint_path(checkpoint_dir: str, job_id: str) -> Path:
+    """Return the journal path of API job `job_id`."""
+    return Path(checkpoint_dir) / f"{job_id}.jsonl"
+
+
+class CheckpointJournal:
+    """
+    Journal of finished URLs for one run, backed by a JSONL file.
+
+    Attributes:
+        path (Path): Journal file.
+        items (dict[str, list[JSONObj]]): Journaled items (JSON dumps) by URL.
+        failures (dict[str, str]): Failure reason by URL.
+        meta (JSONObj): Merged `meta` records.
+    """
+
+    def __init__(self, path: str | Path, *, resume: bool, retry_failed: bool = False) -> None:
+        """
+        Open a journal.
+
+        Args:
+            path (str | Path): Journal file (parent directories are created).
+            resume (bool): Load an existing journal; otherwise start it afresh.
+            retry_failed (bool): Forget journaled failures so they are attempted again.
+        """
+        self.path = Path(path)
+        self.items: dict[str, list[JSONObj]] = {}
+        self.failures: dict[str, str] = {}
+        self.meta: JSONObj = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._load()
+        if retry_failed:
+            self.failures.clear()
+        self._file: IO[str] = self.path.open("a" if resume else "w", encoding="utf-8")
+        if resume and not _ends_with_newline(self.path):
+            self._file.write("\n")  # keep new records off a truncated last line
+
+    def __enter__(self) -> Self:
+        """Return the journal itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the journal file."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the journal file (idempotent)."""
+        self._file.close()
+
+    def pending(self, urls: list[str]) -> list[str]:
+        """Return `urls` (deduplicated, in order) without a journaled outcome."""
+        return [
+            url for url in dict.fromkeys(urls) if url not in self.items and url not in self.failures
+        ]
+
+    def resumed_items(self, urls: list[str]) -> list[JSONObj]:
+        """Return journaled items for `urls`, in input order."""
+        return [item for url in dict.fromkeys(urls) for item in self.items.get(url, [])]
+
+    def write_meta(self, **fields: object) -> None:
+        """Record run metadata (later records override earlier keys on load)."""
+        self.meta.update(fields)
+        self._append({"type": "meta", **fields})
+
+    def record_item(self, item: ScrapedItem) -> None:
+        """Record an extracted item as its URL's result."""
+        dumped = item.model_dump(mode="json")
+        self.items.setdefault(item.url, []).append(dumped)
+        self.failures.pop(item.url, None)
+        self._append({"type": "item", "url": item.url, "item": dumped})
+
+    def record_failure(self, url: str, reason: str) -> None:
+        """Record that `url` failed for `reason` (ignored once it has items)."""
+        if url in self.items:
+            return
+        self.failures[url] = reason
+        self._append({"type": "failed", "url": url, "reason": reason})
+
+    def _append(self, record: JSONObj) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def _load(self) -> None:
+        for kind, record in _read_records(self.path):
+            if kind == "meta":
+                self.meta.update(record)
+            elif kind == "item":
+                self.items.setdefault(record["url"], []).append(record["item"])
+                self.failures.pop(record["url"], None)
+            elif kind == "failed" and record["url"] not in self.items:
+                self.failures[record["url"]] = record["reason"]
+
+
+def read_checkpoint_meta(path: str | Path) -> JSONObj | None:
+    """Return the merged `meta` records of a journal, or None if it does not exist."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    meta: JSONObj = {}
+    for kind, record in _read_records(path):
+        if kind == "meta":
+            meta.update(record)
+    return meta
+
+
+def _read_records(path: Path) -> Iterator[tuple[str, dict[str, Any]]]:
+    with path.open(encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                kind = record.pop("type")
+            except (json.JSONDecodeError, AttributeError, KeyError):
+                logger.warning(MSG_WARNING_CHECKPOINT_LINE_SKIPPED.format(path=path, line=lineno))
+                continue
+            yield kind, record
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with path.open("rb") as f:
+        if f.seek(0, 2) == 0:
+            return True
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
@@ -0,0 +1,254 @@
+"""
+Coordinator/worker mode: spread one batch over several processes via a shared work queue.
+
+Responsibilities:
+- Coordinator: split a batch's URLs into chunks, enqueue them, wait until every chunk
+  is done or failed, and collect the items and stats.
+- Worker: lease one chunk at a time, run the regular pipeline (`scrape_urls`) on it,
+  renew the lease while it works, and report the chunk's items or error.
+
+Public API:
+- `enqueue_batch`: Queue a batch's URLs as chunks; returns the batch id.
+- `collect_batch`: Wait for a batch to settle and return its items and stats.
+- `run_worker`: Worker loop; returns the number of chunks it completed.
+
+Operational:
+- Concurrency: Each worker processes one chunk at a time; the pipeline's own fetch/LLM
+  concurrency settings apply inside the chunk. Throughput scales with worker count.
+- Fault tolerance: A worker that dies stops renewing its lease; once the lease expires
+  another worker picks the chunk up (`work_queue_max_attempts` leases per chunk).
+- Logging: Claims at DEBUG, lost leases and failed chunks at WARNING.
+
+Usage:
+    queue = SQLiteWorkQueue(path, lease_s=settings.work_queue_lease_s, max_attempts=3)
+    batch_id = await enqueue_batch(queue, urls, settings=settings)
+    # ... start workers elsewhere: await run_worker(queue, settings=settings)
+    # (workers spawned for this batch only: run_worker(..., batch_id=batch_id))
+    items, stats = await collect_batch(queue, batch_id, settings=settings)
+
+Notes:
+- Delivery is at-least-once: a chunk whose lease expired mid-run may be scraped twice,
+  but only the current lease holder's items are kept.
+- Chunks are settled as a unit: a chunk fails only when the pipeline raises for it;
+  per-URL fetch/extraction failures simply yield no items, as in a local run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import uuid
+from typing import TYPE_CHECKING
+
+from agentic_scraper.backend.config.constants import WORK_QUEUE_HEARTBEAT_FRACTION
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_WORK_QUEUE_CLAIMED,
+    MSG_INFO_WORK_QUEUE_ENQUEUED,
+    MSG_WARNING_WORK_QUEUE_CHUNK_FAILED,
+    MSG_WARNING_WORK_QUEUE_LEASE_LOST,
+    MSG_WARNING_WORK_QUEUE_STOPPED,
+)
+from agentic_scraper.backend.config.types import WorkChunkState
+from agentic_scraper.backend.scraper.pipeline import scrape_urls
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from agentic_scraper.backend.config.types import OpenAIConfig
+    from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.work_queue import WorkLease, WorkQueue
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["collect_batch", "enqueue_batch", "run_worker"]
+
+
+def _unfinished(counts: dict[WorkChunkState, int]) -> int:
+    return counts[WorkChunkState.QUEUED] + counts[WorkChunkState.LEASED]
+
+
+async def enqueue_batch(
+    queue: WorkQueue,
+    urls: list[str],
+    *,
+    settings: Settings,
+    batch_id: str | None = None,
+) -> str:
+    """
+    Queue a batch's URLs (deduplicated, in order) as chunks of `work_queue_chunk_size`.
+
+    Args:
+        queue (WorkQueue): Shared work queue.
+        urls (list[str]): URLs to scrape.
+        settings (Settings): Runtime configuration (chunk size).
+        batch_id (str | None): Batch id to use; a random one by default.
+
+    Returns:
+        str: The batch id, for `collect_batch`.
+    """
+    batch_id = batch_id or uuid.uuid4().hex
+    unique = list(dict.fromkeys(urls))
+    size = settings.work_queue_chunk_size
+    chunks = [unique[i : i + size] for i in range(0, len(unique), size)]
+    await queue.enqueue(batch_id, chunks)
+    logger.info(
+        MSG_INFO_WORK_QUEUE_ENQUEUED.format(
+            batch_id=batch_id,
+            urls=len(unique),
+            chunks=len(chunks),
+            path=getattr(queue, "path", "?"),
+        )
+    )
+    return batch_id
+
+
+async def collect_batch(
+    queue: WorkQueue,
+    batch_id: str,
+    *,
+    settings: Settings,
+    should_stop: Callable[[], bool] | None = None,
+) -> tuple[list[ScrapedItem], dict[str, float | int]]:
+    """
+    Wait until no chunk of the batch is queued or leased, then return its results.
+
+    Args:
+        queue (WorkQueue): Shared work queue.
+        batch_id (str): Batch returned by `enqueue_batch`.
+        settings (Settings): Runtime configuration (poll interval).
+        should_stop (Callable[[], bool] | None): Stop waiting early when this returns
+            True (e.g. every local worker process exited); unfinished chunks are
+            reported in the stats.
+
+    Returns:
+        tuple[list[ScrapedItem], dict[str, float | int]]: Items of the done chunks (in
+        chunk order) and chunk/URL counts.
+    """
+    while True:
+        # Sample the stop condition first: workers exit only after the batch settled,
+        # so the counts read below already reflect their last reports.
+        stopping = should_stop is not None and should_stop()
+        counts = await queue.counts(batch_id)
+        if not _unfinished(counts):
+            break
+        if stopping:
+            logger.warning(
+                MSG_WARNING_WORK_QUEUE_STOPPED.format(
+                    batch_id=batch_id, pending=_unfinished(counts)
+                )
+            )
+            break
+        await asyncio.sleep(settings.work_queue_poll_interval_s)
+
+    dumped, failed_urls = await queue.results(batch_id)
+    items = [ScrapedItem.model_validate(item) for item in dumped]
+    stats: dict[str, float | int] = {
+        "num_chunks": sum(counts.values()),
+        "num_failed_chunks": counts[WorkChunkState.FAILED],
+        "num_unfinished_chunks": _unfinished(counts),
+        "num_failed_chunk_urls": len(failed_urls),
+    }
+    return items, stats
+
+
+async def _keep_lease(queue: WorkQueue, lease: WorkLease, interval_s: float) -> None:
+    """Renew `lease` every `interval_s` seconds until it is lost or the task is canceled."""
+    while True:
+        await asyncio.sleep(interval_s)
+        if not await queue.heartbeat(lease):
+            return
+
+
+async def _process_chunk(
+    queue: WorkQueue,
+    lease: WorkLease,
+    *,
+    settings: Settings,
+    openai: OpenAIConfig | None,
+    worker_id: str,
+) -> bool:
+    """Scrape one leased chunk and settle it; returns True if its items were stored."""
+    heartbeat = asyncio.create_task(
+        _keep_lease(queue, lease, settings.work_queue_lease_s * WORK_QUEUE_HEARTBEAT_FRACTION)
+    )
+    try:
+        items = await scrape_urls(lease.urls, settings, openai)
+    except Exception as exc:  # noqa: BLE001 - any pipeline error fails the chunk, not the worker
+        error = f"{type(exc).__name__}: {exc}"
+        logger.warning(
+            MSG_WARNING_WORK_QUEUE_CHUNK_FAILED.format(
+                worker_id=worker_id, chunk_id=lease.chunk_id, attempt=lease.attempt, error=error
+            )
+        )
+        await queue.fail(lease, error)
+        return False
+    finally:
+        heartbeat.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await heartbeat
+
+    if await queue.complete(lease, [item.model_dump(mode="json") for item in items]):
+        return True
+    logger.warning(
+        MSG_WARNING_WORK_QUEUE_LEASE_LOST.format(worker_id=worker_id, chunk_id=lease.chunk_id)
+    )
+    return False
+
+
+async def run_worker(  # noqa: PLR0913 - keyword-only knobs for in-process and CLI workers
+    queue: WorkQueue,
+    *,
+    settings: Settings,
+    openai: OpenAIConfig | None = None,
+    worker_id: str | None = None,
+    stop: asyncio.Event | None = None,
+    exit_when_idle: bool = False,
+    batch_id: str | None = None,
+) -> int:
+    """
+    Lease and scrape chunks until stopped.
+
+    Args:
+        queue (WorkQueue): Shared work queue.
+        settings (Settings): Runtime configuration for the pipeline and the queue.
+        openai (OpenAIConfig | None): Optional OpenAI credentials for LLM modes.
+        worker_id (str | None): Name recorded on leases; `<host>-<pid>-<random>` by default.
+        stop (asyncio.Event | None): Finish the current chunk and return once set.
+        exit_when_idle (bool): Return once no chunk (of `batch_id`, if given) is queued
+            or leased.
+        batch_id (str | None): Only lease chunks of this batch; any batch by default.
+
+    Returns:
+        int: Number of chunks this worker completed.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    completed = 0
+    while stop is None or not stop.is_set():
+        lease = await queue.claim(worker_id, batch_id)
+        if lease is None:
+            if exit_when_idle and not _unfinished(await queue.counts(batch_id)):
+                break
+            if stop is None:
+                await asyncio.sleep(settings.work_queue_poll_interval_s)
+            else:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop.wait(), settings.work_queue_poll_interval_s)
+            continue
+
+        logger.debug(
+            MSG_DEBUG_WORK_QUEUE_CLAIMED.format(
+                worker_id=worker_id,
+                chunk_id=lease.chunk_id,
+                urls=len(lease.urls),
+                attempt=lease.attempt,
+            )
+        )
+        if await _process_chunk(
+            queue, lease, settings=settings, openai=openai, worker_id=worker_id
+        ):
+            completed += 1
+    return completed
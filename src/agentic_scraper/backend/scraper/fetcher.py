@@ -5,11 +5,14 @@ Responsibilities:
 - Fetch HTML content from single or multiple URLs using `httpx`.
 - Support retries with exponential backoff for transient errors.
 - Enforce concurrency limits and cancellation via `CancelToken`.
+- Take a global fetch slot from the fair scheduler when one is registered (API).
 - Record structured results keyed by URL with error markers on failure.
 
 Public API:
 - `fetch_url`: Fetch a single URL with retry and cancellation support.
 - `fetch_all`: Fetch multiple URLs concurrently with bounded concurrency.
+- `fetch_stream`: Like `fetch_all`, but yield each result as soon as it is ready and
+  optionally pause new fetches while a `MemoryBudget` is exhausted.
 - `FetchContext`: Context container used internally by concurrent fetch helpers.
 
 Usage:
@@ -25,6 +28,8 @@ Notes:
 - Errors are stored in the results dict prefixed with `FETCH_ERROR_PREFIX`.
 - Verbose mode controls whether exceptions are logged with full tracebacks.
 - Cancel is cooperative: both asyncio.Event and manual predicates are supported.
+- `fetch_timeout_s` (> 0) bounds each URL's whole fetch, retries included; a timeout
+  is recorded as a fetch error like any other transient failure.
 """
 
 from __future__ import annotations
@@ -32,7 +37,9 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING
 
 import httpx
@@ -56,17 +63,23 @@ from agentic_scraper.backend.config.messages import (
     MSG_INFO_FETCH_SUCCESS,
     MSG_WARNING_FETCH_FAILED,
 )
+from agentic_scraper.backend.config.types import SchedulerResource
 from agentic_scraper.backend.scraper.cancel_helpers import (
     CancelToken,
+    await_or_cancel,
     is_canceled,
 )
+from agentic_scraper.backend.scraper.scheduler import scheduled_slot
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.memory_budget import MemoryBudget
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["FetchContext", "fetch_all", "fetch_url"]
+__all__ = ["FetchContext", "fetch_all", "fetch_stream", "fetch_url"]
 
 
 @dataclass
@@ -80,6 +93,8 @@ class FetchContext:
         settings (Settings): Global runtime settings.
         cancel_token (CancelToken | None): Cooperative cancel token.
         results (dict[str, str]): Shared dict to collect results.
+        budget (MemoryBudget | None): Bytes-in-flight budget; fetches wait for room and
+            charge the fetched HTML to their URL.
     """
 
     client: httpx.AsyncClient
@@ -87,6 +102,7 @@ class FetchContext:
     settings: Settings
     cancel_token: CancelToken | None
     results: dict[str, str]
+    budget: MemoryBudget | None = None
 
 
 def _record_fetch_error(
@@ -120,6 +136,14 @@ def _record_fetch_error(
         logger.warning(MSG_WARNING_FETCH_FAILED.format(url=url))
 
 
+@asynccontextmanager
+async def _budget_room(budget: MemoryBudget | None) -> AsyncIterator[None]:
+    """Wait until `budget` has room (no-op without a budget)."""
+    if budget is not None:
+        await budget.wait_for_room()
+    yield
+
+
 async def _bounded_fetch(url: str, *, ctx: FetchContext) -> None:
     """
     Fetch one URL under a semaphore, honoring cancellation, and update results.
@@ -131,8 +155,11 @@ async def _bounded_fetch(url: str, *, ctx: FetchContext) -> None:
     Notes:
         - Cancellation is checked *inside* the semaphore to keep slot accounting
           consistent (task acquires slot → checks cancel → exits quickly if needed).
+        - An in-flight request is cancelled as soon as the token's event is set.
     """
-    async with ctx.sem:  # bound concurrency for all in-flight fetches
+    # Per-job bound first, then the memory budget (if any), then the process-wide fair
+    # slot (API only; no-op otherwise), so a paused job never holds a global slot.
+    async with ctx.sem, _budget_room(ctx.budget), scheduled_slot(SchedulerResource.FETCH):
         try:
             if is_canceled(ctx.cancel_token):
                 # Canonical canceled marker so the caller can distinguish cancellation.
@@ -143,14 +170,21 @@ async def _bounded_fetch(url: str, *, ctx: FetchContext) -> None:
             cancel_event = ctx.cancel_token.event if ctx.cancel_token else None
             should_cancel = ctx.cancel_token.should_cancel if ctx.cancel_token else None
 
-            html = await fetch_url(
+            fetch = fetch_url(
                 ctx.client,
                 url,
                 settings=ctx.settings,
                 cancel_event=cancel_event,
                 should_cancel=should_cancel,
             )
+            timeout_s = ctx.settings.fetch_timeout_s
+            html = await await_or_cancel(
+                asyncio.wait_for(fetch, timeout=timeout_s) if timeout_s > 0 else fetch,
+                ctx.cancel_token,
+            )
             ctx.results[url] = html
+            if ctx.budget is not None:
+                ctx.budget.charge(url, len(html))
             logger.info(MSG_INFO_FETCH_SUCCESS.format(url=url))
 
         except RetryError as e:
@@ -302,3 +336,73 @@ async def fetch_all(
                 await asyncio.gather(*tasks, return_exceptions=True)
 
     return results
+
+
+def _announce_finished(finished: asyncio.Queue[str], url: str, _task: asyncio.Task[None]) -> None:
+    """Task done-callback: queue `url` for `fetch_stream` to hand over."""
+    finished.put_nowait(url)
+
+
+async def fetch_stream(  # noqa: PLR0913 - mirrors fetch_all plus the budget
+    urls: list[str],
+    *,
+    settings: Settings,
+    concurrency: int,
+    cancel: CancelToken | None = None,
+    budget: MemoryBudget | None = None,
+    client_factory: Callable[..., httpx.AsyncClient] | None = None,
+) -> AsyncIterator[tuple[str, str]]:
+    """
+    Fetch URLs concurrently and yield `(url, html_or_error)` as each fetch finishes.
+
+    Args:
+        urls (list[str]): Target URLs (duplicates are fetched once).
+        settings (Settings): Runtime settings.
+        concurrency (int): Maximum simultaneous requests (min=1).
+        cancel (CancelToken | None): Optional cancel token.
+        budget (MemoryBudget | None): When set, a fetch only starts while the budget has
+            room, and fetched HTML is charged to its URL (the caller releases it).
+        client_factory (Callable[..., httpx.AsyncClient] | None): Optional factory
+            for testing/injection.
+
+    Yields:
+        tuple[str, str]: URL and HTML, or an error string prefixed with
+        `FETCH_ERROR_PREFIX`, in completion order.
+
+    Notes:
+        - Results are handed over (not retained), so memory is bounded by what the
+          caller keeps plus fetches that finished but were not consumed yet.
+        - Closing the generator early cancels the outstanding fetches.
+    """
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return
+
+    results: dict[str, str] = {}
+    finished: asyncio.Queue[str] = asyncio.Queue()
+    sem = asyncio.Semaphore(max(1, int(concurrency)))
+    factory = client_factory or httpx.AsyncClient
+
+    async with factory(headers=DEFAULT_HEADERS, follow_redirects=True) as client:
+        ctx = FetchContext(
+            client=client,
+            sem=sem,
+            settings=settings,
+            cancel_token=cancel,
+            results=results,
+            budget=budget,
+        )
+        tasks: list[asyncio.Task[None]] = []
+        for i, url in enumerate(unique):
+            task = asyncio.create_task(_bounded_fetch(url, ctx=ctx), name=f"fetch:{i}")
+            task.add_done_callback(partial(_announce_finished, finished, url))
+            tasks.append(task)
+        try:
+            for _ in tasks:
+                url = await finished.get()
+                yield url, results.pop(url, f"{FETCH_ERROR_PREFIX}: canceled")
+        finally:
+            for t in tasks:
+                if not t.done():
+                    t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
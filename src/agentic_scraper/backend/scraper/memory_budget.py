@@ -0,0 +1,102 @@
+"""
+Bytes-in-flight accounting that throttles fetching when pages pile up unprocessed.
+
+Responsibilities:
+- Track how many bytes of fetched-but-unprocessed pages a run is holding, per URL.
+- Make new fetches wait while the total is at or above the configured budget.
+- Optionally compress queued page text, trading a little CPU for much less memory.
+- Record the peak held bytes for pipeline stats.
+
+Public API:
+- `MemoryBudget`: `wait_for_room()`, `charge()`, `release()` and the `held` / `peak`
+  counters.
+- `pack_text` / `unpack_text`: Optional zlib compression of queued page text.
+
+Operational:
+- Concurrency: Single event loop; state is only touched from the loop.
+- Progress: A fetch may start whenever held bytes are below the budget, so a run can
+  overshoot by up to one page per fetch slot. A page larger than the whole budget is
+  still processed (alone), never deadlocked.
+- Sizes: Page text is measured in characters, which equals bytes for ASCII pages and
+  underestimates multi-byte text.
+
+Usage:
+    budget = MemoryBudget(settings.memory_budget_mb * BYTES_PER_MB)
+    await budget.wait_for_room()  # before each fetch
+    budget.charge(url, len(html))  # after it
+    budget.release(url)            # once the worker pool is done with the page
+
+Notes:
+- Charges for one URL accumulate until `release(url)` drops them all.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import zlib
+from collections import Counter
+
+from agentic_scraper.backend.config.constants import MEMORY_BUDGET_COMPRESS_LEVEL
+
+__all__ = ["MemoryBudget", "pack_text", "unpack_text"]
+
+
+class MemoryBudget:
+    """
+    Byte budget for pages held between fetching and extraction.
+
+    Attributes:
+        limit (int): Budget in bytes.
+        held (int): Bytes currently charged.
+        peak (int): Highest `held` value observed.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        Create a budget.
+
+        Args:
+            limit (int): Budget in bytes (at least 1).
+        """
+        self.limit = max(1, limit)
+        self.held = 0
+        self.peak = 0
+        self._by_key: Counter[str] = Counter()
+        self._room = asyncio.Event()
+        self._room.set()
+
+    async def wait_for_room(self) -> None:
+        """Wait until held bytes drop below the budget."""
+        while self.held >= self.limit:
+            self._room.clear()
+            await self._room.wait()
+
+    def charge(self, key: str, nbytes: int) -> None:
+        """Add `nbytes` (may be negative to shrink a charge) to `key`'s total."""
+        self._by_key[key] += nbytes
+        self.held += nbytes
+        self.peak = max(self.peak, self.held)
+        self._notify()
+
+    def release(self, key: str) -> None:
+        """Drop every byte charged to `key` (no-op for unknown keys)."""
+        self.held -= self._by_key.pop(key, 0)
+        self._notify()
+
+    def _notify(self) -> None:
+        if self.held < self.limit:
+            self._room.set()
+
+
+def pack_text(text: str, *, compress: bool) -> str | bytes:
+    """Return `text` as-is, or zlib-compressed UTF-8 when `compress` is True."""
+    if not compress:
+        return text
+    return zlib.compress(text.encode("utf-8"), MEMORY_BUDGET_COMPRESS_LEVEL)
+
+
+def unpack_text(payload: str | bytes) -> str:
+    """Inverse of `pack_text`."""
+    if isinstance(payload, str):
+        return payload
+    return zlib.decompress(payload).decode("utf-8")
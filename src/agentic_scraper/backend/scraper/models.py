@@ -139,6 +139,8 @@ class RetryContext:
         best_valid_item (ScrapedItem | None): Parsed/validated item for the best valid candidate.
         all_fields (dict[str, Any]): Aggregated field observations (debug/telemetry).
         has_done_discovery (bool): Whether discovery prompts have been executed.
+        best_fields_model (str | None): Fallback model that produced `best_fields`
+            (None when the primary model did).
     """
 
     messages: list[ChatCompletionMessageParam]
@@ -148,6 +150,7 @@ class RetryContext:
     best_valid_item: ScrapedItem | None
     all_fields: dict[str, Any]
     has_done_discovery: bool = False
+    best_fields_model: str | None = None
 
 
 class WorkerPoolConfig(BaseModel):
@@ -164,6 +167,12 @@ class WorkerPoolConfig(BaseModel):
         on_progress (Callable[[int, int], None] | None): Hook with (done, total).
         preserve_order (bool): If True, emit results in input order (may reduce throughput).
         should_cancel (Callable[[], bool] | None): Cooperative cancel check for long runs.
+        screenshot_paths (dict[str, str]): Screenshots already captured upstream (e.g. by
+            the render fetch), keyed by URL; those pages are not captured again.
+        on_input_done (Callable[[str, Any], None] | None): Hook called once per
+            processed input with `(url, item)`; `item` is None when nothing was extracted.
+        collect_results (bool): If False, the pool keeps no result buffer and returns an
+            empty list; results are only delivered through the hooks (streaming).
 
     Notes:
         - `arbitrary_types_allowed=True` is enabled to allow callables in the model.
@@ -179,6 +188,9 @@ class WorkerPoolConfig(BaseModel):
     on_progress: Callable[[int, int], None] | None = None
     preserve_order: bool = False
     should_cancel: Callable[[], bool] | None = None
+    screenshot_paths: dict[str, str] = Field(default_factory=dict)
+    on_input_done: Callable[[str, Any], None] | None = None
+    collect_results: bool = True
 
     @field_validator("max_queue_size")
     @classmethod
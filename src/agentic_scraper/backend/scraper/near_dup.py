@@ -0,0 +1,408 @@
+"""
+Near-duplicate detection so near-identical pages share one extraction result.
+
+Responsibilities:
+- Fingerprint main text with a 64-bit SimHash over word shingles.
+- Cluster a job's inputs by Hamming distance and pick one representative per cluster.
+- Optionally consult/update a persistent JSON index (one file per owner) so duplicates
+  of pages extracted in earlier jobs are answered without an LLM call.
+- Expand representative results back onto every cluster member (with its own URL).
+
+Public API:
+- `simhash`: Text → 64-bit fingerprint (None for texts too short to fingerprint).
+- `hamming_distance`: Bit distance between two fingerprints.
+- `NearDupIndex`: Persistent fingerprint → item index (JSON file, bounded size).
+- `owner_index_path`: Per-owner location of the persistent index.
+- `NearDupPlan`: Result of planning (representatives, duplicate map, index hits).
+- `plan_near_duplicates`: Build a `NearDupPlan` for a list of inputs.
+
+Operational:
+- Complexity: Fingerprints are bucketed by band (pigeonhole LSH): with `max_distance = k`
+  the 64 bits are split into k + 1 bands, and any two fingerprints within distance k
+  agree exactly on at least one band. Only same-bucket fingerprints are compared, so
+  clustering and index lookups stay near-linear for large jobs and a full index.
+- I/O: The index is a JSON file read/written synchronously once per job.
+- Logging: Plan summary at INFO; individual matches at DEBUG.
+
+Usage:
+    from agentic_scraper.backend.scraper.near_dup import plan_near_duplicates
+
+    plan = plan_near_duplicates(inputs, max_distance=settings.near_dup_max_distance)
+    items = await run_worker_pool(inputs=plan.representatives, ...)
+    items = plan.expand(items)
+
+Notes:
+- Fingerprints use BLAKE2b rather than `hash()` so they are stable across processes,
+  which the persistent index depends on.
+- Texts with fewer than `NEAR_DUP_MIN_TOKENS` words are never clustered: short pages
+  (error stubs, redirects) look alike without being interchangeable.
+- The index is scoped per owner (`owner_index_path`) so one user's extractions are
+  never served to another user.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from agentic_scraper.backend.config.constants import (
+    NEAR_DUP_INDEX_MAX_ENTRIES,
+    NEAR_DUP_MIN_TOKENS,
+    SIMHASH_BITS,
+    SIMHASH_SHINGLE_SIZE,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_NEAR_DUP_MATCH,
+    MSG_INFO_NEAR_DUP_PLANNED,
+    MSG_WARNING_NEAR_DUP_INDEX_LOAD_FAILED,
+    MSG_WARNING_NEAR_DUP_INDEX_SAVE_FAILED,
+)
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.config.aliases import ScrapeInput
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "NearDupIndex",
+    "NearDupPlan",
+    "hamming_distance",
+    "owner_index_path",
+    "plan_near_duplicates",
+    "simhash",
+]
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_MASK = (1 << SIMHASH_BITS) - 1
+
+
+def _hash64(token: str) -> int:
+    """Stable 64-bit hash of a shingle."""
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int | None:
+    """
+    Compute a 64-bit SimHash of `text` over word shingles.
+
+    Args:
+        text (str): Main text of a page.
+
+    Returns:
+        int | None: Fingerprint, or None when the text has fewer than
+        `NEAR_DUP_MIN_TOKENS` words.
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < NEAR_DUP_MIN_TOKENS:
+        return None
+
+    shingles = Counter(
+        " ".join(words[i : i + SIMHASH_SHINGLE_SIZE])
+        for i in range(len(words) - SIMHASH_SHINGLE_SIZE + 1)
+    )
+    weights = [0] * SIMHASH_BITS
+    for shingle, count in shingles.items():
+        h = _hash64(shingle)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if (h >> bit) & 1 else -count
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint & _MASK
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+def _band_layout(max_distance: int) -> list[tuple[int, int]]:
+    """`(shift, mask)` of `max_distance + 1` near-equal bands covering all bits."""
+    count = min(max_distance + 1, SIMHASH_BITS)
+    width, extra = divmod(SIMHASH_BITS, count)
+    layout: list[tuple[int, int]] = []
+    shift = 0
+    for band in range(count):
+        bits = width + (1 if band < extra else 0)
+        layout.append((shift, (1 << bits) - 1))
+        shift += bits
+    return layout
+
+
+class _BandedFingerprints:
+    """Fingerprints bucketed by band so only likely matches are compared."""
+
+    def __init__(self, max_distance: int) -> None:
+        self.max_distance = max_distance
+        self._layout = _band_layout(max_distance)
+        self._fingerprints: list[int] = []
+        self._buckets: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+
+    def _keys(self, fingerprint: int) -> list[tuple[int, int]]:
+        return [
+            (band, (fingerprint >> shift) & mask) for band, (shift, mask) in enumerate(self._layout)
+        ]
+
+    def add(self, fingerprint: int) -> int:
+        """Store `fingerprint`; returns its position (insertion order)."""
+        position = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        for key in self._keys(fingerprint):
+            self._buckets[key].append(position)
+        return position
+
+    def nearest(self, fingerprint: int) -> tuple[int, int] | None:
+        """`(position, distance)` of the closest stored fingerprint within `max_distance`."""
+        best: tuple[int, int] | None = None
+        seen: set[int] = set()
+        for key in self._keys(fingerprint):
+            for position in self._buckets.get(key, ()):
+                if position in seen:
+                    continue
+                seen.add(position)
+                distance = hamming_distance(self._fingerprints[position], fingerprint)
+                if distance <= self.max_distance and (
+                    best is None or (distance, position) < (best[1], best[0])
+                ):
+                    best = (position, distance)
+        return best
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Persistent index
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def owner_index_path(path: str | Path, owner: str | None) -> Path:
+    """
+    Per-owner location of the index configured at `path`.
+
+    Args:
+        path (str | Path): Configured index path (`near_dup_index_path`).
+        owner (str | None): Owner identity (e.g. the user's `sub`); None for local runs.
+
+    Returns:
+        Path: `path` itself without an owner, else a sibling tagged with a hash of `owner`.
+    """
+    base = Path(path)
+    if not owner:
+        return base
+    tag = hashlib.sha256(owner.encode("utf-8")).hexdigest()[:12]
+    return base.with_name(f"{base.stem}.{tag}{base.suffix}")
+
+
+@dataclass
+class NearDupIndex:
+    """
+    Bounded fingerprint → extracted-item index persisted as a JSON file.
+
+    Attributes:
+        path (Path): JSON file location.
+        entries (list[tuple[int, dict[str, Any]]]): `(fingerprint, item fields)`, oldest first.
+    """
+
+    path: Path
+    entries: list[tuple[int, dict[str, Any]]] = field(default_factory=list)
+    _banded: _BandedFingerprints | None = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def load(cls, path: str | Path) -> NearDupIndex:
+        """Load an index from `path`; a missing or unreadable file yields an empty index."""
+        index = cls(path=Path(path))
+        if not index.path.exists():
+            return index
+        try:
+            raw = json.loads(index.path.read_text(encoding="utf-8"))
+            index.entries = [(int(e["fingerprint"]), dict(e["item"])) for e in raw]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(MSG_WARNING_NEAR_DUP_INDEX_LOAD_FAILED.format(path=index.path, error=e))
+            index.entries = []
+        return index
+
+    def lookup(self, fingerprint: int, max_distance: int) -> tuple[dict[str, Any], int] | None:
+        """Return the closest stored item within `max_distance`, with its distance."""
+        if self._banded is None or self._banded.max_distance != max_distance:
+            # Built once per job: lookups all happen before `add` invalidates it.
+            self._banded = _BandedFingerprints(max_distance)
+            for stored, _ in self.entries:
+                self._banded.add(stored)
+        match = self._banded.nearest(fingerprint)
+        if match is None:
+            return None
+        position, distance = match
+        return self.entries[position][1], distance
+
+    def add(self, fingerprint: int, item: dict[str, Any]) -> None:
+        """Append an entry, evicting the oldest beyond `NEAR_DUP_INDEX_MAX_ENTRIES`."""
+        self._banded = None
+        self.entries.append((fingerprint, item))
+        overflow = len(self.entries) - NEAR_DUP_INDEX_MAX_ENTRIES
+        if overflow > 0:
+            del self.entries[:overflow]
+
+    def save(self) -> None:
+        """Write the index to disk (best effort; failures are logged)."""
+        payload = [{"fingerprint": fp, "item": item} for fp, item in self.entries]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        except OSError as e:
+            logger.warning(MSG_WARNING_NEAR_DUP_INDEX_SAVE_FAILED.format(path=self.path, error=e))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Planning / expansion
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class NearDupPlan:
+    """
+    Outcome of near-duplicate planning for one job.
+
+    Attributes:
+        representatives (list[ScrapeInput]): Inputs that still need extraction.
+        duplicates (dict[str, str]): Duplicate URL → representative URL (within the job).
+        index_hits (dict[str, dict[str, Any]]): URL → item fields reused from the index.
+        fingerprints (dict[str, int]): Representative URL → fingerprint (for index updates).
+    """
+
+    representatives: list[ScrapeInput]
+    duplicates: dict[str, str] = field(default_factory=dict)
+    index_hits: dict[str, dict[str, Any]] = field(default_factory=dict)
+    fingerprints: dict[str, int] = field(default_factory=dict)
+    _members: dict[str, list[str]] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def reused(self) -> int:
+        """Pages answered without their own extraction."""
+        return len(self.duplicates) + len(self.index_hits)
+
+    def expand(self, items: list[ScrapedItem]) -> list[ScrapedItem]:
+        """
+        Copy representative results onto duplicates and append index hits.
+
+        Args:
+            items (list[ScrapedItem]): Results for `representatives`.
+
+        Returns:
+            list[ScrapedItem]: `items` followed by reused items, each with its own URL.
+            Duplicates whose representative failed extraction are dropped.
+        """
+        by_url = {item.url: item for item in items}
+        out = list(items)
+        for dup_url, rep_url in self.duplicates.items():
+            rep = by_url.get(rep_url)
+            if rep is not None:
+                out.append(_reuse(rep.model_dump(), dup_url))
+        out.extend(url_item for _url, url_item in self.index_hit_items())
+        return out
+
+    def copies_for(
+        self, url: str, item: ScrapedItem | None
+    ) -> list[tuple[str, ScrapedItem | None]]:
+        """
+        Results for the in-job duplicates of representative `url`, as soon as it is done.
+
+        Args:
+            url (str): Representative URL.
+            item (ScrapedItem | None): Its result (None when extraction failed).
+
+        Returns:
+            list[tuple[str, ScrapedItem | None]]: `(duplicate_url, copy)` pairs in input
+            order; the copy is None when the representative produced no item.
+        """
+        if self._members is None:
+            self._members = defaultdict(list)
+            for dup_url, rep_url in self.duplicates.items():
+                self._members[rep_url].append(dup_url)
+        fields = item.model_dump() if item is not None else None
+        return [
+            (dup_url, _reuse(fields, dup_url) if fields is not None else None)
+            for dup_url in self._members.get(url, [])
+        ]
+
+    def index_hit_items(self) -> list[tuple[str, ScrapedItem]]:
+        """Items answered from the cross-job index, as `(url, item)` pairs."""
+        return [(url, _reuse(fields, url)) for url, fields in self.index_hits.items()]
+
+    def remember(self, items: list[ScrapedItem], index: NearDupIndex) -> None:
+        """Add freshly extracted representatives to `index` and persist it."""
+        for item in items:
+            fingerprint = self.fingerprints.get(item.url)
+            if fingerprint is not None:
+                index.add(fingerprint, item.model_dump(mode="json"))
+        index.save()
+
+
+def _reuse(fields: dict[str, Any], url: str) -> ScrapedItem:
+    """Build a copy of an extracted item for another URL."""
+    return ScrapedItem.model_validate({**fields, "url": url})
+
+
+def plan_near_duplicates(
+    inputs: list[ScrapeInput],
+    *,
+    max_distance: int,
+    index: NearDupIndex | None = None,
+) -> NearDupPlan:
+    """
+    Cluster `inputs` by SimHash and pick one representative per cluster.
+
+    Args:
+        inputs (list[ScrapeInput]): `(url, main_text)` pairs.
+        max_distance (int): Largest Hamming distance treated as a duplicate.
+        index (NearDupIndex | None): Optional cross-job index consulted first.
+
+    Returns:
+        NearDupPlan: Representatives (first-seen member of each cluster) and reuse maps.
+    """
+    plan = NearDupPlan(representatives=[])
+    clusters = _BandedFingerprints(max_distance)
+    cluster_urls: list[str] = []  # representative URL by cluster position
+
+    for url, text in inputs:
+        fingerprint = simhash(text)
+        if fingerprint is None:
+            plan.representatives.append((url, text))
+            continue
+
+        if index is not None and (hit := index.lookup(fingerprint, max_distance)) is not None:
+            item, distance = hit
+            logger.debug(
+                MSG_DEBUG_NEAR_DUP_MATCH.format(url=url, source=item.get("url"), distance=distance)
+            )
+            plan.index_hits[url] = item
+            continue
+
+        if (match := clusters.nearest(fingerprint)) is not None:
+            rep_url, distance = cluster_urls[match[0]], match[1]
+            logger.debug(
+                MSG_DEBUG_NEAR_DUP_MATCH.format(url=url, source=rep_url, distance=distance)
+            )
+            plan.duplicates[url] = rep_url
+            continue
+
+        clusters.add(fingerprint)
+        cluster_urls.append(url)
+        plan.fingerprints[url] = fingerprint
+        plan.representatives.append((url, text))
+
+    logger.info(
+        MSG_INFO_NEAR_DUP_PLANNED.format(
+            total=len(inputs),
+            representatives=len(plan.representatives),
+            reused=len(plan.duplicates),
+            index_hits=len(plan.index_hits),
+        )
+    )
+    return plan
@@ -0,0 +1,163 @@
+"""
+Lightweight soft-404 / error-page classifier run between parsing and the worker pool.
+
+Responsibilities:
+- Flag pages that returned 200 but carry no extractable content: soft 404s, login walls,
+  bot challenges, near-empty pages, and host-wide error templates.
+- Give each rejection a typed `PageRejectReason` so callers can report it.
+
+Public API:
+- `classify_page`: Classify a single page from its title and visible text.
+- `classify_pages`: Classify a batch, adding cross-URL duplicate-template detection.
+- `PageRejectedError`: Exception carrying the reason (passed to `on_error` job hooks).
+
+Operational:
+- Cost: Regex/substring checks only; no network, no LLM. Safe to run on every page.
+- Logging: One INFO line per rejected page plus a summary.
+
+Usage:
+    from agentic_scraper.backend.scraper.page_classifier import classify_pages
+
+    rejected = classify_pages(pages, min_text_chars=settings.page_min_text_chars)
+
+Notes:
+- Error phrases and title patterns only count when the page's main text is short; a
+  long article that merely mentions "access denied" (or is titled "404 errors
+  explained") is kept.
+- Duplicate-template detection targets wildcard routes that serve one error body for
+  any path: identical short text on several URLs of the same host.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html as html_lib
+import logging
+import re
+from collections import Counter, defaultdict
+from urllib.parse import urlparse
+
+from agentic_scraper.backend.config.constants import (
+    BOT_CHALLENGE_PHRASES,
+    LOGIN_WALL_PHRASES,
+    PAGE_CLASSIFIER_DUPLICATE_MIN_PAGES,
+    PAGE_CLASSIFIER_MAX_ERROR_TEXT_CHARS,
+    SOFT_404_PHRASES,
+    SOFT_404_TITLE_PATTERN,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_ERROR_PAGE_REJECTED,
+    MSG_INFO_PAGE_REJECTED,
+    MSG_INFO_PAGES_REJECTED_SUMMARY,
+)
+from agentic_scraper.backend.config.types import PageRejectReason
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["PageRejectedError", "classify_page", "classify_pages"]
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_SOFT_404_TITLE_RE = re.compile(SOFT_404_TITLE_PATTERN, re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+
+# Checked in order: challenges/login walls are more specific than a generic "not found".
+_PHRASE_RULES: tuple[tuple[PageRejectReason, tuple[str, ...]], ...] = (
+    (PageRejectReason.BOT_CHALLENGE, BOT_CHALLENGE_PHRASES),
+    (PageRejectReason.LOGIN_WALL, LOGIN_WALL_PHRASES),
+    (PageRejectReason.SOFT_404, SOFT_404_PHRASES),
+)
+
+
+class PageRejectedError(Exception):
+    """Raised/reported for pages skipped by the classifier; `reason` is typed."""
+
+    def __init__(self, reason: PageRejectReason) -> None:
+        self.reason = reason
+        super().__init__(MSG_ERROR_PAGE_REJECTED.format(reason=reason.value))
+
+
+def _title_of(html: str) -> str:
+    """Return the `<title>` text (unescaped, whitespace-collapsed) or ''."""
+    match = _TITLE_RE.search(html)
+    if not match:
+        return ""
+    return _WS_RE.sub(" ", html_lib.unescape(match.group(1))).strip()
+
+
+def classify_page(html: str, text: str, *, min_text_chars: int) -> PageRejectReason | None:
+    """
+    Classify one page.
+
+    Args:
+        html (str): Raw HTML (used for `<title>` only).
+        text (str): Visible text from `extract_main_text`.
+        min_text_chars (int): Pages with less visible text are `THIN_CONTENT`.
+
+    Returns:
+        PageRejectReason | None: Why the page should be skipped, or None to keep it.
+    """
+    title = _title_of(html).lower()
+    body = _WS_RE.sub(" ", text).strip().lower()
+    short = len(body) <= PAGE_CLASSIFIER_MAX_ERROR_TEXT_CHARS
+
+    if short:
+        for reason, phrases in _PHRASE_RULES:
+            if any(p in title or p in body for p in phrases):
+                return reason
+        if _SOFT_404_TITLE_RE.search(title):
+            return PageRejectReason.SOFT_404
+
+    if len(body) < min_text_chars:
+        return PageRejectReason.THIN_CONTENT
+    return None
+
+
+def _duplicate_templates(pages: list[tuple[str, str, str]]) -> set[str]:
+    """URLs whose short body text repeats across enough URLs of the same host."""
+    keys: dict[str, tuple[str, str]] = {}
+    for url, _html, text in pages:
+        body = _WS_RE.sub(" ", text).strip().lower()
+        if not body or len(body) > PAGE_CLASSIFIER_MAX_ERROR_TEXT_CHARS:
+            continue
+        digest = hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+        keys[url] = (urlparse(url).netloc.lower(), digest)
+
+    counts = Counter(keys.values())
+    return {url for url, key in keys.items() if counts[key] >= PAGE_CLASSIFIER_DUPLICATE_MIN_PAGES}
+
+
+def classify_pages(
+    pages: list[tuple[str, str, str]],
+    *,
+    min_text_chars: int,
+) -> dict[str, PageRejectReason]:
+    """
+    Classify a batch of pages.
+
+    Args:
+        pages (list[tuple[str, str, str]]): `(url, html, text)` triples.
+        min_text_chars (int): Threshold for `THIN_CONTENT`.
+
+    Returns:
+        dict[str, PageRejectReason]: Rejected URL → reason (kept pages are absent).
+    """
+    duplicates = _duplicate_templates(pages)
+    rejected: dict[str, PageRejectReason] = {}
+    for url, html, text in pages:
+        reason = classify_page(html, text, min_text_chars=min_text_chars)
+        if reason is None and url in duplicates:
+            reason = PageRejectReason.DUPLICATE_TEMPLATE
+        if reason is not None:
+            rejected[url] = reason
+            logger.info(MSG_INFO_PAGE_REJECTED.format(url=url, reason=reason.value))
+
+    if rejected:
+        by_reason: defaultdict[str, int] = defaultdict(int)
+        for reason in rejected.values():
+            by_reason[reason.value] += 1
+        logger.info(
+            MSG_INFO_PAGES_REJECTED_SUMMARY.format(
+                rejected=len(rejected), total=len(pages), by_reason=dict(by_reason)
+            )
+        )
+    return rejected
@@ -3,16 +3,28 @@ Scraping pipeline orchestrator for AgenticScraper.
 
 Responsibilities:
 - Coordinate the end-to-end scraping flow: fetch → parse → extract via workers.
+- Stream results to callers as they are produced instead of after the whole run.
+- Optionally re-fetch JavaScript-heavy pages in headless Chromium (`fetch_render_mode`).
 - Provide cancellation-aware execution and optional metrics gathering.
+- Resume interrupted runs from a checkpoint journal (`PipelineOptions.checkpoint`).
 
 Public API:
+- `scrape_iter`: Run the pipeline and yield items as workers produce them (optionally
+  in input order via a reorder buffer).
 - `scrape_urls`: Run the pipeline and return extracted items.
 - `scrape_with_stats`: Run the pipeline and also return timing/count stats.
+- `scrape_urls_bulk`: Fetch/parse as usual, then extract through an offline bulk job.
 - `PipelineOptions`: Optional knobs for cancellation and job hook integrations.
 
 Operational:
 - Concurrency: Fetch and worker phases are concurrent; actual limits come from `Settings`.
 - Retries: HTTP fetch retries are handled in the fetcher; worker retries depend on agent logic.
+- Memory: With `memory_budget_mb` set, fetched pages stream straight into the worker
+  pool. Fetching pauses while unprocessed pages exceed the budget, HTML is dropped as
+  soon as its text is extracted, and queued text can be compressed
+  (`memory_budget_compress`).
+- Timeouts: Optional per-stage budgets (`fetch_timeout_s`, `parse_timeout_s`,
+  `llm_timeout_s`, `screenshot_timeout_s`) keep one slow page from stalling a run.
 - Logging: Debug/Info logs summarize phase starts/finishes; verbose mode adds more detail.
 
 Usage:
@@ -28,6 +40,8 @@ Notes:
 - Inputs that fail to fetch are filtered out using `FETCH_ERROR_PREFIX` (caller receives only
   successfully-fetched pages).
 - Cancellation is cooperative via `PipelineOptions(cancel_event/should_cancel)`.
+- The memory-budget path needs no whole-batch stage, so it is skipped (with a warning)
+  when near-duplicate detection or page rendering is enabled.
 """
 
 from __future__ import annotations
@@ -35,35 +49,67 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import os
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import AsyncIterable, Callable
+from dataclasses import dataclass, replace
+from functools import partial
 from typing import TYPE_CHECKING
 
-from agentic_scraper.backend.config.constants import FETCH_ERROR_PREFIX
+from agentic_scraper.backend.config.constants import (
+    BYTES_PER_MB,
+    CHECKPOINT_NO_ITEM_REASON,
+    FETCH_ERROR_PREFIX,
+)
 from agentic_scraper.backend.config.messages import (
     MSG_DEBUG_PIPELINE_FETCH_START,
     MSG_DEBUG_PIPELINE_WORKER_POOL_START,
     MSG_DEBUG_SCRAPE_STATS_START,
+    MSG_INFO_CHECKPOINT_RESUMED,
     MSG_INFO_FETCH_COMPLETE,
+    MSG_INFO_MEMORY_BUDGET_STREAMING,
     MSG_INFO_SCRAPE_STATS_COMPLETE,
     MSG_INFO_VALID_SCRAPE_INPUTS,
+    MSG_WARNING_MEMORY_BUDGET_IGNORED,
+    MSG_WARNING_PARSE_TIMEOUT,
 )
-from agentic_scraper.backend.config.types import AgentMode, OpenAIConfig
-from agentic_scraper.backend.scraper.cancel_helpers import CancelToken
-from agentic_scraper.backend.scraper.fetcher import fetch_all
+from agentic_scraper.backend.config.types import AgentMode, FetchRenderMode, OpenAIConfig
+from agentic_scraper.backend.scraper.agents.llm_endpoint import ensure_endpoint_healthy
+from agentic_scraper.backend.scraper.agents.llm_hedge import hedge_stats_scope
+from agentic_scraper.backend.scraper.browser_pool import browser_pool_session
+from agentic_scraper.backend.scraper.bulk_extract import run_bulk_extraction
+from agentic_scraper.backend.scraper.cancel_helpers import CancelToken, is_canceled
+from agentic_scraper.backend.scraper.fetcher import fetch_all, fetch_stream
+from agentic_scraper.backend.scraper.memory_budget import MemoryBudget, pack_text, unpack_text
 from agentic_scraper.backend.scraper.models import WorkerPoolConfig
+from agentic_scraper.backend.scraper.near_dup import (
+    NearDupIndex,
+    NearDupPlan,
+    owner_index_path,
+    plan_near_duplicates,
+)
+from agentic_scraper.backend.scraper.page_classifier import PageRejectedError, classify_pages
 from agentic_scraper.backend.scraper.parser import extract_main_text
+from agentic_scraper.backend.scraper.renderer import render_pages
+from agentic_scraper.backend.scraper.result_stream import ResultStream
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
 from agentic_scraper.backend.scraper.worker_pool import run_worker_pool
 
 if TYPE_CHECKING:
-    from agentic_scraper.backend.config.aliases import ScrapeInput
+    from collections.abc import AsyncIterator
+
+    from agentic_scraper.backend.config.aliases import OnInputDoneCallback, ScrapeInput
     from agentic_scraper.backend.core.settings import Settings
-    from agentic_scraper.backend.scraper.schemas import ScrapedItem
+    from agentic_scraper.backend.scraper.bulk_backends import BulkBackend
+    from agentic_scraper.backend.scraper.checkpoint import CheckpointJournal
 
 
 logger = logging.getLogger(__name__)
 
+_LLM_AGENT_MODES = frozenset(
+    {AgentMode.LLM_FIXED, AgentMode.LLM_DYNAMIC, AgentMode.LLM_DYNAMIC_ADAPTIVE}
+)
+
 
 @dataclass
 class PipelineOptions:
@@ -78,8 +124,16 @@ class PipelineOptions:
             - on_progress(done: int, total: int) -> None
             - on_item_processed(item: object) -> None
             - on_error(url: str, exc: Exception) -> None
+            - on_input_done(url: str, item: ScrapedItem | None) -> None (also called for
+              near-duplicate copies, right after their representative)
             - on_failed(exc: Exception) -> None
             - on_completed(success: int, failed: int, duration_sec: float) -> None
+        extra_stats (dict[str, float | int] | None): If provided, stages record extra
+            counters here (e.g. near-duplicate reuse); `scrape_with_stats` merges them.
+        checkpoint (CheckpointJournal | None): Journal of finished URLs. Its items are
+            re-emitted, only pending URLs are scraped, and new outcomes are recorded.
+        owner (str | None): Identity the run belongs to (the API user's `sub`); scopes
+            per-user state such as the cross-job near-duplicate index.
 
     Notes:
         - Hooks are invoked best-effort and wrapped in `contextlib.suppress` to avoid surfacing
@@ -89,135 +143,796 @@ class PipelineOptions:
     cancel_event: asyncio.Event | None = None
     should_cancel: Callable[[], bool] | None = None
     job_hooks: object | None = None
+    extra_stats: dict[str, float | int] | None = None
+    checkpoint: CheckpointJournal | None = None
+    owner: str | None = None
 
 
-async def scrape_urls(
-    urls: list[str],
+def _reject_error_pages(
+    pages: list[tuple[str, str, str]],
     settings: Settings,
-    openai: OpenAIConfig | None = None,
-    *,
-    options: PipelineOptions | None = None,
-) -> list[ScrapedItem]:
+    options: PipelineOptions | None,
+) -> list[ScrapeInput]:
     """
-    Run the scraping pipeline on the given URLs and return extracted items.
-
-    Flow:
-        1) Cancellation pre-check (fast exit before any I/O).
-        2) Fetch HTML concurrently (`fetch_all`), honoring cancellation.
-        3) Extract main text for successfully fetched pages.
-        4) Run worker pool (LLM or rule-based) to produce `ScrapedItem`s.
+    Drop soft-404/login/challenge pages and report each one with its typed reason.
 
     Args:
-        urls (list[str]): Target URLs (validated earlier in the request layer).
-        settings (Settings): Runtime configuration (concurrency, agent_mode, etc.).
-        openai (OpenAIConfig | None): Optional OpenAI credentials for LLM modes.
-        options (PipelineOptions | None): Cancellation & job-hook options.
+        pages (list[tuple[str, str, str]]): `(url, html, main_text)` for fetched pages.
+        settings (Settings): Classifier thresholds.
+        options (PipelineOptions | None): Receives per-reason counters (`extra_stats`) and
+            `on_error(url, PageRejectedError)` hook calls.
 
     Returns:
-        list[ScrapedItem]: Extracted items (one or more per input, depending on agent).
+        list[ScrapeInput]: `(url, main_text)` for pages worth extracting.
+    """
+    rejected = classify_pages(pages, min_text_chars=settings.page_min_text_chars)
+    on_error = getattr(options.job_hooks, "on_error", None) if options else None
+    extra_stats = options.extra_stats if options else None
 
-    Raises:
-        Exception: Propagated from worker pool if not handled internally.
-                   (Fetch errors are captured as data and filtered out.)
-    Examples:
-        >>> items = await scrape_urls(["https://example.com"], settings)
-        >>> len(items) >= 0
-        True
+    for url, reason in rejected.items():
+        if extra_stats is not None:
+            key = f"num_rejected_{reason.value}"
+            extra_stats[key] = int(extra_stats.get(key, 0)) + 1
+        if on_error is not None:
+            with contextlib.suppress(Exception):
+                on_error(url, PageRejectedError(reason))
+
+    return [(url, text) for url, _html, text in pages if url not in rejected]
+
+
+async def _parse_page(
+    url: str, html: str, timeout_s: float, slots: asyncio.Semaphore
+) -> tuple[str, str, str] | None:
+    """Extract main text in a worker thread; None (page skipped) if it exceeds `timeout_s`."""
+    await slots.acquire()
+    loop = asyncio.get_running_loop()
+    started = asyncio.Event()
+
+    def _parse() -> str:
+        loop.call_soon_threadsafe(started.set)
+        return extract_main_text(html)
+
+    parse = asyncio.ensure_future(asyncio.to_thread(_parse))
+    # The slot belongs to the thread: a timed-out parse keeps its CPU until it returns.
+    parse.add_done_callback(lambda _done: slots.release())
+    # The budget covers the parse itself, not the wait for a free thread.
+    await started.wait()
+    try:
+        text = await asyncio.wait_for(asyncio.shield(parse), timeout_s)
+    except asyncio.TimeoutError:
+        # The thread cannot be interrupted; it finishes in the background and is ignored.
+        logger.warning(MSG_WARNING_PARSE_TIMEOUT.format(url=url, timeout=timeout_s))
+        return None
+    return url, html, text
+
+
+async def _parse_pages(
+    html_by_url: dict[str, str], settings: Settings
+) -> list[tuple[str, str, str]]:
+    """
+    Turn successfully fetched HTML into `(url, html, main_text)` triples.
+
+    Args:
+        html_by_url (dict[str, str]): Fetch results (errors carry `FETCH_ERROR_PREFIX`).
+        settings (Settings): Provides `parse_timeout_s` (0 parses inline, unbounded).
+
+    Returns:
+        list[tuple[str, str, str]]: Parsed pages in fetch order, minus timed-out ones.
 
     Notes:
-        - Inputs that yield fetch errors (denoted by `FETCH_ERROR_PREFIX`) are skipped.
-        - `openai` is passed only when `settings.agent_mode` is an LLM mode.
-        - Order of outputs may differ from inputs when `preserve_order=False`.
+        - At most one parse per CPU runs at a time, and each page's timeout starts only
+          once its parse is running, so a large batch never times out in the queue.
+          A timed-out parse holds its slot until its thread actually finishes.
     """
-    # Back-compat: allow legacy keyword args (cancel_event, should_cancel, job_hooks)
-    if options is None:
-        options = PipelineOptions()
-    cancel_event = options.cancel_event
-    should_cancel = options.should_cancel
-    job_hooks = options.job_hooks
+    # Non-obvious: we filter by prefix rather than exceptions because fetch errors are recorded
+    # as strings to keep the pool resilient and return partial results.
+    fetched = [
+        (url, html) for url, html in html_by_url.items() if not html.startswith(FETCH_ERROR_PREFIX)
+    ]
+    timeout_s = settings.parse_timeout_s
+    if timeout_s <= 0:
+        return [(url, html, extract_main_text(html)) for url, html in fetched]
+    slots = asyncio.Semaphore(os.cpu_count() or 1)
+    parsed = await asyncio.gather(
+        *(_parse_page(url, html, timeout_s, slots) for url, html in fetched)
+    )
+    return [page for page in parsed if page is not None]
 
-    # Early cancel gate: do not start fetches if already canceled.
-    if (cancel_event and cancel_event.is_set()) or (should_cancel and should_cancel()):
-        if job_hooks and hasattr(job_hooks, "on_failed"):
-            with contextlib.suppress(Exception):
-                job_hooks.on_failed(RuntimeError("Scrape canceled before start."))
-        return []
 
+async def _fetch_scrape_inputs(
+    urls: list[str],
+    settings: Settings,
+    cancel: CancelToken,
+    *,
+    options: PipelineOptions | None = None,
+) -> tuple[list[ScrapeInput], dict[str, str]]:
+    """
+    Fetch `urls` and turn successfully fetched pages into `(url, main_text)` inputs.
+
+    Args:
+        urls (list[str]): Target URLs.
+        settings (Settings): Runtime configuration (fetch concurrency, timeouts).
+        cancel (CancelToken): Cooperative cancel signal forwarded to the fetcher.
+        options (PipelineOptions | None): Hooks/stats sink for classifier rejections.
+
+    Returns:
+        tuple[list[ScrapeInput], dict[str, str]]: Inputs for pages that fetched without
+        error (and, when `settings.page_classifier_enabled`, were not classified as error
+        pages), plus screenshots already captured by the render fetch, keyed by URL.
+    """
     logger.debug(MSG_DEBUG_PIPELINE_FETCH_START.format(count=len(urls)))
 
-    # Fetch phase (concurrency governed by settings.fetch_concurrency).
+    # Fetch phase (concurrency governed by settings.fetch_concurrency). In `always`
+    # render mode every page is loaded in Chromium instead, so plain HTTP is skipped.
+    render_all = settings.fetch_render_mode == FetchRenderMode.ALWAYS
     html_by_url = await fetch_all(
-        urls=urls,
+        urls=[] if render_all else urls,
         settings=settings,
         concurrency=settings.fetch_concurrency,
-        cancel=CancelToken(event=cancel_event, should_cancel=should_cancel),
+        cancel=cancel,
     )
 
     logger.info(MSG_INFO_FETCH_COMPLETE.format(count=len(html_by_url)))
 
     # Transform successfully fetched pages into (url, main_text) inputs for the worker pool.
-    # Non-obvious: we filter by prefix rather than exceptions because fetch errors are recorded
-    # as strings to keep the pool resilient and return partial results.
-    scrape_inputs: list[ScrapeInput] = [
-        (url, extract_main_text(html))
-        for url, html in html_by_url.items()
-        if not html.startswith(FETCH_ERROR_PREFIX)
-    ]
+    pages = await _parse_pages(html_by_url, settings)
+
+    # Optional render stage: thin/SPA pages (or all pages) via pooled headless Chromium.
+    pages, rendered_shots = await render_pages(urls, pages, settings, cancel=cancel)
+    if rendered_shots and options is not None and options.extra_stats is not None:
+        options.extra_stats["num_render_screenshots"] = len(rendered_shots)
+
+    # Optional classifier stage: skip pages that would only burn agent retries.
+    scrape_inputs: list[ScrapeInput] = (
+        _reject_error_pages(pages, settings, options)
+        if settings.page_classifier_enabled
+        else [(url, text) for url, _html, text in pages]
+    )
 
     num_skipped = len(urls) - len(scrape_inputs)
     logger.info(MSG_INFO_VALID_SCRAPE_INPUTS.format(valid=len(scrape_inputs), skipped=num_skipped))
+    return scrape_inputs, rendered_shots
 
-    if job_hooks and hasattr(job_hooks, "on_started"):
-        with contextlib.suppress(Exception):
-            job_hooks.on_started(len(scrape_inputs))
 
-    # Early exit if no valid inputs remain.
-    if not scrape_inputs:
-        if job_hooks and hasattr(job_hooks, "on_completed"):
-            with contextlib.suppress(Exception):
-                job_hooks.on_completed(success=0, failed=len(urls), duration_sec=0.0)
-        return []
+def _memory_budget(settings: Settings) -> MemoryBudget | None:
+    """Return the run's memory budget, or None when unset or a whole-batch stage is on."""
+    if settings.memory_budget_mb <= 0:
+        return None
+    if settings.near_dup_enabled or settings.fetch_render_mode != FetchRenderMode.OFF:
+        stage = "near-duplicate detection" if settings.near_dup_enabled else "page rendering"
+        logger.warning(MSG_WARNING_MEMORY_BUDGET_IGNORED.format(stage=stage))
+        return None
+    logger.info(
+        MSG_INFO_MEMORY_BUDGET_STREAMING.format(
+            mb=settings.memory_budget_mb, compress=settings.memory_budget_compress
+        )
+    )
+    return MemoryBudget(settings.memory_budget_mb * BYTES_PER_MB)
 
-    # Re-check cancellation before spinning up the worker pool (cancels promptly after fetch).
-    if (cancel_event and cancel_event.is_set()) or (should_cancel and should_cancel()):
-        if job_hooks and hasattr(job_hooks, "on_failed"):
-            with contextlib.suppress(Exception):
-                job_hooks.on_failed(RuntimeError("Scrape canceled before worker pool start."))
+
+async def _prepare_fetched_page(
+    url: str, html: str, settings: Settings, options: PipelineOptions
+) -> list[ScrapeInput]:
+    """Parse (and optionally classify) one fetched page; empty when it is dropped."""
+    pages = await _parse_pages({url: html}, settings)
+    if settings.page_classifier_enabled:
+        return _reject_error_pages(pages, settings, options)
+    return [(page_url, text) for page_url, _html, text in pages]
+
+
+async def _budgeted_inputs(
+    urls: list[str],
+    settings: Settings,
+    options: PipelineOptions,
+    *,
+    budget: MemoryBudget,
+    stream: ResultStream,
+) -> AsyncIterator[ScrapeInput]:
+    """
+    Fetch and parse pages under `budget`, yielding `(url, text)` for the worker pool.
+
+    Args:
+        urls (list[str]): Target URLs.
+        settings (Settings): Fetch/parse/classifier configuration.
+        options (PipelineOptions): Cancel signals and classifier hooks.
+        budget (MemoryBudget): Charged with each page's HTML until its text is extracted,
+            then with the (optionally compressed) text until the pool releases it.
+        stream (ResultStream): Told about dropped pages so ordered streams never wait.
+
+    Yields:
+        ScrapeInput: Inputs in fetch-completion order.
+
+    Notes:
+        - A background task keeps fetching and parsing while the pool is busy; only the
+          budget (not the consumer's pace) throttles it, so HTML is never kept waiting.
+    """
+    cancel = CancelToken(event=options.cancel_event, should_cancel=options.should_cancel)
+    compress = settings.memory_budget_compress
+    ready: asyncio.Queue[tuple[str, str | bytes] | None] = asyncio.Queue()
+
+    async def _feed() -> None:
+        try:
+            async for url, html in fetch_stream(
+                urls,
+                settings=settings,
+                concurrency=settings.fetch_concurrency,
+                cancel=cancel,
+                budget=budget,
+            ):
+                inputs = await _prepare_fetched_page(url, html, settings, options)
+                del html
+                budget.release(url)  # HTML is freed once its text has been extracted
+                if not inputs:
+                    stream.push(url, None)
+                for input_url, text in inputs:
+                    payload = pack_text(text, compress=compress)
+                    budget.charge(input_url, len(payload))
+                    ready.put_nowait((input_url, payload))
+        finally:
+            ready.put_nowait(None)
+
+    feeder = asyncio.create_task(_feed(), name="scrape-budget-feeder")
+    try:
+        while (entry := await ready.get()) is not None:
+            url, payload = entry
+            text = unpack_text(payload)
+            # The pool holds the plain text until the input is done.
+            budget.charge(url, len(text) - len(payload))
+            yield url, text
+        await feeder  # surface feeder errors
+    finally:
+        feeder.cancel()
+        await asyncio.gather(feeder, return_exceptions=True)
+
+
+def _release_then_push(
+    budget: MemoryBudget, stream: ResultStream, url: str, item: ScrapedItem | None
+) -> None:
+    """Pool `on_input_done` under a memory budget: free the input, then stream the item."""
+    budget.release(url)
+    stream.push(url, item)
+
+
+def _plan_near_duplicates(
+    scrape_inputs: list[ScrapeInput],
+    settings: Settings,
+    options: PipelineOptions,
+) -> tuple[NearDupPlan, NearDupIndex | None]:
+    """
+    Cluster near-duplicate inputs so only one page per cluster is extracted.
+
+    Args:
+        scrape_inputs (list[ScrapeInput]): Fetched `(url, main_text)` pairs.
+        settings (Settings): Near-duplicate threshold and optional index path.
+        options (PipelineOptions): Owner (selects the index file) and `extra_stats`,
+            which receives reuse counters when provided.
+
+    Returns:
+        tuple[NearDupPlan, NearDupIndex | None]: The plan and the loaded index (if any).
+    """
+    index_path = settings.near_dup_index_path
+    index = NearDupIndex.load(owner_index_path(index_path, options.owner)) if index_path else None
+    extra_stats = options.extra_stats
+    plan = plan_near_duplicates(
+        scrape_inputs, max_distance=settings.near_dup_max_distance, index=index
+    )
+    if extra_stats is not None:
+        extra_stats["num_near_dup_reused"] = plan.reused
+        extra_stats["num_near_dup_index_hits"] = len(plan.index_hits)
+    return plan, index
+
+
+def _push_with_copies(
+    push: OnInputDoneCallback, plan: NearDupPlan, url: str, item: ScrapedItem | None
+) -> None:
+    """Pool `on_input_done` that also reports the in-job duplicates of `url`."""
+    push(url, item)
+    for dup_url, copy in plan.copies_for(url, item):
+        push(dup_url, copy)
+
+
+def _backfill_copy_screenshots(plan: NearDupPlan, items: list[ScrapedItem]) -> None:
+    """Give copies the screenshot their representative received after being copied."""
+    by_url = {item.url: item for item in items}
+    for item in items:
+        rep = by_url.get(plan.duplicates.get(item.url, ""))
+        if rep is not None and item.screenshot_path is None:
+            item.screenshot_path = rep.screenshot_path
+
+
+def _close_near_duplicates(
+    near_dup: tuple[NearDupPlan, NearDupIndex | None] | None,
+    streamed: list[ScrapedItem],
+    leftovers: list[ScrapedItem],
+) -> list[ScrapedItem]:
+    """Copy `leftovers` (not streamed) onto their duplicates, then update the index."""
+    if near_dup is None:
         return []
+    plan, index = near_dup
+    copies = [
+        copy
+        for item in leftovers
+        for _dup_url, copy in plan.copies_for(item.url, item)
+        if copy is not None
+    ]
+    done = [*streamed, *leftovers, *copies]
+    _backfill_copy_screenshots(plan, done)
+    if index is not None and done:
+        plan.remember(done, index)
+    return copies
 
-    # Decide whether to wire OpenAI based on agent mode; avoids passing creds when unused.
-    is_llm_mode = settings.agent_mode in {
-        AgentMode.LLM_FIXED,
-        AgentMode.LLM_DYNAMIC,
-        AgentMode.LLM_DYNAMIC_ADAPTIVE,
-    }
 
-    # Construct pool configuration (note: some fields are optionally present on Settings).
-    pool_config = WorkerPoolConfig(
+def _finish_near_duplicates(
+    near_dup: tuple[NearDupPlan, NearDupIndex | None] | None,
+    items: list[ScrapedItem],
+) -> list[ScrapedItem]:
+    """Record representatives in the index (if any) and copy results onto duplicates."""
+    if near_dup is None:
+        return items
+    plan, index = near_dup
+    if index is not None and items:
+        plan.remember(items, index)
+    return plan.expand(items)
+
+
+async def _check_custom_llm_endpoint(
+    openai: OpenAIConfig | None, settings: Settings, *, is_llm_mode: bool
+) -> None:
+    """
+    Probe the job's OpenAI-compatible endpoint, if one is configured (LLM modes only).
+
+    The public OpenAI API is never probed; credentials are validated later by the agents.
+    Disabled by `settings.llm_endpoint_health_check=False`.
+
+    Raises:
+        LLMEndpointUnavailableError: If the custom endpoint fails its health check.
+    """
+    if not (is_llm_mode and settings.llm_endpoint_health_check):
+        return
+    if settings.openai_base_url or (openai is not None and openai.base_url):
+        await ensure_endpoint_healthy(openai, settings)
+
+
+def _call_hook(job_hooks: object | None, name: str, *args: object, **kwargs: object) -> None:
+    """Invoke `job_hooks.<name>(...)` when defined; hook errors never surface."""
+    hook = getattr(job_hooks, name, None)
+    if callable(hook):
+        with contextlib.suppress(Exception):
+            hook(*args, **kwargs)
+
+
+def _cancel_requested(options: PipelineOptions) -> bool:
+    """Return True once either cancel mechanism in `options` has fired."""
+    event_canceled = options.cancel_event is not None and options.cancel_event.is_set()
+    return event_canceled or bool(options.should_cancel and options.should_cancel())
+
+
+def _notify_input_done(
+    first: OnInputDoneCallback,
+    second: OnInputDoneCallback,
+    url: str,
+    item: ScrapedItem | None,
+) -> None:
+    """Pool `on_input_done` that feeds the result stream, then a job hook."""
+    first(url, item)
+    with contextlib.suppress(Exception):
+        second(url, item)
+
+
+def _input_done_callback(
+    stream: ResultStream,
+    options: PipelineOptions,
+    near_dup: tuple[NearDupPlan, NearDupIndex | None] | None,
+    budget: MemoryBudget | None,
+) -> OnInputDoneCallback:
+    """Pool `on_input_done` feeding `stream` and the job hook, duplicates included."""
+    push: OnInputDoneCallback = (
+        stream.push if budget is None else partial(_release_then_push, budget, stream)
+    )
+    hook_input_done = getattr(options.job_hooks, "on_input_done", None)
+    if hook_input_done is not None:
+        push = partial(_notify_input_done, push, hook_input_done)
+    # Wrapped last so duplicates reach the stream and the job hook with their representative.
+    if near_dup is not None:
+        push = partial(_push_with_copies, push, near_dup[0])
+    return push
+
+
+def _build_pool_config(
+    settings: Settings,
+    openai: OpenAIConfig | None,
+    options: PipelineOptions,
+    *,
+    on_input_done: OnInputDoneCallback,
+    screenshot_paths: dict[str, str],
+) -> WorkerPoolConfig:
+    """
+    Build the streaming worker-pool config for one run.
+
+    The pool keeps no result buffer (`collect_results=False`); every finished input is
+    reported to `on_input_done` (the run's `ResultStream`, which handles ordering, plus
+    the job's `on_input_done` hook).
+    """
+    # Decide whether to wire OpenAI based on agent mode; avoids passing creds when unused.
+    is_llm_mode = settings.agent_mode in _LLM_AGENT_MODES
+    job_hooks = options.job_hooks
+    return WorkerPoolConfig(
         take_screenshot=settings.screenshot_enabled,
         openai=openai if is_llm_mode else None,
         concurrency=settings.llm_concurrency if is_llm_mode else settings.fetch_concurrency,
         on_progress=getattr(job_hooks, "on_progress", None),
         on_item_processed=getattr(job_hooks, "on_item_processed", None),
         on_error=getattr(job_hooks, "on_error", None),
-        preserve_order=getattr(settings, "preserve_order", False),
-        max_queue_size=getattr(settings, "max_queue_size", None),
-        should_cancel=should_cancel,
+        max_queue_size=settings.max_queue_size,
+        should_cancel=options.should_cancel,
+        screenshot_paths=screenshot_paths,
+        on_input_done=on_input_done,
+        collect_results=False,
+    )
+
+
+async def _stream_worker_pool(  # noqa: PLR0913 - stage helper takes the run's state
+    scrape_inputs: list[ScrapeInput] | AsyncIterable[ScrapeInput],
+    settings: Settings,
+    openai: OpenAIConfig | None,
+    options: PipelineOptions,
+    *,
+    stream: ResultStream,
+    rendered_shots: dict[str, str],
+    near_dup: tuple[NearDupPlan, NearDupIndex | None] | None,
+    budget: MemoryBudget | None = None,
+    total: int | None = None,
+) -> AsyncIterator[ScrapedItem]:
+    """
+    Run the worker pool in a background task and yield items as workers finish them.
+
+    Args:
+        scrape_inputs (list[ScrapeInput] | AsyncIterable[ScrapeInput]): Inputs for the
+            pool (near-dup representatives), or a lazy source (memory-budget path).
+        settings (Settings): Runtime configuration.
+        openai (OpenAIConfig | None): Credentials for LLM modes.
+        options (PipelineOptions): Cancel signals and job hooks.
+        stream (ResultStream): Receives finished inputs (ordered or completion order).
+        rendered_shots (dict[str, str]): Screenshots captured by the render fetch.
+        near_dup (tuple[NearDupPlan, NearDupIndex | None] | None): Near-dup plan; copies
+            for duplicates go through `stream` as soon as their representative is done
+            (an ordered `stream` must announce every input URL, not just representatives).
+        budget (MemoryBudget | None): Released per finished input; its peak is reported
+            as `peak_buffered_bytes`.
+        total (int | None): Expected input count for progress when `scrape_inputs` is
+            lazy (pages dropped before extraction still count towards it).
+
+    Yields:
+        ScrapedItem: Extracted items and near-duplicate copies.
+
+    Notes:
+        - Closing the generator early cancels the pool task.
+    """
+    push = _input_done_callback(stream, options, near_dup, budget)
+    if near_dup is not None:
+        for url, hit in near_dup[0].index_hit_items():
+            stream.push(url, hit)
+    pool_config = _build_pool_config(
+        settings, openai, options, on_input_done=push, screenshot_paths=rendered_shots
     )
 
     logger.debug(
-        MSG_DEBUG_PIPELINE_WORKER_POOL_START.format(count=len(scrape_inputs), is_llm=is_llm_mode)
+        MSG_DEBUG_PIPELINE_WORKER_POOL_START.format(
+            count=len(scrape_inputs) if isinstance(scrape_inputs, list) else "streamed",
+            is_llm=pool_config.openai is not None,
+        )
     )
 
-    # Delegate to worker pool: this may run CPU/LLM bound tasks under its own concurrency.
-    return await run_worker_pool(
-        inputs=scrape_inputs,
-        settings=settings,
-        config=pool_config,
-        cancel_event=cancel_event,
-        should_cancel=should_cancel,
+    async def _run_pool() -> list[ScrapedItem]:
+        with hedge_stats_scope() as hedge_stats:
+            try:
+                # Screenshots borrow pages from a long-lived browser pool for the run.
+                async with browser_pool_session(settings):
+                    return await run_worker_pool(
+                        inputs=scrape_inputs,
+                        settings=settings,
+                        config=pool_config,
+                        cancel_event=options.cancel_event,
+                        should_cancel=options.should_cancel,
+                        total=total,
+                    )
+            finally:
+                if settings.llm_hedge_enabled and options.extra_stats is not None:
+                    options.extra_stats.update(hedge_stats.as_stats())
+                if budget is not None and options.extra_stats is not None:
+                    options.extra_stats["peak_buffered_bytes"] = budget.peak
+                stream.close()
+
+    pool_task = asyncio.create_task(_run_pool(), name="scrape-iter-pool")
+    # Streamed items are only retained when the near-dup stage needs them afterwards.
+    streamed: list[ScrapedItem] = []
+    try:
+        async for item in stream:
+            if near_dup is not None:
+                streamed.append(item)
+            yield item
+        # Items the pool returned itself (it streams everything when collect_results=False).
+        leftovers = await pool_task
+    finally:
+        if not pool_task.done():
+            pool_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await pool_task
+
+    for item in [*leftovers, *_close_near_duplicates(near_dup, streamed, leftovers)]:
+        yield item
+
+
+def _journal_ready(
+    journal: CheckpointJournal, items: list[ScrapedItem], *, screenshots: bool
+) -> list[ScrapedItem]:
+    """Journal the `items` whose screenshot (if requested) is in; return the others."""
+    waiting = []
+    for item in items:
+        if screenshots and item.screenshot_path is None:
+            waiting.append(item)
+        else:
+            journal.record_item(item)
+    return waiting
+
+
+class _JournalingHooks:
+    """Job hooks that journal per-URL failures, then forward to the caller's hooks."""
+
+    def __init__(
+        self, journal: CheckpointJournal, inner: object | None, options: PipelineOptions
+    ) -> None:
+        self._journal = journal
+        self._inner = inner
+        self._options = options
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._inner, name)
+
+    def on_error(self, url: str, exc: Exception) -> None:
+        self._journal.record_failure(url, f"{type(exc).__name__}: {exc}")
+        _call_hook(self._inner, "on_error", url, exc)
+
+    def on_input_done(self, url: str, item: ScrapedItem | None) -> None:
+        # Agents report most failures (e.g. LLM errors) as a None item, not an exception.
+        # Inputs cut short by cancellation stay pending so a resume extracts them.
+        if (
+            item is None
+            and url not in self._journal.failures
+            and not _cancel_requested(self._options)
+        ):
+            self._journal.record_failure(url, CHECKPOINT_NO_ITEM_REASON)
+        _call_hook(self._inner, "on_input_done", url, item)
+
+
+async def _resume_from_checkpoint(  # noqa: PLR0913 - mirrors scrape_iter plus the journal
+    urls: list[str],
+    settings: Settings,
+    openai: OpenAIConfig | None,
+    options: PipelineOptions,
+    *,
+    journal: CheckpointJournal,
+    ordered: bool,
+) -> AsyncIterator[ScrapedItem]:
+    """
+    Yield the journal's items for `urls`, then scrape (and journal) the rest.
+
+    With screenshots on, an item is journaled once the screenshot stage has patched in
+    its `screenshot_path` (or the run has finished), so a resume re-emits it complete.
+    Items still waiting when the run is canceled or closed early stay pending.
+    """
+    pending = journal.pending(urls)
+    num_resumed = len(dict.fromkeys(urls)) - len(pending)
+    if options.extra_stats is not None:
+        options.extra_stats["num_resumed"] = num_resumed
+    if num_resumed:
+        logger.info(
+            MSG_INFO_CHECKPOINT_RESUMED.format(
+                path=journal.path, done=num_resumed, pending=len(pending)
+            )
+        )
+    for dumped in journal.resumed_items(urls):
+        yield ScrapedItem.model_validate(dumped)
+    if not pending:
+        return
+
+    inner = replace(
+        options, checkpoint=None, job_hooks=_JournalingHooks(journal, options.job_hooks, options)
+    )
+    screenshots = settings.screenshot_enabled
+    waiting: list[ScrapedItem] = []
+    async for item in scrape_iter(pending, settings, openai, options=inner, ordered=ordered):
+        waiting = _journal_ready(journal, [*waiting, item], screenshots=screenshots)
+        yield item
+    if not _cancel_requested(options):
+        # Screenshots are final once the run ends (a failed capture leaves none).
+        _journal_ready(journal, waiting, screenshots=False)
+
+
+async def scrape_iter(  # noqa: C901 - one branch per path (resume, memory budget, staged)
+    urls: list[str],
+    settings: Settings,
+    openai: OpenAIConfig | None = None,
+    *,
+    options: PipelineOptions | None = None,
+    ordered: bool = False,
+) -> AsyncIterator[ScrapedItem]:
+    """
+    Run the scraping pipeline and yield items as the workers produce them.
+
+    Flow:
+        1) Cancellation pre-check (fast exit before any I/O), then a health probe of a
+           custom OpenAI-compatible endpoint (LLM modes, `settings.llm_endpoint_health_check`).
+        2) Fetch HTML concurrently (`fetch_all`), honoring cancellation.
+        3) Extract main text for successfully fetched pages; optionally drop soft-404,
+           login-wall and bot-challenge pages (`settings.page_classifier_enabled`).
+        4) Run the worker pool (LLM or rule-based) and stream its `ScrapedItem`s.
+        With `settings.memory_budget_mb` set, steps 2-4 overlap: each page is parsed as
+        soon as it is fetched and handed to the pool, under the byte budget.
+
+    Args:
+        urls (list[str]): Target URLs (validated earlier in the request layer).
+        settings (Settings): Runtime configuration (concurrency, agent_mode, etc.).
+        openai (OpenAIConfig | None): Optional OpenAI credentials for LLM modes.
+        options (PipelineOptions | None): Cancellation & job-hook options.
+        ordered (bool): If True, items are yielded in input order: results that finish
+            early wait in a reorder buffer until every earlier input is done.
+
+    Yields:
+        ScrapedItem: Extracted items (one or more per input, depending on agent).
+
+    Raises:
+        LLMEndpointUnavailableError: If the configured custom LLM endpoint is unhealthy.
+        Exception: Propagated from worker pool if not handled internally.
+                   (Fetch errors are captured as data and filtered out.)
+
+    Examples:
+        >>> async for item in scrape_iter(["https://example.com"], settings):
+        ...     print(item.url)
+
+    Notes:
+        - Items are handed over as soon as they are ready; the pipeline keeps no copy
+          of its own (beyond near-duplicate bookkeeping).
+        - With the screenshot stage on, `screenshot_path` may be filled in after an item
+          was yielded; it is set on every item by the time iteration ends.
+        - Near-duplicate copies (`settings.near_dup_enabled`) are yielded as soon as
+          their representative is done; in ordered mode they keep their input position.
+        - The pool does not wait for the consumer: results it finishes ahead of a slow
+          consumer queue up in memory (at most one per input of the run).
+        - Breaking out of the loop (or closing the generator) cancels the remaining work.
+        - With `options.checkpoint`, journaled items are yielded first (ordered mode then
+          orders only the remaining URLs).
+    """
+    options = options or PipelineOptions()
+    job_hooks = options.job_hooks
+
+    # Resume path: replay journaled results, then run the pipeline on what is left.
+    if options.checkpoint is not None:
+        async for item in _resume_from_checkpoint(
+            urls, settings, openai, options, journal=options.checkpoint, ordered=ordered
+        ):
+            yield item
+        return
+
+    # Early cancel gate: do not start fetches if already canceled.
+    if _cancel_requested(options):
+        _call_hook(job_hooks, "on_failed", RuntimeError("Scrape canceled before start."))
+        return
+
+    # Fail fast (before any fetch) when a custom OpenAI-compatible endpoint is down.
+    is_llm_mode = settings.agent_mode in _LLM_AGENT_MODES
+    await _check_custom_llm_endpoint(openai, settings, is_llm_mode=is_llm_mode)
+
+    # Memory-budget path: fetch, parse and extract concurrently under a byte budget.
+    budget = _memory_budget(settings)
+    if budget is not None:
+        unique_urls = list(dict.fromkeys(urls))
+        _call_hook(job_hooks, "on_started", len(unique_urls))
+        stream = ResultStream(unique_urls if ordered else None)
+        inputs = _budgeted_inputs(unique_urls, settings, options, budget=budget, stream=stream)
+        async for item in _stream_worker_pool(
+            inputs,
+            settings,
+            openai,
+            options,
+            stream=stream,
+            rendered_shots={},
+            near_dup=None,
+            budget=budget,
+            total=len(unique_urls),
+        ):
+            yield item
+        return
+
+    scrape_inputs, rendered_shots = await _fetch_scrape_inputs(
+        urls,
+        settings,
+        CancelToken(event=options.cancel_event, should_cancel=options.should_cancel),
+        options=options,
     )
 
+    # Optional near-duplicate stage: extract one page per cluster, copy results to the rest.
+    near_dup: tuple[NearDupPlan, NearDupIndex | None] | None = None
+    stream_urls = [url for url, _text in scrape_inputs]  # every input, in input order
+    if settings.near_dup_enabled and scrape_inputs:
+        near_dup = _plan_near_duplicates(scrape_inputs, settings, options)
+        scrape_inputs = near_dup[0].representatives
+
+    _call_hook(job_hooks, "on_started", len(scrape_inputs))
+
+    # Early exit if no valid inputs remain.
+    if not scrape_inputs:
+        _call_hook(job_hooks, "on_completed", success=0, failed=len(urls), duration_sec=0.0)
+        # Pages answered from the cross-job near-duplicate index still count as results.
+        for item in _finish_near_duplicates(near_dup, []):
+            yield item
+        return
+
+    # Re-check cancellation before spinning up the worker pool (cancels promptly after fetch).
+    if _cancel_requested(options):
+        _call_hook(
+            job_hooks, "on_failed", RuntimeError("Scrape canceled before worker pool start.")
+        )
+        return
+
+    async for item in _stream_worker_pool(
+        scrape_inputs,
+        settings,
+        openai,
+        options,
+        stream=ResultStream(stream_urls if ordered else None),
+        rendered_shots=rendered_shots,
+        near_dup=near_dup,
+    ):
+        yield item
+
+
+async def scrape_urls(
+    urls: list[str],
+    settings: Settings,
+    openai: OpenAIConfig | None = None,
+    *,
+    options: PipelineOptions | None = None,
+) -> list[ScrapedItem]:
+    """
+    Run the scraping pipeline on the given URLs and return extracted items.
+
+    Collects `scrape_iter` into a list; see it for the flow and streaming semantics.
+
+    Args:
+        urls (list[str]): Target URLs (validated earlier in the request layer).
+        settings (Settings): Runtime configuration (concurrency, agent_mode, etc.).
+        openai (OpenAIConfig | None): Optional OpenAI credentials for LLM modes.
+        options (PipelineOptions | None): Cancellation & job-hook options.
+
+    Returns:
+        list[ScrapedItem]: Extracted items (one or more per input, depending on agent).
+
+    Raises:
+        LLMEndpointUnavailableError: If the configured custom LLM endpoint is unhealthy.
+        Exception: Propagated from worker pool if not handled internally.
+                   (Fetch errors are captured as data and filtered out.)
+    Examples:
+        >>> items = await scrape_urls(["https://example.com"], settings)
+        >>> len(items) >= 0
+        True
+
+    Notes:
+        - Inputs that yield fetch errors (denoted by `FETCH_ERROR_PREFIX`) are skipped.
+        - `openai` is passed only when `settings.agent_mode` is an LLM mode.
+        - Order of outputs may differ from inputs when `preserve_order=False`.
+    """
+    return [
+        item
+        async for item in scrape_iter(
+            urls,
+            settings,
+            openai,
+            options=options,
+            ordered=getattr(settings, "preserve_order", False),
+        )
+    ]
+
 
 async def scrape_with_stats(
     urls: list[str],
@@ -225,31 +940,42 @@ async def scrape_with_stats(
     openai: OpenAIConfig | None = None,
     *,
     options: PipelineOptions | None = None,
+    ordered: bool = False,
 ) -> tuple[list[ScrapedItem], dict[str, float | int]]:
     """
     Run the scraping pipeline and return both results and execution stats.
 
-    This is a thin wrapper over `scrape_urls` that measures duration and
-    summarizes counts (success/failed) for telemetry and API responses.
+    This is a thin wrapper over `scrape_iter` that collects the streamed items,
+    measures duration and summarizes counts (success/failed) for telemetry and
+    API responses.
 
     Args:
         urls (list[str]): Target URLs.
         settings (Settings): Runtime configuration.
         openai (OpenAIConfig | None): Optional OpenAI credentials for LLM modes.
         options (PipelineOptions | None): Cancellation & job-hook options.
+        ordered (bool): Collect items in input order instead of completion order.
 
     Returns:
         tuple[list[ScrapedItem], dict[str, float | int]]:
-            - items: Extracted items returned by `scrape_urls`.
+            - items: Extracted items streamed by `scrape_iter`.
             - stats: A dict with keys:
                 * num_urls (int)
                 * num_success (int)
                 * num_failed (int)
                 * duration_sec (float)
                 * was_canceled (bool)
+                * num_near_dup_reused / num_near_dup_index_hits (int, when near-dup is on)
+                * num_rejected_<reason> (int, per `PageRejectReason`, when classifier is on)
+                * num_llm_hedges / num_llm_hedge_wins (int) and llm_hedge_saved_sec
+                  (float, estimated), when `llm_hedge_enabled`
+                * peak_buffered_bytes (int): Most page bytes held between fetch and
+                  extraction, when `memory_budget_mb` is set
+                * num_resumed (int): URLs finished by an earlier run, when
+                  `options.checkpoint` is set
 
     Raises:
-        Exception: Re-raises exceptions from `scrape_urls` after invoking `on_failed` hook.
+        Exception: Re-raises exceptions from `scrape_iter` after invoking `on_failed` hook.
 
     Examples:
         >>> items, stats = await scrape_with_stats(["https://example.com"], settings)
@@ -273,15 +999,20 @@ async def scrape_with_stats(
         )
     )
 
+    # Collect stage counters (e.g. near-duplicate reuse) alongside the base stats.
+    extra_stats: dict[str, float | int] = {}
+    if options.extra_stats is None:
+        options = replace(options, extra_stats=extra_stats)
+    else:
+        extra_stats = options.extra_stats
+
     start = time.perf_counter()
 
     try:
-        results = await scrape_urls(
-            urls,
-            settings=settings,
-            openai=openai,
-            options=options,
-        )
+        results = [
+            item
+            async for item in scrape_iter(urls, settings, openai, options=options, ordered=ordered)
+        ]
     except Exception as e:
         # Ensure failure is surfaced to hooks; never suppress.
         if job_hooks and hasattr(job_hooks, "on_failed"):
@@ -312,6 +1043,7 @@ async def scrape_with_stats(
         "duration_sec": duration,
         "was_canceled": was_canceled,
     }
+    stats.update(extra_stats)
 
     if job_hooks and hasattr(job_hooks, "on_completed"):
         with contextlib.suppress(Exception):
@@ -322,3 +1054,51 @@ async def scrape_with_stats(
             )
 
     return results, stats
+
+
+async def scrape_urls_bulk(
+    urls: list[str],
+    settings: Settings,
+    openai: OpenAIConfig | None = None,
+    *,
+    backend: BulkBackend,
+    options: PipelineOptions | None = None,
+) -> list[ScrapedItem]:
+    """
+    Run fetch → parse as usual, then extract via an offline bulk job instead of workers.
+
+    Args:
+        urls (list[str]): Target URLs.
+        settings (Settings): Runtime configuration; `agent_mode` must be an LLM mode.
+        openai (OpenAIConfig | None): Job credentials; their `model` (or
+            `settings.openai_model_override`) is the model requested in the bulk job.
+        backend (BulkBackend): Provider or local bulk backend used for extraction.
+        options (PipelineOptions | None): Cancellation options (job hooks are not used).
+
+    Returns:
+        list[ScrapedItem]: Items merged from the bulk job, in fetch order.
+
+    Raises:
+        ValueError: If `settings.agent_mode` is rule-based.
+        RuntimeError: If the bulk job fails provider-side.
+        TimeoutError: If the bulk job does not finish within `settings.bulk_timeout_s`.
+
+    Notes:
+        - Intended for large, latency-insensitive runs (e.g. `run_batch.py --bulk`): request
+          files are written under `settings.bulk_work_dir` and can be inspected afterwards.
+    """
+    options = options or PipelineOptions()
+    cancel = CancelToken(event=options.cancel_event, should_cancel=options.should_cancel)
+    if is_canceled(cancel):
+        return []
+
+    # Bulk extraction has no screenshot stage; render-time screenshots stay on disk only.
+    scrape_inputs, _rendered_shots = await _fetch_scrape_inputs(
+        urls, settings, cancel, options=options
+    )
+    if not scrape_inputs or is_canceled(cancel):
+        return []
+
+    return await run_bulk_extraction(
+        scrape_inputs, settings=settings, backend=backend, cancel=cancel, openai=openai
+    )
@@ -0,0 +1,186 @@
+"""
+Cost-ordered scheduling for the worker pool (longest job first).
+
+Responsibilities:
+- Estimate the extraction cost of a `(url, text)` input from its text length and the
+  observed per-domain extraction latency.
+- Provide a work queue that hands workers the most expensive queued input first, so a
+  huge page is started early instead of becoming the batch's tail straggler.
+- Keep a bounded, process-wide history of per-domain latency (seconds per 1k chars).
+
+Public API:
+- `DomainLatencyHistory`: Per-domain latency averages with `record()` and `factor()`.
+- `get_domain_latency_history`: Process-wide history shared by all runs.
+- `estimate_cost`: Relative cost of one input (higher = slower).
+- `CostOrderedQueue`: `asyncio.Queue` that dequeues by descending cost.
+
+Operational:
+- Concurrency: Single event loop; the queue and history are only touched from the loop.
+- Complexity: O(log n) per put/get (binary heap); ties keep arrival order.
+- Memory: History holds at most `DOMAIN_LATENCY_MAX_DOMAINS` domains.
+
+Usage:
+    history = get_domain_latency_history()
+    queue = CostOrderedQueue(maxsize=0, cost=partial(estimate_cost, history=history))
+    ...
+    history.record(url, len(text), elapsed_s)  # after each extraction
+
+Notes:
+- A materialized (list/tuple) batch is sorted by cost before it is enqueued, so
+  longest-first holds for the whole batch even with a bounded queue. A lazy input
+  source is only reordered within the window the producer has filled.
+- Output ordering is unaffected: the producer registers `preserve_order` slots in input
+  order before enqueueing.
+- Domains without history weigh 1.0, i.e. cost falls back to the text length.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from agentic_scraper.backend.config.constants import (
+    DOMAIN_LATENCY_CHARS_UNIT,
+    DOMAIN_LATENCY_EWMA_ALPHA,
+    DOMAIN_LATENCY_MAX_DOMAINS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from agentic_scraper.backend.config.aliases import ScrapeInput
+
+__all__ = [
+    "CostOrderedQueue",
+    "DomainLatencyHistory",
+    "estimate_cost",
+    "get_domain_latency_history",
+]
+
+
+class DomainLatencyHistory:
+    """
+    Exponentially weighted extraction latency per domain, normalized by text length.
+
+    Attributes:
+        alpha (float): Weight of the newest sample.
+        max_domains (int): Domains retained (least recently updated are dropped).
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = DOMAIN_LATENCY_EWMA_ALPHA,
+        max_domains: int = DOMAIN_LATENCY_MAX_DOMAINS,
+    ) -> None:
+        """
+        Create an empty history.
+
+        Args:
+            alpha (float): Weight of the newest sample (0 < alpha <= 1).
+            max_domains (int): Domains retained.
+        """
+        self.alpha = alpha
+        self.max_domains = max_domains
+        self._rates: OrderedDict[str, float] = OrderedDict()
+        self._overall: float | None = None
+
+    def __len__(self) -> int:
+        """Number of domains with history."""
+        return len(self._rates)
+
+    def record(self, url: str, text_len: int, seconds: float) -> None:
+        """
+        Fold one finished extraction into the domain's average.
+
+        Args:
+            url (str): Extracted URL.
+            text_len (int): Length of the page text given to the agent.
+            seconds (float): Wall time the extraction took.
+        """
+        rate = seconds * DOMAIN_LATENCY_CHARS_UNIT / max(1, text_len)
+        domain = _domain(url)
+        previous = self._rates.pop(domain, None)
+        self._rates[domain] = rate if previous is None else self._blend(previous, rate)
+        self._overall = rate if self._overall is None else self._blend(self._overall, rate)
+        while len(self._rates) > self.max_domains:
+            self._rates.popitem(last=False)
+
+    def factor(self, url: str) -> float:
+        """Return the domain's latency relative to all domains (1.0 without history)."""
+        rate = self._rates.get(_domain(url))
+        if rate is None or not self._overall:
+            return 1.0
+        return rate / self._overall
+
+    def clear(self) -> None:
+        """Forget every recorded latency."""
+        self._rates.clear()
+        self._overall = None
+
+    def _blend(self, average: float, sample: float) -> float:
+        return (1 - self.alpha) * average + self.alpha * sample
+
+
+def _domain(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+_HISTORY = DomainLatencyHistory()
+
+
+def get_domain_latency_history() -> DomainLatencyHistory:
+    """Return the process-wide per-domain latency history."""
+    return _HISTORY
+
+
+def estimate_cost(scrape_input: ScrapeInput, *, history: DomainLatencyHistory) -> float:
+    """
+    Estimate the relative extraction cost of one input.
+
+    Args:
+        scrape_input (ScrapeInput): `(url, text)` pair.
+        history (DomainLatencyHistory): Observed per-domain latency.
+
+    Returns:
+        float: Text length scaled by the domain's relative latency.
+    """
+    url, text = scrape_input
+    return len(text) * history.factor(url)
+
+
+class CostOrderedQueue(asyncio.Queue["ScrapeInput"]):
+    """
+    Work queue that returns the most expensive queued input first.
+
+    Attributes:
+        cost (Callable[[ScrapeInput], float]): Cost estimate evaluated once per put.
+    """
+
+    def __init__(self, maxsize: int = 0, *, cost: Callable[[ScrapeInput], float]) -> None:
+        """
+        Create a queue.
+
+        Args:
+            maxsize (int): Queue bound (0 = unbounded), as for `asyncio.Queue`.
+            cost (Callable[[ScrapeInput], float]): Cost estimate for an input.
+        """
+        self.cost = cost
+        self._seq = itertools.count()
+        super().__init__(maxsize)
+
+    # `asyncio.Queue` storage hooks (the same ones `asyncio.PriorityQueue` overrides).
+    def _init(self, maxsize: int) -> None:
+        _ = maxsize
+        self._heap: list[tuple[float, int, ScrapeInput]] = []
+        self._queue = self._heap
+
+    def _put(self, item: ScrapeInput) -> None:
+        heapq.heappush(self._heap, (-self.cost(item), next(self._seq), item))
+
+    def _get(self) -> ScrapeInput:
+        return heapq.heappop(self._heap)[2]
@@ -0,0 +1,174 @@
+"""
+Long-lived process pool for rule-based extraction (`worker_pool_mode=process`).
+
+Responsibilities:
+- Keep one pool of extraction processes alive across worker-pool runs instead of
+  creating, and joining, a pool per run.
+- Start processes with the `spawn` method: forking a process that runs an event loop
+  (and its helper threads) can leave the child with locks that are never released.
+- Enforce a chunk deadline: a chunk cannot be interrupted inside its process, so an
+  overrunning chunk terminates the pool's processes and the next chunk starts a new pool.
+
+Public API:
+- `ExtractionProcessPool`: `run()` a picklable function on one chunk, with a deadline.
+- `get_extraction_pool`: Process-wide pool of the requested size (created on demand).
+- `shutdown_extraction_pool`: Stop the process-wide pools (API lifespan / tests).
+
+Operational:
+- Concurrency: At most `processes` chunks per event loop are in flight, so a chunk's
+  deadline only runs while a process is working on it, never while it waits in the
+  executor's queue.
+- Startup: Processes are spawned on first use (an unused pool is free); the spawn cost
+  is paid once per pool, not once per run.
+- Shutdown: Never joins processes on the event loop; stopping a pool terminates them.
+- Logging: INFO when a pool starts, WARNING when one is terminated after a timeout.
+
+Usage:
+    pool = get_extraction_pool(settings.process_pool_workers or os.cpu_count() or 1)
+    payloads = await pool.run(extract_item_dicts, chunk, timeout_s=30.0)
+
+Notes:
+- Chunks that were in flight on a terminated pool are resubmitted once to the new pool;
+  a second failure is raised to the caller.
+- Pools are kept per size, so runs with different `process_pool_workers` do not
+  replace each other's processes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from agentic_scraper.backend.config.messages import (
+    MSG_INFO_PROCESS_POOL_STARTED,
+    MSG_WARNING_PROCESS_POOL_CHUNK_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ExtractionProcessPool", "get_extraction_pool", "shutdown_extraction_pool"]
+
+A = TypeVar("A")
+T = TypeVar("T")
+
+
+class ExtractionProcessPool:
+    """
+    Reusable `spawn` process pool that is torn down when a chunk misses its deadline.
+
+    Attributes:
+        processes (int): Worker processes per pool.
+    """
+
+    def __init__(self, processes: int) -> None:
+        """
+        Create a pool; no process is started until the first `run()`.
+
+        Args:
+            processes (int): Worker processes to start.
+        """
+        self.processes = processes
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        self._slots = weakref.WeakKeyDictionary()
+
+    def _current(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(MSG_INFO_PROCESS_POOL_STARTED.format(processes=self.processes))
+        return self._executor
+
+    def _slot(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slot = self._slots.get(loop)
+        if slot is None:
+            slot = self._slots[loop] = asyncio.Semaphore(self.processes)
+        return slot
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Terminate `executor`'s processes; the next `run()` starts a new pool."""
+        if self._executor is executor:
+            self._executor = None
+        # The executor has no public way to stop a running task: kill its processes.
+        processes: dict[int, Any] = getattr(executor, "_processes", None) or {}
+        for process in list(processes.values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[[A], T], arg: A, *, timeout_s: float | None) -> T:
+        """
+        Run `fn(arg)` in a worker process.
+
+        Args:
+            fn (Callable[[A], T]): Picklable, module-level function.
+            arg (A): Picklable argument (one chunk of inputs).
+            timeout_s (float | None): Deadline once a process picks the chunk up; None
+                waits indefinitely.
+
+        Returns:
+            T: `fn`'s result.
+
+        Raises:
+            TimeoutError: The chunk overran `timeout_s` (the pool was terminated).
+            BrokenProcessPool: A worker process died (twice, when it was a restart).
+        """
+        async with self._slot():
+            retried = False
+            while True:
+                executor = self._current()
+                try:
+                    future = asyncio.get_running_loop().run_in_executor(executor, fn, arg)
+                    if timeout_s is None:
+                        return await future
+                    return await asyncio.wait_for(future, timeout=timeout_s)
+                except asyncio.TimeoutError:
+                    logger.warning(MSG_WARNING_PROCESS_POOL_CHUNK_TIMEOUT.format(timeout=timeout_s))
+                    self._discard(executor)
+                    raise
+                except BrokenProcessPool:
+                    # Broken by a deadline elsewhere (already replaced): resubmit once.
+                    restarted = self._executor is not executor
+                    self._discard(executor)
+                    if not restarted or retried:
+                        raise
+                    retried = True
+
+    def close(self) -> None:
+        """Terminate the pool's processes (idempotent)."""
+        if self._executor is not None:
+            self._discard(self._executor)
+
+
+_POOLS: dict[int, ExtractionProcessPool] = {}
+
+
+def get_extraction_pool(processes: int) -> ExtractionProcessPool:
+    """
+    Return the process-wide extraction pool with `processes` workers.
+
+    Args:
+        processes (int): Worker processes wanted.
+
+    Returns:
+        ExtractionProcessPool: Shared pool of that size (created on first request).
+    """
+    pool = _POOLS.get(processes)
+    if pool is None:
+        pool = _POOLS[processes] = ExtractionProcessPool(processes)
+    return pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Terminate and forget every process-wide pool."""
+    while _POOLS:
+        _POOLS.popitem()[1].close()
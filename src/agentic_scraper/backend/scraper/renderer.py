@@ -0,0 +1,205 @@
+"""
+Headless-render fetch mode for JavaScript-heavy pages.
+
+Responsibilities:
+- Decide which pages need a rendered fetch (`fetch_render_mode`: off / auto / always).
+- Load those pages in a pooled Chromium page with heavy resources blocked and return the
+  rendered DOM instead of the near-empty server HTML.
+- Reuse the same navigation for the screenshot when screenshots are enabled, so a
+  rendered page is never loaded twice.
+
+Public API:
+- `RenderedPage`: Rendered HTML, its main text, and the optional screenshot path.
+- `select_render_targets`: URLs that should be rendered for the current mode.
+- `render_page`: Render one URL on a pooled page.
+- `render_pages`: Render the selected pages and merge them into the fetched page list.
+
+Operational:
+- Concurrency: Bounded by the browser pool (`browser_pool_max_pages`). A pool is always
+  provided for rendering, even when screenshot pooling is disabled.
+- Blocking: Image/font/media requests are aborted (`render_block_resources`). When the
+  same navigation also produces a screenshot, only media is blocked so the capture
+  looks right.
+- Failures: A failed render keeps the HTTP result (auto mode) or drops the page like a
+  fetch error (always mode); it never fails the run.
+- Logging: INFO summary per run; WARNING per failed render.
+
+Usage:
+    pages, shots = await render_pages(urls, pages, settings, cancel=cancel)
+
+Notes:
+- Screenshot filenames use the content hash of the rendered main text, so the worker
+  pool's screenshot cache and the render path share files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from agentic_scraper.backend.config.constants import (
+    RENDER_BLOCKED_RESOURCE_TYPES,
+    RENDER_BLOCKED_RESOURCE_TYPES_WITH_SCREENSHOT,
+    RENDER_NAV_TIMEOUT_MS,
+)
+from agentic_scraper.backend.config.messages import (
+    MSG_INFO_RENDER_COMPLETE,
+    MSG_WARNING_RENDER_FAILED,
+)
+from agentic_scraper.backend.config.types import FetchRenderMode
+from agentic_scraper.backend.scraper.browser_pool import BrowserPool, browser_pool_session
+from agentic_scraper.backend.scraper.cancel_helpers import CancelToken, is_canceled
+from agentic_scraper.backend.scraper.parser import extract_main_text
+from agentic_scraper.backend.scraper.screenshotter import (
+    ScreenshotOptions,
+    content_hash,
+    save_page_screenshot,
+)
+
+if TYPE_CHECKING:
+    from playwright.async_api import Route
+
+    from agentic_scraper.backend.core.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["RenderedPage", "render_page", "render_pages", "select_render_targets"]
+
+# `(url, html, main_text)` — the page tuple used by the pipeline's fetch stage.
+Page = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    """
+    Result of one rendered fetch.
+
+    Attributes:
+        html (str): Rendered DOM (`page.content()`).
+        text (str): Main text extracted from `html`.
+        screenshot_path (str | None): Screenshot from the same navigation, if requested.
+    """
+
+    html: str
+    text: str
+    screenshot_path: str | None = None
+
+
+def select_render_targets(urls: list[str], pages: list[Page], settings: Settings) -> list[str]:
+    """
+    Pick the URLs to render for `settings.fetch_render_mode`.
+
+    Args:
+        urls (list[str]): All job URLs (in input order).
+        pages (list[Page]): Pages the HTTP fetch returned successfully.
+        settings (Settings): Provides the mode and `render_min_text_chars`.
+
+    Returns:
+        list[str]: Every URL for `always`, thin pages for `auto`, nothing for `off`.
+    """
+    mode = FetchRenderMode(settings.fetch_render_mode)
+    if mode is FetchRenderMode.ALWAYS:
+        return list(urls)
+    if mode is FetchRenderMode.AUTO:
+        return [url for url, _html, text in pages if len(text) < settings.render_min_text_chars]
+    return []
+
+
+async def render_page(
+    url: str, settings: Settings, *, pool: BrowserPool, screenshot: bool
+) -> RenderedPage:
+    """
+    Render `url` on a pooled page and optionally screenshot it in the same navigation.
+
+    Args:
+        url (str): Page to render.
+        settings (Settings): Resource blocking and screenshot options.
+        pool (BrowserPool): Pool providing an isolated page.
+        screenshot (bool): Also capture a screenshot of the rendered page.
+
+    Returns:
+        RenderedPage: Rendered HTML/text and the screenshot path (if captured).
+
+    Raises:
+        Exception: Playwright navigation errors propagate to the caller.
+    """
+    blocked = (
+        RENDER_BLOCKED_RESOURCE_TYPES_WITH_SCREENSHOT
+        if screenshot
+        else RENDER_BLOCKED_RESOURCE_TYPES
+    )
+
+    async def _route(route: Route) -> None:
+        if route.request.resource_type in blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async with pool.page() as page:
+        if settings.render_block_resources:
+            await page.route("**/*", _route)
+        await page.goto(url, wait_until="networkidle", timeout=RENDER_NAV_TIMEOUT_MS)
+        html = await page.content()
+        text = extract_main_text(html)
+        shot = None
+        if screenshot:
+            shot = await save_page_screenshot(
+                page,
+                url,
+                Path(settings.screenshot_dir),
+                options=ScreenshotOptions.from_settings(settings),
+                page_hash=content_hash(text),
+            )
+    return RenderedPage(html=html, text=text, screenshot_path=shot)
+
+
+async def render_pages(
+    urls: list[str],
+    pages: list[Page],
+    settings: Settings,
+    *,
+    cancel: CancelToken | None = None,
+) -> tuple[list[Page], dict[str, str]]:
+    """
+    Render the pages selected by `select_render_targets` and merge them into `pages`.
+
+    Args:
+        urls (list[str]): All job URLs.
+        pages (list[Page]): Successfully HTTP-fetched pages.
+        settings (Settings): Render mode, thresholds and screenshot settings.
+        cancel (CancelToken | None): Cooperative cancel signal (checked per page).
+
+    Returns:
+        tuple[list[Page], dict[str, str]]: Pages with rendered versions substituted (in
+        input order), and screenshot paths captured during rendering, keyed by URL.
+    """
+    targets = select_render_targets(urls, pages, settings)
+    if not targets:
+        return pages, {}
+
+    rendered: dict[str, RenderedPage] = {}
+
+    async def _one(url: str, pool: BrowserPool) -> None:
+        if is_canceled(cancel):
+            return
+        try:
+            rendered[url] = await render_page(
+                url, settings, pool=pool, screenshot=settings.screenshot_enabled
+            )
+        except Exception:  # noqa: BLE001 - a failed render falls back to the HTTP result
+            logger.warning(MSG_WARNING_RENDER_FAILED.format(url=url))
+
+    async with browser_pool_session(settings, required=True) as pool:
+        if pool is not None:
+            await asyncio.gather(*(_one(url, pool) for url in targets))
+
+    logger.info(MSG_INFO_RENDER_COMPLETE.format(rendered=len(rendered), total=len(targets)))
+
+    by_url = {url: (url, html, text) for url, html, text in pages}
+    by_url.update({url: (url, r.html, r.text) for url, r in rendered.items()})
+    merged = [by_url[url] for url in dict.fromkeys(urls) if url in by_url]
+    shots = {url: r.screenshot_path for url, r in rendered.items() if r.screenshot_path}
+    return merged, shots
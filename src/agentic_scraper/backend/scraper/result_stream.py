@@ -0,0 +1,103 @@
+"""
+Streaming result channel between the worker pool and `scrape_iter` consumers.
+
+Responsibilities:
+- Receive one `(url, item)` report per finished input from the worker pool.
+- Hand items to an async consumer as soon as they are produced (completion order), or
+  in input order through a reorder buffer that releases the longest completed prefix.
+- Signal end-of-stream once the pool is done.
+
+Public API:
+- `ResultStream`: `push()` (pool side), `close()`, and async iteration (consumer side).
+
+Operational:
+- Concurrency: Single event loop; `push`/`close` are synchronous and never block, so they
+  are safe to call from worker callbacks.
+- Memory: The queue is unbounded on purpose: `push` runs inside worker callbacks and
+  must not block them, so there is no backpressure on the pool. Unread items pile up
+  while the consumer is slower than the pool, at most one per pushed input. Ordered
+  streams additionally hold results that finished ahead of a slower earlier input.
+
+Usage:
+    stream = ResultStream([url for url, _text in inputs] if ordered else None)
+    config = WorkerPoolConfig(..., on_input_done=stream.push, collect_results=False)
+    ...
+    async for item in stream:
+        handle(item)
+
+Notes:
+- Inputs that never report (e.g. dropped on cancellation) do not block an ordered
+  stream forever: `close()` flushes whatever is buffered, in input order.
+- A URL that was not announced up front is emitted immediately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+__all__ = ["ResultStream"]
+
+
+class ResultStream:
+    """
+    Async-iterable channel of extracted items, optionally reordered to input order.
+
+    Attributes:
+        ordered (bool): True when items are released in input order.
+    """
+
+    def __init__(self, urls: list[str] | None = None) -> None:
+        """
+        Create a stream.
+
+        Args:
+            urls (list[str] | None): Inputs in order to enable the reorder buffer;
+                None streams in completion order.
+        """
+        self.ordered = urls is not None
+        # Unbounded: `push` must never block a worker callback (see Memory above).
+        self._queue: asyncio.Queue[ScrapedItem | None] = asyncio.Queue()
+        self._positions: dict[str, deque[int]] = {}
+        for idx, url in enumerate(urls or []):
+            self._positions.setdefault(url, deque()).append(idx)
+        self._pending: dict[int, ScrapedItem | None] = {}
+        self._next = 0
+        self._closed = False
+
+    def push(self, url: str, item: ScrapedItem | None) -> None:
+        """Record that `url` finished with `item` (None when nothing was extracted)."""
+        indices = self._positions.get(url)
+        if not self.ordered or not indices:
+            self._emit(item)
+            return
+        self._pending[indices.popleft()] = item
+        # Release the longest completed prefix.
+        while self._next in self._pending:
+            self._emit(self._pending.pop(self._next))
+            self._next += 1
+
+    def close(self) -> None:
+        """Flush buffered results in input order and end the stream (idempotent)."""
+        if self._closed:
+            return
+        for idx in sorted(self._pending):
+            self._emit(self._pending[idx])
+        self._pending.clear()
+        self._closed = True
+        self._queue.put_nowait(None)
+
+    def _emit(self, item: ScrapedItem | None) -> None:
+        if item is not None:
+            self._queue.put_nowait(item)
+
+    async def __aiter__(self) -> AsyncIterator[ScrapedItem]:
+        """Yield items until `close()` has been called and the backlog is consumed."""
+        while (item := await self._queue.get()) is not None:
+            yield item
@@ -0,0 +1,298 @@
+"""
+Process-wide fair scheduler for fetch and LLM slots shared by concurrent jobs.
+
+Responsibilities:
+- Enforce global limits on in-flight HTTP fetches and LLM calls across every job in the
+  process (on top of each job's own `fetch_concurrency` / `llm_concurrency`).
+- Grant contended slots by weighted fair queuing: first across owners (`owner_sub`),
+  then across each owner's jobs, so one huge job cannot starve small interactive ones.
+- Carry the current job's identity implicitly (context variable), so fetch and LLM
+  call sites do not need to thread it through.
+
+Public API:
+- `Tenant`: Owner/job identity (+ job weight) a slot is charged to.
+- `FairScheduler`: Per-resource slot accounting with `slot()` context manager.
+- `get_scheduler` / `start_scheduler` / `stop_scheduler`: Loop registry (API lifespan).
+- `scheduler_tenant`: Bind the current owner/job for the enclosed code (and its tasks).
+- `scheduled_slot`: Hold a slot of the running loop's scheduler (no-op without one).
+
+Operational:
+- Concurrency: Single event loop; state is only touched from the loop. Schedulers are
+  registered per loop, like the browser pool.
+- Fairness: Start-time fair queuing. Every grant advances the owner's virtual time by 1
+  and the job's by `1 / weight`; the waiting owner (then job) with the smallest virtual
+  time is served next. Owners that were idle re-enter at the current virtual time, so
+  idleness earns no burst credit.
+- Fast path: Uncontended slots are granted immediately (no queueing overhead).
+- Logging: INFO when the scheduler starts/stops.
+
+Usage:
+    start_scheduler(settings)  # API lifespan
+    with scheduler_tenant(owner=user["sub"], job=job_id):
+        await scrape_with_stats(...)  # fetch/LLM call sites use `scheduled_slot(...)`
+
+Notes:
+- CLI/batch runs register no scheduler; `scheduled_slot` is then a no-op.
+- Work outside any tenant (e.g. health probes) is charged to an anonymous tenant.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from agentic_scraper.backend.config.constants import SCHEDULER_ANONYMOUS_TENANT
+from agentic_scraper.backend.config.messages import (
+    MSG_INFO_SCHEDULER_STARTED,
+    MSG_INFO_SCHEDULER_STOPPED,
+)
+from agentic_scraper.backend.config.types import SchedulerResource
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator, Mapping
+
+    from agentic_scraper.backend.core.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "FairScheduler",
+    "Tenant",
+    "get_scheduler",
+    "scheduled_slot",
+    "scheduler_tenant",
+    "start_scheduler",
+    "stop_scheduler",
+]
+
+
+@dataclass(frozen=True)
+class Tenant:
+    """
+    Identity a scheduler slot is charged to.
+
+    Attributes:
+        owner (str): Owning user (`owner_sub`); fairness is applied across owners first.
+        job (str): Job id; fairness is then applied across the owner's jobs.
+        weight (float): Relative share of the job within its owner (> 0).
+    """
+
+    owner: str
+    job: str
+    weight: float = 1.0
+
+
+_ANONYMOUS = Tenant(owner=SCHEDULER_ANONYMOUS_TENANT, job=SCHEDULER_ANONYMOUS_TENANT)
+_CURRENT_TENANT: ContextVar[Tenant | None] = ContextVar("scheduler_tenant", default=None)
+
+
+@dataclass
+class _JobQueue:
+    weight: float
+    vtime: float
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+
+@dataclass
+class _OwnerQueue:
+    vtime: float = 0.0
+    job_clock: float = 0.0  # virtual time of the owner's last served job
+    jobs: dict[str, _JobQueue] = field(default_factory=dict)
+
+
+@dataclass
+class _Resource:
+    limit: int
+    in_use: int = 0
+    waiting: int = 0
+    clock: float = 0.0  # virtual time of the last served owner
+    owners: dict[str, _OwnerQueue] = field(default_factory=dict)
+
+
+class FairScheduler:
+    """
+    Global slot limits with weighted fair queuing across owners and jobs.
+
+    Attributes:
+        granted (int): Slots granted since creation (all resources).
+    """
+
+    def __init__(self, limits: Mapping[SchedulerResource, int]) -> None:
+        """
+        Create a scheduler.
+
+        Args:
+            limits (Mapping[SchedulerResource, int]): Concurrent slots per resource.
+        """
+        self._resources = {res: _Resource(limit=max(1, n)) for res, n in limits.items()}
+        self.granted = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> FairScheduler:
+        """Build a scheduler from `scheduler_fetch_concurrency` / `scheduler_llm_concurrency`."""
+        return cls(
+            {
+                SchedulerResource.FETCH: settings.scheduler_fetch_concurrency,
+                SchedulerResource.LLM: settings.scheduler_llm_concurrency,
+            }
+        )
+
+    def in_use(self, resource: SchedulerResource) -> int:
+        """Return the number of slots currently held for `resource`."""
+        return self._resources[resource].in_use
+
+    def waiting(self, resource: SchedulerResource) -> int:
+        """Return the number of callers queued for `resource`."""
+        return self._resources[resource].waiting
+
+    @asynccontextmanager
+    async def slot(
+        self, resource: SchedulerResource, tenant: Tenant | None = None
+    ) -> AsyncIterator[None]:
+        """
+        Hold one `resource` slot for the enclosed block.
+
+        Args:
+            resource (SchedulerResource): Resource to acquire.
+            tenant (Tenant | None): Identity to charge; defaults to the bound tenant.
+        """
+        res = self._resources[resource]
+        await self._acquire(res, tenant or _CURRENT_TENANT.get() or _ANONYMOUS)
+        try:
+            yield
+        finally:
+            res.in_use -= 1
+            self._dispatch(res)
+
+    async def _acquire(self, res: _Resource, tenant: Tenant) -> None:
+        if res.in_use < res.limit and not res.waiting:
+            res.in_use += 1
+            self.granted += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._enqueue(res, tenant, waiter)
+        self._dispatch(res)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as we were cancelled: pass the slot on.
+                res.in_use -= 1
+                self._dispatch(res)
+            raise
+
+    def _enqueue(self, res: _Resource, tenant: Tenant, waiter: asyncio.Future[None]) -> None:
+        owner = res.owners.setdefault(tenant.owner, _OwnerQueue(vtime=res.clock))
+        if not owner.jobs:
+            # Re-entering owners start at the current virtual time (no idle credit).
+            owner.vtime = max(owner.vtime, res.clock)
+        job = owner.jobs.get(tenant.job)
+        if job is None:
+            job = owner.jobs[tenant.job] = _JobQueue(
+                weight=max(tenant.weight, 1e-6), vtime=owner.job_clock
+            )
+        job.waiters.append(waiter)
+        res.waiting += 1
+
+    def _dispatch(self, res: _Resource) -> None:
+        while res.in_use < res.limit and res.waiting:
+            # Smallest virtual time wins; dict order breaks ties (first come, first served).
+            owner = min((o for o in res.owners.values() if o.jobs), key=lambda o: o.vtime)
+            job_key, job = min(owner.jobs.items(), key=lambda kv: kv[1].vtime)
+            waiter = job.waiters.popleft()
+            res.waiting -= 1
+            if not job.waiters:
+                del owner.jobs[job_key]
+            if waiter.done():
+                continue  # cancelled while queued
+            res.clock, owner.job_clock = owner.vtime, job.vtime
+            owner.vtime += 1.0
+            job.vtime += 1.0 / job.weight
+            res.in_use += 1
+            self.granted += 1
+            waiter.set_result(None)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-loop registry and tenant binding
+# ─────────────────────────────────────────────────────────────────────────────
+
+_SCHEDULERS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FairScheduler]
+_SCHEDULERS = weakref.WeakKeyDictionary()
+
+
+def get_scheduler() -> FairScheduler | None:
+    """Return the scheduler registered for the running event loop, if any."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _SCHEDULERS.get(loop)
+
+
+def start_scheduler(settings: Settings) -> FairScheduler | None:
+    """
+    Register a scheduler for the running loop (no-op when disabled or already registered).
+
+    Args:
+        settings (Settings): Provides `scheduler_enabled` and the global limits.
+
+    Returns:
+        FairScheduler | None: The registered scheduler, or None when disabled.
+    """
+    existing = get_scheduler()
+    if existing is not None or not settings.scheduler_enabled:
+        return existing
+    scheduler = FairScheduler.from_settings(settings)
+    _SCHEDULERS[asyncio.get_running_loop()] = scheduler
+    logger.info(
+        MSG_INFO_SCHEDULER_STARTED.format(
+            fetch=settings.scheduler_fetch_concurrency, llm=settings.scheduler_llm_concurrency
+        )
+    )
+    return scheduler
+
+
+def stop_scheduler() -> None:
+    """Unregister the running loop's scheduler, if any."""
+    scheduler = _SCHEDULERS.pop(asyncio.get_running_loop(), None)
+    if scheduler is not None:
+        logger.info(MSG_INFO_SCHEDULER_STOPPED.format(granted=scheduler.granted))
+
+
+@contextmanager
+def scheduler_tenant(owner: str, job: str, *, weight: float = 1.0) -> Iterator[Tenant]:
+    """
+    Charge scheduler slots taken by the enclosed code (and tasks it creates) to a job.
+
+    Args:
+        owner (str): Owning user (`owner_sub`).
+        job (str): Job id.
+        weight (float): Relative share of this job among the owner's jobs.
+
+    Yields:
+        Tenant: The bound identity.
+    """
+    tenant = Tenant(owner=owner, job=job, weight=weight)
+    token = _CURRENT_TENANT.set(tenant)
+    try:
+        yield tenant
+    finally:
+        _CURRENT_TENANT.reset(token)
+
+
+@asynccontextmanager
+async def scheduled_slot(resource: SchedulerResource) -> AsyncIterator[None]:
+    """Hold a `resource` slot of the running loop's scheduler (no-op when none is registered)."""
+    scheduler = get_scheduler()
+    if scheduler is None:
+        yield
+        return
+    async with scheduler.slot(resource):
+        yield
@@ -52,6 +52,7 @@ class ScrapedItem(BaseModel):
         author (str | None): Author or content source.
         date_published (str | None): Publication date string, if known.
         screenshot_path (str | None): Optional screenshot file path.
+        llm_model (str | None): LLM model that produced the item (set by model routing).
 
     Notes:
         - Extra keys are allowed to accommodate dynamic agent outputs.
@@ -65,6 +66,7 @@ class ScrapedItem(BaseModel):
     author: str | None = Field(default=None, description="Author or source of the content")
     date_published: str | None = Field(default=None, description="Publication date if known")
     screenshot_path: str | None = Field(default=None, description="Path to screenshot image")
+    llm_model: str | None = Field(default=None, description="LLM model that produced the item")
 
     # URL validation (http/https and trimmed)
     _url_check = field_validator("url", mode="before")(validate_url)
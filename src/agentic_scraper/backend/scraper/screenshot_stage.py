@@ -0,0 +1,137 @@
+"""
+Decoupled screenshot stage for the worker pool.
+
+Responsibilities:
+- Capture screenshots for extracted items on a separate queue, with its own
+  concurrency limit and per-capture timeout, so extraction (LLM) workers never wait
+  on page rendering.
+- Patch `ScrapedItem.screenshot_path` in place once a capture completes.
+- Pass the page-content hash through so unchanged pages reuse cached captures.
+
+Public API:
+- `ScreenshotStage`: Queue + worker tasks; `submit()`, `aclose()`.
+
+Operational:
+- Concurrency: `settings.screenshot_concurrency` capture tasks, started lazily on the
+  first `submit()`. Captures go through the browser pool when one is active.
+- Timeouts: Each capture is bounded by `settings.screenshot_timeout_s`; a timed-out
+  capture leaves `screenshot_path` unset.
+- Logging: WARNING on timeouts; DEBUG summary when the stage closes.
+
+Usage:
+    stage = ScreenshotStage(settings)
+    stage.submit(item, page_hash=content_hash(text))  # returns immediately
+    ...
+    await stage.aclose(drain=True)  # wait for pending captures, then stop
+
+Notes:
+- Items are shared objects: whoever already holds an item (result buffers, hooks)
+  sees `screenshot_path` appear once the capture finishes.
+- `aclose(drain=False)` (cancellation) drops captures that have not started yet; a
+  drain also stops as soon as the `cancel` event is set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_SCREENSHOT_STAGE_DONE,
+    MSG_WARNING_SCREENSHOT_TIMEOUT,
+)
+from agentic_scraper.backend.scraper.agents.agent_helpers import capture_optional_screenshot
+from agentic_scraper.backend.scraper.cancel_helpers import CancelToken, await_or_cancel
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ScreenshotStage"]
+
+
+class ScreenshotStage:
+    """
+    Background screenshot queue that patches items after extraction.
+
+    Attributes:
+        settings (Settings): Screenshot directory, concurrency and timeout.
+        captured (int): Captures that produced a file.
+        failed (int): Captures that returned no file (errors are logged by the helper).
+        timed_out (int): Captures aborted after `screenshot_timeout_s`.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Create an idle stage; capture tasks start on the first submit."""
+        self.settings = settings
+        self.captured = 0
+        self.failed = 0
+        self.timed_out = 0
+        self._queue: asyncio.Queue[tuple[ScrapedItem, str | None]] = asyncio.Queue()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def submit(self, item: ScrapedItem, *, page_hash: str | None = None) -> None:
+        """Queue `item` for a screenshot of `item.url` (non-blocking)."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._run(), name=f"screenshot-{i}")
+                for i in range(self.settings.screenshot_concurrency)
+            ]
+        self._queue.put_nowait((item, page_hash))
+
+    async def _run(self) -> None:
+        while True:
+            item, page_hash = await self._queue.get()
+            try:
+                await self._capture(item, page_hash)
+            finally:
+                self._queue.task_done()
+
+    async def _capture(self, item: ScrapedItem, page_hash: str | None) -> None:
+        url = str(item.url)
+        timeout_s = self.settings.screenshot_timeout_s
+        try:
+            path = await asyncio.wait_for(
+                capture_optional_screenshot(url, self.settings, page_hash=page_hash),
+                timeout=timeout_s,
+            )
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            logger.warning(MSG_WARNING_SCREENSHOT_TIMEOUT.format(url=url, timeout=timeout_s))
+            return
+        if path:
+            item.screenshot_path = path
+            self.captured += 1
+        else:
+            self.failed += 1
+
+    async def aclose(self, *, drain: bool, cancel: asyncio.Event | None = None) -> None:
+        """
+        Stop the capture tasks.
+
+        Args:
+            drain (bool): If True, wait for every queued capture first; otherwise drop
+                captures that have not started (in-flight ones are cancelled).
+            cancel (asyncio.Event | None): Stops a drain early once set, like
+                `drain=False`.
+        """
+        if drain and self._tasks:
+            try:
+                await await_or_cancel(self._queue.join(), CancelToken(event=cancel))
+            except asyncio.CancelledError:
+                if cancel is None or not cancel.is_set():
+                    raise
+        for task in self._tasks:
+            task.cancel()
+        with suppress(asyncio.CancelledError):
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.debug(
+            MSG_DEBUG_SCREENSHOT_STAGE_DONE.format(
+                captured=self.captured, failed=self.failed, timed_out=self.timed_out
+            )
+        )
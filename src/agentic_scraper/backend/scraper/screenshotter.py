@@ -3,15 +3,23 @@ Full-page screenshot utility using Playwright.
 
 Responsibilities:
 - Validate and normalize target URLs and output directories.
-- Generate stable, filesystem-safe filenames (slug + short hash).
-- Capture full-page screenshots via headless Chromium.
+- Generate stable, filesystem-safe filenames (slug + short hash, plus a page-content
+  hash when the caller knows the content).
+- Capture full-page screenshots via headless Chromium, borrowing a page from the
+  long-lived browser pool when one is active (see `browser_pool`).
+- Reuse a fresh capture of the same URL + content instead of capturing again.
+- Encode PNG/JPEG/WebP, optionally clip to a maximum height, and write thumbnails.
 
 Public API:
+- `ScreenshotOptions`: Output format, quality, clipping, thumbnail and cache knobs.
+- `content_hash`: Short BLAKE2b digest of page text for content-addressed filenames.
 - `slugify`: Convert arbitrary text to a filesystem-safe slug.
 - `capture_screenshot`: Save a full-page screenshot for a given URL.
+- `save_page_screenshot`: Screenshot a page the caller already navigated (render fetch).
 
 Operational:
-- Concurrency: Safe for concurrent calls; each call launches its own browser.
+- Concurrency: Safe for concurrent calls. With an active `BrowserPool` pages come from
+  pooled browsers (bounded); otherwise each call launches its own browser.
 - Retries: None at this layer (delegate to caller if needed).
 - Logging: Errors and save confirmations logged via structured messages.
 
@@ -25,30 +33,136 @@ Usage:
 
 Notes:
 - Filenames include a short BLAKE2b hash of the URL to avoid collisions when
-  different pages share the same domain.
+  different pages share the same domain. With `content_hash`, the filename also encodes
+  the page content, so a changed page never reuses a stale capture. Once a new capture
+  of a URL is written, its captures for older content are deleted.
+- The cache only applies to content-addressed captures: without a content hash there is
+  no way to tell a fresh file from a stale one, so the page is always recaptured.
+- Playwright encodes PNG/JPEG natively; WebP and thumbnails are encoded with Pillow in a
+  worker thread.
 - The function returns `None` on validation or runtime failure (non-exception control flow).
 """
 
 from __future__ import annotations
 
+import asyncio
+import glob
 import hashlib
+import io
 import logging
 import re
+import time
+from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
+from PIL import Image
 from playwright.async_api import async_playwright
 
+from agentic_scraper.backend.config.constants import (
+    DEFAULT_SCREENSHOT_QUALITY,
+    SCREENSHOT_CONTENT_HASH_BYTES,
+    SCREENSHOT_NAV_TIMEOUT_MS,
+    SCREENSHOT_THUMBNAIL_SUFFIX,
+    SCREENSHOT_URL_HASH_BYTES,
+    SCREENSHOT_VIEWPORT_HEIGHT,
+    SCREENSHOT_VIEWPORT_WIDTH,
+)
 from agentic_scraper.backend.config.messages import (
+    MSG_DEBUG_SCREENSHOT_CACHE_HIT,
     MSG_ERROR_INVALID_SCREENSHOT_URL,
     MSG_ERROR_SCREENSHOT_FAILED,
     MSG_INFO_SCREENSHOT_SAVED,
+    MSG_WARNING_SCREENSHOT_THUMBNAIL_FAILED,
 )
+from agentic_scraper.backend.config.types import ScreenshotFormat
+from agentic_scraper.backend.scraper.browser_pool import get_browser_pool
 from agentic_scraper.backend.utils.validators import validate_path, validate_url
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+    from agentic_scraper.backend.core.settings import Settings
+
 logger = logging.getLogger(__name__)
 
-__all__ = ["capture_screenshot", "slugify"]
+__all__ = [
+    "ScreenshotOptions",
+    "capture_screenshot",
+    "content_hash",
+    "save_page_screenshot",
+    "slugify",
+]
+
+_EXTENSIONS = {
+    ScreenshotFormat.PNG: "png",
+    ScreenshotFormat.JPEG: "jpg",
+    ScreenshotFormat.WEBP: "webp",
+}
+_PIL_FORMATS = {
+    ScreenshotFormat.PNG: "PNG",
+    ScreenshotFormat.JPEG: "JPEG",
+    ScreenshotFormat.WEBP: "WEBP",
+}
+
+
+@dataclass(frozen=True)
+class ScreenshotOptions:
+    """
+    Output and cache options for `capture_screenshot`.
+
+    The defaults reproduce the original behavior: an uncached, full-page PNG with no
+    thumbnail.
+
+    Attributes:
+        image_format (ScreenshotFormat): PNG, JPEG or WebP.
+        quality (int): Encoder quality for JPEG/WebP (1-100).
+        full_page (bool): Capture the full scroll height instead of the viewport.
+        max_height (int): Clip full-page captures to this height in px (0 = no cap).
+        thumbnail_width (int): Also write a thumbnail this wide (0 = none).
+        cache_ttl_s (float): Reuse a content-addressed capture younger than this.
+    """
+
+    image_format: ScreenshotFormat = ScreenshotFormat.PNG
+    quality: int = DEFAULT_SCREENSHOT_QUALITY
+    full_page: bool = True
+    max_height: int = 0
+    thumbnail_width: int = 0
+    cache_ttl_s: float = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ScreenshotOptions:
+        """Build options from the `screenshot_*` settings."""
+        return cls(
+            image_format=ScreenshotFormat(settings.screenshot_format),
+            quality=settings.screenshot_quality,
+            full_page=settings.screenshot_full_page,
+            max_height=settings.screenshot_max_height,
+            thumbnail_width=settings.screenshot_thumbnail_width,
+            cache_ttl_s=settings.screenshot_cache_ttl_s,
+        )
+
+    @property
+    def extension(self) -> str:
+        """File extension (without dot) for the configured format."""
+        return _EXTENSIONS[self.image_format]
+
+
+def content_hash(text: str) -> str:
+    """
+    Return a short, stable digest of page content for content-addressed filenames.
+
+    Args:
+        text (str): Page text (the same text handed to the extraction agent).
+
+    Returns:
+        str: 12 hex characters of BLAKE2b.
+    """
+    return hashlib.blake2b(
+        text.encode("utf-8", "replace"), digest_size=SCREENSHOT_CONTENT_HASH_BYTES
+    ).hexdigest()
 
 
 def slugify(text: str) -> str:
@@ -76,16 +190,136 @@ def slugify(text: str) -> str:
     return re.sub(r"[^a-zA-Z0-9]+", "-", text.lower()).strip("-")[:40]
 
 
-async def capture_screenshot(url: str, output_dir: Path) -> str | None:
+def _screenshot_path(
+    url: str, output_dir: Path, options: ScreenshotOptions, digest: str | None
+) -> Path:
+    """Build `<domain-slug>-<url-hash>[-<content-hash>].<ext>` inside `output_dir`."""
+    # Base filename uses the domain (readable); add a short URL hash to avoid collisions
+    # when multiple pages share a domain or when slugs truncate similarly.
+    base = slugify(urlparse(url).netloc)
+    url_hash = hashlib.blake2b(url.encode(), digest_size=SCREENSHOT_URL_HASH_BYTES).hexdigest()
+    stem = f"{base}-{url_hash}-{digest}" if digest else f"{base}-{url_hash}"
+    return output_dir / f"{stem}.{options.extension}"
+
+
+def _thumbnail_path(file_path: Path) -> Path:
+    return file_path.with_name(f"{file_path.stem}{SCREENSHOT_THUMBNAIL_SUFFIX}{file_path.suffix}")
+
+
+def _is_fresh(file_path: Path, ttl_s: float) -> bool:
+    try:
+        age = time.time() - file_path.stat().st_mtime
+    except OSError:
+        return False
+    return age < ttl_s
+
+
+def _screenshot_kwargs(file_path: Path, options: ScreenshotOptions) -> dict[str, Any]:
+    """
+    Translate options into `page.screenshot()` keyword arguments.
+
+    Default options produce exactly `path=..., full_page=True`. WebP is not a Playwright
+    output type, so it is captured as PNG bytes (no `path`) and re-encoded afterwards.
+    """
+    kwargs: dict[str, Any] = {"full_page": options.full_page}
+    if options.image_format is ScreenshotFormat.JPEG:
+        kwargs.update(type="jpeg", quality=options.quality)
+    if options.image_format is not ScreenshotFormat.WEBP:
+        kwargs["path"] = file_path
+    if options.full_page and options.max_height > 0:
+        kwargs["clip"] = {
+            "x": 0,
+            "y": 0,
+            "width": SCREENSHOT_VIEWPORT_WIDTH,
+            "height": options.max_height,
+        }
+    return kwargs
+
+
+def _encode_webp(png: bytes, file_path: Path, quality: int) -> None:
+    with Image.open(io.BytesIO(png)) as img:
+        img.save(file_path, format="WEBP", quality=quality)
+
+
+def _write_thumbnail(file_path: Path, options: ScreenshotOptions) -> None:
+    with Image.open(file_path) as img:
+        ratio = options.thumbnail_width / img.width
+        size = (options.thumbnail_width, max(1, round(img.height * ratio)))
+        thumb = img.convert("RGB") if options.image_format is ScreenshotFormat.JPEG else img
+        thumb.resize(size).save(
+            _thumbnail_path(file_path),
+            format=_PIL_FORMATS[options.image_format],
+            quality=options.quality,
+        )
+
+
+async def _capture_page(
+    page: Page,
+    url: str,
+    file_path: Path,
+    options: ScreenshotOptions,
+    *,
+    page_hash: str | None = None,
+) -> None:
+    """Navigate `page` to `url` and write the screenshot (and thumbnail) to `file_path`."""
+    await page.goto(url, wait_until="networkidle", timeout=SCREENSHOT_NAV_TIMEOUT_MS)
+    await _write_page_screenshot(page, file_path, options, page_hash=page_hash)
+
+
+def _prune_stale_captures(file_path: Path, page_hash: str) -> None:
+    """Delete captures (and thumbnails) of the same URL taken for other page content."""
+    prefix = file_path.stem.removesuffix(page_hash)  # "<domain-slug>-<url-hash>-"
+    keep = {file_path.name, _thumbnail_path(file_path).name}
+    for sibling in file_path.parent.glob(f"{glob.escape(prefix)}*"):
+        if sibling.name not in keep:
+            with suppress(OSError):
+                sibling.unlink()
+
+
+async def _write_page_screenshot(
+    page: Page, file_path: Path, options: ScreenshotOptions, *, page_hash: str | None = None
+) -> None:
+    """
+    Write the screenshot (and thumbnail) of an already-loaded `page` to `file_path`.
+
+    With `page_hash`, captures of the same URL for older content are deleted afterwards,
+    so the screenshot directory holds one capture per URL.
+    """
+    data = await page.screenshot(**_screenshot_kwargs(file_path, options))
+    if options.image_format is ScreenshotFormat.WEBP:
+        await asyncio.to_thread(_encode_webp, data, file_path, options.quality)
+    if options.thumbnail_width > 0:
+        try:
+            await asyncio.to_thread(_write_thumbnail, file_path, options)
+        except (OSError, ValueError):
+            # A missing thumbnail never fails the capture itself.
+            logger.warning(MSG_WARNING_SCREENSHOT_THUMBNAIL_FAILED.format(path=file_path))
+    if page_hash:
+        await asyncio.to_thread(_prune_stale_captures, file_path, page_hash)
+
+
+async def capture_screenshot(
+    url: str,
+    output_dir: Path,
+    *,
+    options: ScreenshotOptions | None = None,
+    page_hash: str | None = None,
+) -> str | None:
     """
     Capture a full-page screenshot using Playwright (headless Chromium).
 
     The output filename is derived from the URL's domain slug plus a short
-    BLAKE2b hash of the full URL to ensure uniqueness across different pages.
+    BLAKE2b hash of the full URL to ensure uniqueness across different pages
+    (and the page-content hash, when given).
 
     Args:
         url (str): Target page URL (must be http/https).
-        output_dir (Path): Directory where the PNG will be saved. Created if missing.
+        output_dir (Path): Directory where the image will be saved. Created if missing.
+        options (ScreenshotOptions | None): Format/clipping/thumbnail/cache options;
+            defaults to an uncached full-page PNG.
+        page_hash (str | None): `content_hash()` of the page text. Enables the cache:
+            a capture of the same URL + content younger than `options.cache_ttl_s` is
+            returned without opening a browser.
 
     Returns:
         str | None: Absolute path (as POSIX string) to the saved screenshot, or `None`
@@ -104,7 +338,7 @@ async def capture_screenshot(url: str, output_dir: Path) -> str | None:
         - We wait for `"networkidle"` to capture a more stable page. This is a
           heuristic and can be adjusted by callers if needed.
         - A fixed viewport is set before navigation; `full_page=True` then expands
-          the capture to the full scroll height.
+          the capture to the full scroll height (clipped to `max_height` when set).
         - Errors are logged with standardized messages; secrets/URLs are not mutated.
     """
     try:
@@ -119,29 +353,35 @@ async def capture_screenshot(url: str, output_dir: Path) -> str | None:
     output_path = validate_path(str(output_dir))
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # ---- Filename strategy ----------------------------------------------------
-    # Base filename uses the domain (readable); add a short URL hash to avoid collisions
-    # when multiple pages share a domain or when slugs truncate similarly.
-    domain = urlparse(url).netloc
-    base = slugify(domain)
-    hash_suffix = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()  # 8 hex chars
-    filename = f"{base}-{hash_suffix}.png"
-    file_path = output_path / filename
+    options = options or ScreenshotOptions()
+    file_path = _screenshot_path(url, output_path, options, page_hash)
+
+    # Content-addressed cache: same URL + same content + fresh file → no browser at all.
+    if page_hash and options.cache_ttl_s > 0 and _is_fresh(file_path, options.cache_ttl_s):
+        logger.debug(MSG_DEBUG_SCREENSHOT_CACHE_HIT.format(path=file_path))
+        return file_path.as_posix()
 
+    pool = get_browser_pool()
     try:
+        if pool is not None:
+            # Pooled path: isolated context on a long-lived browser (viewport preset).
+            async with pool.page() as page:
+                await _capture_page(page, url, file_path, options, page_hash=page_hash)
+            logger.info(MSG_INFO_SCREENSHOT_SAVED.format(path=file_path))
+            return file_path.as_posix()
+
         # Each call uses its own browser context to avoid cross-call state or races.
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page()
 
             # Set a deterministic viewport for consistent rendering of responsive pages.
-            await page.set_viewport_size({"width": 1280, "height": 800})
+            await page.set_viewport_size(
+                {"width": SCREENSHOT_VIEWPORT_WIDTH, "height": SCREENSHOT_VIEWPORT_HEIGHT}
+            )
 
-            # Navigate and wait for network to be idle to reduce flicker/partial loads.
-            await page.goto(url, wait_until="networkidle", timeout=15000)
-
-            # Capture full page (beyond the viewport height).
-            await page.screenshot(path=file_path, full_page=True)
+            # Navigate (network idle reduces flicker/partial loads) and capture.
+            await _capture_page(page, url, file_path, options, page_hash=page_hash)
 
             # Clean shutdown to free resources immediately.
             await browser.close()
@@ -154,3 +394,46 @@ async def capture_screenshot(url: str, output_dir: Path) -> str | None:
         # We log and return `None` to keep the scraper resilient.
         logger.exception(MSG_ERROR_SCREENSHOT_FAILED.format(url=url))
         return None
+
+
+async def save_page_screenshot(
+    page: Page,
+    url: str,
+    output_dir: Path,
+    *,
+    options: ScreenshotOptions | None = None,
+    page_hash: str | None = None,
+) -> str | None:
+    """
+    Screenshot a page that is already loaded, reusing the caller's navigation.
+
+    Used by the render fetch mode: one navigation yields both the rendered HTML and the
+    screenshot. Naming, caching, formats and thumbnails match `capture_screenshot`.
+
+    Args:
+        page (Page): Playwright page already navigated to `url`.
+        url (str): The page URL (used for the filename).
+        output_dir (Path): Directory where the image will be saved. Created if missing.
+        options (ScreenshotOptions | None): Output/cache options (default: full-page PNG).
+        page_hash (str | None): `content_hash()` of the page text (enables the cache).
+
+    Returns:
+        str | None: POSIX path of the screenshot (fresh or cached), or `None` on failure.
+    """
+    output_path = validate_path(str(output_dir))
+    output_path.mkdir(parents=True, exist_ok=True)
+    options = options or ScreenshotOptions()
+    file_path = _screenshot_path(url, output_path, options, page_hash)
+
+    if page_hash and options.cache_ttl_s > 0 and _is_fresh(file_path, options.cache_ttl_s):
+        logger.debug(MSG_DEBUG_SCREENSHOT_CACHE_HIT.format(path=file_path))
+        return file_path.as_posix()
+
+    try:
+        await _write_page_screenshot(page, file_path, options, page_hash=page_hash)
+    except Exception:
+        # Same resilience contract as `capture_screenshot`: log and return None.
+        logger.exception(MSG_ERROR_SCREENSHOT_FAILED.format(url=url))
+        return None
+    logger.info(MSG_INFO_SCREENSHOT_SAVED.format(path=file_path))
+    return file_path.as_posix()
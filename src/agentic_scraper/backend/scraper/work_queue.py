@@ -0,0 +1,341 @@
+"""
+Pluggable work queue shared by a batch coordinator and its worker processes.
+
+Responsibilities:
+- Define the queue contract used by the distributed runner: enqueue URL chunks, lease
+  one to a worker, renew the lease, and record the chunk's items or failure.
+- Provide `SQLiteWorkQueue`, a single-file backend that works across processes on one
+  machine without any extra service.
+- Hand a chunk to another worker when its lease expires (visibility timeout), and mark
+  it failed after `max_attempts` leases.
+
+Public API:
+- `WorkQueue`: Protocol implemented by all queue backends.
+- `WorkLease`: A chunk leased to one worker.
+- `SQLiteWorkQueue`: SQLite-backed implementation (WAL mode, one connection per call).
+
+Operational:
+- Concurrency: Every state change runs in its own `BEGIN IMMEDIATE` transaction, so any
+  number of processes can share the file. Calls run in a thread (`asyncio.to_thread`)
+  to keep the event loop free while SQLite waits for a lock.
+- Delivery: At-least-once. A worker whose lease expired may still be running; its
+  late `complete()` is ignored because the lease now belongs to someone else.
+- Storage: Chunk items are kept as JSON in the queue file until the batch is purged.
+
+Usage:
+    queue = SQLiteWorkQueue(settings.work_queue_path, lease_s=120.0, max_attempts=3)
+    await queue.enqueue(batch_id, [urls[:50], urls[50:]])
+    lease = await queue.claim("worker-1", batch_id)  # or any batch: claim("worker-1")
+    if lease is not None:
+        await queue.complete(lease, [item.model_dump(mode="json") for item in items])
+
+Notes:
+- A networked broker can implement `WorkQueue` with the same semantics (lease ids,
+  heartbeats extending the visibility timeout) to spread workers across machines.
+- SQLite over a network filesystem is not supported; use one machine per queue file.
+- Chunks stay in the file until their batch is purged. A coordinator that died before
+  purging leaves its batch behind, so workers started for one batch should claim with
+  that `batch_id` rather than pick up stale chunks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from agentic_scraper.backend.config.constants import WORK_QUEUE_SQLITE_BUSY_TIMEOUT_S
+from agentic_scraper.backend.config.types import WorkChunkState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ["SQLiteWorkQueue", "WorkLease", "WorkQueue"]
+
+JSONObj = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class WorkLease:
+    """
+    A chunk of URLs leased to one worker.
+
+    Attributes:
+        chunk_id (int): Chunk identifier within the queue.
+        batch_id (str): Batch the chunk belongs to.
+        urls (list[str]): URLs to scrape.
+        token (str): Lease token; only its holder may renew or settle the chunk.
+        attempt (int): 1 for the first lease, 2 for the first retry, ...
+    """
+
+    chunk_id: int
+    batch_id: str
+    urls: list[str]
+    token: str
+    attempt: int
+
+
+class WorkQueue(Protocol):
+    """Contract for work-queue backends (local SQLite, or a networked broker)."""
+
+    async def enqueue(self, batch_id: str, chunks: list[list[str]]) -> None:
+        """Add one chunk per URL list to `batch_id`."""
+        ...
+
+    async def claim(self, worker_id: str, batch_id: str | None = None) -> WorkLease | None:
+        """Lease the oldest available chunk (of `batch_id`, if given), or return None."""
+        ...
+
+    async def heartbeat(self, lease: WorkLease) -> bool:
+        """Extend the lease; False if it expired and was taken by another worker."""
+        ...
+
+    async def complete(self, lease: WorkLease, items: list[JSONObj]) -> bool:
+        """Store the chunk's items; False if the lease was lost (items discarded)."""
+        ...
+
+    async def fail(self, lease: WorkLease, error: str) -> None:
+        """Release the chunk for a retry, or mark it failed after its last attempt."""
+        ...
+
+    async def counts(self, batch_id: str | None = None) -> dict[WorkChunkState, int]:
+        """Return chunk counts per state for one batch (or all batches)."""
+        ...
+
+    async def results(self, batch_id: str) -> tuple[list[JSONObj], list[str]]:
+        """Return the batch's items and the URLs of its failed chunks."""
+        ...
+
+    async def purge(self, batch_id: str) -> None:
+        """Delete every chunk of `batch_id`."""
+        ...
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id TEXT NOT NULL,
+    urls TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_token TEXT,
+    lease_owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    items TEXT
+);
+CREATE INDEX IF NOT EXISTS chunks_by_state ON chunks (state, lease_expires);
+CREATE INDEX IF NOT EXISTS chunks_by_batch ON chunks (batch_id, state);
+"""
+
+
+class SQLiteWorkQueue:
+    """
+    Work queue stored in a local SQLite file.
+
+    Attributes:
+        path (Path): Queue database file.
+        lease_s (float): Visibility timeout of a lease, renewed by `heartbeat()`.
+        max_attempts (int): Leases per chunk before it is marked failed.
+    """
+
+    def __init__(self, path: str | Path, *, lease_s: float, max_attempts: int) -> None:
+        """
+        Open (and create if needed) a queue file.
+
+        Args:
+            path (str | Path): Queue database file (parent directories are created).
+            lease_s (float): Visibility timeout of a lease in seconds.
+            max_attempts (int): Leases per chunk before it is marked failed.
+        """
+        self.path = Path(path)
+        self.lease_s = lease_s
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")  # persistent: readers never block writers
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            self.path, timeout=WORK_QUEUE_SQLITE_BUSY_TIMEOUT_S, isolation_level=None
+        )
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    async def enqueue(self, batch_id: str, chunks: list[list[str]]) -> None:
+        """Add one chunk per URL list to `batch_id`."""
+        await asyncio.to_thread(self._enqueue, batch_id, chunks)
+
+    async def claim(self, worker_id: str, batch_id: str | None = None) -> WorkLease | None:
+        """Lease the oldest queued (or lease-expired) chunk, of `batch_id` if given."""
+        return await asyncio.to_thread(self._claim, worker_id, batch_id)
+
+    async def heartbeat(self, lease: WorkLease) -> bool:
+        """Push the lease's expiry `lease_s` into the future."""
+        return await asyncio.to_thread(self._heartbeat, lease)
+
+    async def complete(self, lease: WorkLease, items: list[JSONObj]) -> bool:
+        """Mark the chunk done with its items (ignored if the lease was lost)."""
+        return await asyncio.to_thread(self._complete, lease, items)
+
+    async def fail(self, lease: WorkLease, error: str) -> None:
+        """Requeue the chunk, or mark it failed once it used `max_attempts` leases."""
+        await asyncio.to_thread(self._fail, lease, error)
+
+    async def counts(self, batch_id: str | None = None) -> dict[WorkChunkState, int]:
+        """Return chunk counts per state (exhausted expired leases are failed first)."""
+        return await asyncio.to_thread(self._counts, batch_id)
+
+    async def results(self, batch_id: str) -> tuple[list[JSONObj], list[str]]:
+        """Return the batch's items (chunk order) and the URLs of its failed chunks."""
+        return await asyncio.to_thread(self._results, batch_id)
+
+    async def purge(self, batch_id: str) -> None:
+        """Delete every chunk of `batch_id`."""
+        await asyncio.to_thread(self._purge, batch_id)
+
+    # ----- synchronous implementation (runs in a worker thread) ---------------
+
+    def _enqueue(self, batch_id: str, chunks: list[list[str]]) -> None:
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO chunks (batch_id, urls, state) VALUES (?, ?, ?)",
+                [(batch_id, json.dumps(urls), WorkChunkState.QUEUED.value) for urls in chunks],
+            )
+
+    def _claim(self, worker_id: str, only_batch: str | None) -> WorkLease | None:
+        now = time.time()
+        with self._transaction() as conn:
+            self._fail_exhausted(conn, now)
+            row = conn.execute(
+                "SELECT id, batch_id, urls, attempts FROM chunks "
+                "WHERE (state = ? OR (state = ? AND lease_expires < ?)) "
+                "AND (? IS NULL OR batch_id = ?) ORDER BY id LIMIT 1",
+                (
+                    WorkChunkState.QUEUED.value,
+                    WorkChunkState.LEASED.value,
+                    now,
+                    only_batch,
+                    only_batch,
+                ),
+            ).fetchone()
+            if row is None:
+                return None
+            chunk_id, batch_id, urls, attempts = row
+            token = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE chunks SET state = ?, attempts = ?, lease_token = ?, lease_owner = ?, "
+                "lease_expires = ? WHERE id = ?",
+                (
+                    WorkChunkState.LEASED.value,
+                    attempts + 1,
+                    token,
+                    worker_id,
+                    now + self.lease_s,
+                    chunk_id,
+                ),
+            )
+        return WorkLease(chunk_id, batch_id, json.loads(urls), token, attempts + 1)
+
+    def _fail_exhausted(self, conn: sqlite3.Connection, now: float) -> None:
+        """Fail expired leases that have no attempts left (their worker kept dying)."""
+        conn.execute(
+            "UPDATE chunks SET state = ?, error = 'lease expired' "
+            "WHERE state = ? AND lease_expires < ? AND attempts >= ?",
+            (WorkChunkState.FAILED.value, WorkChunkState.LEASED.value, now, self.max_attempts),
+        )
+
+    def _heartbeat(self, lease: WorkLease) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE chunks SET lease_expires = ? WHERE id = ? AND lease_token = ? "
+                "AND state = ?",
+                (
+                    time.time() + self.lease_s,
+                    lease.chunk_id,
+                    lease.token,
+                    WorkChunkState.LEASED.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def _complete(self, lease: WorkLease, items: list[JSONObj]) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE chunks SET state = ?, items = ?, lease_expires = NULL, error = NULL "
+                "WHERE id = ? AND lease_token = ? AND state = ?",
+                (
+                    WorkChunkState.DONE.value,
+                    json.dumps(items, ensure_ascii=False),
+                    lease.chunk_id,
+                    lease.token,
+                    WorkChunkState.LEASED.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def _fail(self, lease: WorkLease, error: str) -> None:
+        state = (
+            WorkChunkState.FAILED if lease.attempt >= self.max_attempts else WorkChunkState.QUEUED
+        )
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE chunks SET state = ?, error = ?, lease_token = NULL, "
+                "lease_expires = NULL WHERE id = ? AND lease_token = ? AND state = ?",
+                (state.value, error, lease.chunk_id, lease.token, WorkChunkState.LEASED.value),
+            )
+
+    def _counts(self, batch_id: str | None) -> dict[WorkChunkState, int]:
+        counts = dict.fromkeys(WorkChunkState, 0)
+        with self._transaction() as conn:
+            self._fail_exhausted(conn, time.time())
+            rows = conn.execute(
+                "SELECT state, COUNT(*) FROM chunks "
+                "WHERE (? IS NULL OR batch_id = ?) GROUP BY state",
+                (batch_id, batch_id),
+            ).fetchall()
+        for state, count in rows:
+            counts[WorkChunkState(state)] = count
+        return counts
+
+    def _purge(self, batch_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM chunks WHERE batch_id = ?", (batch_id,))
+
+    def _results(self, batch_id: str) -> tuple[list[JSONObj], list[str]]:
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT state, urls, items FROM chunks WHERE batch_id = ? AND state IN (?, ?) "
+                "ORDER BY id",
+                (batch_id, WorkChunkState.DONE.value, WorkChunkState.FAILED.value),
+            ).fetchall()
+        items: list[JSONObj] = []
+        failed_urls: list[str] = []
+        for state, urls, chunk_items in rows:
+            if state == WorkChunkState.DONE.value:
+                items.extend(json.loads(chunk_items))
+            else:
+                failed_urls.extend(json.loads(urls))
+        return items, failed_urls
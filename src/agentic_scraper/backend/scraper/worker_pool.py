@@ -3,18 +3,35 @@ Asynchronous worker pool for structured data extraction.
 
 Responsibilities:
 - Spawn and manage N async workers to process `(url, text)` scraping inputs.
+- Feed inputs through a producer task into a (optionally bounded) queue, so large or
+  lazily produced (async iterator) batches never sit in the queue all at once.
 - Build `ScrapeRequest` objects and delegate extraction to the active agent.
 - Support cooperative cancellation (event and/or predicate).
 - Optionally preserve input ordering in the final results.
 - Surface progress via guarded callbacks and structured logging.
+- Optionally coalesce short pages into shared LLM calls (`settings.llm_batch_enabled`).
+- Optionally route each LLM request to a model per page (`settings.model_routing_enabled`).
+- Optionally capture screenshots in a separate stage (`settings.screenshot_stage_enabled`)
+  so extraction workers never wait on page rendering.
+- Report every finished input through `on_input_done`, so callers can stream results
+  without the pool buffering them (`collect_results=False`).
+- Optionally run rule-based extraction in worker processes (`worker_pool_mode=process`),
+  so CPU-bound regex/validation work uses every core.
+- Optionally dequeue the most expensive inputs first (`worker_pool_schedule=
+  longest_first`), so a huge page late in the batch does not become a tail straggler.
 
 Public API:
 - `run_worker_pool`: Orchestrate queueing, workers, and result collation.
 - `worker`: Worker coroutine that processes items until the queue is drained.
+- `process_worker`: Worker coroutine that extracts chunks of inputs in a process pool.
 
 Operational:
-- Concurrency: Fully asyncio-based; one Task per worker, plus queue join/pollers.
+- Concurrency: Fully asyncio-based; one Task per worker, one producer Task, plus queue
+  join/pollers.
+- Backpressure: `max_queue_size` bounds the queue; the producer waits while it is full.
 - Ordering: Optional input-order preservation via pre-sized buffer + index map.
+  Longest-first scheduling only changes the processing order, never the output order;
+  list/tuple inputs are sorted by estimated cost before they are fed to the queue.
 - Logging: Uses message constants; verbose mode includes tracebacks.
 - Cancellation: Cooperative. Workers check before/after blocking and long work.
 
@@ -28,41 +45,78 @@ Notes:
 - User callbacks (on_progress / on_item_processed / on_error) are guarded and
   must never break worker liveness.
 - Per-item timeouts are supported via `settings.scrape_timeout_s` (if present).
+- With LLM batching on, the pool spawns `concurrency * llm_batch_max_items` workers so
+  batches can fill, while the batcher caps concurrent LLM calls at `concurrency`.
+- With the screenshot stage on, items reach `on_item_processed` as soon as extraction
+  finishes; `screenshot_path` is filled in later, and the pool drains the stage before
+  returning (unless cancelled) so returned items carry their screenshots.
+- Process mode (rule-based only) spawns one dispatcher per process instead of
+  `concurrency` workers. Each dispatcher ships up to `process_pool_chunk_size` queued
+  inputs to `rule_engine.extract_item_dicts` and applies the usual per-input callbacks,
+  ordering and cancellation checks to the returned items. Screenshots always go through
+  the screenshot stage, since worker processes cannot capture them. The per-item timeout
+  scales with the chunk size. The processes are spawned once and reused across runs
+  (`process_pool.get_extraction_pool`); a chunk that overruns its timeout terminates
+  them, since a hung chunk cannot be interrupted otherwise. Chunk wall time feeds the
+  latency history, split across the chunk's inputs by text length.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
 from collections import deque
-from collections.abc import Callable
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Sequence, Sized
 from contextlib import suppress
 from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING
 
 from agentic_scraper.backend.config.messages import (
     MSG_DEBUG_POOL_CANCELLING_WORKERS,
     MSG_DEBUG_POOL_DONE,
+    MSG_DEBUG_POOL_PROCESS_MODE,
     MSG_DEBUG_POOL_SPAWNED_WORKERS,
     MSG_DEBUG_WORKER_CANCELLED,
     MSG_INFO_WORKER_POOL_START,
 )
+from agentic_scraper.backend.config.types import AgentMode, WorkerPoolMode, WorkerPoolSchedule
 from agentic_scraper.backend.scraper import agents as agents_mode
+from agentic_scraper.backend.scraper.agents.llm_batch import ShortPageBatcher
+from agentic_scraper.backend.scraper.agents.model_router import ModelRouter
+from agentic_scraper.backend.scraper.agents.rule_engine import extract_item_dicts
+from agentic_scraper.backend.scraper.cancel_helpers import CancelToken, await_or_cancel
 from agentic_scraper.backend.scraper.models import (
     ScrapeRequest,
     WorkerPoolConfig,
 )
+from agentic_scraper.backend.scraper.pool_schedule import (
+    DomainLatencyHistory,
+    estimate_cost,
+    get_domain_latency_history,
+)
+from agentic_scraper.backend.scraper.process_pool import (
+    ExtractionProcessPool,
+    get_extraction_pool,
+)
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+from agentic_scraper.backend.scraper.screenshot_stage import ScreenshotStage
+from agentic_scraper.backend.scraper.screenshotter import content_hash
 from agentic_scraper.backend.scraper.worker_pool_helpers import (
     _await_join_with_optional_cancel,
     _prepare_queue_and_ordering,
     build_request,
+    call_input_done_callback,
     call_progress_callback,
     dequeue_next,
     handle_failure,
     handle_success_item,
     log_progress_verbose,
     place_ordered_result,
+    produce_inputs,
+    register_order_slots,
 )
 from agentic_scraper.backend.scraper.worker_pool_helpers import (
     early_cancel_or_raise_ext as early_cancel_or_raise,
@@ -71,12 +125,12 @@ from agentic_scraper.backend.scraper.worker_pool_helpers import (
 if TYPE_CHECKING:
     from agentic_scraper.backend.config.aliases import (
         OnErrorCallback,
+        OnInputDoneCallback,
         OnSuccessCallback,
         ScrapeInput,
     )
     from agentic_scraper.backend.config.types import OpenAIConfig
     from agentic_scraper.backend.core.settings import Settings
-    from agentic_scraper.backend.scraper.schemas import ScrapedItem
 
 
 @dataclass
@@ -86,7 +140,7 @@ class _WorkerContext:
 
     Attributes:
         settings (Settings): Global runtime settings.
-        take_screenshot (bool): Whether screenshots should be captured by agents.
+        take_screenshot (bool): Whether screenshots should be captured for each item.
         total_inputs (int): Total number of inputs enqueued (for progress).
         processed_count (int): Number of inputs the pool has processed so far.
         processed_lock (asyncio.Lock): Guards `processed_count` increments.
@@ -94,12 +148,22 @@ class _WorkerContext:
         on_item_processed (OnSuccessCallback | None): Success callback (guarded).
         on_error (OnErrorCallback | None): Error callback (guarded).
         on_progress (Callable[[int, int], None] | None): Progress callback (guarded).
+        on_input_done (OnInputDoneCallback | None): Per-input `(url, item)` callback (guarded).
+        collect_results (bool): Whether items are kept in the pool's result buffers.
         cancel_event (asyncio.Event | None): Event-style cancel signal.
         should_cancel (Callable[[], bool] | None): Predicate-style cancel signal.
         preserve_order (bool): If True, maintain input order in outputs.
         ordered_results (list[ScrapedItem | None] | None): Slot-buffered results.
         url_to_indices (dict[str, deque[int]] | None): URL → pending index slots.
         order_lock (asyncio.Lock): Serializes ordered placement.
+        batcher (ShortPageBatcher | None): Short-page LLM batcher (None when disabled).
+        router (ModelRouter | None): Per-run model router (None when routing is disabled).
+        screenshots (ScreenshotStage | None): Decoupled screenshot stage; when set, agents
+            skip inline capture and items are queued here after extraction.
+        screenshot_paths (dict[str, str]): Screenshots captured upstream (render fetch),
+            keyed by URL; these pages are never captured again.
+        latency_history (DomainLatencyHistory | None): Receives per-input extraction
+            latency when longest-first scheduling is on (None otherwise).
     """
 
     settings: Settings
@@ -111,17 +175,139 @@ class _WorkerContext:
     on_item_processed: OnSuccessCallback | None = None
     on_error: OnErrorCallback | None = None
     on_progress: Callable[[int, int], None] | None = None
+    on_input_done: OnInputDoneCallback | None = None
+    collect_results: bool = True
     cancel_event: asyncio.Event | None = None
     should_cancel: Callable[[], bool] | None = None
     preserve_order: bool = False
     ordered_results: list[ScrapedItem | None] | None = None
     url_to_indices: dict[str, deque[int]] | None = None
     order_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    batcher: ShortPageBatcher | None = None
+    router: ModelRouter | None = None
+    screenshots: ScreenshotStage | None = None
+    screenshot_paths: dict[str, str] = field(default_factory=dict)
+    latency_history: DomainLatencyHistory | None = None
 
 
 logger = logging.getLogger(__name__)
 
 
+async def _extract_single(
+    request: ScrapeRequest,
+    settings: Settings,
+    router: ModelRouter | None = None,
+) -> ScrapedItem | None:
+    """Dispatch one request to the active agent (looked up at call time for patching)."""
+    if router is not None:
+        return await agents_mode.extract_structured_data(request, settings=settings, router=router)
+    return await agents_mode.extract_structured_data(request, settings=settings)
+
+
+def _extract_item(request: ScrapeRequest, context: _WorkerContext) -> Awaitable[ScrapedItem | None]:
+    """Route a request through the short-page batcher when enabled, else straight to the agent."""
+    if context.batcher is not None:
+        return context.batcher.extract(request)
+    return _extract_single(request, context.settings, context.router)
+
+
+def _build_router(settings: Settings) -> ModelRouter | None:
+    """Create a run-scoped model router when routing is enabled for an LLM agent mode."""
+    if not settings.model_routing_enabled or settings.agent_mode == AgentMode.RULE_BASED:
+        return None
+    return ModelRouter(settings)
+
+
+def _build_batcher(
+    settings: Settings,
+    concurrency: int,
+    router: ModelRouter | None = None,
+) -> ShortPageBatcher | None:
+    """
+    Create a short-page batcher when batching is enabled for an LLM agent mode.
+
+    Returns:
+        ShortPageBatcher | None: The batcher, or None for rule-based runs, batching off,
+            or an active model router (batched calls cannot be routed per page).
+    """
+    if (
+        not settings.llm_batch_enabled
+        or settings.agent_mode == AgentMode.RULE_BASED
+        or router is not None
+    ):
+        return None
+    return ShortPageBatcher(
+        settings=settings,
+        fallback=lambda req: _extract_single(req, settings),
+        max_calls=concurrency,
+    )
+
+
+def _build_screenshot_stage(
+    settings: Settings, *, take_screenshot: bool, inline_capture: bool = True
+) -> ScreenshotStage | None:
+    """
+    Create the decoupled screenshot stage when screenshots are requested and staged.
+
+    Without `inline_capture` (process mode) the stage is used whenever screenshots are on.
+    """
+    if not take_screenshot or (inline_capture and not settings.screenshot_stage_enabled):
+        return None
+    return ScreenshotStage(settings)
+
+
+def _process_mode_workers(settings: Settings) -> int:
+    """Return the extraction process count for process mode, or 0 to run on the loop."""
+    if (
+        settings.worker_pool_mode != WorkerPoolMode.PROCESS
+        or settings.agent_mode != AgentMode.RULE_BASED
+    ):
+        return 0
+    return settings.process_pool_workers or os.cpu_count() or 1
+
+
+async def _close_screenshot_stage(
+    stage: ScreenshotStage | None,
+    cancel_event: asyncio.Event | None,
+    should_cancel: Callable[[], bool] | None,
+) -> None:
+    """Drain pending captures after a normal run; drop them after cancellation."""
+    if stage is None:
+        return
+    canceled = bool(cancel_event and cancel_event.is_set()) or bool(
+        should_cancel and should_cancel()
+    )
+    await stage.aclose(drain=not canceled, cancel=cancel_event)
+
+
+def _attach_screenshot(
+    item: ScrapedItem | None, url: str, text: str, context: _WorkerContext
+) -> None:
+    """Reuse an upstream screenshot for `url`, or queue the item on the screenshot stage."""
+    if item is None:
+        return
+    if url in context.screenshot_paths:
+        item.screenshot_path = context.screenshot_paths[url]
+    elif context.screenshots is not None:
+        # Patched in place later; the content hash lets unchanged pages hit the cache.
+        context.screenshots.submit(item, page_hash=content_hash(text))
+
+
+def _emit_progress(
+    cb: Callable[[int, int], None] | None,
+    done: int,
+    total: int,
+    cancel_event: asyncio.Event | None,
+    should_cancel: Callable[[], bool] | None,
+) -> None:
+    """Emit a pool-level progress callback unless cancellation is already signaled."""
+    event_canceled = cancel_event and cancel_event.is_set()
+    manual_canceled = should_cancel and should_cancel()
+    if cb is not None and not event_canceled and not manual_canceled:
+        with suppress(Exception):
+            cb(done, total)
+
+
 async def worker(
     *,
     worker_id: int,
@@ -144,6 +330,8 @@ async def worker(
             (a) before blocking on the queue,
             (b) after dequeue (so task_done still runs in `finally`),
             (c) immediately after extraction.
+          An in-flight extraction (LLM calls, inline screenshot) is cancelled as soon
+          as the cancel event is set, rather than finishing first.
         - Per-item timeout is honored when `settings.scrape_timeout_s` is set.
     """
     try:
@@ -153,34 +341,35 @@ async def worker(
 
             # Blocking dequeue — if this raises, we didn't remove anything.
             url, text = await dequeue_next(queue, worker_id=worker_id)
+            produced: ScrapedItem | None = None
 
             try:
                 # Check again *after* dequeue; still ensure task_done() will run in finally.
                 early_cancel_or_raise(context.cancel_event, context.should_cancel)
 
-                # Compose request (OpenAI creds injected only when present).
+                # Compose request (OpenAI creds injected only when present). The agent
+                # skips inline capture when the stage or the render fetch handles it.
+                inline_shot = context.screenshots is None and url not in context.screenshot_paths
                 request = build_request(
                     scrape_input=(url, text),
-                    take_screenshot=context.take_screenshot,
+                    take_screenshot=context.take_screenshot and inline_shot,
                     openai=context.openai,
                     worker_id=worker_id,
                     scrape_request_cls=ScrapeRequest,
                 )
 
                 # Optional per-item timeout (if configured on settings).
+                started = time.perf_counter()
                 timeout_s = getattr(context.settings, "scrape_timeout_s", None)
+                extraction: Awaitable[ScrapedItem | None] = _extract_item(request, context)
                 if isinstance(timeout_s, (int, float)) and timeout_s > 0:
-                    item = await asyncio.wait_for(
-                        agents_mode.extract_structured_data(request, settings=context.settings),
-                        timeout=timeout_s,
-                    )
-                else:
-                    item = await agents_mode.extract_structured_data(
-                        request, settings=context.settings
-                    )
+                    extraction = asyncio.wait_for(extraction, timeout=timeout_s)
+                item = await await_or_cancel(extraction, CancelToken(event=context.cancel_event))
 
                 # Bail quickly if cancel was signaled during extraction.
                 early_cancel_or_raise(context.cancel_event, context.should_cancel)
+                if context.latency_history is not None:
+                    context.latency_history.record(url, len(text), time.perf_counter() - started)
 
                 # Successful extraction → append + guarded callbacks.
                 handle_success_item(
@@ -190,6 +379,11 @@ async def worker(
                     worker_id=worker_id,
                     context=context,
                 )
+                produced = item
+
+                # Attach the render-time screenshot or hand off to the screenshot stage.
+                if context.take_screenshot:
+                    _attach_screenshot(item, url, text, context)
 
                 # If ordering is enabled, place into the pre-sized buffer.
                 await place_ordered_result(context=context, url=url, item=item)
@@ -215,76 +409,219 @@ async def worker(
                 # Verbose progress log and guarded progress callback.
                 log_progress_verbose(worker_id=worker_id, url=url, queue=queue, context=context)
                 call_progress_callback(context=context)
+                call_input_done_callback(context=context, url=url, item=produced)
 
     except asyncio.CancelledError:
         # Normal shutdown path when the pool controller cancels the worker task.
         logger.debug(MSG_DEBUG_WORKER_CANCELLED.format(worker_id=worker_id))
 
 
-async def run_worker_pool(
-    inputs: list[ScrapeInput],
+async def _next_chunk(
+    queue: asyncio.Queue[ScrapeInput], *, worker_id: int, chunk_size: int
+) -> list[ScrapeInput]:
+    """Wait for one input, then take whatever else is already queued (up to `chunk_size`)."""
+    chunk = [await dequeue_next(queue, worker_id=worker_id)]
+    # No await between `empty()` and `get_nowait()`, so this cannot race other workers.
+    while len(chunk) < chunk_size and not queue.empty():
+        chunk.append(queue.get_nowait())
+    return chunk
+
+
+async def _extract_chunk_in_process(
+    chunk: list[ScrapeInput], context: _WorkerContext, processes: ExtractionProcessPool
+) -> list[ScrapedItem | None]:
+    """Run `extract_item_dicts` for `chunk` in the process pool and re-validate the items."""
+    timeout_s = getattr(context.settings, "scrape_timeout_s", None)
+    deadline = (
+        timeout_s * len(chunk) if isinstance(timeout_s, (int, float)) and timeout_s > 0 else None
+    )
+    payloads = await processes.run(extract_item_dicts, chunk, timeout_s=deadline)
+    return [ScrapedItem.model_validate(p) if p is not None else None for p in payloads]
+
+
+def _record_chunk_latency(
+    history: DomainLatencyHistory, chunk: list[ScrapeInput], elapsed: float
+) -> None:
+    """Record a chunk's wall time, split across its inputs by text length."""
+    chars = sum(len(text) for _url, text in chunk)
+    for url, text in chunk:
+        share = len(text) / chars if chars else 1 / len(chunk)
+        history.record(url, len(text), elapsed * share)
+
+
+async def process_worker(
+    *,
+    worker_id: int,
+    queue: asyncio.Queue[ScrapeInput],
+    results: list[ScrapedItem],
+    context: _WorkerContext,
+    pool: ExtractionProcessPool,
+) -> None:
+    """
+    Worker coroutine that extracts chunks of inputs in a process pool (rule-based mode).
+
+    Args:
+        worker_id (int): Identifier for logging/tracing.
+        queue (asyncio.Queue[ScrapeInput]): Shared work queue of `(url, text)`.
+        results (list[ScrapedItem]): Shared result buffer (unordered).
+        context (_WorkerContext): Shared runtime context.
+        pool (ExtractionProcessPool): Process pool running `rule_engine.extract_item_dicts`.
+
+    Notes:
+        - Same per-input contract as `worker`: every dequeued input is acknowledged and
+          reported through progress / `on_input_done`, even on failure or cancellation.
+        - A failed chunk (worker crash, timeout) fails each of its undelivered inputs.
+    """
+    chunk_size = context.settings.process_pool_chunk_size
+    try:
+        while True:
+            early_cancel_or_raise(context.cancel_event, context.should_cancel)
+            chunk = await _next_chunk(queue, worker_id=worker_id, chunk_size=chunk_size)
+            produced: list[ScrapedItem | None] = [None] * len(chunk)
+            delivered = 0
+            try:
+                early_cancel_or_raise(context.cancel_event, context.should_cancel)
+                started = time.perf_counter()
+                items = await await_or_cancel(
+                    _extract_chunk_in_process(chunk, context, pool),
+                    CancelToken(event=context.cancel_event),
+                )
+                early_cancel_or_raise(context.cancel_event, context.should_cancel)
+                if context.latency_history is not None:
+                    _record_chunk_latency(
+                        context.latency_history, chunk, time.perf_counter() - started
+                    )
+
+                for (url, text), item in zip(chunk, items, strict=True):
+                    handle_success_item(
+                        item=item, results=results, url=url, worker_id=worker_id, context=context
+                    )
+                    produced[delivered] = item
+                    delivered += 1
+                    if context.take_screenshot:
+                        _attach_screenshot(item, url, text, context)
+                    await place_ordered_result(context=context, url=url, item=item)
+
+            except Exception as e:  # noqa: BLE001 — routine failure path (pool/timeout/etc.)
+                for url, _text in chunk[delivered:]:
+                    handle_failure(url=url, error=e, context=context)
+            finally:
+                for (url, _text), item in zip(chunk, produced, strict=True):
+                    with suppress(ValueError):
+                        queue.task_done()
+                    async with context.processed_lock:
+                        context.processed_count += 1
+                    log_progress_verbose(worker_id=worker_id, url=url, queue=queue, context=context)
+                    call_progress_callback(context=context)
+                    call_input_done_callback(context=context, url=url, item=item)
+
+    except asyncio.CancelledError:
+        logger.debug(MSG_DEBUG_WORKER_CANCELLED.format(worker_id=worker_id))
+
+
+def _cost_ordered_feed(
+    inputs: Iterable[ScrapeInput] | AsyncIterable[ScrapeInput],
+    cost: Callable[[ScrapeInput], float] | None,
+    context: _WorkerContext,
+) -> Iterable[ScrapeInput] | AsyncIterable[ScrapeInput]:
+    """
+    Sort a materialized batch by descending cost before it reaches the queue.
+
+    Longest-first then holds for the whole batch, not just for the window a bounded queue
+    holds. Ordering slots are registered here in input order; lazy sources pass through.
+    """
+    if cost is None or not isinstance(inputs, Sequence):
+        return inputs
+    register_order_slots(context, inputs)
+    return sorted(inputs, key=cost, reverse=True)
+
+
+async def run_worker_pool(  # noqa: PLR0913 - `total` only matters for async iterators
+    inputs: Iterable[ScrapeInput] | AsyncIterable[ScrapeInput],
     *,
     settings: Settings,
     config: WorkerPoolConfig,
     cancel_event: asyncio.Event | None = None,
     should_cancel: Callable[[], bool] | None = None,
+    total: int | None = None,
 ) -> list[ScrapedItem]:
     """
     Launch and manage a pool of workers to process scraping inputs concurrently.
 
     Args:
-        inputs (list[ScrapeInput]): Prepared `(url, text)` inputs to process.
+        inputs (Iterable[ScrapeInput] | AsyncIterable[ScrapeInput]): `(url, text)` inputs;
+            a list, or any (async) iterable consumed lazily by the producer task.
         settings (Settings): Global runtime settings object.
         config (WorkerPoolConfig): Pool config (concurrency, callbacks, etc.).
         cancel_event (asyncio.Event | None): Event-style cancel signal.
         should_cancel (Callable[[], bool] | None): Predicate-style cancel signal.
+        total (int | None): Expected input count for progress when `inputs` has no
+            `len()`; if omitted, the total grows as inputs are produced.
 
     Returns:
-        list[ScrapedItem]: Extracted items; input order if `preserve_order=True`.
+        list[ScrapedItem]: Extracted items; input order if `preserve_order=True`. Empty
+        when `collect_results=False` (items were delivered via `on_input_done`).
 
     Notes:
-        - Spawns `min(concurrency, len(inputs))` workers to avoid idle tasks.
+        - Spawns `min(concurrency, len(inputs))` workers to avoid idle tasks (the full
+          `concurrency` when the input count is unknown).
         - Initial and final progress callbacks (0/total and total/total) are emitted
           unless cancellation is already signaled.
         - When `preserve_order` is on, results are compacted from the slot buffer.
     """
     start_t = time.perf_counter()
-    total = len(inputs)
+    known_total = len(inputs) if isinstance(inputs, Sized) else total
+    total = known_total or 0
 
     # Respect a should_cancel provided at config-level first, then fallback.
     composed_should_cancel = config.should_cancel or should_cancel
 
     # Early return when there's nothing to process (still emit a benign progress).
-    if total == 0:
-        cb = config.on_progress
-        event_canceled = cancel_event and cancel_event.is_set()
-        manual_canceled = composed_should_cancel and composed_should_cancel()
-        if cb is not None and not event_canceled and not manual_canceled:
-            with suppress(Exception):
-                cb(0, 0)
+    if known_total == 0:
+        _emit_progress(config.on_progress, 0, 0, cancel_event, composed_should_cancel)
         return []
 
     # Emit initial progress (0 of total) unless already canceled.
-    cb = config.on_progress
-    event_canceled = cancel_event and cancel_event.is_set()
-    manual_canceled = composed_should_cancel and composed_should_cancel()
-    if cb is not None and not event_canceled and not manual_canceled:
-        with suppress(Exception):
-            cb(0, total)
-
-    # Prepare queue, shared result buffers, and optional ordering structures.
+    _emit_progress(config.on_progress, 0, total, cancel_event, composed_should_cancel)
+
+    # Prepare queue, shared result buffers, and optional ordering structures. Longest-first
+    # scheduling swaps in a cost-ordered queue; ordering slots stay in input order.
+    history = (
+        get_domain_latency_history()
+        if settings.worker_pool_schedule == WorkerPoolSchedule.LONGEST_FIRST
+        else None
+    )
+    cost = partial(estimate_cost, history=history) if history is not None else None
     (
         queue,
         results,
         ordered_results,
         url_to_indices,
-    ) = await _prepare_queue_and_ordering(inputs, config)
+    ) = await _prepare_queue_and_ordering(config, cost=cost)
 
     if settings.is_verbose_mode:
         logger.info(MSG_INFO_WORKER_POOL_START.format(enabled=config.take_screenshot))
 
-    # Cap the number of workers to available work (at least one).
-    worker_count = min(config.concurrency, max(1, total))
+    # Short-page batching: more workers so batches can fill; the batcher caps LLM calls.
+    router = _build_router(settings)
+    batcher = _build_batcher(settings, config.concurrency, router)
+    # Process mode: one dispatcher per extraction process replaces the async workers.
+    processes = _process_mode_workers(settings)
+    process_pool = get_extraction_pool(processes) if processes else None
+    screenshots = _build_screenshot_stage(
+        settings, take_screenshot=config.take_screenshot, inline_capture=process_pool is None
+    )
+    slots = config.concurrency * settings.llm_batch_max_items if batcher else config.concurrency
+    if process_pool is not None:
+        slots = processes
+        logger.debug(
+            MSG_DEBUG_POOL_PROCESS_MODE.format(
+                processes=processes, chunk_size=settings.process_pool_chunk_size
+            )
+        )
+
+    # Cap the number of workers to available work (at least one) when it is known.
+    worker_count = slots if known_total is None else min(slots, max(1, total))
 
     # Shared context consumed by workers.
     context = _WorkerContext(
@@ -295,11 +632,18 @@ async def run_worker_pool(
         on_item_processed=config.on_item_processed,
         on_error=config.on_error,
         on_progress=config.on_progress,
+        on_input_done=config.on_input_done,
+        collect_results=config.collect_results,
         cancel_event=cancel_event,
         should_cancel=composed_should_cancel,
         preserve_order=config.preserve_order,
         ordered_results=ordered_results,
         url_to_indices=url_to_indices,
+        batcher=batcher,
+        router=router,
+        screenshots=screenshots,
+        screenshot_paths=config.screenshot_paths,
+        latency_history=history,
     )
 
     # Spawn `worker_count` independent tasks. Each task runs until `queue.join()`.
@@ -310,6 +654,14 @@ async def run_worker_pool(
                 queue=queue,
                 results=results,
                 context=context,
+            )
+            if process_pool is None
+            else process_worker(
+                worker_id=i,
+                queue=queue,
+                results=results,
+                context=context,
+                pool=process_pool,
             ),
             name=f"worker-{i}",
         )
@@ -317,23 +669,39 @@ async def run_worker_pool(
     ]
     logger.debug(MSG_DEBUG_POOL_SPAWNED_WORKERS.format(count=len(workers)))
 
+    feed = _cost_ordered_feed(inputs, cost, context)
+    # The producer runs beside the workers, so a bounded queue applies backpressure
+    # instead of blocking startup.
+    producer = asyncio.create_task(
+        produce_inputs(
+            feed,
+            queue,
+            context=context,
+            count_inputs=known_total is None,
+            register_order=feed is inputs,
+        ),
+        name="worker-pool-producer",
+    )
+
     try:
-        # Wait for the queue to drain, but allow early exit on cancel signals.
-        await _await_join_with_optional_cancel(queue, cancel_event, composed_should_cancel)
+        # Wait for the producer and the queue to drain; allow early exit on cancel signals.
+        await _await_join_with_optional_cancel(
+            queue, cancel_event, composed_should_cancel, producer=producer
+        )
     finally:
-        # Cancel the workers deterministically and wait them out.
+        # Cancel the producer and workers deterministically and wait them out.
         logger.debug(MSG_DEBUG_POOL_CANCELLING_WORKERS)
+        producer.cancel()
         for w in workers:
             w.cancel()
-        await asyncio.gather(*workers, return_exceptions=True)
+        await asyncio.gather(producer, *workers, return_exceptions=True)
+        if batcher is not None:
+            await batcher.aclose()
+        await _close_screenshot_stage(screenshots, cancel_event, composed_should_cancel)
 
     # Emit final progress (total/total) unless we were canceled.
-    cb = config.on_progress
-    event_canceled = cancel_event and cancel_event.is_set()
-    manual_canceled = composed_should_cancel and composed_should_cancel()
-    if cb is not None and not event_canceled and not manual_canceled:
-        with suppress(Exception):
-            cb(total, total)
+    done = context.total_inputs
+    _emit_progress(config.on_progress, done, done, cancel_event, composed_should_cancel)
 
     elapsed = time.perf_counter() - start_t
 
@@ -14,7 +14,9 @@ Public API:
 - `handle_failure`: Uniform failure logging + guarded `on_error`.
 - `log_progress_verbose`: Verbose-only progress logging.
 - `call_progress_callback`: Guarded `on_progress` invocation.
+- `call_input_done_callback`: Guarded per-input `on_input_done` invocation (streaming).
 - `_prepare_queue_and_ordering`: Initialize queue and optional ordering buffers.
+- `produce_inputs`: Producer coroutine feeding inputs (sync or async iterable) into the queue.
 - `place_ordered_result`: Place an item respecting input-order semantics.
 - `_await_join_with_optional_cancel`: Join queue with optional cancel support.
 
@@ -22,6 +24,8 @@ Operational:
 - Concurrency: Functions are designed for use inside multiple async workers.
 - Logging: Uses message constants; verbose mode controls stack traces.
 - Idempotency: Ordering helpers avoid double-inserting results.
+- Backpressure: The producer runs beside the workers, so a bounded queue
+  (`max_queue_size`) throttles intake instead of blocking pool startup.
 
 Usage:
     from agentic_scraper.backend.scraper.worker_pool_helpers import build_request, dequeue_next
@@ -46,7 +50,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections import deque
-from collections.abc import Callable
+from collections.abc import AsyncIterable, Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 from agentic_scraper.backend.config.messages import (
@@ -59,6 +63,7 @@ from agentic_scraper.backend.config.messages import (
     MSG_DEBUG_WORKER_PROGRESS,
     MSG_ERROR_WORKER_FAILED,
     MSG_WARNING_ON_ERROR_CALLBACK_FAILED,
+    MSG_WARNING_ON_INPUT_DONE_FAILED,
     MSG_WARNING_ON_ITEM_PROCESSED_FAILED,
     MSG_WARNING_PROGRESS_CALLBACK_FAILED,
     MSG_WARNING_WORKER_FAILED_SHORT,
@@ -72,8 +77,11 @@ from agentic_scraper.backend.scraper.cancel_helpers import (
 from agentic_scraper.backend.scraper.cancel_helpers import (
     safe_should_cancel as _safe_pred,
 )
+from agentic_scraper.backend.scraper.pool_schedule import CostOrderedQueue
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from agentic_scraper.backend.config.aliases import ScrapeInput
     from agentic_scraper.backend.config.types import OpenAIConfig
     from agentic_scraper.backend.scraper.models import (
@@ -244,7 +252,8 @@ def handle_success_item(
     if context.settings.is_verbose_mode:
         logger.debug(MSG_DEBUG_WORKER_GOT_ITEM.format(worker_id=worker_id, item=item))
     if item is not None:
-        results.append(item)
+        if getattr(context, "collect_results", True):
+            results.append(item)
         logger.debug(MSG_DEBUG_WORKER_ITEM_APPENDED.format(worker_id=worker_id, url=url))
         if context.on_item_processed:
             try:
@@ -332,14 +341,36 @@ def call_progress_callback(
         logger.warning(MSG_WARNING_PROGRESS_CALLBACK_FAILED.format(error=error))
 
 
+def call_input_done_callback(
+    *,
+    context: _WorkerContext,
+    url: str,
+    item: ScrapedItem | None,
+) -> None:
+    """
+    Report a finished input (with its item, or None) via the guarded `on_input_done`.
+
+    Notes:
+        - Called exactly once per dequeued input, including failures and cancellation,
+          so streaming consumers can release reorder-buffer slots.
+    """
+    if context.on_input_done is None:
+        return
+    try:
+        context.on_input_done(url, item)
+    except Exception as error:  # noqa: BLE001 — user callback must never break the pool
+        logger.warning(MSG_WARNING_ON_INPUT_DONE_FAILED.format(error=error))
+
+
 # ───────────────────────────
 # Ordering helpers
 # ───────────────────────────
 
 
 async def _prepare_queue_and_ordering(
-    inputs: list[ScrapeInput],
     config: WorkerPoolConfig,
+    *,
+    cost: Callable[[ScrapeInput], float] | None = None,
 ) -> tuple[
     asyncio.Queue[ScrapeInput],
     list[ScrapedItem],
@@ -350,40 +381,102 @@ async def _prepare_queue_and_ordering(
     Initialize the input queue and optional ordering data structures.
 
     Args:
-        inputs (list[ScrapeInput]): Prepared `(url, text)` inputs.
         config (WorkerPoolConfig): Pool configuration (preserve_order, max_queue_size, ...).
+        cost (Callable[[ScrapeInput], float] | None): When set, workers dequeue the most
+            expensive queued input first (`CostOrderedQueue`); otherwise FIFO.
 
     Returns:
         tuple[queue, results, ordered_results, url_to_indices]:
-            - queue: Work queue seeded with all inputs (bounded if configured).
+            - queue: Empty work queue (bounded if configured); see `produce_inputs`.
             - results: Shared results list (used when ordering is disabled).
-            - ordered_results: Fixed-size list with per-input slots (or None).
+            - ordered_results: Per-input slots, grown by the producer (or None).
             - url_to_indices: Map URL → deque of pending indices (or None).
 
     Notes:
         - We use a `deque[int]` for O(1) pops from the left when placing results by URL.
-        - When `preserve_order` is False, `ordered_results` and `url_to_indices` are None.
+        - When `preserve_order` is False, `ordered_results` and `url_to_indices` are None
+          (also when `collect_results` is False: streaming callers order results themselves).
+        - The queue is not seeded here: putting every input before any worker exists
+          deadlocks as soon as `max_queue_size < len(inputs)`.
     """
     # Build a bounded queue only if max_queue_size is set; 0 means unbounded (Queue default).
-    queue: asyncio.Queue[ScrapeInput] = asyncio.Queue(maxsize=config.max_queue_size or 0)
+    maxsize = config.max_queue_size or 0
+    queue: asyncio.Queue[ScrapeInput] = (
+        CostOrderedQueue(maxsize, cost=cost) if cost else asyncio.Queue(maxsize=maxsize)
+    )
     results: list[ScrapedItem] = []
 
     ordered_results: list[ScrapedItem | None] | None = None
     url_to_indices: dict[str, deque[int]] | None = None
 
-    if config.preserve_order:
-        # Pre-allocate the result slots for deterministic placement by original input order.
-        ordered_results = [None] * len(inputs)
+    if config.preserve_order and config.collect_results:
+        # Slots are registered by the producer in input order, before each put.
+        ordered_results = []
         url_to_indices = {}
-        for idx, (url, _text) in enumerate(inputs):
-            url_to_indices.setdefault(url, deque()).append(idx)
 
-    # Seed the queue (one put per input). We log enqueueing for traceability in verbose/debug flows.
-    for url, text in inputs:
+    return queue, results, ordered_results, url_to_indices
+
+
+async def _iter_inputs(
+    inputs: Iterable[ScrapeInput] | AsyncIterable[ScrapeInput],
+) -> AsyncIterator[ScrapeInput]:
+    """Iterate a sync or async source of inputs uniformly."""
+    if isinstance(inputs, AsyncIterable):
+        async for scrape_input in inputs:
+            yield scrape_input
+    else:
+        for scrape_input in inputs:
+            yield scrape_input
+
+
+async def produce_inputs(
+    inputs: Iterable[ScrapeInput] | AsyncIterable[ScrapeInput],
+    queue: asyncio.Queue[ScrapeInput],
+    *,
+    context: _WorkerContext,
+    count_inputs: bool = False,
+    register_order: bool = True,
+) -> None:
+    """
+    Feed inputs into the work queue while workers drain it.
+
+    Args:
+        inputs (Iterable[ScrapeInput] | AsyncIterable[ScrapeInput]): Input source; may be
+            a lazy async iterator (e.g. pages fetched on the fly).
+        queue (asyncio.Queue[ScrapeInput]): Work queue; `put` blocks while it is full.
+        context (_WorkerContext): Ordering buffers and cancel signals.
+        count_inputs (bool): Grow `context.total_inputs` per input (unknown total).
+        register_order (bool): Register ordering slots per input. Off when the caller
+            registered them up front (`register_order_slots`) and feeds a reordered list.
+
+    Notes:
+        - The ordering slot for an input is registered before it is enqueued, so a
+          worker can always place its result.
+        - Stops early (without raising) once cancellation is signaled.
+    """
+    async for url, text in _iter_inputs(inputs):
+        if (context.cancel_event and context.cancel_event.is_set()) or _safe_should_cancel(
+            context.should_cancel
+        ):
+            return
+        if register_order:
+            _register_order_slot(context, url)
+        if count_inputs:
+            context.total_inputs += 1
         await queue.put((url, text))
         logger.debug(MSG_DEBUG_POOL_ENQUEUED_URL.format(url=url))
 
-    return queue, results, ordered_results, url_to_indices
+
+def _register_order_slot(context: _WorkerContext, url: str) -> None:
+    if context.ordered_results is not None and context.url_to_indices is not None:
+        context.url_to_indices.setdefault(url, deque()).append(len(context.ordered_results))
+        context.ordered_results.append(None)
+
+
+def register_order_slots(context: _WorkerContext, inputs: Iterable[ScrapeInput]) -> None:
+    """Register `preserve_order` slots for `inputs` in their original order."""
+    for url, _text in inputs:
+        _register_order_slot(context, url)
 
 
 async def place_ordered_result(
@@ -465,10 +558,42 @@ async def _poll_cancel_predicate(
         await asyncio.sleep(interval_sec)
 
 
+async def _join_after_producer(
+    queue: asyncio.Queue[ScrapeInput],
+    producer: asyncio.Task[None] | None,
+) -> None:
+    """Wait for the producer to finish (re-raising its error), then for `queue.join()`."""
+    if producer is not None:
+        # `asyncio.wait` neither raises nor propagates our own cancellation into the producer.
+        await asyncio.wait({producer})
+        if not producer.cancelled() and (error := producer.exception()) is not None:
+            raise error
+    await queue.join()
+
+
+async def _stop_producer_and_drain(
+    queue: asyncio.Queue[ScrapeInput],
+    producer: asyncio.Task[None] | None,
+) -> None:
+    """Stop the producer first (so nothing is enqueued afterwards), then empty the queue."""
+    if producer is not None:
+        producer.cancel()
+        await asyncio.wait({producer})
+    while True:
+        try:
+            _ = queue.get_nowait()
+        except asyncio.QueueEmpty:  # noqa: PERF203 - acceptable; avoids racing qsize()
+            break
+        else:
+            queue.task_done()
+
+
 async def _await_join_with_optional_cancel(
     queue: asyncio.Queue[ScrapeInput],
     cancel_event: asyncio.Event | None,
     should_cancel: Callable[[], bool] | None = None,
+    *,
+    producer: asyncio.Task[None] | None = None,
 ) -> None:
     """
     Await `queue.join()`, with optional early cancellation (event and/or predicate).
@@ -477,6 +602,8 @@ async def _await_join_with_optional_cancel(
         queue (asyncio.Queue[ScrapeInput]): Queue whose tasks are being processed.
         cancel_event (asyncio.Event | None): Event-based cancel signal.
         should_cancel (Callable[[], bool] | None): Predicate-based cancel signal.
+        producer (asyncio.Task[None] | None): Task still feeding the queue; the join only
+            counts once it has finished (an empty queue is not "done" before that).
 
     Notes:
         - If a cancel signal arrives before `join()` completes, we drain the queue by
@@ -484,12 +611,16 @@ async def _await_join_with_optional_cancel(
           This avoids deadlocks where workers stop pulling but join still waits.
         - We ensure any auxiliary tasks (cancel-wait/poll) are cancelled and awaited to
           prevent task leaks.
+        - On cancellation the producer is stopped before the drain, so nothing is put
+          back into the queue afterwards.
     """
     if cancel_event is None and not should_cancel:
-        await queue.join()
+        await _join_after_producer(queue, producer)
         return
 
-    join_task: asyncio.Task[Any] = asyncio.create_task(queue.join(), name="queue-join")
+    join_task: asyncio.Task[Any] = asyncio.create_task(
+        _join_after_producer(queue, producer), name="queue-join"
+    )
     waiters: set[asyncio.Task[Any]] = {join_task}
 
     cancel_task: asyncio.Task[Any] | None = None
@@ -507,13 +638,7 @@ async def _await_join_with_optional_cancel(
 
     if join_task not in done:
         # A cancel path finished first: drain outstanding items so `join()` can finish.
-        while True:
-            try:
-                _ = queue.get_nowait()
-            except asyncio.QueueEmpty:  # noqa: PERF203 - acceptable; avoids racing qsize()
-                break
-            else:
-                queue.task_done()
+        await _stop_producer_and_drain(queue, producer)
         await join_task
 
     # Cleanup any still-pending waiters to avoid lingering tasks.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
@@ -10,16 +11,22 @@ from fastapi import status
 # Import route module once at top-level (avoid PLC0415 in tests)
 import agentic_scraper.backend.api.routes.scrape as scrape_routes
 from agentic_scraper import __api_version__ as api_version
+from agentic_scraper.backend.api.routes import scrape_executor, scrape_helpers
+from agentic_scraper.backend.api.routes.scrape_executor import JobExecutor
 from agentic_scraper.backend.api.schemas.scrape import ScrapeJob, ScrapeList
 from agentic_scraper.backend.api.stores import job_store as js
+from agentic_scraper.backend.config.messages import MSG_HTTP_JOB_STILL_STOPPING
 from agentic_scraper.backend.config.types import JobStatus
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     import httpx  # for type hints only
 
 # Always ensure JWKS mock is active (avoid PT019 on each test)
 pytestmark = pytest.mark.usefixtures("_jwks_mock")
 PAGE_SIZE_TWO = 2
+RETRY_AFTER_S = 7
 
 
 def _unique_sub(tag: str) -> str:
@@ -31,6 +38,12 @@ async def _noop(*_args: object, **_kwargs: object) -> None:  # typed, no Any
     return None
 
 
+async def _let_runs_finish() -> None:
+    # Background job tasks only advance when the test yields to the loop.
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
 @pytest.mark.asyncio
 async def test_create_scrape_job_accepted_sets_location_and_body(
     monkeypatch: pytest.MonkeyPatch,
@@ -320,3 +333,128 @@ async def test_scope_enforcement(
         status.HTTP_401_UNAUTHORIZED,
         status.HTTP_403_FORBIDDEN,
     }
+
+
+@pytest.mark.asyncio
+async def test_create_scrape_job_queues_then_rejects_with_retry_after(
+    monkeypatch: pytest.MonkeyPatch,
+    test_client: httpx.AsyncClient,
+    make_jwt: Callable[..., str],
+    api_base: str,
+) -> None:
+    release = asyncio.Event()
+
+    async def _blocked(*_args: object, **_kwargs: object) -> None:
+        await release.wait()
+
+    monkeypatch.setattr(scrape_routes, "_run_scrape_job", _blocked, raising=True)
+    executor = JobExecutor(
+        max_running=1, max_queued=10, max_queued_per_user=1, retry_after_s=RETRY_AFTER_S
+    )
+    monkeypatch.setitem(scrape_executor._EXECUTORS, asyncio.get_running_loop(), executor)  # noqa: SLF001
+
+    sub = _unique_sub("admission")
+    scopes = ["create:scrapes", "read:scrapes"]
+    test_client.headers.update({"Authorization": f"Bearer {make_jwt(sub=sub, scope=scopes)}"})
+
+    body = {"urls": ["https://example.com/queued"]}
+    running = await test_client.post(f"{api_base}/scrapes/", json=body)
+    queued = await test_client.post(f"{api_base}/scrapes/", json=body)
+    rejected = await test_client.post(f"{api_base}/scrapes/", json=body)
+
+    assert running.json()["queue_position"] is None
+    assert queued.json()["queue_position"] == 1
+    assert rejected.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert rejected.headers["Retry-After"] == str(RETRY_AFTER_S)
+
+    queued_id = ScrapeJob.model_validate(queued.json()).id
+    polled = await test_client.get(f"{api_base}/scrapes/{queued_id}")
+    assert polled.json()["queue_position"] == 1
+
+    release.set()
+
+
+@pytest.mark.asyncio
+async def test_resume_scrape_job_requeues_failed_and_restores_lost_jobs(
+    monkeypatch: pytest.MonkeyPatch,
+    test_client: httpx.AsyncClient,
+    make_jwt: Callable[..., str],
+    api_base: str,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(scrape_routes, "_run_scrape_job", _noop, raising=True)
+
+    sub = _unique_sub("resume")
+    scopes = ["create:scrapes", "read:scrapes"]
+    test_client.headers.update({"Authorization": f"Bearer {make_jwt(sub=sub, scope=scopes)}"})
+
+    # Without a checkpoint directory there is nothing to resume from.
+    monkeypatch.setattr(scrape_helpers.settings, "checkpoint_dir", None)
+    res_off = await test_client.post(f"{api_base}/scrapes/{uuid4()}/resume")
+    assert res_off.status_code == status.HTTP_409_CONFLICT
+
+    monkeypatch.setattr(scrape_helpers.settings, "checkpoint_dir", str(tmp_path))
+    r = await test_client.post(
+        f"{api_base}/scrapes/",
+        json={"urls": ["https://example.com/resume-me"]},
+    )
+    jid = str(ScrapeJob.model_validate(r.json()).id)
+    assert (tmp_path / f"{jid}.jsonl").exists()
+
+    res_active = await test_client.post(f"{api_base}/scrapes/{jid}/resume")
+    assert res_active.status_code == status.HTTP_409_CONFLICT
+
+    _ = js.update_job(jid, status=JobStatus.FAILED, error="boom")
+    await _let_runs_finish()  # a job is only resumable once its last run has exited
+    res_failed = await test_client.post(f"{api_base}/scrapes/{jid}/resume")
+    assert res_failed.status_code == status.HTTP_202_ACCEPTED
+    assert res_failed.json()["status"] == JobStatus.QUEUED.value
+
+    # A restart loses the in-memory record; the journal brings the job back.
+    await _let_runs_finish()
+    monkeypatch.delitem(js._STORE, jid)  # noqa: SLF001
+    res_lost = await test_client.post(f"{api_base}/scrapes/{jid}/resume")
+    assert res_lost.status_code == status.HTTP_202_ACCEPTED
+    restored = js.get_job(jid)
+    assert restored is not None
+    assert restored["owner_sub"] == sub
+
+    res_missing = await test_client.post(f"{api_base}/scrapes/{uuid4()}/resume")
+    assert res_missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_resume_waits_for_the_canceled_run_to_exit(
+    monkeypatch: pytest.MonkeyPatch,
+    test_client: httpx.AsyncClient,
+    make_jwt: Callable[..., str],
+    api_base: str,
+    tmp_path: Path,
+) -> None:
+    release = asyncio.Event()
+
+    async def _slow_to_stop(*_args: object, **_kwargs: object) -> None:
+        await release.wait()  # a canceled pipeline still unwinding
+
+    monkeypatch.setattr(scrape_routes, "_run_scrape_job", _slow_to_stop, raising=True)
+    monkeypatch.setattr(scrape_helpers.settings, "checkpoint_dir", str(tmp_path))
+    executor = JobExecutor(
+        max_running=2, max_queued=10, max_queued_per_user=10, retry_after_s=RETRY_AFTER_S
+    )
+    monkeypatch.setitem(scrape_executor._EXECUTORS, asyncio.get_running_loop(), executor)  # noqa: SLF001
+
+    sub = _unique_sub("resume-race")
+    scopes = ["create:scrapes", "read:scrapes"]
+    test_client.headers.update({"Authorization": f"Bearer {make_jwt(sub=sub, scope=scopes)}"})
+    r = await test_client.post(f"{api_base}/scrapes/", json={"urls": ["https://example.com/r"]})
+    jid = str(ScrapeJob.model_validate(r.json()).id)
+    _ = js.update_job(jid, status=JobStatus.CANCELED)
+
+    res_early = await test_client.post(f"{api_base}/scrapes/{jid}/resume")
+    assert res_early.status_code == status.HTTP_409_CONFLICT
+    assert res_early.json()["detail"] == MSG_HTTP_JOB_STILL_STOPPING.format(job_id=jid)
+
+    release.set()
+    await _let_runs_finish()
+    res_late = await test_client.post(f"{api_base}/scrapes/{jid}/resume")
+    assert res_late.status_code == status.HTTP_202_ACCEPTED
@@ -70,6 +70,18 @@ def test_set_canceled_before_register_marks_pre_canceled_and_is_set_after_regist
     assert ev2.is_set() is False
 
 
+def test_register_replaces_an_event_a_previous_run_already_set() -> None:
+    jid = _jid()
+    stale = reg.register_cancel_event(jid)
+    reg.set_canceled(jid)
+
+    fresh = reg.register_cancel_event(jid)  # e.g. resuming a canceled job
+
+    assert fresh is not stale
+    assert fresh.is_set() is False
+    assert reg.get_cancel_event(jid) is fresh
+
+
 def test_set_canceled_after_register_sets_and_returns_true() -> None:
     jid = _jid()
     ev = reg.register_cancel_event(jid)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from agentic_scraper.backend.api.routes import scrape_executor as executor_mod
+from agentic_scraper.backend.api.routes.scrape_executor import (
+    JobAdmissionError,
+    JobExecutor,
+    stop_job_executor,
+)
+from agentic_scraper.backend.api.stores import job_store as js
+from agentic_scraper.backend.config.messages import MSG_JOB_CANCELED_ON_SHUTDOWN
+from agentic_scraper.backend.config.types import JobStatus
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.api.models import OwnerSub
+
+RETRY_AFTER_S = 7
+QUEUE_LIMIT = 2
+
+
+def _executor(**overrides: int) -> JobExecutor:
+    kwargs = {
+        "max_running": 1,
+        "max_queued": QUEUE_LIMIT,
+        "max_queued_per_user": QUEUE_LIMIT,
+        "retry_after_s": RETRY_AFTER_S,
+    }
+    kwargs.update(overrides)
+    return JobExecutor(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_jobs_beyond_running_limit_queue_in_fifo_order() -> None:
+    executor = _executor()
+    release = asyncio.Event()
+    started: list[str] = []
+
+    async def _job(name: str) -> None:
+        started.append(name)
+        await release.wait()
+
+    assert executor.submit("a", "u1", lambda: _job("a")) is None
+    assert executor.submit("b", "u1", lambda: _job("b")) == 1
+    assert executor.submit("c", "u2", lambda: _job("c")) == QUEUE_LIMIT
+    await asyncio.sleep(0)
+
+    assert started == ["a"]
+    assert (executor.running, executor.queued) == (1, QUEUE_LIMIT)
+    assert executor.position("c") == QUEUE_LIMIT
+
+    release.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert started == ["a", "b", "c"]
+    assert (executor.running, executor.queued) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_admission_limits_and_discard() -> None:
+    executor = _executor(max_queued_per_user=1)
+    release = asyncio.Event()
+
+    async def _job() -> None:
+        await release.wait()
+
+    executor.admit("u1")  # free slot: always admitted
+    executor.submit("a", "u1", _job)
+    executor.admit("u1")
+    executor.submit("b", "u1", _job)
+
+    with pytest.raises(JobAdmissionError) as per_user:
+        executor.admit("u1")
+    assert per_user.value.per_user is True
+    assert per_user.value.retry_after_s == RETRY_AFTER_S
+
+    executor.submit("c", "u2", _job)
+    with pytest.raises(JobAdmissionError) as full:
+        executor.admit("u3")
+    assert full.value.per_user is False
+
+    # A canceled queued job frees its owner's quota and never starts.
+    assert executor.discard("b") is True
+    assert executor.discard("b") is False
+    assert executor.position("c") == 1
+    executor.admit("u1")
+
+    release.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert (executor.running, executor.queued) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_job_stays_active_until_its_task_finishes() -> None:
+    executor = _executor()
+    release = asyncio.Event()
+
+    async def _job() -> None:
+        await release.wait()
+
+    executor.submit("a", "u1", _job)
+    executor.submit("b", "u1", _job)
+    assert (executor.is_active("a"), executor.is_active("b")) == (True, True)
+    assert executor.is_active("c") is False
+
+    release.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert (executor.is_active("a"), executor.is_active("b")) == (False, False)
+
+
+@pytest.mark.asyncio
+async def test_stop_marks_dropped_queued_jobs_canceled() -> None:
+    executor = _executor()
+    executor_mod._EXECUTORS[asyncio.get_running_loop()] = executor  # noqa: SLF001
+    owner = cast("OwnerSub", "auth0|user123")
+    running = js.create_job({"n": 1}, owner)
+    waiting = js.create_job({"n": 2}, owner)
+    js.update_job(running["id"], status=JobStatus.RUNNING)
+    release = asyncio.Event()
+
+    async def _job() -> None:
+        await release.wait()
+
+    executor.submit(running["id"], owner, _job)
+    executor.submit(waiting["id"], owner, _job)
+    await asyncio.sleep(0)
+
+    stop_job_executor()
+
+    dropped = js.get_job(waiting["id"])
+    assert dropped is not None
+    assert dropped["status"] is JobStatus.CANCELED
+    assert dropped["error"] == MSG_JOB_CANCELED_ON_SHUTDOWN.format(job_id=waiting["id"])
+    still_running = js.get_job(running["id"])
+    assert still_running is not None
+    assert still_running["status"] is JobStatus.RUNNING
+    assert executor.queued == 0
+
+    release.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert executor.running == 0
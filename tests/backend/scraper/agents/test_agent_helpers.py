@@ -45,7 +45,7 @@ async def test_capture_optional_screenshot_success(
 ) -> None:
     settings.screenshot_dir = str(tmp_path)
 
-    async def _fake_capture(url: str, *, output_dir: Path) -> str:
+    async def _fake_capture(url: str, *, output_dir: Path, **_options: object) -> str:
         _ = (url, output_dir)
         return (tmp_path / "ok.png").as_posix()
 
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from agentic_scraper.backend.scraper.agents import agent_helpers as ah
+from agentic_scraper.backend.scraper.agents.json_repair import TolerantJSONParser, loads_tolerant
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("```json\n{'url': 'https://x', 'title': 'T',}\n```", {"url": "https://x", "title": "T"}),
+        ("{title: 'Bob's shop', price: 12,}", {"title": "Bob's shop", "price": 12}),
+        ('Sure! Here it is: {"tags": ["a", "b",], "ok": True}', {"tags": ["a", "b"], "ok": True}),
+        ('{"q": "say \\"hi\\" \\u00e9", "n": null}', {"q": 'say "hi" é', "n": None}),
+        ('{"a": "x"\n"b": 1}', {"a": "x", "b": 1}),
+        ('{"desc": "line one\nline two"}', {"desc": "line one\nline two"}),
+        ("no json at all", None),
+    ],
+)
+def test_loads_tolerant_repairs_common_artifacts(text: str, expected: Any) -> None:  # noqa: ANN401
+    assert loads_tolerant(text) == expected
+
+
+def test_truncated_output_keeps_completed_fields() -> None:
+    parser = TolerantJSONParser(
+        '{"title": "Widget", "price": 9.5, "items": [{"a": 1}, {"a": 2, "b": "cut'
+    )
+
+    assert parser.parse() == {"title": "Widget", "price": 9.5, "items": [{"a": 1}, {"a": 2}]}
+    assert parser.truncated
+
+
+def test_parse_llm_response_recovers_truncated_object(settings: Settings) -> None:
+    content = '{"title": "Widget", "description": "A very long description that was cu'
+
+    parsed = ah.parse_llm_response(content, url="https://x", settings=settings)
+
+    assert parsed == {"title": "Widget"}
+
+
+def test_parse_llm_response_keeps_apostrophes(settings: Settings) -> None:
+    parsed = ah.parse_llm_response(
+        "{'title': 'Bob's Burgers', 'author': 'O'Neil'}", url="https://x", settings=settings
+    )
+
+    assert parsed == {"title": "Bob's Burgers", "author": "O'Neil"}
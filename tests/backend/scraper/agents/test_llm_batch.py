@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.config.types import AgentMode, OpenAIConfig
+from agentic_scraper.backend.scraper.agents import llm_batch as lb
+from agentic_scraper.backend.scraper.models import ScrapeRequest
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+
+EXPECTED_TWO = 2
+EXPECTED_THREE = 3
+
+
+# ------------------------------- fakes -------------------------------- #
+
+
+class _Msg:
+    def __init__(self, content: str | None) -> None:
+        self.content = content
+
+
+class _Choice:
+    def __init__(self, content: str | None) -> None:
+        self.message = _Msg(content)
+
+
+class _Response:
+    def __init__(self, content: str | None) -> None:
+        self.choices: list[_Choice] = [_Choice(content)]
+
+
+def _install_fake_client(
+    monkeypatch: pytest.MonkeyPatch,
+    content: str | None,
+    prompts: list[str],
+) -> None:
+    class _Completions:
+        async def create(
+            self,
+            *,
+            model: str,
+            messages: list[dict[str, object]],
+            temperature: float,
+            max_tokens: int,
+        ) -> _Response:
+            _ = (model, temperature, max_tokens)
+            prompts.append(str(messages[0]["content"]))
+            return _Response(content)
+
+    class _Chat:
+        def __init__(self) -> None:
+            self.completions = _Completions()
+
+    class _Client:
+        def __init__(self, *, api_key: str | None, project: str | None) -> None:
+            _ = (api_key, project)
+            self.chat = _Chat()
+
+    monkeypatch.setattr(lb, "AsyncOpenAI", _Client, raising=True)
+
+
+def _mk_request(url: str, text: str = "short page text") -> ScrapeRequest:
+    cfg = OpenAIConfig(api_key="sk-test", project_id="proj-test")
+    return ScrapeRequest(url=url, text=text, take_screenshot=False, openai=cfg)
+
+
+def _item(url: str) -> ScrapedItem:
+    return ScrapedItem(
+        url=url,
+        title="single",
+        description=None,
+        price=None,
+        author=None,
+        date_published=None,
+    )
+
+
+# -------------------------------- tests ------------------------------- #
+
+
+def test_estimate_tokens_rounds_up() -> None:
+    assert lb.estimate_tokens("") == 0
+    assert lb.estimate_tokens("abcde") == EXPECTED_TWO
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_splits_reply_by_url(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.agent_mode = AgentMode.LLM_DYNAMIC
+    reply = {
+        "items": [
+            {"url": "https://b.test/", "page_type": "blog", "title": "B"},
+            {"url": "https://a.test", "page_type": "product", "title": "A"},
+        ]
+    }
+    prompts: list[str] = []
+    _install_fake_client(monkeypatch, json.dumps(reply), prompts)
+
+    reqs = [
+        _mk_request("https://a.test"),
+        _mk_request("https://b.test"),
+        _mk_request("https://c.test"),
+    ]
+    out = await lb.extract_batch(reqs, settings=settings)
+
+    assert len(prompts) == 1
+    assert all(r.url in prompts[0] for r in reqs)
+    a, b = out["https://a.test"], out["https://b.test"]
+    assert a is not None
+    assert a.title == "A"
+    assert b is not None
+    assert b.url == "https://b.test"
+    # Page missing from the reply is reported as None (caller falls back).
+    assert out["https://c.test"] is None
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_accepts_bare_array(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.agent_mode = AgentMode.LLM_FIXED
+    reply = [{"url": "https://a.test", "title": "A", "price": 3.5}]
+    _install_fake_client(monkeypatch, json.dumps(reply), [])
+
+    out = await lb.extract_batch([_mk_request("https://a.test")], settings=settings)
+    item = out["https://a.test"]
+    assert item is not None
+    assert item.price == pytest.approx(3.5)
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_short_pages_and_falls_back(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.llm_batch_max_items = 3
+    calls: list[list[str]] = []
+
+    async def fake_extract_batch(
+        requests: list[ScrapeRequest], *, settings: Settings
+    ) -> dict[str, ScrapedItem | None]:
+        _ = settings
+        calls.append([r.url for r in requests])
+        # Second page "fails validation" inside the batch.
+        return {r.url: (None if r.url.endswith("/1") else _item(r.url)) for r in requests}
+
+    monkeypatch.setattr(lb, "extract_batch", fake_extract_batch, raising=True)
+
+    singles: list[str] = []
+
+    async def fallback(req: ScrapeRequest) -> ScrapedItem:
+        singles.append(req.url)
+        return _item(req.url)
+
+    batcher = lb.ShortPageBatcher(settings=settings, fallback=fallback, max_calls=2)
+    reqs = [_mk_request(f"https://x.test/{i}") for i in range(3)]
+    out = await asyncio.gather(*(batcher.extract(r) for r in reqs))
+    await batcher.aclose()
+
+    assert calls == [[r.url for r in reqs]]
+    assert singles == ["https://x.test/1"]
+    assert [o.url for o in out if o is not None] == [r.url for r in reqs]
+    assert batcher.counters.batches == 1
+    assert batcher.counters.batched_pages == EXPECTED_THREE
+    assert batcher.counters.fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_batcher_captures_screenshots_after_releasing_the_call_slot(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.llm_batch_max_items = 2
+
+    async def fake_extract_batch(
+        requests: list[ScrapeRequest], *, settings: Settings
+    ) -> dict[str, ScrapedItem | None]:
+        _ = settings
+        return {r.url: _item(r.url) for r in requests}
+
+    slot_free_during_capture: list[bool] = []
+
+    async def fake_capture(url: str, settings: Settings) -> str:
+        _ = settings
+        slot_free_during_capture.append(not batcher._call_slots.locked())  # noqa: SLF001
+        return f"shots/{url.rsplit('/', 1)[-1]}.png"
+
+    async def fallback(req: ScrapeRequest) -> ScrapedItem:
+        return _item(req.url)
+
+    monkeypatch.setattr(lb, "extract_batch", fake_extract_batch, raising=True)
+    monkeypatch.setattr(lb, "capture_optional_screenshot", fake_capture, raising=True)
+    batcher = lb.ShortPageBatcher(settings=settings, fallback=fallback, max_calls=1)
+    reqs = [
+        _mk_request(f"https://x.test/{i}").model_copy(update={"take_screenshot": True})
+        for i in range(2)
+    ]
+    out = await asyncio.gather(*(batcher.extract(r) for r in reqs))
+    await batcher.aclose()
+
+    assert [o.screenshot_path for o in out if o is not None] == ["shots/0.png", "shots/1.png"]
+    assert slot_free_during_capture == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_batcher_sends_long_pages_alone(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.llm_batch_page_max_tokens = 16
+
+    async def _should_not_batch(*args: object, **kwargs: object) -> None:
+        _ = (args, kwargs)
+        msg = "long pages must not be batched"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(lb, "extract_batch", _should_not_batch, raising=True)
+
+    async def fallback(req: ScrapeRequest) -> ScrapedItem:
+        return _item(req.url)
+
+    batcher = lb.ShortPageBatcher(settings=settings, fallback=fallback, max_calls=1)
+    item = await batcher.extract(_mk_request("https://long.test", "x" * 200))
+    await batcher.aclose()
+
+    assert item is not None
+    assert batcher.counters.single_calls == 1
+    assert batcher.counters.batches == 0
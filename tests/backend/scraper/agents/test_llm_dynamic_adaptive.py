@@ -176,3 +176,27 @@ async def test_adaptive_handles_openai_exception(
     out = await lda.extract_adaptive_data(req, settings=settings)
     assert out is None
     assert handled == ["_BoomError"]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_records_fallback_model(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    content = '{"url":"https://ok","title":"T","price":9.5,"description":"D"}'
+    fallback = "gpt-4o-fallback"
+
+    async def _fake_completion(*_args: object, **_kwargs: object) -> tuple[_Response, str]:
+        return _Response(content), fallback
+
+    def _factory(*, api_key: str | None, project: str | None) -> _FakeAsyncClient:
+        return _FakeAsyncClient(api_key=api_key, project=project, content=None)
+
+    monkeypatch.setattr(lda, "AsyncOpenAI", _factory, raising=True)
+    monkeypatch.setattr(lda, "create_chat_completion", _fake_completion, raising=True)
+    monkeypatch.setattr(lda, "retrieve_openai_credentials", lambda _cfg: ("k", "p"), raising=True)
+
+    out = await lda.extract_adaptive_data(_mk_request("https://ok", "<p>x</p>"), settings=settings)
+
+    assert out is not None
+    assert out.llm_model == fallback
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from agentic_scraper.backend.config.constants import LLM_ENDPOINT_PLACEHOLDER_API_KEY
+from agentic_scraper.backend.config.types import AgentMode, OpenAIConfig
+from agentic_scraper.backend.scraper.agents import llm_endpoint as le
+from agentic_scraper.backend.scraper.agents import llm_fixed
+from agentic_scraper.backend.scraper.models import ScrapeRequest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from agentic_scraper.backend.core.settings import Settings
+
+LOCAL_URL = "http://localhost:8000/v1"
+LOCAL_MODEL = "llama-3.1-8b-instruct"
+SLOT_LIMIT = 2
+SLOT_TASKS = 6
+
+
+# ------------------------------- resolution -------------------------------- #
+
+
+def test_resolve_endpoint_public_and_default_base_url(settings: Settings) -> None:
+    public = le.resolve_endpoint(OpenAIConfig(api_key="sk-x", project_id="p"), settings)
+    assert (public.base_url, public.label) == (None, "openai")
+    assert "base_url" not in public.client_kwargs()
+
+    cfg = settings.model_copy(
+        update={"openai_base_url": LOCAL_URL + "/", "openai_model_override": LOCAL_MODEL}
+    )
+    local = le.resolve_endpoint(None, cfg)  # keyless local server: no creds needed
+    assert local == le.LLMEndpoint(
+        api_key=LLM_ENDPOINT_PLACEHOLDER_API_KEY, base_url=LOCAL_URL, model=LOCAL_MODEL
+    )
+    assert local.client_kwargs()["base_url"] == LOCAL_URL
+
+
+def test_resolve_endpoint_per_job_allow_list_and_model_precedence(settings: Settings) -> None:
+    job = OpenAIConfig(base_url="http://gpu-box:8080/v1", model="qwen2.5")
+    with pytest.raises(ValueError, match="not allowed"):
+        le.resolve_endpoint(job, settings)
+
+    cfg = settings.model_copy(
+        update={
+            "llm_allowed_base_urls": f"{LOCAL_URL}, http://gpu-box:8080/v1/",
+            "openai_model_override": LOCAL_MODEL,
+        }
+    )
+    endpoint = le.resolve_endpoint(job, cfg)
+    assert (endpoint.base_url, endpoint.model) == ("http://gpu-box:8080/v1", "qwen2.5")
+
+
+@pytest.mark.asyncio
+async def test_endpoint_slot_caps_in_flight_requests(settings: Settings) -> None:
+    cfg = settings.model_copy(update={"llm_endpoint_concurrency": SLOT_LIMIT})
+    in_flight = peak = 0
+
+    async def call() -> None:
+        nonlocal in_flight, peak
+        async with le.endpoint_slot(LOCAL_URL, cfg):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+    await asyncio.gather(*(call() for _ in range(SLOT_TASKS)))
+    assert peak == SLOT_LIMIT
+
+
+# ------------------------- local stand-in server -------------------------- #
+
+
+class _OpenAICompatHandler(BaseHTTPRequestHandler):
+    """Minimal vLLM/llama.cpp-style server: `/v1/models` and `/v1/chat/completions`."""
+
+    seen_models: list[str] = []  # noqa: RUF012 - shared across handler instances
+
+    def _send(self, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path != "/v1/models":
+            self.send_error(404)
+            return
+        self._send({"object": "list", "data": [{"id": LOCAL_MODEL, "object": "model"}]})
+
+    def do_POST(self) -> None:
+        if self.path != "/v1/chat/completions":
+            self.send_error(404)
+            return
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.seen_models.append(request["model"])
+        content = json.dumps({"title": "Local Widget", "price": 9.5})
+        self._send(
+            {
+                "id": "chatcmpl-local",
+                "object": "chat.completion",
+                "created": 0,
+                "model": request["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+            }
+        )
+
+    def log_message(self, *_: object) -> None:
+        return
+
+
+@pytest.fixture
+def local_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OpenAICompatHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _OpenAICompatHandler.seen_models.clear()
+    le._HEALTH_CACHE.clear()  # noqa: SLF001
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_llm_fixed_against_local_openai_compatible_server(
+    settings: Settings, local_server: str
+) -> None:
+    cfg = settings.model_copy(
+        update={
+            "agent_mode": AgentMode.LLM_FIXED,
+            "openai_base_url": local_server,
+            "openai_model_override": LOCAL_MODEL,
+            "llm_endpoint_concurrency": SLOT_LIMIT,
+        }
+    )
+    await le.ensure_endpoint_healthy(None, cfg)
+
+    request = ScrapeRequest(url="https://shop.test/widget", text="Local Widget costs $9.50")
+    item = await llm_fixed.extract_structured_data(request, settings=cfg)
+
+    assert item is not None
+    assert (item.title, item.price) == ("Local Widget", 9.5)
+    assert _OpenAICompatHandler.seen_models == [LOCAL_MODEL]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_unhealthy_endpoint_fails_fast(settings: Settings, local_server: str) -> None:
+    cfg = settings.model_copy(update={"openai_base_url": local_server + "/missing"})
+    with pytest.raises(le.LLMEndpointUnavailableError):
+        await le.ensure_endpoint_healthy(None, cfg)
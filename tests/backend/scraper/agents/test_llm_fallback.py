@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+import httpx
+import openai
+import pytest
+
+from agentic_scraper.backend.scraper.agents import llm_fallback as fb
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from agentic_scraper.backend.core.settings import Settings
+
+_REQ = httpx.Request("POST", "https://api.test/v1/chat/completions")
+
+
+def _response(status: int) -> Any:  # noqa: ANN401
+    # openai may annotate `response` against its own httpx build; the runtime type matches.
+    return cast("Any", httpx.Response(status, request=_REQ))
+
+
+def _rate_limited() -> openai.RateLimitError:
+    return openai.RateLimitError("slow down", response=_response(429), body=None)
+
+
+def _bad_request() -> openai.BadRequestError:
+    return openai.BadRequestError("bad", response=_response(400), body=None)
+
+
+class _Client:
+    """Stub client whose `create` fails for models listed in `failing`."""
+
+    def __init__(self, failing: dict[str, Exception], calls: list[str]) -> None:
+        self.failing = failing
+        self.calls = calls
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, *, model: str, **_: Any) -> str:  # noqa: ANN401
+        self.calls.append(model)
+        if model in self.failing:
+            raise self.failing[model]
+        return f"reply from {model}"
+
+
+@pytest.fixture(autouse=True)
+def _clean_breakers() -> Iterator[None]:
+    fb.reset_circuit_breakers()
+    yield
+    fb.reset_circuit_breakers()
+
+
+def _chain_settings(settings: Settings, chain: str) -> Settings:
+    return settings.model_copy(
+        update={
+            "llm_fallback_chain": chain,
+            "llm_circuit_failure_threshold": 1,
+            "llm_circuit_cooldown_s": 60.0,
+        }
+    )
+
+
+def test_parse_fallback_chain() -> None:
+    assert fb.parse_fallback_chain(" gpt-4o , ,gpt-3.5-turbo-16k@BACKUP_KEY") == (
+        fb.FallbackTarget("gpt-4o"),
+        fb.FallbackTarget("gpt-3.5-turbo-16k", "BACKUP_KEY"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_fails_over_and_skips_open_circuit(settings: Settings) -> None:
+    cfg = _chain_settings(settings, "gpt-4o")
+    primary = str(cfg.openai_model.value)
+    calls: list[str] = []
+    client = _Client({primary: _rate_limited()}, calls)
+
+    first, model = await fb.create_chat_completion(
+        client, settings=cfg, make_client=lambda _k: client, messages=[], max_tokens=10
+    )
+    assert (first, model) == ("reply from gpt-4o", "gpt-4o")
+
+    # Primary breaker is now open: the next call goes straight to the fallback.
+    calls.clear()
+    await fb.create_chat_completion(
+        client, settings=cfg, make_client=lambda _k: client, messages=[], max_tokens=10
+    )
+    assert calls == ["gpt-4o"]
+
+
+@pytest.mark.asyncio
+async def test_alternate_credentials_and_request_errors(
+    settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _chain_settings(settings, "gpt-4o@BACKUP_KEY")
+    primary = str(cfg.openai_model.value)
+    monkeypatch.setenv("BACKUP_KEY", "sk-backup")
+    calls: list[str] = []
+    keys: list[str] = []
+    backup = _Client({}, calls)
+
+    def make_client(key: str) -> _Client:
+        keys.append(key)
+        return backup
+
+    _, model = await fb.create_chat_completion(
+        _Client({primary: _rate_limited()}, calls),
+        settings=cfg,
+        make_client=make_client,
+        messages=[],
+        max_tokens=10,
+    )
+    assert (model, keys) == ("gpt-4o", ["sk-backup"])
+
+    # 4xx errors are the caller's fault: no failover.
+    fb.reset_circuit_breakers()
+    with pytest.raises(openai.BadRequestError):
+        await fb.create_chat_completion(
+            _Client({primary: _bad_request()}, calls),
+            settings=cfg,
+            make_client=make_client,
+            messages=[],
+            max_tokens=10,
+        )
+
+
+@pytest.mark.asyncio
+async def test_breakers_are_scoped_per_api_key(settings: Settings) -> None:
+    cfg = _chain_settings(settings, "gpt-4o")
+    primary = str(cfg.openai_model.value)
+    calls: list[str] = []
+    throttled = _Client({primary: _rate_limited()}, calls)
+    throttled.api_key = "sk-user-a"  # type: ignore[attr-defined]
+    healthy = _Client({}, calls)
+    healthy.api_key = "sk-user-b"  # type: ignore[attr-defined]
+
+    await fb.create_chat_completion(
+        throttled, settings=cfg, make_client=lambda _k: throttled, messages=[], max_tokens=10
+    )
+
+    # User A's quota problem opened A's breaker only: user B still starts on the primary.
+    calls.clear()
+    _, model = await fb.create_chat_completion(
+        healthy, settings=cfg, make_client=lambda _k: healthy, messages=[], max_tokens=10
+    )
+    assert (model, calls) == (primary, [primary])
+
+
+@pytest.mark.asyncio
+async def test_entry_with_unset_key_variable_is_skipped(
+    settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _chain_settings(settings, "gpt-4o@UNSET_BACKUP_KEY")
+    primary = str(cfg.openai_model.value)
+    monkeypatch.delenv("UNSET_BACKUP_KEY", raising=False)
+    calls: list[str] = []
+    client = _Client({primary: _rate_limited()}, calls)
+
+    with pytest.raises(openai.RateLimitError):
+        await fb.create_chat_completion(
+            client, settings=cfg, make_client=lambda _k: client, messages=[], max_tokens=10
+        )
+    assert calls == [primary]  # never sent to gpt-4o with the primary credentials
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.config.constants import LLM_HEDGE_MIN_SAMPLES
+from agentic_scraper.backend.scraper.agents import llm_hedge
+from agentic_scraper.backend.scraper.agents.llm_hedge import (
+    hedge_stats_scope,
+    hedged_call,
+    reset_latency_windows,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from agentic_scraper.backend.core.settings import Settings
+
+KEY = "gpt-test"
+TYPICAL_S = 0.01
+STUCK_S = 5.0
+TIMEOUT_S = 0.05
+
+
+@pytest.fixture(autouse=True)
+def _clean_windows() -> Iterator[None]:
+    reset_latency_windows()
+    yield
+    reset_latency_windows()
+
+
+def _warm_up(seconds: float = TYPICAL_S) -> None:
+    window = llm_hedge._WINDOWS.setdefault(KEY, llm_hedge._LatencyWindow())  # noqa: SLF001
+    for _ in range(LLM_HEDGE_MIN_SAMPLES):
+        window.add(seconds)
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_loser_cancelled(settings: Settings) -> None:
+    settings.llm_hedge_enabled = True
+    _warm_up()
+    delays = [STUCK_S, 0.0]
+    cancelled: list[bool] = []
+
+    async def _call() -> str:
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return f"slept {delay}"
+
+    with hedge_stats_scope() as stats:
+        result = await hedged_call(_call, key=KEY, settings=settings)
+
+    assert result == "slept 0.0"
+    assert cancelled == [True]  # the stuck primary does not linger
+    assert (stats.hedges, stats.wins) == (1, 1)
+    assert stats.as_stats()["num_llm_hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_before_warm_up_and_timeout_applies(settings: Settings) -> None:
+    settings.llm_hedge_enabled = True
+    settings.llm_timeout_s = TIMEOUT_S
+    calls: list[int] = []
+
+    async def _stuck() -> None:
+        calls.append(1)
+        await asyncio.sleep(STUCK_S)
+
+    with hedge_stats_scope() as stats, pytest.raises(asyncio.TimeoutError):
+        await hedged_call(_stuck, key=KEY, settings=settings)
+
+    assert calls == [1]  # too few samples recorded: no duplicate request
+    assert stats.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_time_queued_for_slot_does_not_trigger_hedge(settings: Settings) -> None:
+    settings.llm_hedge_enabled = True
+    _warm_up()
+    slots = asyncio.Semaphore(1)
+    calls: list[int] = []
+
+    async def _fast() -> str:
+        calls.append(1)
+        return "ok"
+
+    await slots.acquire()  # another request holds the only slot for a while
+    asyncio.get_running_loop().call_later(TYPICAL_S * 10, slots.release)
+    with hedge_stats_scope() as stats:
+        result = await hedged_call(_fast, key=KEY, settings=settings, slot=lambda: slots)
+
+    assert result == "ok"
+    assert calls == [1]
+    assert stats.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_when_its_slot_would_queue(settings: Settings) -> None:
+    settings.llm_hedge_enabled = True
+    _warm_up()
+    slots = asyncio.Semaphore(1)
+    calls: list[int] = []
+
+    async def _slow() -> str:
+        calls.append(1)
+        await asyncio.sleep(TYPICAL_S * 5)
+        return "primary"
+
+    with hedge_stats_scope() as stats:
+        result = await hedged_call(_slow, key=KEY, settings=settings, slot=lambda: slots)
+
+    assert result == "primary"
+    assert calls == [1]  # the primary holds the only slot: no hedge was sent
+    assert stats.hedges == 0
+    assert not slots.locked()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import agentic_scraper.backend.scraper.agents as agents_mod
+from agentic_scraper.backend.config.constants import MODEL_ROUTING_MIN_SAMPLES
+from agentic_scraper.backend.config.types import AgentMode, OpenAIModel
+from agentic_scraper.backend.scraper.agents.agent_helpers import note_invalid_output
+from agentic_scraper.backend.scraper.agents.model_router import ModelRouter
+from agentic_scraper.backend.scraper.models import ScrapeRequest
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+
+LONG_PAGE_TOKENS = 300
+
+
+def _routing_settings(settings: Settings) -> Settings:
+    return settings.model_copy(
+        update={
+            "agent_mode": AgentMode.LLM_FIXED,
+            "openai_model": OpenAIModel.GPT_3_5,
+            "model_routing_enabled": True,
+            "model_routing_long_model": OpenAIModel.GPT_3_5_16K,
+            "model_routing_escalation_model": OpenAIModel.GPT_4O,
+            "model_routing_long_page_tokens": LONG_PAGE_TOKENS,
+        }
+    )
+
+
+def _request(url: str = "https://shop.test/product/1", chars: int = 100) -> ScrapeRequest:
+    return ScrapeRequest(url=url, text="x" * chars)
+
+
+def test_choose_default_long_page_and_failure_rate(settings: Settings) -> None:
+    router = ModelRouter(_routing_settings(settings))
+
+    short = router.choose(_request())
+    assert (short.model, short.reason, short.page_type) == (
+        OpenAIModel.GPT_3_5,
+        "default",
+        "product",
+    )
+
+    long_page = router.choose(_request(chars=LONG_PAGE_TOKENS * 4))
+    assert (long_page.model, long_page.reason) == (OpenAIModel.GPT_3_5_16K, "long_page")
+
+    for _ in range(MODEL_ROUTING_MIN_SAMPLES):
+        router.record(OpenAIModel.GPT_3_5, "product", ok=False)
+    escalated = router.choose(_request())
+    assert (escalated.model, escalated.reason) == (OpenAIModel.GPT_4O, "failure_rate")
+
+    # Other page types keep the cheap default.
+    assert router.choose(_request(url="https://news.test/blog/1")).model == OpenAIModel.GPT_3_5
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_escalates_after_failure_and_records_model(
+    settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _routing_settings(settings)
+    seen: list[OpenAIModel] = []
+
+    async def fake_fixed(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem | None:
+        seen.append(settings.openai_model)
+        if settings.openai_model == OpenAIModel.GPT_3_5:
+            note_invalid_output()  # e.g. validation failure on the cheap model
+            return None
+        return ScrapedItem(url=req.url, title="ok")
+
+    monkeypatch.setitem(agents_mod.AGENT_DISPATCH, AgentMode.LLM_FIXED, fake_fixed)
+    router = ModelRouter(cfg)
+
+    item = await agents_mod.extract_structured_data(_request(), settings=cfg, router=router)
+
+    assert seen == [OpenAIModel.GPT_3_5, OpenAIModel.GPT_4O]
+    assert item is not None
+    assert item.llm_model == OpenAIModel.GPT_4O.value
+    assert router.failure_rate(OpenAIModel.GPT_3_5, "product") is None  # too few samples
+
+
+@pytest.mark.asyncio
+async def test_provider_failure_is_not_escalated(
+    settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _routing_settings(settings)
+    seen: list[OpenAIModel] = []
+
+    async def fake_fixed(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem | None:
+        _ = req
+        seen.append(settings.openai_model)
+        return None  # e.g. every fallback target timed out
+
+    monkeypatch.setitem(agents_mod.AGENT_DISPATCH, AgentMode.LLM_FIXED, fake_fixed)
+    router = ModelRouter(cfg)
+
+    for _ in range(MODEL_ROUTING_MIN_SAMPLES):
+        item = await agents_mod.extract_structured_data(_request(), settings=cfg, router=router)
+        assert item is None
+
+    assert seen == [OpenAIModel.GPT_3_5] * MODEL_ROUTING_MIN_SAMPLES
+    assert router.failure_rate(OpenAIModel.GPT_3_5, "product") is None  # not counted
+
+
+@pytest.mark.asyncio
+async def test_low_score_item_is_escalated_and_better_item_kept(
+    settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = _routing_settings(settings)
+
+    async def fake_fixed(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem | None:
+        if settings.openai_model == OpenAIModel.GPT_3_5:
+            return ScrapedItem(url=req.url, date_published="2024-01-01")  # valid but sparse
+        return ScrapedItem(url=req.url, title="Widget", price=9.5)
+
+    monkeypatch.setitem(agents_mod.AGENT_DISPATCH, AgentMode.LLM_FIXED, fake_fixed)
+    router = ModelRouter(cfg)
+
+    item = await agents_mod.extract_structured_data(_request(), settings=cfg, router=router)
+
+    assert item is not None
+    assert (item.title, item.llm_model) == ("Widget", OpenAIModel.GPT_4O.value)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+from agentic_scraper.backend.config.constants import (
+    DESCRIPTION_MAX_LENGTH,
+    DESCRIPTION_MIN_LENGTH,
+)
+from agentic_scraper.backend.scraper.agents import rule_based as rb
+from agentic_scraper.backend.scraper.agents import rule_engine as re_engine
+
+GOOD_DESC = "x" * ((DESCRIPTION_MIN_LENGTH + DESCRIPTION_MAX_LENGTH) // 2)
+SHORT_DESC = "x" * (DESCRIPTION_MIN_LENGTH - 1)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Price: $12.50", 12.5),
+        ("Only EUR: 19,99 €", 19.99),
+        ("Preis: 1.234,99 €", 1234.99),
+        ("Cena: 1\u00a0234,56 zł", 1234.56),
+        ("Cena: 1\u202f234,56 zł", 1234.56),
+        ("Sale $49 100% cotton shirt", 49.0),
+        ("Only $20 3 days left", 20.0),
+        ("Now £1,250.00!", 1250.0),
+        ("US$ 3,000.50 incl. tax", 3000.5),
+        ("CHF 49.90", 49.9),
+        ("₹ 2,499", 2499.0),
+        ("Total 12.99 USD", 12.99),
+        ("Price: $12x34", None),
+        ("Top 10 products of 2024", None),
+    ],
+)
+def test_prices_across_currencies_and_locales(text: str, expected: float | None) -> None:
+    assert re_engine.extract_fields(text).price == expected
+
+
+def test_extract_fields_matches_legacy_helpers_on_typical_page() -> None:
+    text = f"\n  My Product  \n\n{SHORT_DESC}\n\n{GOOD_DESC}\nPrice: $12.5\n\nFooter"
+    fields = re_engine.extract_fields(text)
+
+    assert fields.title == rb.guess_title(text) == "My Product"
+    assert fields.description == rb.guess_description(text) == GOOD_DESC
+    assert fields.price == rb.guess_price(text)
+
+
+def test_extract_fields_empty_text() -> None:
+    fields = re_engine.extract_fields("   \n\n")
+    assert fields.is_empty
+
+
+def test_batch_and_parallel_preserve_order() -> None:
+    texts = [f"Item {i}\n\n${i}.99" for i in range(5)]
+    batch = re_engine.extract_fields_batch(texts)
+    parallel = re_engine.extract_fields_parallel(texts, max_workers=2)
+
+    assert batch == parallel
+    assert [f.title for f in batch] == [f"Item {i}" for i in range(5)]
+    assert [f.price for f in batch] == [pytest.approx(i + 0.99) for i in range(5)]
+
+
+def test_extract_items_batch_returns_none_for_empty_pages() -> None:
+    items = re_engine.extract_items_batch(
+        [("https://a.test", "Title\n\n$5"), ("https://b.test", "")]
+    )
+
+    first, second = items
+    assert first is not None
+    assert first.url == "https://a.test"
+    assert first.price == pytest.approx(5.0)
+    assert second is None
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING, Self
+
+import pytest
+
+from agentic_scraper.backend.scraper import browser_pool as bp
+from agentic_scraper.backend.scraper import screenshotter
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from agentic_scraper.backend.core.settings import Settings
+
+MAX_PAGES = 2
+RECYCLE_AFTER = 3
+NUM_PAGES = 6
+
+
+# -------------------- minimal async Playwright fakes -------------------- #
+class _Stats:
+    def __init__(self) -> None:
+        self.open_contexts = 0
+        self.peak_contexts = 0
+        self.launches = 0
+        self.closed_browsers = 0
+        self.driver_stopped = False
+
+
+class _FakePage:
+    async def goto(self, _url: str, *, wait_until: str, timeout: int) -> None:
+        _ = (wait_until, timeout)
+        await asyncio.sleep(0)
+
+    async def screenshot(self, *, path: Path, full_page: bool) -> None:
+        _ = full_page
+        path.write_bytes(b"\x89PNG\r\n")  # noqa: ASYNC240 - tiny fake write
+
+
+class _FakeContext:
+    def __init__(self, stats: _Stats) -> None:
+        self.stats = stats
+        stats.open_contexts += 1
+        stats.peak_contexts = max(stats.peak_contexts, stats.open_contexts)
+
+    async def new_page(self) -> _FakePage:
+        return _FakePage()
+
+    async def close(self) -> None:
+        self.stats.open_contexts -= 1
+
+
+class _FakeBrowser:
+    def __init__(self, stats: _Stats) -> None:
+        self.stats = stats
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def new_context(self, *, viewport: dict[str, int]) -> _FakeContext:
+        _ = viewport
+        return _FakeContext(self.stats)
+
+    async def close(self) -> None:
+        self.stats.closed_browsers += 1
+
+
+class _FakeChromium:
+    def __init__(self, stats: _Stats) -> None:
+        self.stats = stats
+
+    async def launch(self, *, headless: bool) -> _FakeBrowser:
+        _ = headless
+        self.stats.launches += 1
+        return _FakeBrowser(self.stats)
+
+
+class _FakePlaywrightCtx:
+    def __init__(self, stats: _Stats) -> None:
+        self.stats = stats
+        self.chromium = _FakeChromium(stats)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        _ = (exc_type, exc, tb)
+        self.stats.driver_stopped = True
+
+
+@pytest.fixture
+def stats(monkeypatch: pytest.MonkeyPatch) -> _Stats:
+    s = _Stats()
+    monkeypatch.setattr(bp, "async_playwright", lambda: _FakePlaywrightCtx(s), raising=True)
+    return s
+
+
+# --------------------------------- tests -------------------------------- #
+@pytest.mark.asyncio
+async def test_pool_bounds_pages_and_recycles_browsers(stats: _Stats) -> None:
+    pool = bp.BrowserPool(size=1, max_pages=MAX_PAGES, recycle_after=RECYCLE_AFTER)
+    assert stats.launches == 0  # lazy: nothing launched until the first page
+
+    async def use() -> None:
+        async with pool.page() as page:
+            await page.goto("https://example.com", wait_until="load", timeout=1)
+
+    await asyncio.gather(*(use() for _ in range(NUM_PAGES)))
+
+    assert stats.peak_contexts == MAX_PAGES
+    assert stats.open_contexts == 0
+    assert stats.launches == NUM_PAGES // RECYCLE_AFTER
+    assert pool.recycled == stats.closed_browsers == NUM_PAGES // RECYCLE_AFTER
+
+    await pool.close()
+    assert stats.driver_stopped is True
+    with pytest.raises(RuntimeError):
+        async with pool.page():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_capture_screenshot_uses_session_pool(
+    stats: _Stats, settings: Settings, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def _no_per_call_launch() -> None:
+        msg = "per-call browser launched"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(screenshotter, "async_playwright", _no_per_call_launch, raising=True)
+    cfg = settings.model_copy(update={"screenshot_enabled": True, "browser_pool_enabled": True})
+
+    async with bp.browser_pool_session(cfg) as pool:
+        assert pool is not None
+        assert bp.get_browser_pool() is pool
+        paths = await asyncio.gather(
+            screenshotter.capture_screenshot("https://example.com/a", tmp_path),
+            screenshotter.capture_screenshot("https://example.com/b", tmp_path),
+        )
+
+    assert all(p and Path(p).exists() for p in paths)  # noqa: ASYNC240
+    assert stats.launches == 1
+    assert stats.driver_stopped is True
+    assert bp.get_browser_pool() is None
+
+
+@pytest.mark.asyncio
+async def test_session_disabled_yields_none(settings: Settings) -> None:
+    cfg = settings.model_copy(update={"screenshot_enabled": True, "browser_pool_enabled": False})
+    async with bp.browser_pool_session(cfg) as pool:
+        assert pool is None
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from agentic_scraper.backend.config.constants import (
+    BULK_ENDPOINT,
+    BULK_MANIFEST_FILENAME,
+    BULK_REQUESTS_FILENAME,
+)
+from agentic_scraper.backend.config.types import AgentMode, BulkJobState, OpenAIConfig
+from agentic_scraper.backend.scraper import bulk_extract as be
+from agentic_scraper.backend.scraper.agents.llm_endpoint import resolve_endpoint
+from agentic_scraper.backend.scraper.bulk_backends import LocalFileBulkBackend, OpenAIBulkBackend
+from agentic_scraper.backend.scraper.pipeline import scrape_urls_bulk
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from agentic_scraper.backend.core.settings import Settings
+
+EXPECTED_TWO = 2
+LOCAL_URL = "http://localhost:8000/v1"
+LOCAL_MODEL = "llama-3.1-8b-instruct"
+EXPECTED_THREE = 3
+
+
+def _title_responder(body: dict[str, Any]) -> str:
+    """Echo a title derived from the prompt; fail for pages mentioning 'broken'."""
+    prompt = str(body["messages"][-1]["content"])
+    if "broken" in prompt:
+        msg = "upstream error"
+        raise RuntimeError(msg)
+    return json.dumps({"title": "Bulk title", "page_type": "blog"})
+
+
+def test_build_request_lines_uses_mode_prompts(settings: Settings) -> None:
+    settings.agent_mode = AgentMode.LLM_FIXED
+    lines, manifest = be.build_bulk_request_lines(
+        [("https://a.test", "alpha"), ("https://a.test", "again")], settings=settings
+    )
+
+    assert manifest == {"req-0": "https://a.test", "req-1": "https://a.test"}
+    assert lines[0]["url"] == BULK_ENDPOINT
+    messages = lines[0]["body"]["messages"]
+    assert messages[0]["role"] == "system"
+    assert messages[1]["content"] == "alpha"
+
+    settings.agent_mode = AgentMode.LLM_DYNAMIC
+    lines, _ = be.build_bulk_request_lines([("https://b.test", "beta")], settings=settings)
+    (message,) = lines[0]["body"]["messages"]
+    assert "https://b.test" in message["content"]
+
+
+def test_bulk_model_and_backend_follow_endpoint_resolution(settings: Settings) -> None:
+    settings.agent_mode = AgentMode.LLM_FIXED
+    cfg = settings.model_copy(
+        update={"openai_base_url": LOCAL_URL, "openai_model_override": LOCAL_MODEL}
+    )
+
+    lines, _ = be.build_bulk_request_lines([("https://a.test", "x")], settings=cfg)
+    assert lines[0]["body"]["model"] == LOCAL_MODEL
+
+    job = OpenAIConfig(model="qwen2.5")
+    lines, _ = be.build_bulk_request_lines([("https://a.test", "x")], settings=cfg, openai=job)
+    assert lines[0]["body"]["model"] == "qwen2.5"
+
+    backend = OpenAIBulkBackend.from_endpoint(resolve_endpoint(job, cfg))
+    assert str(backend.client.base_url).rstrip("/") == LOCAL_URL
+
+
+def test_build_request_lines_rejects_rule_based(settings: Settings) -> None:
+    settings.agent_mode = AgentMode.RULE_BASED
+    with pytest.raises(ValueError, match="LLM agent mode"):
+        be.build_bulk_request_lines([("https://a.test", "x")], settings=settings)
+
+
+@pytest.mark.asyncio
+async def test_run_bulk_extraction_with_local_backend(settings: Settings, tmp_path: Path) -> None:
+    settings.agent_mode = AgentMode.LLM_DYNAMIC
+    settings.bulk_poll_interval_s = 0.01
+    backend = LocalFileBulkBackend(work_dir=tmp_path / "backend", responder=_title_responder)
+    job_dir = tmp_path / "job"
+
+    items = await be.run_bulk_extraction(
+        [
+            ("https://ok.test/1", "first page"),
+            ("https://bad.test", "broken page"),
+            ("https://ok.test/2", "second page"),
+        ],
+        settings=settings,
+        backend=backend,
+        job_dir=job_dir,
+    )
+
+    assert [i.url for i in items] == ["https://ok.test/1", "https://ok.test/2"]
+    assert all(i.title == "Bulk title" for i in items)
+    manifest = json.loads((job_dir / BULK_MANIFEST_FILENAME).read_text("utf-8"))
+    assert manifest["req-1"] == "https://bad.test"
+    assert len((job_dir / BULK_REQUESTS_FILENAME).read_text("utf-8").splitlines()) == EXPECTED_THREE
+
+
+def test_merge_ignores_unknown_custom_ids(settings: Settings) -> None:
+    settings.agent_mode = AgentMode.LLM_FIXED
+    results: list[dict[str, Any]] = [
+        {"custom_id": "req-9", "response": None, "error": None},
+        {
+            "custom_id": "req-0",
+            "response": {
+                "status_code": 200,
+                "body": {"choices": [{"message": {"content": '{"title": "T"}'}}]},
+            },
+            "error": None,
+        },
+    ]
+    items = be.merge_bulk_results(results, {"req-0": "https://a.test"}, settings=settings)
+    assert [i.title for i in items] == ["T"]
+
+
+@pytest.mark.asyncio
+async def test_run_bulk_extraction_raises_on_failed_job(settings: Settings, tmp_path: Path) -> None:
+    settings.agent_mode = AgentMode.LLM_FIXED
+
+    class _FailingBackend:
+        async def submit(self, requests_path: Path) -> str:
+            _ = requests_path
+            return "batch-1"
+
+        async def status(self, batch_id: str) -> BulkJobState:
+            _ = batch_id
+            return BulkJobState.FAILED
+
+        async def results(self, batch_id: str) -> list[dict[str, Any]]:
+            _ = batch_id
+            return []
+
+    with pytest.raises(RuntimeError, match="batch-1"):
+        await be.run_bulk_extraction(
+            [("https://a.test", "x")],
+            settings=settings,
+            backend=_FailingBackend(),
+            job_dir=tmp_path,
+        )
+
+
+@pytest.mark.asyncio
+async def test_scrape_urls_bulk_uses_fetched_pages(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+    tmp_path: Path,
+) -> None:
+    settings.agent_mode = AgentMode.LLM_FIXED
+    settings.bulk_work_dir = str(tmp_path / "bulk")
+
+    async def fake_fetch_all(
+        urls: list[str], settings: Settings, concurrency: int, cancel: object
+    ) -> dict[str, str]:
+        _ = (settings, concurrency, cancel)
+        return {u: f"<p>{u}</p>" for u in urls}
+
+    monkeypatch.setattr(
+        "agentic_scraper.backend.scraper.pipeline.fetch_all", fake_fetch_all, raising=True
+    )
+
+    backend = LocalFileBulkBackend(work_dir=tmp_path / "backend", responder=_title_responder)
+    items = await scrape_urls_bulk(["https://a.test", "https://b.test"], settings, backend=backend)
+
+    assert len(items) == EXPECTED_TWO
+    assert {i.url for i in items} == {"https://a.test", "https://b.test"}
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from agentic_scraper.backend.scraper.checkpoint import CheckpointJournal, read_checkpoint_meta
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DONE = "https://c.test/done"
+FAILED = "https://c.test/failed"
+TODO = "https://c.test/todo"
+
+
+def test_journal_reloads_outcomes_and_survives_a_torn_last_line(tmp_path: Path) -> None:
+    path = tmp_path / "job.jsonl"
+    with CheckpointJournal(path, resume=False) as journal:
+        journal.write_meta(owner_sub="auth0|u1")
+        journal.record_item(ScrapedItem(url=DONE, title="Done"))
+        journal.record_failure(FAILED, "TimeoutError: ")
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"type": "item", "url": "https://c.test/to')  # killed mid-write
+
+    with CheckpointJournal(path, resume=True) as journal:
+        assert journal.pending([DONE, FAILED, TODO, TODO]) == [TODO]
+        assert journal.resumed_items([TODO, DONE])[0]["title"] == "Done"
+        journal.record_item(ScrapedItem(url=TODO))  # appended after the torn line
+
+    with CheckpointJournal(path, resume=True, retry_failed=True) as journal:
+        assert journal.pending([DONE, FAILED, TODO]) == [FAILED]
+    assert read_checkpoint_meta(path) == {"owner_sub": "auth0|u1"}
+
+
+def test_fresh_journal_truncates_and_missing_meta_is_none(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "run.jsonl"
+    assert read_checkpoint_meta(path) is None
+
+    with CheckpointJournal(path, resume=False) as journal:
+        journal.record_item(ScrapedItem(url=DONE))
+    with CheckpointJournal(path, resume=False) as journal:
+        assert journal.pending([DONE]) == [DONE]
+    assert path.read_text(encoding="utf-8") == ""
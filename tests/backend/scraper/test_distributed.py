@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.scraper import distributed
+from agentic_scraper.backend.scraper.distributed import collect_batch, enqueue_batch, run_worker
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+from agentic_scraper.backend.scraper.work_queue import SQLiteWorkQueue
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from agentic_scraper.backend.core.settings import Settings
+
+URLS = [f"https://d.test/{i}" for i in range(5)]
+BROKEN = URLS[4]
+CHUNK_SIZE = 2
+NUM_WORKERS = 2
+POLL_S = 0.01
+
+
+@pytest.mark.asyncio
+async def test_workers_drain_batch_and_coordinator_collects(
+    settings: Settings, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings.work_queue_chunk_size = CHUNK_SIZE
+    settings.work_queue_max_attempts = 2
+    settings.work_queue_poll_interval_s = POLL_S
+    calls: list[list[str]] = []
+
+    async def _fake_scrape_urls(
+        urls: list[str], settings: Settings, openai: object = None
+    ) -> list[ScrapedItem]:
+        _ = (settings, openai)
+        calls.append(urls)
+        await asyncio.sleep(0)
+        if BROKEN in urls:
+            raise RuntimeError(BROKEN)
+        return [ScrapedItem(url=url, title=url[-1]) for url in urls]
+
+    monkeypatch.setattr(distributed, "scrape_urls", _fake_scrape_urls)
+    queue = SQLiteWorkQueue(
+        tmp_path / "q.sqlite3",
+        lease_s=settings.work_queue_lease_s,
+        max_attempts=settings.work_queue_max_attempts,
+    )
+
+    batch_id = await enqueue_batch(queue, [*URLS, URLS[0]], settings=settings)
+    completed = await asyncio.gather(
+        *(
+            run_worker(queue, settings=settings, worker_id=f"w{i}", exit_when_idle=True)
+            for i in range(NUM_WORKERS)
+        )
+    )
+    items, stats = await collect_batch(queue, batch_id, settings=settings)
+
+    assert sum(completed) == stats["num_chunks"] - 1
+    assert [item.url for item in items] == URLS[:4]  # chunk order, duplicate dropped
+    assert calls.count([BROKEN]) == settings.work_queue_max_attempts
+    assert stats["num_failed_chunks"] == 1
+    assert stats["num_failed_chunk_urls"] == 1
+    assert stats["num_unfinished_chunks"] == 0
+
+
+@pytest.mark.asyncio
+async def test_collect_batch_stops_when_workers_are_gone(
+    settings: Settings, tmp_path: Path
+) -> None:
+    settings.work_queue_poll_interval_s = POLL_S
+    queue = SQLiteWorkQueue(tmp_path / "q.sqlite3", lease_s=1.0, max_attempts=1)
+    batch_id = await enqueue_batch(queue, URLS, settings=settings)
+
+    items, stats = await collect_batch(queue, batch_id, settings=settings, should_stop=lambda: True)
+
+    assert items == []
+    assert stats["num_unfinished_chunks"] == stats["num_chunks"]
+
+
+@pytest.mark.asyncio
+async def test_batch_scoped_worker_ignores_stale_batches(
+    settings: Settings, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings.work_queue_poll_interval_s = POLL_S
+    scraped: list[str] = []
+
+    async def _fake_scrape_urls(
+        urls: list[str], settings: Settings, openai: object = None
+    ) -> list[ScrapedItem]:
+        _ = (settings, openai)
+        scraped.extend(urls)
+        return [ScrapedItem(url=url) for url in urls]
+
+    monkeypatch.setattr(distributed, "scrape_urls", _fake_scrape_urls)
+    queue = SQLiteWorkQueue(tmp_path / "q.sqlite3", lease_s=1.0, max_attempts=1)
+    await enqueue_batch(queue, ["https://stale.test/left-behind"], settings=settings)
+    batch_id = await enqueue_batch(queue, URLS, settings=settings)
+
+    completed = await asyncio.wait_for(
+        run_worker(queue, settings=settings, exit_when_idle=True, batch_id=batch_id),
+        timeout=5,
+    )
+    items, stats = await collect_batch(queue, batch_id, settings=settings)
+
+    assert completed == stats["num_chunks"]
+    assert scraped == URLS
+    assert [item.url for item in items] == URLS
@@ -10,10 +10,13 @@ import pytest
 from agentic_scraper.backend.config.constants import FETCH_ERROR_PREFIX
 from agentic_scraper.backend.core.settings import Settings
 from agentic_scraper.backend.scraper.cancel_helpers import CancelToken
-from agentic_scraper.backend.scraper.fetcher import fetch_all, fetch_url
+from agentic_scraper.backend.scraper.fetcher import fetch_all, fetch_stream, fetch_url
+from agentic_scraper.backend.scraper.memory_budget import MemoryBudget
 
 TEST_FERNET_KEY = "A" * 43 + "="
 EXPECTED_RETRY_ATTEMPTS = 2  # avoid magic number in assertions
+STUCK_S = 5.0
+CANCEL_AFTER_S = 0.02
 
 
 def _settings(**overrides: object) -> Settings:
@@ -185,6 +188,36 @@ async def test_fetch_all_honors_cancel_and_marks_entries() -> None:
     assert "canceled" in out["https://x.test/"]
 
 
+@pytest.mark.asyncio
+async def test_fetch_all_cancels_in_flight_request_when_event_is_set() -> None:
+    settings = _settings(request_timeout=STUCK_S)
+    cancel_event = asyncio.Event()
+    aborted: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        try:
+            await asyncio.sleep(STUCK_S)  # a hung server
+        except asyncio.CancelledError:
+            aborted.append(str(request.url))
+            raise
+        return httpx.Response(200, text="<late/>", request=request)
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(CANCEL_AFTER_S, cancel_event.set)
+    started = loop.time()
+    out = await fetch_all(
+        ["https://hung.test/"],
+        settings=settings,
+        concurrency=1,
+        cancel=CancelToken(event=cancel_event),
+        client_factory=_factory_with_transport(httpx.MockTransport(handler)),
+    )
+
+    assert loop.time() - started < STUCK_S / 2
+    assert aborted == ["https://hung.test/"]
+    assert out["https://hung.test/"].startswith(FETCH_ERROR_PREFIX)
+
+
 @pytest.mark.asyncio
 async def test_fetch_all_concurrency_nonpositive_is_clamped() -> None:
     """If a caller passes 0/negative, we still fetch using a minimum of 1."""
@@ -204,3 +237,32 @@ async def test_fetch_all_concurrency_nonpositive_is_clamped() -> None:
         "https://t.test/1": "<ok/>",
         "https://t.test/2": "<ok/>",
     }
+
+
+@pytest.mark.asyncio
+async def test_fetch_stream_yields_each_url_once_and_charges_budget() -> None:
+    settings = _settings()
+    data = {"https://a.test/": "<a>aaaa</a>", "https://b.test/": "<b/>"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if url not in data:
+            return httpx.Response(404, request=request)
+        return httpx.Response(200, text=data[url], request=request)
+
+    budget = MemoryBudget(1)  # full after any page: the next fetch waits for a release
+    got: dict[str, str] = {}
+    async for url, html in fetch_stream(
+        [*data, "https://a.test/", "https://missing.test/"],
+        settings=settings,
+        concurrency=1,
+        budget=budget,
+        client_factory=_factory_with_transport(httpx.MockTransport(handler)),
+    ):
+        assert url not in got
+        got[url] = html
+        budget.release(url)  # consumer is done with the page
+
+    assert {u: got[u] for u in data} == data
+    assert got["https://missing.test/"].startswith(FETCH_ERROR_PREFIX)
+    assert budget.peak == max(len(html) for html in data.values())
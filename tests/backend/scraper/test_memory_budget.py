@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agentic_scraper.backend.scraper.memory_budget import MemoryBudget, pack_text, unpack_text
+
+LIMIT = 100
+PAGE = 60
+
+
+@pytest.mark.asyncio
+async def test_wait_for_room_blocks_until_release_and_tracks_peak() -> None:
+    budget = MemoryBudget(LIMIT)
+    await budget.wait_for_room()  # empty budget: immediate
+    budget.charge("a", PAGE)
+    await budget.wait_for_room()  # below the limit: a page may still start
+    budget.charge("b", PAGE)
+
+    waiter = asyncio.create_task(budget.wait_for_room())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    budget.charge("a", -PAGE // 2)  # shrinking a charge (e.g. compression) counts too
+    budget.release("b")
+    await asyncio.wait_for(waiter, timeout=1)
+    assert (budget.held, budget.peak) == (PAGE // 2, 2 * PAGE)
+
+    budget.release("a")
+    budget.release("unknown")
+    assert budget.held == 0
+
+
+def test_pack_text_round_trips_and_compresses() -> None:
+    text = "Product description. " * 200 + "ünïcödé"
+    packed = pack_text(text, compress=True)
+    assert isinstance(packed, bytes)
+    assert len(packed) < len(text)
+    assert unpack_text(packed) == text
+    assert pack_text(text, compress=False) is text
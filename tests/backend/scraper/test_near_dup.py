@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.config.types import AgentMode
+from agentic_scraper.backend.scraper import near_dup as nd
+from agentic_scraper.backend.scraper.pipeline import scrape_iter, scrape_with_stats
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.models import WorkerPoolConfig
+
+EXPECTED_THREE = 3
+MAX_DISTANCE = 3
+
+_ARTICLE = (
+    "The quarterly report shows revenue growth across all regions with strong "
+    "demand for cloud services and a steady increase in subscription renewals "
+    "while operating costs remained flat compared with the previous year and "
+    "management expects similar momentum in the coming quarters"
+)
+
+
+def test_simhash_is_stable_and_tolerates_small_edits() -> None:
+    base = nd.simhash(_ARTICLE)
+    edited = nd.simhash(_ARTICLE + " Page 2 of 3")
+    other = nd.simhash(" ".join(reversed(_ARTICLE.split())) + " unrelated words entirely")
+
+    assert base is not None
+    assert edited is not None
+    assert other is not None
+    assert base == nd.simhash(_ARTICLE)
+    assert nd.hamming_distance(base, edited) < nd.hamming_distance(base, other)
+
+
+def test_simhash_skips_short_texts() -> None:
+    assert nd.simhash("Page not found") is None
+
+
+def test_plan_clusters_and_expands_with_own_urls() -> None:
+    inputs = [
+        ("https://a.test/1", _ARTICLE),
+        ("https://a.test/2", _ARTICLE),
+        ("https://b.test", "short text"),
+    ]
+    plan = nd.plan_near_duplicates(inputs, max_distance=MAX_DISTANCE)
+
+    assert [u for u, _ in plan.representatives] == ["https://a.test/1", "https://b.test"]
+    assert plan.duplicates == {"https://a.test/2": "https://a.test/1"}
+
+    rep = ScrapedItem(url="https://a.test/1", title="Report")
+    expanded = plan.expand([rep])
+    assert [(i.url, i.title) for i in expanded] == [
+        ("https://a.test/1", "Report"),
+        ("https://a.test/2", "Report"),
+    ]
+
+
+def test_index_reuses_results_across_jobs(tmp_path: Path) -> None:
+    path = tmp_path / "index.json"
+    first = nd.plan_near_duplicates(
+        [("https://a.test", _ARTICLE)], max_distance=MAX_DISTANCE, index=nd.NearDupIndex.load(path)
+    )
+    first.remember([ScrapedItem(url="https://a.test", title="Report")], nd.NearDupIndex.load(path))
+
+    second = nd.plan_near_duplicates(
+        [("https://mirror.test", _ARTICLE)],
+        max_distance=MAX_DISTANCE,
+        index=nd.NearDupIndex.load(path),
+    )
+    assert second.representatives == []
+    (item,) = second.expand([])
+    assert item.url == "https://mirror.test"
+    assert item.title == "Report"
+
+
+def test_banded_lookup_matches_linear_scan() -> None:
+    rng = random.Random(7)  # noqa: S311 - deterministic test data
+    stored = [rng.getrandbits(64) for _ in range(500)]
+    # Probes within and beyond the threshold of some stored fingerprint.
+    probes = [fp ^ (1 << rng.randrange(64)) ^ (1 << rng.randrange(64)) for fp in stored[:50]]
+    probes += [fp ^ rng.getrandbits(64) for fp in stored[50:100]]
+    index = nd.NearDupIndex(path=Path("unused.json"))
+    for fp in stored:
+        index.add(fp, {"fp": fp})
+
+    for probe in probes:
+        distances = [nd.hamming_distance(fp, probe) for fp in stored]
+        best = min(distances)
+        hit = index.lookup(probe, MAX_DISTANCE)
+        if best > MAX_DISTANCE:
+            assert hit is None
+        else:
+            assert hit is not None
+            assert hit[1] == best
+
+
+def test_owner_index_path_scopes_per_owner(tmp_path: Path) -> None:
+    base = tmp_path / "index.json"
+
+    assert nd.owner_index_path(base, None) == base
+    alice, bob = nd.owner_index_path(base, "auth0|alice"), nd.owner_index_path(base, "auth0|bob")
+    assert alice != bob
+    assert alice.parent == base.parent
+    assert alice.suffix == ".json"
+
+
+def test_index_load_tolerates_corrupt_file(tmp_path: Path) -> None:
+    path = tmp_path / "index.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert nd.NearDupIndex.load(path).entries == []
+
+
+@pytest.mark.asyncio
+async def test_scrape_with_stats_reports_near_dup_reuse(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.agent_mode = AgentMode.RULE_BASED
+    settings.near_dup_enabled = True
+    urls = ["https://a.test/en", "https://a.test/en-gb", "https://a.test/en-us"]
+    pool_inputs: list[str] = []
+
+    async def fake_fetch_all(
+        urls: list[str], settings: Settings, concurrency: int, cancel: object
+    ) -> dict[str, str]:
+        _ = (settings, concurrency, cancel)
+        return dict.fromkeys(urls, "<html/>")
+
+    async def fake_run_worker_pool(
+        *,
+        inputs: list[tuple[str, str]],
+        settings: Settings,
+        config: object,
+        cancel_event: object,
+        should_cancel: object,
+        **_extra: object,
+    ) -> list[ScrapedItem]:
+        _ = (settings, config, cancel_event, should_cancel)
+        pool_inputs.extend(u for u, _t in inputs)
+        return [ScrapedItem(url=u, title="Same") for u, _t in inputs]
+
+    prefix = "agentic_scraper.backend.scraper.pipeline"
+    monkeypatch.setattr(f"{prefix}.fetch_all", fake_fetch_all, raising=True)
+    monkeypatch.setattr(f"{prefix}.extract_main_text", lambda _html: _ARTICLE, raising=True)
+    monkeypatch.setattr(f"{prefix}.run_worker_pool", fake_run_worker_pool, raising=True)
+
+    items, stats = await scrape_with_stats(urls, settings=settings)
+
+    assert pool_inputs == ["https://a.test/en"]
+    assert sorted(i.url for i in items) == sorted(urls)
+    assert stats["num_success"] == EXPECTED_THREE
+    assert stats["num_near_dup_reused"] == EXPECTED_THREE - 1
+
+
+@pytest.mark.asyncio
+async def test_ordered_scrape_iter_keeps_near_dup_copies_in_input_order(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.agent_mode = AgentMode.RULE_BASED
+    settings.near_dup_enabled = True
+    urls = ["https://a.test/en", "https://a.test/en-gb", "https://b.test/other"]
+    other = " ".join(reversed(_ARTICLE.split())) + " unrelated words entirely"
+
+    async def fake_fetch_all(
+        urls: list[str], settings: Settings, concurrency: int, cancel: object
+    ) -> dict[str, str]:
+        _ = (settings, concurrency, cancel)
+        return {url: url for url in urls}
+
+    async def fake_run_worker_pool(
+        *,
+        inputs: list[tuple[str, str]],
+        settings: Settings,
+        config: WorkerPoolConfig,
+        cancel_event: object,
+        should_cancel: object,
+        **_extra: object,
+    ) -> list[ScrapedItem]:
+        _ = (settings, cancel_event, should_cancel)
+        assert config.on_input_done is not None
+        for url, _text in reversed(inputs):  # finish in reverse input order
+            config.on_input_done(url, ScrapedItem(url=url, title="T"))
+        return []
+
+    prefix = "agentic_scraper.backend.scraper.pipeline"
+    monkeypatch.setattr(f"{prefix}.fetch_all", fake_fetch_all, raising=True)
+    monkeypatch.setattr(
+        f"{prefix}.extract_main_text",
+        lambda html: _ARTICLE if "a.test" in html else other,
+        raising=True,
+    )
+    monkeypatch.setattr(f"{prefix}.run_worker_pool", fake_run_worker_pool, raising=True)
+
+    out = [str(item.url) async for item in scrape_iter(urls, settings, ordered=True)]
+
+    assert out == urls
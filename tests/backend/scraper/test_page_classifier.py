@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.config.types import AgentMode, PageRejectReason
+from agentic_scraper.backend.scraper import page_classifier as pc
+from agentic_scraper.backend.scraper.pipeline import PipelineOptions, scrape_with_stats
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+
+MIN_CHARS = 50
+_ARTICLE = "A long and useful article about gardening tools and soil. " * 40
+
+
+@pytest.mark.parametrize(
+    ("html", "text", "expected"),
+    [
+        ("<title>Page Not Found</title>", "Sorry, nothing here.", PageRejectReason.SOFT_404),
+        (
+            "<title>Shop</title>",
+            "Oops! Page not found. Try the homepage.",
+            PageRejectReason.SOFT_404,
+        ),
+        ("<title>404</title>", "Sorry, nothing here.", PageRejectReason.SOFT_404),
+        # A bare "error" title is not a soft 404 (e.g. "Error handling in Python").
+        (
+            "<title>Error handling in Python</title>",
+            "Use try/except blocks to catch exceptions where they can be handled.",
+            None,
+        ),
+        ("<title>Account</title>", "Please sign in to continue.", PageRejectReason.LOGIN_WALL),
+        (
+            "<title>Just a moment...</title>",
+            "Checking your browser before accessing the site.",
+            PageRejectReason.BOT_CHALLENGE,
+        ),
+        ("<title>Blog</title>", "Hi", PageRejectReason.THIN_CONTENT),
+        ("<title>Blog</title>", _ARTICLE, None),
+        # Long pages that merely mention an error phrase are kept.
+        ("<title>Blog</title>", _ARTICLE + " The page not found error is common.", None),
+        # Title rules are gated on text length too.
+        ("<title>Page not found: a guide</title>", _ARTICLE, None),
+        ("<title>Fixing 404 errors</title>", _ARTICLE, None),
+    ],
+)
+def test_classify_page(html: str, text: str, expected: PageRejectReason | None) -> None:
+    assert pc.classify_page(html, text, min_text_chars=MIN_CHARS) == expected
+
+
+def test_classify_pages_flags_host_wide_templates() -> None:
+    template = "We looked everywhere but this item is gone. Browse our catalogue instead."
+    pages = [(f"https://shop.test/p/{i}", "<title>Shop</title>", template) for i in range(3)]
+    pages.append(("https://other.test/p/1", "<title>Shop</title>", template))
+    pages.append(("https://shop.test/about", "<title>About</title>", _ARTICLE))
+
+    rejected = pc.classify_pages(pages, min_text_chars=MIN_CHARS)
+
+    assert rejected == {
+        f"https://shop.test/p/{i}": PageRejectReason.DUPLICATE_TEMPLATE for i in range(3)
+    }
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_rejected_pages_and_reports_reason(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.agent_mode = AgentMode.RULE_BASED
+    settings.page_classifier_enabled = True
+    settings.page_min_text_chars = MIN_CHARS
+    pages = {
+        "https://ok.test": f"<title>Ok</title><p>{_ARTICLE}</p>",
+        "https://gone.test": "<title>404 Not Found</title><p>Nothing here</p>",
+    }
+    pool_inputs: list[str] = []
+    errors: list[tuple[str, PageRejectReason]] = []
+
+    async def fake_fetch_all(
+        urls: list[str], settings: Settings, concurrency: int, cancel: object
+    ) -> dict[str, str]:
+        _ = (settings, concurrency, cancel)
+        return {u: pages[u] for u in urls}
+
+    async def fake_run_worker_pool(
+        *,
+        inputs: list[tuple[str, str]],
+        settings: Settings,
+        config: object,
+        cancel_event: object,
+        should_cancel: object,
+        **_extra: object,
+    ) -> list[ScrapedItem]:
+        _ = (settings, config, cancel_event, should_cancel)
+        pool_inputs.extend(u for u, _t in inputs)
+        return [ScrapedItem(url=u) for u, _t in inputs]
+
+    class Hooks:
+        def on_error(self, url: str, exc: Exception) -> None:
+            assert isinstance(exc, pc.PageRejectedError)
+            errors.append((url, exc.reason))
+
+    prefix = "agentic_scraper.backend.scraper.pipeline"
+    monkeypatch.setattr(f"{prefix}.fetch_all", fake_fetch_all, raising=True)
+    monkeypatch.setattr(f"{prefix}.run_worker_pool", fake_run_worker_pool, raising=True)
+
+    _, stats = await scrape_with_stats(
+        list(pages), settings=settings, options=PipelineOptions(job_hooks=Hooks())
+    )
+
+    assert pool_inputs == ["https://ok.test"]
+    assert errors == [("https://gone.test", PageRejectReason.SOFT_404)]
+    assert stats["num_rejected_soft_404"] == 1
+    assert stats["num_failed"] == 1
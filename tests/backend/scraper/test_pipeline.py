@@ -1,18 +1,36 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 import pytest
 
-from agentic_scraper.backend.config.constants import FETCH_ERROR_PREFIX
+from agentic_scraper.backend.config.constants import CHECKPOINT_NO_ITEM_REASON, FETCH_ERROR_PREFIX
 from agentic_scraper.backend.config.types import AgentMode
-from agentic_scraper.backend.scraper.pipeline import PipelineOptions, scrape_urls, scrape_with_stats
+from agentic_scraper.backend.scraper import agents as agents_mod
+from agentic_scraper.backend.scraper import pipeline as pipeline_mod
+from agentic_scraper.backend.scraper import screenshot_stage as ss
+from agentic_scraper.backend.scraper.checkpoint import CheckpointJournal
+from agentic_scraper.backend.scraper.pipeline import (
+    PipelineOptions,
+    scrape_iter,
+    scrape_urls,
+    scrape_with_stats,
+)
 from agentic_scraper.backend.scraper.schemas import ScrapedItem
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
     from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.memory_budget import MemoryBudget
+    from agentic_scraper.backend.scraper.models import ScrapeRequest
 
+EXPECTED_THREE = 3
 EXPECTED_TWO = 2
 EXPECTED_ZERO = 0
 EXPECTED_ONE = 1
@@ -54,6 +72,7 @@ async def _fake_run_worker_pool_invoke_hooks(
     config: object,
     cancel_event: object,
     should_cancel: object,
+    **_extra: object,
 ) -> list[ScrapedItem]:
     _ = (inputs, settings, cancel_event, should_cancel)
     on_progress = getattr(config, "on_progress", None)
@@ -108,6 +127,7 @@ async def test_scrape_urls_happy_path(
         config: object,
         cancel_event: object,
         should_cancel: object,
+        **_extra: object,
     ) -> list[ScrapedItem]:
         _ = (settings, config, cancel_event, should_cancel)
         captured_inputs.extend(inputs)
@@ -183,6 +203,7 @@ async def test_scrape_urls_filters_fetch_errors(
         config: object,
         cancel_event: object,
         should_cancel: object,
+        **_extra: object,
     ) -> list[ScrapedItem]:
         _ = (settings, config, cancel_event, should_cancel)
         # Should receive only the OK input
@@ -313,16 +334,17 @@ async def test_scrape_with_stats_success(
 ) -> None:
     urls: list[str] = ["https://a", "https://b"]
 
-    async def fake_scrape_urls(
+    async def fake_scrape_iter(
         urls: list[str],
         settings: Settings,
         openai: object | None = None,
         *,
         options: PipelineOptions | None = None,
-    ) -> list[ScrapedItem]:
-        _ = (urls, settings, openai, options)
-        return [
-            ScrapedItem(
+        ordered: bool = False,
+    ) -> AsyncIterator[ScrapedItem]:
+        _ = (settings, openai, options, ordered)
+        for u in urls:
+            yield ScrapedItem(
                 url=u,
                 title=None,
                 description=None,
@@ -330,12 +352,10 @@ async def test_scrape_with_stats_success(
                 author=None,
                 date_published=None,
             )
-            for u in urls
-        ]
 
     monkeypatch.setattr(
-        "agentic_scraper.backend.scraper.pipeline.scrape_urls",
-        fake_scrape_urls,
+        "agentic_scraper.backend.scraper.pipeline.scrape_iter",
+        fake_scrape_iter,
         raising=True,
     )
 
@@ -365,20 +385,23 @@ async def test_scrape_with_stats_canceled_before_start(
     cancel_event = asyncio.Event()
     cancel_event.set()
 
-    async def fake_scrape_urls(
+    async def fake_scrape_iter(
         urls: list[str],
         settings: Settings,
         openai: object | None = None,
         *,
         options: PipelineOptions | None = None,
-    ) -> list[ScrapedItem]:
-        _ = (urls, settings, openai, options)
-        # Pipeline should return empty due to cancel
-        return []
+        ordered: bool = False,
+    ) -> AsyncIterator[ScrapedItem]:
+        _ = (urls, settings, openai, options, ordered)
+        # Pipeline should yield nothing due to cancel
+        nothing: tuple[ScrapedItem, ...] = ()
+        for item in nothing:
+            yield item
 
     monkeypatch.setattr(
-        "agentic_scraper.backend.scraper.pipeline.scrape_urls",
-        fake_scrape_urls,
+        "agentic_scraper.backend.scraper.pipeline.scrape_iter",
+        fake_scrape_iter,
         raising=True,
     )
 
@@ -529,6 +552,7 @@ async def test_scrape_urls_llm_mode_changes_concurrency(
         config: object,
         cancel_event: object,
         should_cancel: object,
+        **_extra: object,
     ) -> list[ScrapedItem]:
         _ = (inputs, settings, cancel_event, should_cancel)
         # capture the concurrency used in pool config
@@ -569,3 +593,273 @@ async def test_scrape_urls_llm_mode_changes_concurrency(
         options=PipelineOptions(),
     )
     assert seen_concurrency == [settings.llm_concurrency]
+
+
+# --------------------------- streaming (scrape_iter) ------------------------- #
+SLOW_URL = "https://s.test/slow"
+FAST_URLS = ["https://s.test/fast-1", "https://s.test/fast-2"]
+SLOW_DELAY_S = 0.05
+
+
+def _patch_streaming_run(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings, finished: list[str]
+) -> None:
+    async def fake_fetch_all(
+        *, urls: list[str], settings: Settings, concurrency: int, cancel: object
+    ) -> dict[str, str]:
+        _ = (settings, concurrency, cancel)
+        return {u: f"<html>{u}</html>" for u in urls}
+
+    async def fake_extract(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
+        _ = settings
+        if req.url == SLOW_URL:
+            await asyncio.sleep(SLOW_DELAY_S)
+        finished.append(req.url)
+        return ScrapedItem(
+            url=req.url, title=None, description=None, price=None, author=None, date_published=None
+        )
+
+    monkeypatch.setattr("agentic_scraper.backend.scraper.pipeline.fetch_all", fake_fetch_all)
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+    settings.agent_mode = AgentMode.RULE_BASED
+    settings.page_classifier_enabled = False
+    settings.screenshot_enabled = False
+
+
+@pytest.mark.asyncio
+async def test_scrape_iter_yields_items_before_the_run_finishes(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    finished: list[str] = []
+    _patch_streaming_run(monkeypatch, settings, finished)
+
+    # Record, per yielded item, whether the slow page had finished at that moment.
+    seen = [
+        (str(item.url), SLOW_URL in finished)
+        async for item in scrape_iter([SLOW_URL, *FAST_URLS], settings)
+    ]
+
+    # Fast pages are handed out while the slow one is still being extracted.
+    assert seen[0] == (FAST_URLS[0], False)
+    assert [url for url, _ in seen] == [*FAST_URLS, SLOW_URL]
+
+
+@pytest.mark.asyncio
+async def test_scrape_iter_ordered_mode_releases_input_order(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    finished: list[str] = []
+    _patch_streaming_run(monkeypatch, settings, finished)
+
+    out = [
+        str(item.url) async for item in scrape_iter([SLOW_URL, *FAST_URLS], settings, ordered=True)
+    ]
+
+    assert finished == [*FAST_URLS, SLOW_URL]  # completion order differs...
+    assert out == [SLOW_URL, *FAST_URLS]  # ...but items come out in input order
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_streams_fetched_pages_into_the_pool(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    finished: list[str] = []
+    _patch_streaming_run(monkeypatch, settings, finished)
+    broken = "https://s.test/broken"
+
+    async def must_not_fetch_all(**_kwargs: object) -> dict[str, str]:
+        msg = "staged fetch used under a memory budget"
+        raise AssertionError(msg)
+
+    async def fake_fetch_stream(
+        urls: list[str],
+        *,
+        settings: Settings,
+        concurrency: int,
+        cancel: object,
+        budget: MemoryBudget,
+    ) -> AsyncIterator[tuple[str, str]]:
+        _ = (settings, concurrency, cancel)
+        for url in urls:
+            await budget.wait_for_room()
+            if url == broken:
+                yield url, f"{FETCH_ERROR_PREFIX}: 404"
+                continue
+            html = f"<html><body><p>{url} text</p></body></html>"
+            budget.charge(url, len(html))
+            yield url, html
+
+    monkeypatch.setattr("agentic_scraper.backend.scraper.pipeline.fetch_all", must_not_fetch_all)
+    monkeypatch.setattr("agentic_scraper.backend.scraper.pipeline.fetch_stream", fake_fetch_stream)
+    settings.memory_budget_mb = 1
+    settings.memory_budget_compress = True
+    urls = [SLOW_URL, broken, *FAST_URLS]
+    progress: list[tuple[int, int]] = []
+    hooks = SimpleNamespace(on_progress=lambda done, total: progress.append((done, total)))
+
+    items, stats = await scrape_with_stats(
+        urls, settings, options=PipelineOptions(job_hooks=hooks), ordered=True
+    )
+
+    # The dropped page does not hold back the ordered stream.
+    assert [str(it.url) for it in items] == [SLOW_URL, *FAST_URLS]
+    assert finished == [*FAST_URLS, SLOW_URL]
+    assert stats["peak_buffered_bytes"] > 0
+    # Progress is measured against every URL, not just the pages produced so far.
+    assert progress
+    assert {total for _done, total in progress} == {len(urls)}
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resume_skips_finished_and_failed_urls(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings, tmp_path: Path
+) -> None:
+    finished: list[str] = []
+    _patch_streaming_run(monkeypatch, settings, finished)
+    broken = "https://s.test/broken"
+    empty = "https://s.test/empty"
+    extract = agents_mod.extract_structured_data
+
+    async def flaky_extract(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem | None:
+        if req.url == broken:
+            finished.append(req.url)
+            msg = "boom"
+            raise RuntimeError(msg)
+        if req.url == empty:
+            finished.append(req.url)
+            return None  # e.g. the LLM call failed and the agent returned no item
+        return await extract(req, settings=settings)
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", flaky_extract, raising=True)
+    path = tmp_path / "run.checkpoint.jsonl"
+
+    # First run: one page extracted, two failed; the process then "dies".
+    with CheckpointJournal(path, resume=False) as journal:
+        await scrape_urls(
+            [FAST_URLS[0], broken, empty], settings, options=PipelineOptions(checkpoint=journal)
+        )
+    assert journal.failures == {broken: "RuntimeError: boom", empty: CHECKPOINT_NO_ITEM_REASON}
+
+    finished.clear()
+    with CheckpointJournal(path, resume=True) as journal:
+        items, stats = await scrape_with_stats(
+            [FAST_URLS[0], broken, empty, FAST_URLS[1]],
+            settings,
+            options=PipelineOptions(checkpoint=journal),
+        )
+
+    assert finished == [FAST_URLS[1]]  # only the remainder is extracted
+    assert [str(it.url) for it in items] == FAST_URLS  # journaled item is re-emitted
+    assert stats["num_resumed"] == EXPECTED_THREE
+    assert stats["num_failed"] == EXPECTED_TWO
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_journals_items_with_their_staged_screenshots(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings, tmp_path: Path
+) -> None:
+    finished: list[str] = []
+    _patch_streaming_run(monkeypatch, settings, finished)
+    settings.screenshot_enabled = True
+    settings.screenshot_stage_enabled = True
+    settings.browser_pool_enabled = False
+
+    async def slow_capture(url: str, settings: Settings, *, page_hash: str | None) -> str:
+        _ = (settings, page_hash)
+        await asyncio.sleep(SLOW_DELAY_S)  # lands after the item was yielded
+        return f"/shots/{url.rsplit('/', 1)[-1]}.png"
+
+    monkeypatch.setattr(ss, "capture_optional_screenshot", slow_capture, raising=True)
+    path = tmp_path / "run.checkpoint.jsonl"
+
+    with CheckpointJournal(path, resume=False) as journal:
+        await scrape_urls(FAST_URLS, settings, options=PipelineOptions(checkpoint=journal))
+
+    finished.clear()
+    with CheckpointJournal(path, resume=True) as journal:
+        items = await scrape_urls(FAST_URLS, settings, options=PipelineOptions(checkpoint=journal))
+
+    assert finished == []
+    assert sorted(it.screenshot_path or "" for it in items) == [
+        "/shots/fast-1.png",
+        "/shots/fast-2.png",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_journals_near_dup_copies_of_a_failed_page(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings, tmp_path: Path
+) -> None:
+    finished: list[str] = []
+    _patch_streaming_run(monkeypatch, settings, finished)
+    settings.near_dup_enabled = True
+    settings.near_dup_index_path = None
+    article = " ".join(f"word{i}" for i in range(60))
+    monkeypatch.setattr(pipeline_mod, "extract_main_text", lambda _html: article)
+
+    async def empty_extract(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem | None:
+        _ = settings
+        finished.append(req.url)
+        return None
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", empty_extract, raising=True)
+    path = tmp_path / "run.checkpoint.jsonl"
+
+    with CheckpointJournal(path, resume=False) as journal:
+        await scrape_urls(FAST_URLS, settings, options=PipelineOptions(checkpoint=journal))
+    assert finished == [FAST_URLS[0]]  # the copy was never extracted itself
+    assert journal.failures == dict.fromkeys(FAST_URLS, CHECKPOINT_NO_ITEM_REASON)
+
+    finished.clear()
+    with CheckpointJournal(path, resume=True) as journal:
+        assert (
+            await scrape_urls(FAST_URLS, settings, options=PipelineOptions(checkpoint=journal))
+            == []
+        )
+    assert finished == []
+
+
+@pytest.mark.asyncio
+async def test_parse_timeout_counts_only_running_parse_for_many_pages(
+    settings: Settings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    parse_s = 0.01
+    num_pages = 200
+
+    def _slow_extract(html: str) -> str:
+        time.sleep(parse_s)  # releases the GIL like lxml does
+        return html.upper()
+
+    monkeypatch.setattr(pipeline_mod, "extract_main_text", _slow_extract)
+    settings.parse_timeout_s = parse_s * 20  # far below the time to parse all pages
+    html_by_url = {f"https://p.test/{i}": f"<p>{i}</p>" for i in range(num_pages)}
+
+    pages = await pipeline_mod._parse_pages(html_by_url, settings)  # noqa: SLF001
+
+    assert len(pages) == num_pages
+    assert pages[0] == ("https://p.test/0", "<p>0</p>", "<P>0</P>")
+
+
+@pytest.mark.asyncio
+async def test_timed_out_parse_keeps_its_slot_until_the_thread_finishes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    unblock = threading.Event()
+
+    def _stuck_extract(html: str) -> str:
+        unblock.wait(timeout=5)
+        return html
+
+    monkeypatch.setattr(pipeline_mod, "extract_main_text", _stuck_extract)
+    slots = asyncio.Semaphore(1)
+
+    page = await pipeline_mod._parse_page("https://p.test/stuck", "<p/>", 0.01, slots)  # noqa: SLF001
+
+    assert page is None
+    assert slots.locked()  # the thread is still parsing
+    unblock.set()
+    for _ in range(100):
+        if not slots.locked():
+            break
+        await asyncio.sleep(0.01)
+    assert not slots.locked()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agentic_scraper.backend.scraper.pool_schedule import (
+    CostOrderedQueue,
+    DomainLatencyHistory,
+    estimate_cost,
+)
+
+PAGE_LEN = 1000
+SLOW_S = 4.0
+FAST_S = 1.0
+
+
+def test_domain_history_scales_cost_relative_to_other_domains() -> None:
+    history = DomainLatencyHistory()
+    history.record("https://slow.test/a", PAGE_LEN, SLOW_S)
+    history.record("https://fast.test/a", PAGE_LEN, FAST_S)
+
+    # Same text length, but the slow domain is ~4x more expensive per char.
+    slow = estimate_cost(("https://slow.test/b", "x" * PAGE_LEN), history=history)
+    fast = estimate_cost(("https://fast.test/b", "x" * PAGE_LEN), history=history)
+    unknown = estimate_cost(("https://new.test/", "x" * PAGE_LEN), history=history)
+    assert slow > unknown > fast
+    assert slow / fast == pytest.approx(SLOW_S / FAST_S)
+
+
+def test_domain_history_is_bounded() -> None:
+    history = DomainLatencyHistory(max_domains=2)
+    for name in ("a", "b", "c"):
+        history.record(f"https://{name}.test/", PAGE_LEN, FAST_S)
+    assert len(history) == 2  # noqa: PLR2004
+    assert history.factor("https://a.test/") == 1.0  # evicted: no history
+
+
+@pytest.mark.asyncio
+async def test_cost_ordered_queue_pops_most_expensive_first_fifo_on_ties() -> None:
+    queue = CostOrderedQueue(cost=lambda item: len(item[1]))
+    for item in [("a", "x"), ("b", "xxx"), ("c", "xx"), ("d", "xxx")]:
+        await queue.put(item)
+
+    assert queue.qsize() == 4  # noqa: PLR2004
+    assert [queue.get_nowait()[0] for _ in range(4)] == ["b", "d", "c", "a"]
+    assert queue.empty()
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.scraper.process_pool import (
+    ExtractionProcessPool,
+    get_extraction_pool,
+    shutdown_extraction_pool,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+PROCESSES = 2
+HUNG_S = 30.0
+DEADLINE_S = 0.5
+SHORT_S = 0.2
+
+
+@pytest.fixture(autouse=True)
+def _stop_extraction_pools() -> Iterator[None]:
+    yield
+    shutdown_extraction_pool()
+
+
+def test_pool_is_shared_per_size() -> None:
+    pool = get_extraction_pool(PROCESSES)
+    assert get_extraction_pool(PROCESSES) is pool
+    assert get_extraction_pool(PROCESSES + 1) is not pool
+
+
+@pytest.mark.asyncio
+async def test_processes_are_reused_across_runs() -> None:
+    pool = ExtractionProcessPool(PROCESSES)
+    try:
+        assert await pool.run(abs, -1, timeout_s=None) == 1
+        executor = pool._executor  # noqa: SLF001 - identity of the live executor
+        assert await pool.run(abs, -2, timeout_s=None) == PROCESSES
+        assert pool._executor is executor  # noqa: SLF001
+    finally:
+        pool.close()
+
+
+@pytest.mark.asyncio
+async def test_hung_chunk_terminates_pool_and_in_flight_chunk_is_resubmitted() -> None:
+    pool = ExtractionProcessPool(PROCESSES)
+    try:
+        await pool.run(abs, 0, timeout_s=None)  # warm up: spawn the processes
+        hung = pool._executor  # noqa: SLF001
+        started = time.monotonic()
+
+        results = await asyncio.gather(
+            pool.run(time.sleep, HUNG_S, timeout_s=DEADLINE_S),
+            pool.run(time.sleep, SHORT_S, timeout_s=None),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[0], asyncio.TimeoutError)
+        assert results[1] is None  # broken by the timeout, then rerun on the new pool
+        assert time.monotonic() - started < HUNG_S / 2
+        assert pool._executor is not hung  # noqa: SLF001
+        assert await pool.run(abs, -3, timeout_s=None) == abs(-3)
+    finally:
+        pool.close()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import io
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from PIL import Image
+
+from agentic_scraper.backend.config.types import FetchRenderMode
+from agentic_scraper.backend.scraper import agents as agents_mod
+from agentic_scraper.backend.scraper import renderer
+from agentic_scraper.backend.scraper.models import ScrapeRequest, WorkerPoolConfig
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+from agentic_scraper.backend.scraper.worker_pool import run_worker_pool
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+    from pathlib import Path
+
+    from agentic_scraper.backend.core.settings import Settings
+
+THIN = "https://spa.test/app"
+RICH = "https://blog.test/post"
+RENDERED_TEXT = "Rendered product description " * 20
+SHOT_PATH = "/shots/spa.png"
+
+
+# ------------------------- fake pooled Playwright page ------------------------- #
+class _FakePage:
+    def __init__(self, log: dict[str, Any]) -> None:
+        self.log = log
+        self.handler: Callable[[Any], Awaitable[None]] | None = None
+
+    async def route(self, _pattern: str, handler: Callable[[Any], Awaitable[None]]) -> None:
+        self.handler = handler
+
+    async def goto(self, url: str, *, wait_until: str, timeout: int) -> None:
+        _ = (wait_until, timeout)
+        self.log["gotos"].append(url)
+
+    async def content(self) -> str:
+        return f"<html><body><main><p>{RENDERED_TEXT}</p></main></body></html>"
+
+    async def screenshot(self, **kwargs: Any) -> bytes:  # noqa: ANN401
+        buf = io.BytesIO()
+        Image.new("RGB", (4, 4)).save(buf, format="PNG")
+        kwargs["path"].write_bytes(buf.getvalue())
+        self.log["shots"] += 1
+        return buf.getvalue()
+
+
+class _FakePool:
+    def __init__(self) -> None:
+        self.log: dict[str, Any] = {"gotos": [], "shots": 0, "pages": []}
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[_FakePage]:
+        page = _FakePage(self.log)
+        self.log["pages"].append(page)
+        yield page
+
+
+@pytest.fixture
+def fake_pool(monkeypatch: pytest.MonkeyPatch) -> _FakePool:
+    pool = _FakePool()
+
+    @asynccontextmanager
+    async def _session(_settings: Settings, *, required: bool) -> AsyncIterator[_FakePool]:
+        assert required is True
+        yield pool
+
+    monkeypatch.setattr(renderer, "browser_pool_session", _session, raising=True)
+    return pool
+
+
+# ------------------------------------ tests ------------------------------------ #
+def test_select_render_targets_by_mode(settings: Settings) -> None:
+    pages = [(THIN, "<html/>", "tiny"), (RICH, "<html/>", "x" * 500)]
+    urls = [THIN, RICH]
+
+    settings.fetch_render_mode = FetchRenderMode.OFF
+    assert renderer.select_render_targets(urls, pages, settings) == []
+    settings.fetch_render_mode = FetchRenderMode.AUTO
+    assert renderer.select_render_targets(urls, pages, settings) == [THIN]
+    settings.fetch_render_mode = FetchRenderMode.ALWAYS
+    assert renderer.select_render_targets(urls, pages, settings) == urls
+
+
+@pytest.mark.asyncio
+async def test_auto_render_replaces_thin_page_and_reuses_navigation_for_screenshot(
+    fake_pool: _FakePool, settings: Settings, tmp_path: Path
+) -> None:
+    settings.fetch_render_mode = FetchRenderMode.AUTO
+    settings.screenshot_enabled = True
+    settings.screenshot_dir = str(tmp_path)
+    rich_page = (RICH, "<html/>", "x" * 500)
+    pages = [(THIN, "<div id=root></div>", ""), rich_page]
+
+    merged, shots = await renderer.render_pages([THIN, RICH], pages, settings)
+
+    assert fake_pool.log["gotos"] == [THIN]  # one navigation, only for the thin page
+    assert fake_pool.log["shots"] == 1  # screenshot taken from that same navigation
+    assert merged[0][0] == THIN
+    assert "Rendered product description" in merged[0][2]
+    assert merged[1] == rich_page
+    assert set(shots) == {THIN}
+
+    blocked: list[str] = []
+
+    class _Route:
+        def __init__(self, kind: str) -> None:
+            self.request = type("Req", (), {"resource_type": kind})()
+
+        async def abort(self) -> None:
+            blocked.append(self.request.resource_type)
+
+        async def continue_(self) -> None:
+            return None
+
+    handler = fake_pool.log["pages"][0].handler
+    for kind in ("image", "font", "media", "document"):
+        await handler(_Route(kind))
+    assert blocked == ["media"]  # images/fonts kept for the screenshot
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_reuses_render_screenshot(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    seen: list[bool] = []
+
+    async def fake_extract(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
+        _ = settings
+        seen.append(req.take_screenshot)
+        return ScrapedItem(
+            url=req.url, title=None, description=None, price=None, author=None, date_published=None
+        )
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+    settings.screenshot_stage_enabled = False
+    cfg = WorkerPoolConfig(take_screenshot=True, concurrency=1, screenshot_paths={THIN: SHOT_PATH})
+
+    out = await run_worker_pool([(THIN, RENDERED_TEXT)], settings=settings, config=cfg)
+
+    assert seen == [False]
+    assert out[0].screenshot_path == SHOT_PATH
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from agentic_scraper.backend.scraper.result_stream import ResultStream
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+
+URLS = ["https://r.test/0", "https://r.test/1", "https://r.test/2", "https://r.test/3"]
+
+
+def _item(url: str) -> ScrapedItem:
+    return ScrapedItem(
+        url=url, title=None, description=None, price=None, author=None, date_published=None
+    )
+
+
+async def _drain_ready(stream: ResultStream) -> list[str]:
+    """Read what has been released so far (without waiting for close)."""
+    out: list[str] = []
+    queue = stream._queue  # noqa: SLF001 - peek at released items
+    while not queue.empty():
+        item = queue.get_nowait()
+        assert item is not None
+        out.append(str(item.url))
+    return out
+
+
+@pytest.mark.asyncio
+async def test_ordered_stream_releases_longest_completed_prefix() -> None:
+    stream = ResultStream(URLS)
+
+    stream.push(URLS[2], _item(URLS[2]))
+    stream.push(URLS[1], None)  # failed input: frees its slot, emits nothing
+    assert await _drain_ready(stream) == []  # still waiting on input 0
+
+    stream.push(URLS[0], _item(URLS[0]))
+    assert await _drain_ready(stream) == [URLS[0], URLS[2]]
+
+    stream.close()  # input 3 never reported (e.g. cancelled)
+    assert [str(it.url) async for it in stream] == []
+
+
+@pytest.mark.asyncio
+async def test_unordered_stream_emits_in_completion_order_and_close_flushes() -> None:
+    stream = ResultStream()
+    stream.push(URLS[3], _item(URLS[3]))
+    stream.push(URLS[0], None)
+    stream.push(URLS[1], _item(URLS[1]))
+    stream.close()
+    stream.close()  # idempotent
+
+    assert [str(it.url) async for it in stream] == [URLS[3], URLS[1]]
+
+    ordered = ResultStream(URLS)
+    ordered.push(URLS[3], _item(URLS[3]))
+    ordered.close()  # buffered results are flushed in input order
+    assert [str(it.url) async for it in ordered] == [URLS[3]]
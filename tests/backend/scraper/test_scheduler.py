@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.config.types import SchedulerResource
+from agentic_scraper.backend.scraper import scheduler as sched_mod
+from agentic_scraper.backend.scraper.scheduler import FairScheduler, Tenant
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+
+LLM = SchedulerResource.LLM
+BIG_JOB_ITEMS = 6
+SMALL_JOB_ITEMS = 2
+HEAVY_WEIGHT = 2.0
+WINDOW = 6
+
+
+async def _run_contended(sched: FairScheduler, tenants: list[Tenant]) -> list[Tenant]:
+    """Queue `tenants` behind a held slot, release it, and return the grant order."""
+    order: list[Tenant] = []
+    gate = asyncio.Event()
+
+    async def hold() -> None:
+        async with sched.slot(LLM, Tenant("holder", "holder")):
+            await gate.wait()
+
+    async def use(tenant: Tenant) -> None:
+        async with sched.slot(LLM, tenant):
+            order.append(tenant)
+            await asyncio.sleep(0)
+
+    blocker = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(use(t)) for t in tenants]
+    await asyncio.sleep(0)
+    assert sched.waiting(LLM) == len(tenants)
+    gate.set()
+    await asyncio.gather(blocker, *tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_small_owner_is_not_starved_by_a_huge_job() -> None:
+    big, small = Tenant("alice", "bulk"), Tenant("bob", "interactive")
+    sched = FairScheduler({LLM: 1})
+
+    order = await _run_contended(sched, [big] * BIG_JOB_ITEMS + [small] * SMALL_JOB_ITEMS)
+
+    # FIFO would serve all six bulk items first; fair queuing alternates owners.
+    assert [t.owner for t in order] == ["alice", "bob", "alice", "bob"] + ["alice"] * 4
+    assert sched.in_use(LLM) == 0
+
+
+@pytest.mark.asyncio
+async def test_jobs_of_one_owner_share_by_weight() -> None:
+    heavy = Tenant("alice", "heavy", weight=HEAVY_WEIGHT)
+    light = Tenant("alice", "light")
+    sched = FairScheduler({LLM: 1})
+
+    order = await _run_contended(sched, [heavy] * BIG_JOB_ITEMS + [light] * BIG_JOB_ITEMS)
+
+    assert Counter(t.job for t in order[:WINDOW]) == {"heavy": 4, "light": 2}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_releases_its_place_and_registry(settings: Settings) -> None:
+    settings.scheduler_llm_concurrency = 1
+    sched = sched_mod.start_scheduler(settings)
+    assert sched is not None
+    assert sched_mod.get_scheduler() is sched
+
+    try:
+        with sched_mod.scheduler_tenant("alice", "job-1"):
+            async with sched_mod.scheduled_slot(LLM):
+                waiter = asyncio.create_task(sched.slot(LLM).__aenter__())
+                await asyncio.sleep(0)
+                assert sched.waiting(LLM) == 1
+                waiter.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await waiter
+            # The cancelled waiter never holds a slot; the next caller goes straight in.
+            async with sched_mod.scheduled_slot(LLM):
+                assert sched.in_use(LLM) == 1
+        assert sched.in_use(LLM) == 0
+    finally:
+        sched_mod.stop_scheduler()
+
+    assert sched_mod.get_scheduler() is None
+    async with sched_mod.scheduled_slot(LLM):  # no scheduler: no-op
+        pass
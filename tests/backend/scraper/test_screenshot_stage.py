@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.config.types import AgentMode
+from agentic_scraper.backend.scraper import agents as agents_mod
+from agentic_scraper.backend.scraper import screenshot_stage as ss
+from agentic_scraper.backend.scraper.models import ScrapeRequest, WorkerPoolConfig
+from agentic_scraper.backend.scraper.schemas import ScrapedItem
+from agentic_scraper.backend.scraper.worker_pool import run_worker_pool
+
+if TYPE_CHECKING:
+    from agentic_scraper.backend.core.settings import Settings
+
+CAPTURE_DELAY_S = 0.05
+SHORT_TIMEOUT_S = 0.01
+NUM_URLS = 4
+
+
+def _item(url: str) -> ScrapedItem:
+    return ScrapedItem(
+        url=url, title=None, description=None, price=None, author=None, date_published=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_emits_items_before_screenshots_and_patches_them(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    settings.agent_mode = AgentMode.RULE_BASED
+    inline_flags: list[bool] = []
+    paths_at_emit: list[str | None] = []
+
+    async def fake_extract(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
+        _ = settings
+        inline_flags.append(req.take_screenshot)
+        return _item(req.url)
+
+    async def slow_capture(url: str, settings: Settings, *, page_hash: str | None) -> str:
+        _ = (settings, page_hash)
+        await asyncio.sleep(CAPTURE_DELAY_S)
+        return f"/shots/{url.rsplit('/', 1)[-1]}.png"
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+    monkeypatch.setattr(ss, "capture_optional_screenshot", slow_capture, raising=True)
+
+    cfg = WorkerPoolConfig(
+        take_screenshot=True,
+        concurrency=NUM_URLS,
+        on_item_processed=lambda it: paths_at_emit.append(it.screenshot_path),
+    )
+    inputs = [(f"https://s.test/{i}", "text") for i in range(NUM_URLS)]
+    out = await run_worker_pool(inputs, settings=settings, config=cfg)
+
+    assert inline_flags == [False] * NUM_URLS  # agents skipped inline capture
+    assert paths_at_emit == [None] * NUM_URLS  # emitted before the capture finished
+    assert sorted(o.screenshot_path or "" for o in out) == [
+        f"/shots/{i}.png" for i in range(NUM_URLS)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stage_timeout_leaves_item_unpatched(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    async def hung_capture(url: str, settings: Settings, *, page_hash: str | None) -> str:
+        _ = (url, settings, page_hash)
+        await asyncio.sleep(CAPTURE_DELAY_S * 10)
+        return "/never.png"
+
+    monkeypatch.setattr(ss, "capture_optional_screenshot", hung_capture, raising=True)
+    stage = ss.ScreenshotStage(
+        settings.model_copy(update={"screenshot_timeout_s": SHORT_TIMEOUT_S})
+    )
+    item = _item("https://s.test/slow")
+
+    stage.submit(item)
+    await stage.aclose(drain=True)
+
+    assert item.screenshot_path is None
+    assert (stage.captured, stage.timed_out) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_stage_disabled_keeps_inline_capture(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    settings.screenshot_stage_enabled = False
+    inline_flags: list[bool] = []
+
+    async def fake_extract(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
+        _ = settings
+        inline_flags.append(req.take_screenshot)
+        return _item(req.url)
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+
+    cfg = WorkerPoolConfig(take_screenshot=True, concurrency=1)
+    await run_worker_pool([("https://s.test/a", "text")], settings=settings, config=cfg)
+
+    assert inline_flags == [True]
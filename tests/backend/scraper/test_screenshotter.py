@@ -1,14 +1,28 @@
 from __future__ import annotations
 
 import hashlib
+import io
 from pathlib import Path
 from types import TracebackType
+from typing import Any
 
 import pytest
+from PIL import Image
 
-from agentic_scraper.backend.scraper.screenshotter import capture_screenshot, slugify
+from agentic_scraper.backend.config.types import ScreenshotFormat
+from agentic_scraper.backend.scraper.screenshotter import (
+    ScreenshotOptions,
+    capture_screenshot,
+    content_hash,
+    slugify,
+)
 
 LEN_LONG_TEXT = 40
+PAGE_WIDTH = 1280
+PAGE_HEIGHT = 3000
+MAX_HEIGHT = 2000
+THUMB_WIDTH = 320
+EXPECTED_CAPTURES = 2
 
 
 # -------------------- minimal async Playwright fakes -------------------- #
@@ -181,3 +195,108 @@ async def test_capture_screenshot_playwright_error_logs_and_returns_none(
 
     # Ensure the "screenshot failed" message was logged
     assert any("Failed to capture screenshot" in m for m in captured)
+
+
+# ---------------------- cache, formats and thumbnails ---------------------- #
+class _PNGPage(_FakePage):
+    calls: list[dict[str, Any]] = []  # noqa: RUF012 - shared across instances
+
+    async def screenshot(self, **kwargs: Any) -> bytes:  # type: ignore[override]  # noqa: ANN401
+        self.calls.append(kwargs)
+        buf = io.BytesIO()
+        Image.new("RGB", (PAGE_WIDTH, PAGE_HEIGHT), "white").save(buf, format="PNG")
+        if "path" in kwargs:
+            kwargs["path"].write_bytes(buf.getvalue())
+        return buf.getvalue()
+
+
+class _PNGBrowser(_FakeBrowser):
+    async def new_page(self) -> _PNGPage:
+        return _PNGPage()
+
+
+class _PNGChromium(_FakeChromium):
+    async def launch(self, *, headless: bool) -> _PNGBrowser:
+        _ = headless
+        return _PNGBrowser()
+
+
+class _PNGPlaywright(_FakePlaywright):
+    def __init__(self) -> None:
+        self.chromium = _PNGChromium()
+
+
+class _PNGCtx(_AsyncPWCtx):
+    async def __aenter__(self) -> _PNGPlaywright:
+        return _PNGPlaywright()
+
+
+@pytest.fixture
+def png_playwright(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    _PNGPage.calls = []
+    monkeypatch.setattr(
+        "agentic_scraper.backend.scraper.screenshotter.async_playwright",
+        _PNGCtx,
+        raising=True,
+    )
+    return _PNGPage.calls
+
+
+@pytest.mark.asyncio
+async def test_capture_screenshot_cache_skips_unchanged_content(
+    png_playwright: list[dict[str, Any]], tmp_path: Path
+) -> None:
+    url = "https://example.com/cached"
+    opts = ScreenshotOptions(cache_ttl_s=60.0)
+
+    first = await capture_screenshot(url, tmp_path, options=opts, page_hash=content_hash("v1"))
+    again = await capture_screenshot(url, tmp_path, options=opts, page_hash=content_hash("v1"))
+    changed = await capture_screenshot(url, tmp_path, options=opts, page_hash=content_hash("v2"))
+
+    assert first == again
+    assert changed not in (None, first)
+    assert len(png_playwright) == EXPECTED_CAPTURES  # the repeat was served from disk
+
+
+@pytest.mark.asyncio
+async def test_capture_screenshot_webp_clipped_with_thumbnail(
+    png_playwright: list[dict[str, Any]], tmp_path: Path
+) -> None:
+    opts = ScreenshotOptions(
+        image_format=ScreenshotFormat.WEBP, max_height=MAX_HEIGHT, thumbnail_width=THUMB_WIDTH
+    )
+    out = await capture_screenshot("https://example.com/w", tmp_path, options=opts)
+
+    assert out is not None
+    assert out.endswith(".webp")
+    assert png_playwright[0]["clip"]["height"] == MAX_HEIGHT
+    assert "path" not in png_playwright[0]  # bytes are re-encoded, not written as PNG
+    with Image.open(out) as img:
+        assert img.format == "WEBP"
+    with Image.open(Path(out).with_name(Path(out).stem + ".thumb.webp")) as thumb:
+        assert thumb.width == THUMB_WIDTH
+
+
+def _listing(directory: Path) -> list[str]:
+    return sorted(p.name for p in directory.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_capture_screenshot_prunes_captures_of_older_content(
+    png_playwright: list[dict[str, Any]], tmp_path: Path
+) -> None:
+    url = "https://example.com/changing"
+    opts = ScreenshotOptions(cache_ttl_s=60.0, thumbnail_width=THUMB_WIDTH)
+    other = await capture_screenshot("https://example.com/other", tmp_path, options=opts)
+
+    old = await capture_screenshot(url, tmp_path, options=opts, page_hash=content_hash("v1"))
+    new = await capture_screenshot(url, tmp_path, options=opts, page_hash=content_hash("v2"))
+
+    assert len(png_playwright) == EXPECTED_CAPTURES + 1
+    assert old is not None
+    assert new is not None
+    assert other is not None
+    kept = [Path(path) for path in (new, other)]
+    assert _listing(tmp_path) == sorted(
+        name for path in kept for name in (path.name, f"{path.stem}.thumb.png")
+    )
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentic_scraper.backend.config.types import WorkChunkState
+from agentic_scraper.backend.scraper.work_queue import SQLiteWorkQueue
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BATCH = "batch-1"
+SHORT_LEASE_S = 0.05
+CHUNK_A = ["https://q.test/a1", "https://q.test/a2"]
+CHUNK_B = ["https://q.test/b1"]
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed_and_late_completion_ignored(tmp_path: Path) -> None:
+    queue = SQLiteWorkQueue(tmp_path / "q.sqlite3", lease_s=SHORT_LEASE_S, max_attempts=2)
+    await queue.enqueue(BATCH, [CHUNK_A, CHUNK_B])
+
+    stale = await queue.claim("w1")
+    assert stale is not None
+    assert (stale.urls, stale.attempt) == (CHUNK_A, 1)
+    await asyncio.sleep(SHORT_LEASE_S * 2)  # w1 stalls past its visibility timeout
+
+    fresh = await queue.claim("w2")
+    assert fresh is not None
+    assert (fresh.chunk_id, fresh.attempt) == (stale.chunk_id, 2)
+    assert not await queue.heartbeat(stale)
+    assert not await queue.complete(stale, [{"url": "stale"}])
+    assert await queue.complete(fresh, [{"url": CHUNK_A[0]}])
+
+    other = await queue.claim("w1")
+    assert other is not None
+    assert other.urls == CHUNK_B
+    await queue.fail(other, "RuntimeError: boom")  # requeued: attempt 1 of 2
+
+    counts = await queue.counts(BATCH)
+    assert counts[WorkChunkState.DONE] == 1
+    assert counts[WorkChunkState.QUEUED] == 1
+
+
+@pytest.mark.asyncio
+async def test_chunk_fails_after_max_attempts_and_results_split(tmp_path: Path) -> None:
+    queue = SQLiteWorkQueue(tmp_path / "q.sqlite3", lease_s=SHORT_LEASE_S, max_attempts=1)
+    await queue.enqueue(BATCH, [CHUNK_A, CHUNK_B])
+    await queue.enqueue("other", [["https://q.test/other"]])
+
+    crashed = await queue.claim("w1")  # worker dies: the lease just expires
+    failed = await queue.claim("w1")
+    assert crashed is not None
+    assert failed is not None
+    await queue.fail(failed, "RuntimeError: boom")
+    await asyncio.sleep(SHORT_LEASE_S * 2)
+
+    counts = await queue.counts(BATCH)
+    assert counts[WorkChunkState.FAILED] == len([CHUNK_A, CHUNK_B])
+    items, failed_urls = await queue.results(BATCH)
+    assert items == []
+    assert failed_urls == CHUNK_A + CHUNK_B
+
+    await queue.purge(BATCH)
+    assert sum((await queue.counts(BATCH)).values()) == 0
+    assert (await queue.counts())[WorkChunkState.QUEUED] == 1
+
+
+@pytest.mark.asyncio
+async def test_claim_can_be_scoped_to_one_batch(tmp_path: Path) -> None:
+    queue = SQLiteWorkQueue(tmp_path / "q.sqlite3", lease_s=SHORT_LEASE_S, max_attempts=1)
+    await queue.enqueue("stale", [CHUNK_A])
+    await queue.enqueue(BATCH, [CHUNK_B])
+
+    lease = await queue.claim("w1", BATCH)
+    assert lease is not None
+    assert (lease.batch_id, lease.urls) == (BATCH, CHUNK_B)
+    assert await queue.claim("w1", BATCH) is None
+    assert (await queue.counts("stale"))[WorkChunkState.QUEUED] == 1
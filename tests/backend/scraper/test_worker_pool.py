@@ -2,31 +2,64 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import pytest
 
+from agentic_scraper.backend.config.types import AgentMode, WorkerPoolMode, WorkerPoolSchedule
 from agentic_scraper.backend.scraper import agents as agents_mod
+from agentic_scraper.backend.scraper import process_pool as process_pool_mod
+from agentic_scraper.backend.scraper import worker_pool as worker_pool_mod
+from agentic_scraper.backend.scraper.agents import llm_batch
 from agentic_scraper.backend.scraper.models import ScrapeRequest, WorkerPoolConfig
+from agentic_scraper.backend.scraper.pool_schedule import get_domain_latency_history
 from agentic_scraper.backend.scraper.schemas import ScrapedItem
 from agentic_scraper.backend.scraper.worker_pool import run_worker_pool
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
     # Imported only for typing to satisfy TC001
     from agentic_scraper.backend.core.settings import Settings
+    from agentic_scraper.backend.scraper.agents.model_router import ModelRouter
+
+
+PROCESS_WORKERS = 2
+PROCESS_CHUNK_SIZE = 2
+STUCK_S = 5.0
+CANCEL_AFTER_S = 0.02
+
+
+@pytest.fixture(autouse=True)
+def _stop_extraction_pools() -> Iterator[None]:
+    # Process-mode pools outlive a run; do not leak them (or patched ones) across tests.
+    yield
+    process_pool_mod.shutdown_extraction_pool()
+
+
+def _thread_executor(max_workers: int, mp_context: object = None) -> ThreadPoolExecutor:
+    _ = mp_context
+    return ThreadPoolExecutor(max_workers=max_workers)
 
 
 # Protocol that matches the real extract_structured_data signature
 class Extractor(Protocol):
     def __call__(
-        self, request: ScrapeRequest, *, settings: Settings
+        self,
+        request: ScrapeRequest,
+        *,
+        settings: Settings,
+        router: ModelRouter | None = None,
     ) -> Coroutine[Any, Any, ScrapedItem | None]: ...
 
 
 @pytest.mark.asyncio
 async def test_run_worker_pool_success_basic(settings: Settings) -> None:
-    async def fake_extract(_req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
-        _ = settings
+    async def fake_extract(
+        _req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
         return ScrapedItem(
             url="https://ok",
             title=None,
@@ -51,8 +84,10 @@ async def test_run_worker_pool_success_basic(settings: Settings) -> None:
 
 @pytest.mark.asyncio
 async def test_run_worker_pool_preserve_order(settings: Settings) -> None:
-    async def fake_extract(req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
-        _ = settings
+    async def fake_extract(
+        req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
         # delay based on url to scramble completion
         await asyncio.sleep(0.02 if "1" in req.url else 0.0)
         return ScrapedItem(
@@ -85,8 +120,10 @@ async def test_run_worker_pool_progress_callbacks(settings: Settings) -> None:
     def on_progress(done: int, total: int) -> None:
         progress.append((done, total))
 
-    async def fake_extract(_req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
-        _ = settings
+    async def fake_extract(
+        _req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
         await asyncio.sleep(0.001)
         return ScrapedItem(
             url="https://ok",
@@ -122,8 +159,10 @@ async def test_run_worker_pool_progress_callbacks(settings: Settings) -> None:
 
 @pytest.mark.asyncio
 async def test_run_worker_pool_cancel_via_event(settings: Settings) -> None:
-    async def fake_extract(_req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
-        _ = settings
+    async def fake_extract(
+        _req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
         await asyncio.sleep(0.05)  # long work; we will cancel
         return ScrapedItem(
             url="https://ok",
@@ -154,6 +193,43 @@ async def test_run_worker_pool_cancel_via_event(settings: Settings) -> None:
         agents_mod.extract_structured_data = orig
 
 
+@pytest.mark.asyncio
+async def test_run_worker_pool_cancel_interrupts_in_flight_extraction(settings: Settings) -> None:
+    interrupted: list[str] = []
+
+    async def fake_extract(
+        req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
+        try:
+            await asyncio.sleep(STUCK_S)  # a hung LLM call
+        except asyncio.CancelledError:
+            interrupted.append(req.url)
+            raise
+        return ScrapedItem(url=req.url)
+
+    orig: Extractor = agents_mod.extract_structured_data
+    agents_mod.extract_structured_data = cast("Extractor", fake_extract)
+    try:
+        cancel_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.call_later(CANCEL_AFTER_S, cancel_event.set)
+        started = loop.time()
+
+        out = await run_worker_pool(
+            [("https://a.test", "ta"), ("https://b.test", "tb")],
+            settings=settings,
+            config=WorkerPoolConfig(take_screenshot=False, concurrency=2),
+            cancel_event=cancel_event,
+        )
+
+        assert out == []
+        assert loop.time() - started < STUCK_S / 2
+        assert sorted(interrupted) == ["https://a.test", "https://b.test"]
+    finally:
+        agents_mod.extract_structured_data = orig
+
+
 @pytest.mark.asyncio
 async def test_run_worker_pool_error_path_calls_on_error(settings: Settings) -> None:
     errors: list[str] = []
@@ -161,8 +237,10 @@ async def test_run_worker_pool_error_path_calls_on_error(settings: Settings) ->
     def on_error(url: str, err: Exception) -> None:
         errors.append(url + ":" + err.__class__.__name__)
 
-    async def fake_extract(_req: ScrapeRequest, *, settings: Settings) -> ScrapedItem:
-        _ = settings
+    async def fake_extract(
+        _req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
         err_msg = "boom"
         raise RuntimeError(err_msg)
 
@@ -182,3 +260,288 @@ async def test_run_worker_pool_error_path_calls_on_error(settings: Settings) ->
         assert errors[0].startswith("https://u.test:RuntimeError")
     finally:
         agents_mod.extract_structured_data = orig
+
+
+@pytest.mark.asyncio
+async def test_run_worker_pool_batches_short_pages(
+    monkeypatch: pytest.MonkeyPatch,
+    settings: Settings,
+) -> None:
+    settings.agent_mode = AgentMode.LLM_DYNAMIC
+    settings.llm_batch_enabled = True
+    batched: list[list[str]] = []
+
+    async def fake_extract_batch(
+        requests: list[ScrapeRequest], *, settings: Settings
+    ) -> dict[str, ScrapedItem | None]:
+        _ = settings
+        batched.append([r.url for r in requests])
+        return {
+            r.url: ScrapedItem(
+                url=r.url,
+                title=None,
+                description=None,
+                price=None,
+                author=None,
+                date_published=None,
+            )
+            for r in requests
+        }
+
+    async def fake_extract(
+        _req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
+        msg = "short pages should be served by the batch call"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(llm_batch, "extract_batch", fake_extract_batch, raising=True)
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+
+    cfg = WorkerPoolConfig(take_screenshot=False, concurrency=1, preserve_order=True)
+    inputs = [(f"https://s.test/{i}", f"short text {i}") for i in range(4)]
+    out = await run_worker_pool(inputs, settings=settings, config=cfg)
+
+    assert [o.url for o in out] == [u for (u, _t) in inputs]
+    assert sum(len(b) for b in batched) == len(inputs)
+    assert len(batched) < len(inputs)
+
+
+def test_model_routing_disables_short_page_batching(settings: Settings) -> None:
+    settings.agent_mode = AgentMode.LLM_DYNAMIC
+    settings.llm_batch_enabled = True
+    assert worker_pool_mod._build_batcher(settings, 1) is not None  # noqa: SLF001
+
+    settings.model_routing_enabled = True
+    router = worker_pool_mod._build_router(settings)  # noqa: SLF001
+    assert router is not None
+    assert worker_pool_mod._build_batcher(settings, 1, router) is None  # noqa: SLF001
+
+
+QUEUE_BOUND = 2
+MANY_INPUTS = 25
+POOL_DEADLINE_S = 5.0
+
+
+def _plain_item(url: str) -> ScrapedItem:
+    return ScrapedItem(
+        url=url, title=None, description=None, price=None, author=None, date_published=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_worker_pool_bounded_queue_smaller_than_inputs(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    async def fake_extract(
+        req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
+        await asyncio.sleep(0)
+        return _plain_item(req.url)
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+
+    cfg = WorkerPoolConfig(
+        take_screenshot=False, concurrency=2, max_queue_size=QUEUE_BOUND, preserve_order=True
+    )
+    inputs = [(f"https://q.test/{i}", "t") for i in range(MANY_INPUTS)]
+    # Used to hang forever: every input was put before any worker existed.
+    out = await asyncio.wait_for(
+        run_worker_pool(inputs, settings=settings, config=cfg), timeout=POOL_DEADLINE_S
+    )
+
+    assert [o.url for o in out] == [u for (u, _t) in inputs]
+
+
+@pytest.mark.asyncio
+async def test_run_worker_pool_streams_async_iterator(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    produced = 0
+    max_ahead = 0
+    extracted = 0
+    progress: list[tuple[int, int]] = []
+
+    async def fake_extract(
+        req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        nonlocal extracted
+        _ = (settings, router)
+        await asyncio.sleep(0)
+        extracted += 1
+        return _plain_item(req.url)
+
+    async def source() -> AsyncIterator[tuple[str, str]]:
+        nonlocal produced, max_ahead
+        for i in range(MANY_INPUTS):
+            produced += 1
+            max_ahead = max(max_ahead, produced - extracted)
+            yield (f"https://it.test/{i}", "t")
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+
+    cfg = WorkerPoolConfig(
+        take_screenshot=False,
+        concurrency=1,
+        max_queue_size=QUEUE_BOUND,
+        preserve_order=True,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    out = await run_worker_pool(source(), settings=settings, config=cfg)
+
+    assert [o.url for o in out] == [f"https://it.test/{i}" for i in range(MANY_INPUTS)]
+    # Queue bound + the item in the worker's hands + the one waiting on `put`.
+    assert max_ahead <= QUEUE_BOUND + 2
+    assert progress[-1] == (MANY_INPUTS, MANY_INPUTS)
+
+
+@pytest.mark.asyncio
+async def test_process_mode_extracts_chunks_in_processes_in_order(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    async def must_not_run(
+        _req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
+        msg = "async agent used in process mode"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", must_not_run, raising=True)
+    settings.agent_mode = AgentMode.RULE_BASED
+    settings.worker_pool_mode = WorkerPoolMode.PROCESS
+    settings.process_pool_workers = PROCESS_WORKERS
+    settings.process_pool_chunk_size = PROCESS_CHUNK_SIZE
+
+    inputs = [(f"https://p.test/{i}", f"Product {i}\n\nPrice: ${i}.99") for i in range(5)]
+    inputs.insert(2, ("https://p.test/empty", ""))
+    done: list[str] = []
+    progress: list[tuple[int, int]] = []
+    cfg = WorkerPoolConfig(
+        take_screenshot=False,
+        preserve_order=True,
+        on_input_done=lambda url, _item: done.append(url),
+        on_progress=lambda n, total: progress.append((n, total)),
+    )
+
+    out = await run_worker_pool(inputs, settings=settings, config=cfg)
+
+    assert [it.url for it in out] == [url for url, text in inputs if text]
+    assert [it.title for it in out] == [f"Product {i}" for i in range(5)]
+    assert sorted(done) == sorted(url for url, _text in inputs)
+    assert progress[-1] == (len(inputs), len(inputs))
+
+
+@pytest.mark.asyncio
+async def test_process_mode_chunk_failure_fails_each_input(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    def broken_chunk(_chunk: list[tuple[str, str]]) -> list[dict[str, Any] | None]:
+        msg = "worker process died"
+        raise RuntimeError(msg)
+
+    # Threads stand in for processes so the patched entry point is used as-is.
+    monkeypatch.setattr(process_pool_mod, "ProcessPoolExecutor", _thread_executor)
+    monkeypatch.setattr(worker_pool_mod, "extract_item_dicts", broken_chunk)
+    settings.agent_mode = AgentMode.RULE_BASED
+    settings.worker_pool_mode = WorkerPoolMode.PROCESS
+    settings.process_pool_workers = 1
+
+    errors: list[str] = []
+    done: list[tuple[str, object]] = []
+    cfg = WorkerPoolConfig(
+        take_screenshot=False,
+        on_error=lambda url, _e: errors.append(url),
+        on_input_done=lambda url, item: done.append((url, item)),
+    )
+    urls = ["https://p.test/a", "https://p.test/b"]
+
+    out = await run_worker_pool([(u, "text") for u in urls], settings=settings, config=cfg)
+
+    assert out == []
+    assert sorted(errors) == urls
+    assert sorted(done) == [(u, None) for u in urls]
+
+
+@pytest.fixture
+def _fresh_latency_history() -> Iterator[None]:
+    get_domain_latency_history().clear()
+    yield
+    get_domain_latency_history().clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_fresh_latency_history")
+async def test_longest_first_schedule_starts_big_pages_first_and_keeps_order(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    started: list[str] = []
+
+    async def fake_extract(
+        req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
+        started.append(req.url)
+        await asyncio.sleep(0)
+        return ScrapedItem(
+            url=req.url, title=None, description=None, price=None, author=None, date_published=None
+        )
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+    settings.worker_pool_schedule = WorkerPoolSchedule.LONGEST_FIRST
+    inputs = [(f"https://s.test/{size}", "x" * size) for size in (10, 30, 500, 20)]
+    cfg = WorkerPoolConfig(take_screenshot=False, concurrency=1, preserve_order=True)
+
+    out = await run_worker_pool(inputs, settings=settings, config=cfg)
+
+    assert started == [f"https://s.test/{size}" for size in (500, 30, 20, 10)]
+    assert [it.url for it in out] == [url for url, _text in inputs]
+    assert len(get_domain_latency_history()) == 1  # s.test latency was recorded
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_fresh_latency_history")
+async def test_longest_first_sorts_whole_list_despite_bounded_queue(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    started: list[str] = []
+
+    async def fake_extract(
+        req: ScrapeRequest, *, settings: Settings, router: ModelRouter | None = None
+    ) -> ScrapedItem:
+        _ = (settings, router)
+        started.append(req.url)
+        await asyncio.sleep(0)
+        return ScrapedItem(url=req.url)
+
+    monkeypatch.setattr(agents_mod, "extract_structured_data", fake_extract, raising=True)
+    settings.worker_pool_schedule = WorkerPoolSchedule.LONGEST_FIRST
+    sizes = (10, 30, 20, 40, 500)
+    inputs = [(f"https://s.test/{size}", "x" * size) for size in sizes]
+    cfg = WorkerPoolConfig(
+        take_screenshot=False, concurrency=1, preserve_order=True, max_queue_size=1
+    )
+
+    out = await run_worker_pool(inputs, settings=settings, config=cfg)
+
+    assert started == [f"https://s.test/{size}" for size in sorted(sizes, reverse=True)]
+    assert [it.url for it in out] == [url for url, _text in inputs]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("_fresh_latency_history")
+async def test_process_mode_records_domain_latency(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    # Threads stand in for processes so the test stays fast and picklable-agnostic.
+    monkeypatch.setattr(process_pool_mod, "ProcessPoolExecutor", _thread_executor)
+    settings.agent_mode = AgentMode.RULE_BASED
+    settings.worker_pool_mode = WorkerPoolMode.PROCESS
+    settings.process_pool_workers = 1
+    settings.worker_pool_schedule = WorkerPoolSchedule.LONGEST_FIRST
+    inputs = [("https://p.test/a", "Product A\n\nPrice: $1.99"), ("https://q.test/b", "B")]
+    cfg = WorkerPoolConfig(take_screenshot=False)
+
+    await run_worker_pool(inputs, settings=settings, config=cfg)
+
+    assert len(get_domain_latency_history()) == len(inputs)
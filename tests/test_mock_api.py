@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import random
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from httpx import ASGITransport
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+MOCK_API_PATH = Path(__file__).resolve().parents[1] / "mock_api.py"
+PAGE_URL = "https://shop.test/product/blue-widget"
+HTTP_OK = 200
+HTTP_TOO_MANY_REQUESTS = 429
+
+
+@pytest.fixture
+def mock_api(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    # The script parses its CLI flags at import time; keep pytest's argv out of it.
+    monkeypatch.setattr(sys, "argv", ["mock_api.py", "--latency-profile", "none"])
+    spec = importlib.util.spec_from_file_location("mock_api", MOCK_API_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _completion_request(url: str = PAGE_URL) -> dict[str, object]:
+    return {
+        "model": "mock-gpt",
+        "messages": [{"role": "user", "content": f"Extract data.\nPage URL: {url}"}],
+    }
+
+
+async def _post(module: ModuleType, body: dict[str, object]) -> httpx.Response:
+    transport = ASGITransport(app=module.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://mock") as client:
+        return await client.post("/v1/chat/completions", json=body)
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_is_deterministic_per_page_url(mock_api: ModuleType) -> None:
+    first = await _post(mock_api, _completion_request())
+    second = await _post(mock_api, _completion_request())
+
+    assert first.status_code == second.status_code == HTTP_OK
+    content = json.loads(first.json()["choices"][0]["message"]["content"])
+    assert content["url"] == PAGE_URL
+    assert content["title"] == "Mock Blue Widget"
+    assert second.json()["choices"][0]["message"]["content"] == json.dumps(content)
+    assert first.json()["usage"]["total_tokens"] > 0
+    assert list(mock_api._prompt_attempts.values()) == [2]  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_streamed_completion_matches_json_content(mock_api: ModuleType) -> None:
+    plain = await _post(mock_api, _completion_request())
+    streamed = await _post(
+        mock_api,
+        {**_completion_request(), "stream": True, "stream_options": {"include_usage": True}},
+    )
+
+    events = [
+        json.loads(line.removeprefix("data: "))
+        for line in streamed.text.splitlines()
+        if line.startswith("data: {")
+    ]
+    text = "".join(e["choices"][0]["delta"].get("content", "") for e in events if e["choices"])
+    assert streamed.text.rstrip().endswith("data: [DONE]")
+    assert text == plain.json()["choices"][0]["message"]["content"]
+    assert events[-1]["usage"] == plain.json()["usage"]
+
+
+@pytest.mark.asyncio
+async def test_rpm_limit_returns_429_with_retry_after(
+    mock_api: ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(mock_api.args, "rpm_limit", 1)
+
+    allowed = await _post(mock_api, _completion_request())
+    limited = await _post(mock_api, _completion_request("https://shop.test/product/2"))
+
+    assert allowed.status_code == HTTP_OK
+    assert limited.status_code == HTTP_TOO_MANY_REQUESTS
+    assert limited.json()["error"]["type"] == "rate_limit_exceeded"
+    assert int(limited.headers["retry-after"]) >= 1
+
+
+def test_prompt_attempts_are_bounded(mock_api: ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(mock_api, "MAX_TRACKED_PROMPTS", 2)
+
+    attempts = [mock_api._next_attempt(key) for key in ("a", "b", "a", "c")]  # noqa: SLF001
+
+    assert attempts == [1, 1, 2, 1]
+    assert dict(mock_api._prompt_attempts) == {"a": 2, "c": 1}  # noqa: SLF001
+
+
+@pytest.mark.parametrize("profile", ["fixed", "uniform", "normal", "lognormal", "pareto"])
+def test_zero_latency_mean_samples_zero(
+    mock_api: ModuleType, monkeypatch: pytest.MonkeyPatch, profile: str
+) -> None:
+    monkeypatch.setattr(mock_api.args, "latency_profile", profile)
+    monkeypatch.setattr(mock_api.args, "latency_mean", 0.0)
+
+    assert mock_api._sample_latency(random.Random(0)) == 0.0  # noqa: SLF001, S311